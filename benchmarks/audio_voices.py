@@ -0,0 +1,161 @@
+"""
+benchmarks/audio_voices.py
+
+Voice management under load: 500 one-shot sounds per second for 10 s at
+60 fps with 32 OpenAL sources. For each kind of sound, reports how many
+play_sound rejected outright and how many were never heard. Also prints
+the voice statistics (virtualized, resumed, stolen, expired, dropped) and
+the cost of update(). The script also runs against audio systems without
+voice priorities, for a before/after comparison.
+
+No audio device is needed. A simulated OpenAL plays each buffer for its
+real duration on a simulated clock, so the run is deterministic.
+
+Usage: python benchmarks/audio_voices.py
+"""
+
+import os
+import random
+import sys
+import time
+import types
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SOURCES = 32
+FPS = 60
+SECONDS = 10
+SOUNDS_PER_SECOND = 500
+
+KINDS = [  # name, share of sounds, duration, priority, max instances
+    ("footstep", 0.50, 0.4, 10, 0),
+    ("gunshot", 0.30, 1.2, 60, 8),
+    ("debris", 0.10, 3.0, 20, 0),
+    ("explosion", 0.05, 2.5, 80, 4),
+    ("ui_click", 0.05, 0.15, 100, 0),
+]
+
+
+class SimulatedOpenAL:
+    """The slice of PyOpenAL's `al` module the audio system uses, on a simulated clock"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.durations = {}
+        self.sources = {}
+        names = ("AL_GAIN AL_PITCH AL_LOOPING AL_BUFFER AL_POSITION AL_SOURCE_STATE AL_PLAYING AL_PAUSED "
+                 "AL_STOPPED AL_INITIAL AL_SEC_OFFSET AL_SOURCE_RELATIVE AL_TRUE AL_FALSE").split()
+        for i, name in enumerate(names):
+            setattr(self, name, 100 + i)
+        for name in ("alSource3f", "alSourcePause", "alListener3f", "alListenerf", "alDeleteSources",
+                     "alDeleteBuffers"):
+            setattr(self, name, lambda *args: None)
+
+    def _source(self, source_id):
+        return self.sources.setdefault(source_id, {"buffer": 0, "loop": False, "start": None,
+                                                   "offset": 0.0, "pitch": 1.0})
+
+    def alSourcei(self, source_id, param, value):
+        if param == self.AL_BUFFER:
+            self._source(source_id)["buffer"] = value
+        elif param == self.AL_LOOPING:
+            self._source(source_id)["loop"] = value == self.AL_TRUE
+
+    def alSourcef(self, source_id, param, value):
+        if param == self.AL_SEC_OFFSET:
+            self._source(source_id)["offset"] = value
+        elif param == self.AL_PITCH:
+            self._source(source_id)["pitch"] = value
+
+    def alSourcePlay(self, source_id):
+        self._source(source_id)["start"] = self.now
+
+    def alSourceStop(self, source_id):
+        source = self._source(source_id)
+        source["start"] = None
+        source["offset"] = 0.0
+
+    def alGetSourcei(self, source_id, param, ref):
+        source = self._source(source_id)
+        playing = False
+        if source["start"] is not None:
+            position = (self.now - source["start"]) * source["pitch"] + source["offset"]
+            playing = source["loop"] or position < self.durations.get(source["buffer"], 0.0)
+            if not playing:
+                source["start"] = None
+                source["offset"] = 0.0
+        ref._obj.value = self.AL_PLAYING if playing else self.AL_STOPPED
+
+
+def main():
+    al = SimulatedOpenAL()
+    module = types.ModuleType("openal")
+    module.al = al
+    module.alc = types.SimpleNamespace()
+    sys.modules["openal"] = module
+
+    import core.openal_audio as openal_audio
+    openal_audio.time = types.SimpleNamespace(perf_counter=lambda: al.now, time=lambda: al.now)
+    openal_audio.OpenALAudioSystem.initialize = lambda self: self.available_sources.extend(range(1, SOURCES + 1))
+    system = openal_audio.OpenALAudioSystem()
+
+    has_priorities = hasattr(system, "set_sound_settings")
+    for buffer_id, (name, _, duration, priority, max_instances) in enumerate(KINDS, start=1):
+        al.durations[buffer_id] = duration
+        system.buffers[name] = openal_audio.AudioBuffer(buffer_id, duration)
+        if has_priorities:
+            system.set_sound_settings(name, priority, max_instances)
+    al.durations[99] = 10.0
+    system.buffers["ambient"] = openal_audio.AudioBuffer(99, 10.0)
+    if has_priorities:
+        system.set_sound_settings("ambient", 40)
+
+    random.seed(7)
+    for _ in range(4):
+        system.play_sound("ambient", loop=True, x=random.uniform(-300, 300), y=random.uniform(-300, 300))
+
+    fired = {kind[0]: 0 for kind in KINDS}
+    rejected = {kind[0]: 0 for kind in KINDS}
+    voices = []
+    heard = set()
+    update_time = 0.0
+    due = 0.0
+    for frame in range(FPS * SECONDS):
+        al.now = frame / FPS
+        due += SOUNDS_PER_SECOND / FPS
+        while due >= 1:
+            due -= 1
+            roll = random.random()
+            share_total = 0.0
+            for name, share, *_ in KINDS:
+                share_total += share
+                if roll < share_total:
+                    break
+            fired[name] += 1
+            if name == "ui_click":
+                x = y = 0.0
+            else:
+                x, y = random.uniform(-1500, 1500), random.uniform(-1500, 1500)
+            voice = system.play_sound(name, volume=random.uniform(0.5, 1.0), x=x, y=y)
+            if voice is None:
+                rejected[name] += 1
+            else:
+                voices.append((name, voice))
+        start = time.perf_counter()
+        system.update()
+        update_time += time.perf_counter() - start
+        for _, voice in voices:
+            if voice.id is not None:
+                heard.add(id(voice))
+
+    print(f"{'sound':10s} {'fired':>6s} {'rejected':>9s} {'never heard':>12s}")
+    for name, *_ in KINDS:
+        never_heard = sum(1 for kind, voice in voices if kind == name and id(voice) not in heard)
+        print(f"{name:10s} {fired[name]:6d} {rejected[name]:9d} {never_heard:12d}")
+    if has_priorities:
+        print("voice statistics:", system.get_voice_statistics())
+    print(f"update(): {update_time / (FPS * SECONDS) * 1e6:.0f} us/frame on average")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+benchmarks/scene_streaming.py
+
+Worst frame time while switching to a large level: a synchronous
+Scene.load_from_file against SceneStreamer. The level has 12,500 nodes
+(2,500 static bodies with sprites, shapes and decorations) and 24 512x512
+PNG textures. Each frame does ~3 ms of stand-in game work and is paced to
+60 fps. Textures are decoded for real; "upload" copies the bytes because
+there is no GL context here.
+
+Usage: python benchmarks/scene_streaming.py [sync] [stream]
+"""
+
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image
+
+from core.physics import PhysicsWorld
+from core.scene.scene_manager import Scene
+from core.scene.scene_streamer import SceneStreamer
+from core.shared_renderer import SharedRenderer
+
+LEVEL_GROUPS = 2500  # 5 nodes each
+TEXTURES = 24
+
+
+def _node(name, node_type, properties=None, children=(), **extra):
+    data = {"name": name, "type": node_type, "properties": properties or {}, "children": list(children),
+            "position": [random.uniform(-3000, 3000), random.uniform(-3000, 3000)],
+            "rotation": 0.0, "scale": [1.0, 1.0]}
+    data.update(extra)
+    return data
+
+
+def write_project(root: Path) -> None:
+    """Write the level and its textures under root"""
+    random.seed(4)
+    (root / "assets").mkdir()
+    (root / "scenes").mkdir()
+    for i in range(TEXTURES):
+        Image.new("RGBA", (512, 512), (i * 10, 80, 160, 255)).save(root / "assets" / f"tex{i}.png")
+    nodes = []
+    for g in range(LEVEL_GROUPS):
+        nodes.append(_node(f"Crate{g}", "StaticBody2D", {}, [
+            _node("Sprite", "Sprite", {}, texture=f"assets/tex{g % TEXTURES}.png"),
+            _node("Shape", "CollisionShape2D", {"shape": "rectangle", "size": [32.0, 32.0]}),
+            _node("Deco", "Node2D", {"tag": "deco"}, [
+                _node("Glow", "Sprite", {}, texture=f"assets/tex{(g + 1) % TEXTURES}.png")])]))
+    with open(root / "scenes" / "level.scene", "w") as f:
+        json.dump({"name": "Level", "nodes": nodes}, f)
+
+
+class Renderer:
+    """SharedRenderer's decode path with a CPU-side upload"""
+    decode_texture = SharedRenderer.decode_texture
+    _decode_texture_pil = staticmethod(SharedRenderer._decode_texture_pil)
+
+    def __init__(self, project_path: Path):
+        self.project_path = project_path
+        self.texture_cache = {}
+
+    def upload_texture(self, path, decoded):
+        self.texture_cache[path] = bytearray(decoded[2])
+
+    def load_texture(self, path):
+        if path not in self.texture_cache:
+            self.upload_texture(path, self.decode_texture(path))
+
+
+def run(mode: str, root: Path, frames: int = 900) -> str:
+    world = PhysicsWorld()
+    renderer = Renderer(root)
+
+    def setup_node(node):
+        """Stand-in for LupineGameEngine._setup_node"""
+        if node.type == "StaticBody2D":
+            world.add_node(node)
+        texture = node.properties.get("texture") or getattr(node, "texture", None)
+        if texture:
+            renderer.load_texture(texture)
+        node._ready()
+
+    streamer = None
+    if mode == "stream":
+        streamer = SceneStreamer(path_resolver=lambda p: root / p, renderer=renderer, node_finalizer=setup_node)
+    done = {}
+    current = [0]
+    frame_times = []
+    for frame in range(frames):
+        current[0] = frame
+        start = time.perf_counter()
+        if frame == 30:
+            if streamer is None:
+                scene = Scene.load_from_file(str(root / "scenes" / "level.scene"))
+                stack = list(scene.root_nodes)
+                while stack:
+                    node = stack.pop()
+                    setup_node(node)
+                    stack.extend(node.children)
+                done["frame"] = frame
+            else:
+                streamer.load("scenes/level.scene", callback=lambda s, e, r: done.setdefault("frame", current[0]))
+        if streamer is not None:
+            streamer.update()
+        while time.perf_counter() - start < 0.003:
+            pass
+        frame_times.append(time.perf_counter() - start)
+        if "frame" in done and frame > done["frame"] + 5:
+            break
+        rest = 1 / 60 - (time.perf_counter() - start)
+        if rest > 0:
+            time.sleep(rest)
+    if streamer is not None:
+        streamer.shutdown()
+
+    frame_times.sort()
+    ready = done["frame"] - 30 if "frame" in done else "never"
+    return (f"{mode:6s}: level ready after {ready} frames, worst frame {frame_times[-1] * 1000:.1f} ms, "
+            f"p99 {frame_times[int(len(frame_times) * 0.99)] * 1000:.1f} ms, "
+            f"frames over 20 ms: {sum(t > 0.02 for t in frame_times)}")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        write_project(root)
+        with contextlib.redirect_stdout(io.StringIO()):
+            Scene.load_from_file(str(root / "scenes" / "level.scene"))  # Warm imports and caches
+        for mode in sys.argv[1:] or ["sync", "stream"]:
+            with contextlib.redirect_stdout(io.StringIO()):
+                result = run(mode, root)
+            print(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,10 @@ from .animation_track import (
     AnimationTrack, PropertyTrack, SpriteFrameTrack,
     TransformTrack, ColorTrack, AudioTrack
 )
-from .tween import Tween, TweenType, EaseType
+from .tween import Tween, TweenType, EaseType, get_easing_function
+from .baked_curve import BakedCurve
+from .tween_manager import TweenManager
+from .animation_lod import AnimationLOD
 from .animation_player import (
     create_simple_tween_animation, create_fade_animation, create_move_animation,
     create_scale_animation, create_rotation_animation, create_sprite_frame_animation,
@@ -26,8 +29,12 @@ __all__ = [
     'ColorTrack',
     'AudioTrack',
     'Tween',
+    'BakedCurve',
+    'TweenManager',
+    'AnimationLOD',
     'TweenType',
     'EaseType',
+    'get_easing_function',
     'create_simple_tween_animation',
     'create_fade_animation',
     'create_move_animation',
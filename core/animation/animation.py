@@ -3,11 +3,14 @@ Animation class for Lupine Engine
 Manages animation tracks, playback, and timing
 """
 
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Tuple
 import time
 import copy
 
 from .animation_track import AnimationTrack, create_track_from_dict
+from .baked_curve import DEFAULT_BAKE_RATE, DEFAULT_BAKE_TOLERANCE
+from .keyframe_reduction import DEFAULT_REDUCE_TOLERANCE
+from ..scene.base_node import get_tree_version
 
 
 class Animation:
@@ -28,6 +31,15 @@ class Animation:
         self.is_playing = False
         self.current_time = 0.0
         self.last_update_time = 0.0
+        self._cursors: Dict[AnimationTrack, int] = {}  # Track -> keyframe index of the last sample
+
+        # Tracks resolved to setters on their target nodes (see bind)
+        self._bindings: Optional[List[Tuple[AnimationTrack, Callable[[Any], None]]]] = None
+        self._offscreen_bindings: List[Tuple[AnimationTrack, Callable[[Any], None]]] = []  # See runs_offscreen
+        self._bound_targets: List[Tuple[Any, str]] = []  # (target node, its path when bound)
+        self._bound_root = None
+        self._bound_version = -1
+        self._unbound_tracks: List[AnimationTrack] = []  # Tracks whose target was missing
         
         # Events
         self.on_animation_finished: Optional[Callable] = None
@@ -36,12 +48,15 @@ class Animation:
     def add_track(self, track: AnimationTrack):
         """Add an animation track"""
         self.tracks.append(track)
+        self._bindings = None
         self._update_length()
     
     def remove_track(self, track: AnimationTrack) -> bool:
         """Remove an animation track"""
         if track in self.tracks:
             self.tracks.remove(track)
+            self._cursors.pop(track, None)
+            self._bindings = None
             self._update_length()
             return True
         return False
@@ -53,6 +68,17 @@ class Animation:
                 return track
         return None
     
+    def bake(self, rate: float = DEFAULT_BAKE_RATE, tolerance: float = DEFAULT_BAKE_TOLERANCE) -> int:
+        """Bake every track that can be baked (see AnimationTrack.bake); returns the number baked"""
+        return sum(1 for track in self.tracks if track.bake(rate, tolerance))
+
+    def reduce_keyframes(self, tolerance: float = DEFAULT_REDUCE_TOLERANCE, change_easing: bool = True) -> int:
+        """Remove redundant keyframes from every track (see AnimationTrack.reduce_keyframes); returns the number removed"""
+        removed = sum(track.reduce_keyframes(tolerance, change_easing) for track in self.tracks)
+        if removed:
+            self._cursors.clear()
+        return removed
+
     def get_tracks_for_target(self, target_path: str) -> List[AnimationTrack]:
         """Get all tracks for a specific target"""
         return [track for track in self.tracks if track.target_path == target_path]
@@ -81,6 +107,7 @@ class Animation:
         """Stop the animation"""
         self.is_playing = False
         self.current_time = 0.0
+        self.unbind()
     
     def pause(self):
         """Pause the animation"""
@@ -122,24 +149,82 @@ class Animation:
                 if self.on_animation_finished:
                     self.on_animation_finished()
     
-    def apply_to_scene(self, scene_root):
-        """Apply current animation state to scene nodes"""
-        for track in self.tracks:
+    def apply_to_scene(self, scene_root, visual: bool = True):
+        """
+        Apply current animation state to scene nodes. With visual=False
+        only the tracks that run off-screen (audio and transforms, see
+        AnimationTrack.runs_offscreen) are applied; sampling by time lets the
+        other visual tracks catch up on the next full apply.
+        """
+        if self._bindings is None or scene_root is not self._bound_root:
+            self.bind(scene_root)
+        elif self._bound_version != get_tree_version():
+            self._revalidate(scene_root)
+
+        current_time = self.current_time
+        cursors = self._cursors
+        for track, setter in (self._bindings if visual else self._offscreen_bindings):
             if not track.enabled:
                 continue
             
-            # Find target node
-            target_node = self._find_node_by_path(scene_root, track.target_path)
-            if target_node is None:
-                continue
-            
-            # Get value at current time and apply it
-            value = track.get_value_at_time(self.current_time)
+            # Get value at current time and apply it; the cursor makes forward playback O(1)
+            baked = track.baked
+            if baked is not None:
+                value = baked.sample(current_time)
+            else:
+                index = track.find_keyframe_index(current_time, cursors.get(track, -1))
+                cursors[track] = index
+                value = track.get_value_at_index(current_time, index)
             if value is not None:
                 try:
-                    track.apply_value(target_node, value)
+                    setter(value)
                 except Exception as e:
                     print(f"Error applying animation value: {e}")
+
+    def bind(self, scene_root):
+        """
+        Resolve each track's target node and setter under a scene root.
+        apply_to_scene() reuses the result until the root changes, or the
+        tree structure changed in a way that moved a bound target.
+        """
+        bindings = []
+        targets = []
+        unbound = []
+        for track in self.tracks:
+            target_node = self._find_node_by_path(scene_root, track.target_path)
+            setter = track.get_setter(target_node) if target_node is not None else None
+            if setter is None:
+                unbound.append(track)
+                continue
+            bindings.append((track, setter))
+            targets.append((target_node, target_node.get_path()))
+
+        self._bindings = bindings
+        self._offscreen_bindings = [binding for binding in bindings if binding[0].runs_offscreen()]
+        self._bound_targets = targets
+        self._bound_root = scene_root
+        self._bound_version = get_tree_version()
+        self._unbound_tracks = unbound
+
+    def unbind(self):
+        """Drop the resolved track targets"""
+        self._bindings = None
+        self._offscreen_bindings = []
+        self._bound_targets = []
+        self._bound_root = None
+
+    def _revalidate(self, scene_root):
+        """After a tree change, rebind only if a target moved or a missing target appeared"""
+        for track in self._unbound_tracks:
+            target_node = self._find_node_by_path(scene_root, track.target_path)
+            if target_node is not None and track.get_setter(target_node) is not None:
+                self.bind(scene_root)
+                return
+        for target_node, path in self._bound_targets:
+            if target_node.get_path() != path:  # Cached per node until it or an ancestor moves
+                self.bind(scene_root)
+                return
+        self._bound_version = get_tree_version()
     
     def _find_node_by_path(self, root_node, path: str):
         """Find node by path string (e.g., 'Player/Sprite')"""
@@ -153,7 +238,13 @@ class Animation:
             if not part:  # Skip empty parts
                 continue
             
-            # Look for child with matching name
+            # Look for child with matching name (indexed by name on scene nodes)
+            if hasattr(current_node, 'get_child'):
+                current_node = current_node.get_child(part)
+                if current_node is None:
+                    return None
+                continue
+
             found = False
             if hasattr(current_node, 'children'):
                 for child in current_node.children:
@@ -188,15 +279,15 @@ class Animation:
         
         return new_animation
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert animation to dictionary for serialization"""
+    def to_dict(self, compact: bool = False, precision: Optional[int] = None) -> Dict[str, Any]:
+        """Convert animation to dictionary for serialization (see AnimationTrack.to_dict for compact/precision)"""
         return {
             "name": self.name,
             "length": self.length,
             "loop": self.loop,
             "autoplay": self.autoplay,
             "speed_scale": self.speed_scale,
-            "tracks": [track.to_dict() for track in self.tracks]
+            "tracks": [track.to_dict(compact, precision) for track in self.tracks]
         }
     
     @classmethod
@@ -263,11 +354,15 @@ class AnimationLibrary:
         self.animations.clear()
         self.default_animation = None
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert library to dictionary for serialization"""
+    def reduce_keyframes(self, tolerance: float = DEFAULT_REDUCE_TOLERANCE, change_easing: bool = True) -> int:
+        """Remove redundant keyframes from every animation; returns the number removed"""
+        return sum(animation.reduce_keyframes(tolerance, change_easing) for animation in self.animations.values())
+
+    def to_dict(self, compact: bool = False, precision: Optional[int] = None) -> Dict[str, Any]:
+        """Convert library to dictionary for serialization (see AnimationTrack.to_dict for compact/precision)"""
         return {
             "default_animation": self.default_animation,
-            "animations": {name: anim.to_dict() for name, anim in self.animations.items()}
+            "animations": {name: anim.to_dict(compact, precision) for name, anim in self.animations.items()}
         }
     
     @classmethod
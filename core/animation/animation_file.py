@@ -0,0 +1,43 @@
+"""
+Animation files for Lupine Engine
+Reads and writes .anim files (a JSON AnimationLibrary). Files are written
+compact: packed keyframe lists and no indentation. Both the packed and the
+older verbose keyframe format load.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+from .animation import AnimationLibrary
+from .keyframe_reduction import DEFAULT_REDUCE_TOLERANCE
+
+
+def load_animation_library(animation_path: Union[str, Path]) -> AnimationLibrary:
+    """Load an animation library from an .anim file"""
+    with open(animation_path, "r", encoding="utf-8") as f:
+        return AnimationLibrary.from_dict(json.load(f))
+
+
+def save_animation_library(library: AnimationLibrary, animation_path: Union[str, Path],
+                           compact: bool = True, precision: Optional[int] = None):
+    """Write an animation library to an .anim file (compact=False writes the verbose, indented format)"""
+    Path(animation_path).parent.mkdir(parents=True, exist_ok=True)
+    data = library.to_dict(compact, precision)
+    temp_path = str(animation_path) + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        if compact:
+            json.dump(data, f, separators=(",", ":"))
+        else:
+            json.dump(data, f, indent=2)
+    os.replace(temp_path, animation_path)
+
+
+def compact_animation_file(animation_path: Union[str, Path], tolerance: float = DEFAULT_REDUCE_TOLERANCE,
+                           precision: Optional[int] = None) -> int:
+    """Build step: reduce the keyframes of an .anim file and rewrite it compact; returns the keyframes removed"""
+    library = load_animation_library(animation_path)
+    removed = library.reduce_keyframes(tolerance) if tolerance > 0 else 0
+    save_animation_library(library, animation_path, True, precision)
+    return removed
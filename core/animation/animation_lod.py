@@ -0,0 +1,222 @@
+"""
+Animation level of detail for Lupine Engine
+Decides how often animated nodes update from their visibility and size on
+screen under the active camera. Small nodes update every few frames with
+the skipped time accumulated, off-screen nodes pause their visual work,
+and a node that comes back into view catches up on its next frame.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..scene.base_node import get_tree_version
+from ..scene.node2d import Node2D
+
+
+LOD_FULL = 0  # Visible and large enough: update every frame
+LOD_REDUCED = 1  # Small on screen
+LOD_MINIMAL = 2  # Tiny on screen
+LOD_OFFSCREEN = 3  # Outside the view: visual updates paused
+
+LOD_LEVEL_NAMES = ("full", "reduced", "minimal", "offscreen")
+
+
+class AnimationLOD:
+    """
+    Per-frame LOD decisions for AnimationPlayer and AnimatedSprite nodes.
+    A node is measured at its nearest Node2D (itself or an ancestor): its
+    sprite size, or default_size world units, times its global scale. An
+    AnimationPlayer is measured at the nodes its current animation is bound
+    to instead and gets the most detailed level among them. Anchors and
+    their unscaled sizes are cached until the tree or the bindings change.
+    An off-screen node is only measured again every off-screen interval
+    (staggered like its updates) while the view moved less than the margin,
+    since its moving anchors would otherwise need their global transforms
+    recomputed every frame; a node moving into view is noticed within that
+    interval.
+
+    Example:
+        lod = AnimationLOD()
+        set_animation_lod(lod)
+        # each frame, before processing nodes:
+        lod.set_camera(camera, (1280, 720))
+        lod.begin_frame()
+    """
+
+    def __init__(self, reduced_size: float = 32.0, minimal_size: float = 8.0, margin: float = 64.0,
+                 intervals: Sequence[int] = (1, 2, 4, 8), default_size: float = 64.0):
+        self.enabled = True
+        self.reduced_size = reduced_size  # On-screen pixels below which updates are halved
+        self.minimal_size = minimal_size  # On-screen pixels below which updates are quartered
+        self.margin = margin  # World units around the view still treated as visible
+        self.intervals = list(intervals)  # Frames between updates per LOD level
+        self.default_size = default_size
+
+        self.view_rect: Optional[Tuple[float, float, float, float]] = None  # left, top, right, bottom; None: all visible
+        self.pixels_per_unit = 1.0
+        self.frame = 0
+
+        self._stats = self._new_stats()
+        self._last_stats = self._new_stats()
+
+    # View
+    def set_view(self, left: float, top: float, width: float, height: float, pixels_per_unit: float = 1.0):
+        """Set the visible world rectangle and its screen scale"""
+        self.view_rect = (left, top, left + width, top + height)
+        self.pixels_per_unit = pixels_per_unit
+
+    def set_camera(self, camera: Any, viewport_size: Sequence[float]):
+        """Set the view from a Camera2D node"""
+        zoom = getattr(camera, 'zoom', 1.0)
+        if isinstance(zoom, (list, tuple)):
+            zoom_x, zoom_y = zoom[0], zoom[1]
+        else:
+            zoom_x = zoom_y = zoom
+        zoom_x = zoom_x or 1.0
+        zoom_y = zoom_y or 1.0
+
+        if hasattr(camera, 'get_camera_position'):
+            center = camera.get_camera_position()
+        else:
+            center = camera.get_global_position()
+        width = viewport_size[0] / zoom_x
+        height = viewport_size[1] / zoom_y
+        self.set_view(center[0] - width / 2, center[1] - height / 2, width, height, min(zoom_x, zoom_y))
+
+    def clear_view(self):
+        """Treat everything as visible"""
+        self.view_rect = None
+
+    def begin_frame(self):
+        """Start a new frame; call once before nodes process"""
+        self.frame += 1
+        self._last_stats = self._stats
+        self._stats = self._new_stats()
+
+    # Decisions
+    def get_level(self, node: Any, targets: Optional[Sequence[Tuple[Any, str]]] = None) -> int:
+        """Get the LOD level of an animated node this frame, measured at its bound (node, path) targets if given"""
+        view = self.view_rect
+        if not self.enabled or view is None:
+            return LOD_FULL
+
+        cache = node._lod_cache
+        version = get_tree_version()
+        if cache is None or cache[0] != version or cache[1] is not targets:
+            cache = node._lod_cache = [version, targets, self._find_anchors(node, targets), LOD_FULL, view]
+        elif cache[3] == LOD_OFFSCREEN:
+            interval = self.intervals[LOD_OFFSCREEN]
+            measured, margin = cache[4], self.margin
+            if (interval > 1 and (self.frame + (id(node) >> 4)) % interval
+                    and abs(view[0] - measured[0]) < margin and abs(view[1] - measured[1]) < margin
+                    and abs(view[2] - measured[2]) < margin and abs(view[3] - measured[3]) < margin):
+                return LOD_OFFSCREEN
+        cache[3] = level = self._measure(cache[2], view)
+        cache[4] = view
+        return level
+
+    def _measure(self, anchors: List[Tuple[Any, float]], view: Tuple[float, float, float, float]) -> int:
+        """Get the LOD level of a set of anchors under the view"""
+        if not anchors:
+            return LOD_FULL
+
+        # Visible if any anchor is; as detailed as the largest visible anchor
+        size = -1.0
+        margin = self.margin
+        for anchor, base_size in anchors:
+            position, _, scale = anchor._get_global_transform()
+            scale_x, scale_y = abs(scale[0]), abs(scale[1])
+            anchor_size = base_size * (scale_x if scale_x > scale_y else scale_y)
+            reach = anchor_size * 0.5 + margin
+            x, y = position[0], position[1]
+            if x + reach < view[0] or x - reach > view[2] or y + reach < view[1] or y - reach > view[3]:
+                continue
+            if anchor_size > size:
+                size = anchor_size
+        if size < 0.0:
+            return LOD_OFFSCREEN
+
+        screen_size = size * self.pixels_per_unit
+        if screen_size >= self.reduced_size:
+            return LOD_FULL
+        if screen_size >= self.minimal_size:
+            return LOD_REDUCED
+        return LOD_MINIMAL
+
+    def _find_anchors(self, node: Any, targets: Optional[Sequence[Tuple[Any, str]]]) -> List[Tuple[Any, float]]:
+        """Get the distinct Node2D anchors (with unscaled sizes) of a node's bound targets, or of the node itself"""
+        anchors = []
+        seen = set()
+        for target in ([target for target, _ in targets] if targets else [node]):
+            anchor = target
+            while anchor is not None and not isinstance(anchor, Node2D):
+                anchor = anchor.parent
+            if anchor is not None and id(anchor) not in seen:
+                seen.add(id(anchor))
+                anchors.append((anchor, self._get_size(anchor)))
+        return anchors
+
+    def step(self, node: Any, delta: float, level: int) -> Optional[float]:
+        """
+        Accumulate a node's frame time. Returns the time to advance it by
+        this frame, or None to skip it. Nodes are staggered so skipped
+        updates spread evenly over frames.
+        """
+        self._stats["levels"][level] += 1
+        interval = self.intervals[level]
+        if interval > 1 and (self.frame + (id(node) >> 4)) % interval:
+            node._lod_delta += delta
+            self._stats["skipped"] += 1
+            return None
+        return self.flush(node, delta)
+
+    def flush(self, node: Any, delta: float) -> float:
+        """Take a node's accumulated time plus this frame's delta"""
+        pending = node._lod_delta
+        if pending:
+            node._lod_delta = 0.0
+            delta += pending
+        self._stats["updated"] += 1
+        return delta
+
+    def count_offscreen(self):
+        """Record a node that only ran its non-visual work this frame"""
+        self._stats["levels"][LOD_OFFSCREEN] += 1
+        self._stats["offscreen"] += 1
+
+    # Statistics
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get the decisions of the last complete frame"""
+        stats = self._last_stats
+        return {
+            'updated': stats["updated"],
+            'skipped': stats["skipped"],
+            'offscreen': stats["offscreen"],
+            'levels': dict(zip(LOD_LEVEL_NAMES, stats["levels"])),
+        }
+
+    def _get_size(self, anchor: Any) -> float:
+        """Get the world size of a node before scaling"""
+        if getattr(anchor, '_texture_loaded', False):
+            if anchor.region_enabled and anchor.region_rect[2] > 0:
+                return max(anchor.region_rect[2], anchor.region_rect[3])
+            texture_size = anchor._texture_size
+            return max(texture_size[0], texture_size[1])
+        return getattr(anchor, 'lod_size', None) or self.default_size
+
+    @staticmethod
+    def _new_stats() -> Dict[str, Any]:
+        return {"updated": 0, "skipped": 0, "offscreen": 0, "levels": [0, 0, 0, 0]}
+
+
+_active_lod: Optional[AnimationLOD] = None
+
+
+def set_animation_lod(lod: Optional[AnimationLOD]):
+    """Set the LOD used by animated nodes (None: always update fully)"""
+    global _active_lod
+    _active_lod = lod
+
+
+def get_animation_lod() -> Optional[AnimationLOD]:
+    """Get the LOD used by animated nodes, if any"""
+    return _active_lod
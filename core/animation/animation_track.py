@@ -3,24 +3,52 @@ Animation track classes for Lupine Engine
 Handles different types of animated properties and keyframes
 """
 
-from typing import Any, Dict, List, Optional, Union, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union, Tuple
 from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from functools import partial
 import copy
 
-from .tween import Tween, TweenType, EaseType
+from .tween import Tween, TweenType, EaseType, get_easing_function
+from .baked_curve import BakedCurve, bake_track, DEFAULT_BAKE_RATE, DEFAULT_BAKE_TOLERANCE
+from .keyframe_reduction import reduce_track, DEFAULT_REDUCE_TOLERANCE
+
+
+_TWEEN_TYPES = {tween_type.value: tween_type for tween_type in TweenType}
+_EASE_TYPES = {ease_type.value: ease_type for ease_type in EaseType}
 
 
 class Keyframe:
     """
     Represents a single keyframe in an animation track
+    The easing function for its tween and ease types is resolved when they are set
     """
     
     def __init__(self, time: float, value: Any, tween_type: TweenType = TweenType.LINEAR, 
                  ease_type: EaseType = EaseType.IN_OUT):
         self.time = time
         self.value = value
-        self.tween_type = tween_type
-        self.ease_type = ease_type
+        self._tween_type = tween_type
+        self._ease_type = ease_type
+        self.easing = get_easing_function(tween_type, ease_type)
+
+    @property
+    def tween_type(self) -> TweenType:
+        return self._tween_type
+
+    @tween_type.setter
+    def tween_type(self, value: TweenType):
+        self._tween_type = value
+        self.easing = get_easing_function(value, self._ease_type)
+
+    @property
+    def ease_type(self) -> EaseType:
+        return self._ease_type
+
+    @ease_type.setter
+    def ease_type(self, value: EaseType):
+        self._ease_type = value
+        self.easing = get_easing_function(self._tween_type, value)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert keyframe to dictionary for serialization"""
@@ -42,131 +70,256 @@ class Keyframe:
         )
 
 
+# Properties that move a node, so they are applied even while it is off-screen
+OFFSCREEN_PROPERTIES = frozenset(("position", "rotation", "scale", "global_position", "global_rotation",
+                                  "global_scale", "rect_position", "rect_size", "rect_scale", "size"))
+
+
 class AnimationTrack(ABC):
     """
     Base class for animation tracks
     Handles keyframes and interpolation for a specific property
+
+    Keyframes are kept sorted by time, with a parallel list of their times
+    for binary search. Code that edits Keyframe.time directly should call
+    sort_keyframes() afterwards.
+
+    A baked track (see bake) samples a fixed-rate curve instead of the
+    keyframes; changing keyframes through the track API drops the bake.
     """
+
+    bakeable = True  # False for tracks whose keyframes are events rather than a curve
+    visual = True  # False for tracks that must keep running while their node is off-screen
     
     def __init__(self, target_path: str, property_name: str):
         self.target_path = target_path  # Node path (e.g., "Player/Sprite")
         self.property_name = property_name  # Property name (e.g., "position")
         self.keyframes: List[Keyframe] = []
         self.enabled = True
+        self.baked: Optional[BakedCurve] = None
+        self._times: List[float] = []  # keyframes[i].time, sorted
     
+    def runs_offscreen(self) -> bool:
+        """
+        Check whether the track keeps applying while its node is off-screen:
+        non-visual tracks, and transform tracks, which can bring it into view
+        """
+        return not self.visual or self.property_name in OFFSCREEN_PROPERTIES
+
     def add_keyframe(self, time: float, value: Any, tween_type: TweenType = TweenType.LINEAR,
                     ease_type: EaseType = EaseType.IN_OUT) -> Keyframe:
         """Add a keyframe to the track"""
         keyframe = Keyframe(time, value, tween_type, ease_type)
+        times = self._get_times()
+        self.baked = None
         
         # Insert keyframe in chronological order
-        inserted = False
-        for i, existing_kf in enumerate(self.keyframes):
-            if existing_kf.time > time:
-                self.keyframes.insert(i, keyframe)
-                inserted = True
-                break
-            elif existing_kf.time == time:
-                # Replace existing keyframe at same time
-                self.keyframes[i] = keyframe
-                inserted = True
-                break
-        
-        if not inserted:
-            self.keyframes.append(keyframe)
+        i = bisect_left(times, time)
+        if i < len(times) and times[i] == time:
+            # Replace existing keyframe at same time
+            self.keyframes[i] = keyframe
+        else:
+            self.keyframes.insert(i, keyframe)
+            times.insert(i, time)
         
         return keyframe
+
+    def add_keyframes(self, keyframes: Iterable[Union[Keyframe, Tuple]]) -> int:
+        """
+        Add many keyframes at once, sorting only once. Items are Keyframes or
+        (time, value[, tween_type, ease_type]) tuples; as with add_keyframe, a
+        later keyframe replaces an earlier one at the same time.
+        Returns the number of keyframes on the track afterwards.
+        """
+        merged = self.keyframes + [kf if isinstance(kf, Keyframe) else Keyframe(*kf) for kf in keyframes]
+        merged.sort(key=lambda kf: kf.time)  # Stable: same-time keyframes keep their insertion order
+
+        unique: List[Keyframe] = []
+        for keyframe in merged:
+            if unique and unique[-1].time == keyframe.time:
+                unique[-1] = keyframe
+            else:
+                unique.append(keyframe)
+
+        self.keyframes[:] = unique
+        self._times = [kf.time for kf in unique]
+        self.baked = None
+        return len(unique)
+
+    def sort_keyframes(self):
+        """Re-sort the keyframes after their times were edited in place"""
+        self.add_keyframes([])
     
     def remove_keyframe(self, time: float) -> bool:
         """Remove keyframe at specific time"""
-        for i, keyframe in enumerate(self.keyframes):
-            if abs(keyframe.time - time) < 0.001:  # Small tolerance for float comparison
-                del self.keyframes[i]
-                return True
-        return False
+        i = self._find_near(time)
+        if i < 0:
+            return False
+        del self.keyframes[i]
+        del self._times[i]
+        self.baked = None
+        return True
     
     def get_keyframe_at_time(self, time: float) -> Optional[Keyframe]:
         """Get keyframe at specific time"""
-        for keyframe in self.keyframes:
-            if abs(keyframe.time - time) < 0.001:
-                return keyframe
-        return None
+        i = self._find_near(time)
+        return self.keyframes[i] if i >= 0 else None
+
+    def find_keyframe_index(self, time: float, hint: int = -1) -> int:
+        """
+        Get the index of the last keyframe at or before a time (-1 if the time
+        is before the first keyframe). `hint` is a previous result for this
+        track, e.g. a playback cursor: it is checked first, then the next
+        keyframe, so forward playback usually avoids the binary search.
+        """
+        times = self._get_times()
+        count = len(times)
+        if 0 <= hint < count and times[hint] <= time:
+            if hint + 1 == count or time < times[hint + 1]:
+                return hint
+            if hint + 2 == count or time < times[hint + 2]:
+                return hint + 1
+        return bisect_right(times, time) - 1
     
     def get_value_at_time(self, time: float) -> Any:
         """Get interpolated value at specific time"""
-        if not self.keyframes:
+        if self.baked is not None:
+            return self.baked.sample(time)
+        return self.get_value_at_index(time, self.find_keyframe_index(time))
+
+    def bake(self, rate: float = DEFAULT_BAKE_RATE, tolerance: float = DEFAULT_BAKE_TOLERANCE) -> bool:
+        """
+        Sample the keyframe curve at a fixed rate for constant-time playback.
+        Returns False (and keeps sampling keyframes) if the track isn't
+        numeric or the curve can't be baked within tolerance.
+        """
+        self.baked = None
+        if self.bakeable:
+            self.baked = bake_track(self, rate, tolerance)
+        return self.baked is not None
+
+    def reduce_keyframes(self, tolerance: float = DEFAULT_REDUCE_TOLERANCE, change_easing: bool = True) -> int:
+        """Remove keyframes reproducible within tolerance (see keyframe_reduction); returns the number removed"""
+        return reduce_track(self, tolerance, change_easing)
+
+    def get_value_at_index(self, time: float, index: int) -> Any:
+        """Get the value at a time, given its find_keyframe_index() result"""
+        keyframes = self.keyframes
+        if not keyframes:
             return None
         
-        # Find surrounding keyframes
-        before_kf = None
-        after_kf = None
-        
-        for keyframe in self.keyframes:
-            if keyframe.time <= time:
-                before_kf = keyframe
-            elif keyframe.time > time and after_kf is None:
-                after_kf = keyframe
-                break
-        
         # Handle edge cases
-        if before_kf is None:
-            return self.keyframes[0].value
-        if after_kf is None:
+        if index < 0:
+            return keyframes[0].value
+        before_kf = keyframes[index]
+        if index + 1 == len(keyframes):
             return before_kf.value
+        after_kf = keyframes[index + 1]
         if before_kf.time == after_kf.time:
             return before_kf.value
         
         # Interpolate between keyframes
         progress = (time - before_kf.time) / (after_kf.time - before_kf.time)
         return self._interpolate_value(before_kf, after_kf, progress)
+
+    def _get_times(self) -> List[float]:
+        """Get the sorted keyframe times, rebuilding them if keyframes was changed directly"""
+        times = self._times
+        if len(times) != len(self.keyframes):
+            self.sort_keyframes()
+            times = self._times
+        return times
+
+    def _find_near(self, time: float) -> int:
+        """Get the index of the first keyframe within 1 ms of a time, or -1"""
+        times = self._get_times()
+        i = bisect_left(times, time - 0.001)
+        if i < len(times) and abs(times[i] - time) < 0.001:  # Small tolerance for float comparison
+            return i
+        return -1
     
     def _interpolate_value(self, start_kf: Keyframe, end_kf: Keyframe, progress: float) -> Any:
         """Interpolate between two keyframes"""
-        return Tween.interpolate(
-            start_kf.value, 
-            end_kf.value, 
-            progress, 
-            start_kf.tween_type, 
-            start_kf.ease_type
-        )
+        return Tween._lerp_value(start_kf.value, end_kf.value, start_kf.easing(max(0.0, min(1.0, progress))))
     
     def get_duration(self) -> float:
         """Get total duration of the track"""
-        if not self.keyframes:
-            return 0.0
-        return max(kf.time for kf in self.keyframes)
+        times = self._get_times()
+        return times[-1] if times else 0.0
     
     def clear_keyframes(self):
         """Remove all keyframes"""
         self.keyframes.clear()
+        self._times.clear()
+        self.baked = None
     
     @abstractmethod
     def apply_value(self, target_node: Any, value: Any):
         """Apply the animated value to the target node"""
         pass
+
+    def get_setter(self, target_node: Any) -> Optional[Callable[[Any], None]]:
+        """Get a callable applying values to a target node, or None if it can't be animated"""
+        return partial(self.apply_value, target_node)
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert track to dictionary for serialization"""
-        return {
+    def to_dict(self, compact: bool = False, precision: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Convert track to dictionary for serialization. compact stores the
+        keyframes as parallel lists ("packed"), with the tween and ease
+        types written once when all keyframes share them; precision rounds
+        float values (not times) to that many decimals.
+        """
+        data = {
             "type": self.__class__.__name__,
             "target_path": self.target_path,
             "property_name": self.property_name,
-            "enabled": self.enabled,
-            "keyframes": [kf.to_dict() for kf in self.keyframes]
+            "enabled": self.enabled
         }
+        if compact:
+            data["packed"] = self._pack_keyframes(precision)
+        else:
+            data["keyframes"] = [kf.to_dict() for kf in self.keyframes]
+        return data
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AnimationTrack":
-        """Create track from dictionary"""
+        """Create track from dictionary (verbose or packed keyframes)"""
         track = cls(data["target_path"], data["property_name"])
         track.enabled = data.get("enabled", True)
         
-        for kf_data in data.get("keyframes", []):
-            keyframe = Keyframe.from_dict(kf_data)
-            track.keyframes.append(keyframe)
+        packed = data.get("packed")
+        if packed is not None:
+            track.add_keyframes(cls._unpack_keyframes(packed))
+        else:
+            track.add_keyframes(Keyframe.from_dict(kf_data) for kf_data in data.get("keyframes", []))
         
         return track
 
+    def _pack_keyframes(self, precision: Optional[int]) -> Dict[str, Any]:
+        """Store keyframes as parallel lists"""
+        keyframes = self.keyframes
+        tween_types = [kf.tween_type.value for kf in keyframes]
+        ease_types = [kf.ease_type.value for kf in keyframes]
+        return {
+            "times": [kf.time for kf in keyframes],
+            "values": [_round_value(kf.value, precision) for kf in keyframes],
+            "tween_type": tween_types[0] if len(set(tween_types)) == 1 else tween_types,
+            "ease_type": ease_types[0] if len(set(ease_types)) == 1 else ease_types
+        }
+
+    @staticmethod
+    def _unpack_keyframes(packed: Dict[str, Any]) -> List[Keyframe]:
+        """Rebuild keyframes from parallel lists"""
+        times = packed.get("times", [])
+        tween_types = packed.get("tween_type", "linear")
+        ease_types = packed.get("ease_type", "in_out")
+        if isinstance(tween_types, str):
+            tween_types = [tween_types] * len(times)
+        if isinstance(ease_types, str):
+            ease_types = [ease_types] * len(times)
+        return [Keyframe(time, value, _TWEEN_TYPES[tween_type], _EASE_TYPES[ease_type])
+                for time, value, tween_type, ease_type in zip(times, packed.get("values", []), tween_types, ease_types)]
+
 
 class PropertyTrack(AnimationTrack):
     """
@@ -178,14 +331,20 @@ class PropertyTrack(AnimationTrack):
         if hasattr(target_node, self.property_name):
             setattr(target_node, self.property_name, value)
 
+    def get_setter(self, target_node: Any) -> Optional[Callable[[Any], None]]:
+        """Set the property directly; the hasattr check is done once at bind time"""
+        if hasattr(target_node, self.property_name):
+            return partial(setattr, target_node, self.property_name)
+        return None
+
 
 class SpriteFrameTrack(AnimationTrack):
     """
     Track for animating sprite frames (frame-by-frame animation)
     """
     
-    def __init__(self, target_path: str):
-        super().__init__(target_path, "frame")
+    def __init__(self, target_path: str, property_name: str = "frame"):
+        super().__init__(target_path, property_name)
     
     def apply_value(self, target_node: Any, value: Any):
         """Apply frame value to sprite node"""
@@ -227,6 +386,9 @@ class AudioTrack(AnimationTrack):
     """
     Track for animating audio properties and triggering audio events
     """
+
+    bakeable = False
+    visual = False
     
     def apply_value(self, target_node: Any, value: Any):
         """Apply audio value or trigger audio event"""
@@ -240,6 +402,17 @@ class AudioTrack(AnimationTrack):
             target_node.stop()
 
 
+def _round_value(value: Any, precision: Optional[int]) -> Any:
+    """Round the floats in a keyframe value (None keeps them exact)"""
+    if precision is None:
+        return value
+    if isinstance(value, float):
+        return round(value, precision)
+    if isinstance(value, list):
+        return [_round_value(component, precision) for component in value]
+    return value
+
+
 # Track type registry for deserialization
 TRACK_TYPES = {
     "PropertyTrack": PropertyTrack,
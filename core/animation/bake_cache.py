@@ -0,0 +1,116 @@
+"""
+Bake cache for animation files in Lupine Engine
+Stores the baked curves of an animation file next to it (<file>.bake.npz),
+keyed by the file's content hash and the bake settings, so animations are
+only re-baked after the file changed
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Any, Union
+
+import numpy as np
+
+from .animation import AnimationLibrary
+from .animation_file import load_animation_library
+from .baked_curve import BakedCurve, DEFAULT_BAKE_RATE, DEFAULT_BAKE_TOLERANCE
+
+
+BAKE_CACHE_SUFFIX = ".bake.npz"
+BAKE_CACHE_VERSION = 1
+
+
+def get_bake_cache_path(animation_path: Union[str, Path]) -> Path:
+    """Get the bake cache file of an animation file"""
+    return Path(str(animation_path) + BAKE_CACHE_SUFFIX)
+
+
+def bake_library(library: AnimationLibrary, rate: float = DEFAULT_BAKE_RATE,
+                 tolerance: float = DEFAULT_BAKE_TOLERANCE) -> int:
+    """Bake every animation in a library; returns the number of tracks baked"""
+    return sum(animation.bake(rate, tolerance) for animation in library.animations.values())
+
+
+def load_bake_cache(library: AnimationLibrary, animation_path: Union[str, Path],
+                    rate: float = DEFAULT_BAKE_RATE, tolerance: float = DEFAULT_BAKE_TOLERANCE) -> bool:
+    """Attach cached curves to a library loaded from animation_path; False if the cache is missing or stale"""
+    try:
+        source_hash = _hash_file(animation_path)
+        with np.load(get_bake_cache_path(animation_path)) as data:
+            meta = json.loads(str(data["meta"]))
+            if (meta.get("version") != BAKE_CACHE_VERSION or meta.get("source_hash") != source_hash
+                    or meta.get("rate") != rate or meta.get("tolerance") != tolerance):
+                return False
+
+            curves = {}
+            for name, tracks in meta["animations"].items():
+                animation = library.animations.get(name)
+                if animation is None or len(animation.tracks) != tracks["track_count"]:
+                    return False
+                for index, curve in tracks["curves"].items():
+                    curves[(name, int(index))] = BakedCurve(curve["start"], curve["rate"],
+                                                            data[curve["key"]], curve["kind"])
+    except (OSError, ValueError, KeyError) as e:
+        if not isinstance(e, FileNotFoundError):
+            print(f"Error reading bake cache for {animation_path}: {e}")
+        return False
+
+    for name, animation in library.animations.items():
+        for index, track in enumerate(animation.tracks):
+            track.baked = curves.get((name, index))
+    return True
+
+
+def save_bake_cache(library: AnimationLibrary, animation_path: Union[str, Path],
+                    rate: float = DEFAULT_BAKE_RATE, tolerance: float = DEFAULT_BAKE_TOLERANCE) -> bool:
+    """Write the baked curves of a library loaded from animation_path"""
+    arrays: Dict[str, np.ndarray] = {}
+    animations: Dict[str, Any] = {}
+    for name, animation in library.animations.items():
+        curves = {}
+        for index, track in enumerate(animation.tracks):
+            if track.baked is None:
+                continue
+            key = f"curve{len(arrays)}"
+            arrays[key] = track.baked.values
+            curves[str(index)] = {"key": key, "start": track.baked.start,
+                                  "rate": track.baked.rate, "kind": track.baked.kind}
+        animations[name] = {"track_count": len(animation.tracks), "curves": curves}
+
+    cache_path = get_bake_cache_path(animation_path)
+    temp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        meta = {"version": BAKE_CACHE_VERSION, "source_hash": _hash_file(animation_path),
+                "rate": rate, "tolerance": tolerance, "animations": animations}
+        with open(temp_path, "wb") as f:
+            np.savez(f, meta=np.array(json.dumps(meta)), **arrays)
+        os.replace(temp_path, cache_path)
+        return True
+    except OSError as e:
+        print(f"Error saving bake cache for {animation_path}: {e}")
+        return False
+
+
+def bake_animation_library(library: AnimationLibrary, animation_path: Union[str, Path],
+                           rate: float = DEFAULT_BAKE_RATE, tolerance: float = DEFAULT_BAKE_TOLERANCE) -> int:
+    """Bake a library loaded from animation_path, reusing its cache when current; returns the tracks baked"""
+    if not load_bake_cache(library, animation_path, rate, tolerance):
+        bake_library(library, rate, tolerance)
+        save_bake_cache(library, animation_path, rate, tolerance)
+    return sum(1 for animation in library.animations.values()
+               for track in animation.tracks if track.baked is not None)
+
+
+def bake_animation_file(animation_path: Union[str, Path], rate: float = DEFAULT_BAKE_RATE,
+                        tolerance: float = DEFAULT_BAKE_TOLERANCE) -> int:
+    """Build step: write the bake cache of an animation file; returns the tracks baked"""
+    library = load_animation_library(animation_path)
+    return bake_animation_library(library, animation_path, rate, tolerance)
+
+
+def _hash_file(path: Union[str, Path]) -> str:
+    """Hash a file's content"""
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
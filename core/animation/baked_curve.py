@@ -0,0 +1,137 @@
+"""
+Baked animation curves for Lupine Engine
+Samples a track's keyframes, tweens and easing once at a fixed rate, so
+runtime sampling is an index and a linear interpolation
+"""
+
+import math
+from typing import Any, List, Optional
+
+import numpy as np
+
+
+DEFAULT_BAKE_RATE = 60.0  # Samples per second
+DEFAULT_BAKE_TOLERANCE = 1e-3  # Maximum error against the keyframe curve
+MAX_BAKE_RATE = 960.0
+
+
+class BakedCurve:
+    """
+    Fixed-rate samples of a numeric track.
+    values has one row per sample: a float per row for scalar tracks, one
+    column per component for vector and color tracks.
+    """
+
+    __slots__ = ('start', 'rate', 'values', 'kind')
+
+    def __init__(self, start: float, rate: float, values: np.ndarray, kind: str):
+        self.start = start
+        self.rate = rate
+        self.values = values
+        self.kind = kind  # "float", "list" or "tuple": the type sample() returns
+
+    def sample(self, time: float) -> Any:
+        """Get the curve value at a time (clamped to the baked range)"""
+        values = self.values
+        position = (time - self.start) * self.rate
+        last = len(values) - 1
+        if position <= 0.0 or last == 0:
+            value = values[0].tolist()
+        elif position >= last:
+            value = values[last].tolist()
+        else:
+            index = int(position)
+            fraction = position - index
+            a, b = values[index:index + 2].tolist()
+            if self.kind == "float":
+                return a + (b - a) * fraction
+            value = [x + (y - x) * fraction for x, y in zip(a, b)]
+
+        if self.kind == "tuple":
+            return tuple(value)
+        return value
+
+    def get_duration(self) -> float:
+        """Get the length of the baked range in seconds"""
+        return (len(self.values) - 1) / self.rate if self.rate else 0.0
+
+    def get_memory_usage(self) -> int:
+        """Get the size of the sample array in bytes"""
+        return self.values.nbytes
+
+
+def get_value_kind(values: List[Any]) -> Optional[str]:
+    """Get the BakedCurve kind for a list of keyframe values, or None if they can't be baked"""
+    first = values[0]
+    if _is_number(first):
+        return "float" if all(_is_number(value) for value in values) else None
+    if isinstance(first, (list, tuple)) and first:
+        size = len(first)
+        for value in values:
+            if value.__class__ is not first.__class__ or len(value) != size:
+                return None
+            if not all(_is_number(component) for component in value):
+                return None
+        return "tuple" if isinstance(first, tuple) else "list"
+    return None
+
+
+def bake_track(track, rate: float = DEFAULT_BAKE_RATE, tolerance: float = DEFAULT_BAKE_TOLERANCE,
+               max_rate: float = MAX_BAKE_RATE) -> Optional[BakedCurve]:
+    """
+    Bake a track's keyframe curve. The rate is raised (up to max_rate)
+    until the curve is within tolerance at the keyframes and between
+    samples. Returns None for tracks that aren't numeric, can't meet the
+    tolerance, or have at least as many keyframes as samples at `rate`
+    (those gain nothing from baking).
+    """
+    keyframes = track.keyframes
+    if not keyframes:
+        return None
+    kind = get_value_kind([kf.value for kf in keyframes])
+    if kind is None:
+        return None
+
+    start = keyframes[0].time
+    span = keyframes[-1].time - start
+    if span <= 0.0:
+        values = np.array([_to_row(track.get_value_at_time(start))], dtype=np.float64)
+        return BakedCurve(start, 0.0, values, kind)
+
+    if len(keyframes) >= int(math.ceil(span * rate)) + 1:
+        return None
+
+    key_times = [kf.time for kf in keyframes]
+    while True:
+        count = max(2, int(math.ceil(span * rate)) + 1)
+        step = span / (count - 1)
+        times = [start + i * step for i in range(count)]
+        times[-1] = keyframes[-1].time
+        values = np.array([_to_row(track.get_value_at_time(t)) for t in times], dtype=np.float64)
+        curve = BakedCurve(start, (count - 1) / span, values, kind)
+
+        # Compare against the exact curve at the keyframes and halfway between samples
+        check_times = key_times + [t + step * 0.5 for t in times[:-1]]
+        exact = np.array([_to_row(track.get_value_at_time(t)) for t in check_times], dtype=np.float64)
+        baked = np.array([_to_row(curve.sample(t)) for t in check_times], dtype=np.float64)
+        error = float(np.max(np.abs(exact - baked)))
+        if error <= tolerance:
+            return curve
+
+        # Interpolation error falls with the square of the rate on smooth curves
+        needed = rate * math.sqrt(error / tolerance)
+        if rate >= max_rate or needed > max_rate:
+            return None
+        rate = min(max(rate * 2.0, needed), max_rate)
+
+
+def _is_number(value: Any) -> bool:
+    """Check for an int or float (bools are discrete and are not baked)"""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _to_row(value: Any):
+    """Convert a track value to a float or a list of floats"""
+    if isinstance(value, (list, tuple)):
+        return [float(component) for component in value]
+    return float(value)
@@ -0,0 +1,275 @@
+"""
+Keyframe reduction for Lupine Engine animations
+Removes keyframes that the remaining keys reproduce within a tolerance.
+Dense linear runs collapse to their end points, and runs that follow an
+easing curve collapse to one eased segment.
+"""
+
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from .baked_curve import get_value_kind
+from .tween import Tween, TweenType, EaseType
+
+
+DEFAULT_REDUCE_TOLERANCE = 1e-3  # Maximum error against the original curve
+CHECK_FRACTIONS = (0.25, 0.5, 0.75)  # Points checked inside each original linear segment
+EASED_CHECK_COUNT = 32  # Intervals checked inside each original eased segment
+EASED_CHECK_FRACTIONS = tuple(i / EASED_CHECK_COUNT for i in range(1, EASED_CHECK_COUNT))
+
+CURVE_TABLE_SIZE = 1025  # Samples per curve when screening candidate curves
+BOUNCE_KINKS = (1.0 / 2.75, 2.0 / 2.75, 2.5 / 2.75)  # Curved progress where the bounce curve has corners
+
+# Curves tried when merging segments, after the anchor keyframe's own curve
+_CANDIDATE_CURVES: List[Tuple[TweenType, EaseType]] = [(TweenType.LINEAR, EaseType.IN_OUT)] + [
+    (tween_type, ease_type) for tween_type in TweenType if tween_type != TweenType.LINEAR
+    for ease_type in EaseType]
+
+# Every tween/ease pair (a keyframe's own curve may be e.g. LINEAR with IN), indexing the curve tables
+_CANDIDATE_LIST: List[Tuple[TweenType, EaseType]] = [
+    (tween_type, ease_type) for tween_type in TweenType for ease_type in EaseType]
+_CURVE_INDEX = {curve: index for index, curve in enumerate(_CANDIDATE_LIST)}
+_CANDIDATE_ORDER = [_CURVE_INDEX[curve] for curve in _CANDIDATE_CURVES]
+_curve_tables: Optional[np.ndarray] = None
+_check_fraction_sets: Optional[List[np.ndarray]] = None
+
+
+def reduce_track(track, tolerance: float = DEFAULT_REDUCE_TOLERANCE, change_easing: bool = True) -> int:
+    """
+    Remove keyframes of a track that can be reconstructed within
+    tolerance; returns the number removed. With change_easing, a kept
+    keyframe may get a different tween/ease type if that lets it replace
+    the keys after it (e.g. a recorded ease-in becomes one IN keyframe).
+    Numeric tracks are checked at the removed keys and densely along both
+    the original segments and every merged one, including bounce corners.
+    The tolerance is exact at those points; between them, measured against
+    densely sampled originals, the error stays within 1.02x the tolerance
+    (elastic curves, whose ripples can peak between checks) and at the
+    tolerance for the other curves. Other value tracks only lose keys that
+    repeat the values on both sides.
+    Event tracks (audio) are left unchanged.
+    """
+    keyframes = track.keyframes
+    if len(keyframes) < 3 or not track.bakeable:
+        return 0
+
+    kind = get_value_kind([kf.value for kf in keyframes])
+    if kind is None:
+        kept = _reduce_holds(keyframes)
+    else:
+        if all(isinstance(kf.value, int) for kf in keyframes):
+            tolerance = min(tolerance, 1e-9)  # Integer tracks (frames) must stay exact
+        kept = _reduce_curve(track, tolerance, change_easing)
+
+    removed = len(keyframes) - len(kept)
+    if removed:
+        track.clear_keyframes()
+        track.add_keyframes(kept)
+    return removed
+
+
+def _reduce_holds(keyframes) -> List:
+    """Keep keyframes unless their value equals both neighbours'"""
+    kept = [keyframes[0]]
+    for i in range(1, len(keyframes) - 1):
+        value = keyframes[i].value
+        if not (value == kept[-1].value and value == keyframes[i + 1].value):
+            kept.append(keyframes[i])
+    kept.append(keyframes[-1])
+    return kept
+
+
+def _reduce_curve(track, tolerance: float, change_easing: bool) -> List:
+    """
+    Extend each kept keyframe's segment as far as some curve stays within
+    tolerance, probing ends at growing steps and then bisecting. Curves are
+    screened together through lookup tables, a curve that stops fitting is
+    dropped for the rest of the segment, and the preferred remaining curve
+    is confirmed with the exact easing.
+    """
+    keyframes = track.keyframes
+    count = len(keyframes)
+    times = np.array([kf.time for kf in keyframes], dtype=np.float64)
+    values = np.array([_to_row(kf.value) for kf in keyframes], dtype=np.float64)
+    curve_indices = np.array([_CURVE_INDEX[(kf.tween_type, kf.ease_type)] for kf in keyframes], dtype=np.intp)
+    check_times, check_values, check_start = _sample_checks(times, values, curve_indices)
+    # Any candidate curve may be chosen, so merged segments are checked at every curve's points
+    merged_fractions = np.unique(np.concatenate(_get_check_fractions()))[:-1]
+
+    order = _CANDIDATE_ORDER if change_easing else []
+    kept = [keyframes[0]]
+    anchor = 0
+    while anchor < count - 1:
+        own = int(curve_indices[anchor])
+        alive = [own] + [index for index in order if index != own]
+        good, curve = anchor + 1, own
+        bad = count
+        step = 1
+        while good < bad - 1:
+            if bad == count:
+                probe = min(anchor + 1 + step, count - 1)
+                step *= 2
+            else:
+                probe = (good + bad) // 2
+            checks = slice(check_start[anchor], check_start[probe])
+            sample_merged = None
+            if probe > anchor + 1:
+                # The merged curve can bulge between the original checks, so it is checked along its own span too
+                merged_times = times[anchor] + (times[probe] - times[anchor]) * merged_fractions
+                sample_merged = lambda: _sample_track(merged_times, times, values, curve_indices)
+            fit, survivors = _fit_segment(times[anchor], times[probe], values[anchor], values[probe],
+                                          check_times[checks], check_values[checks], tolerance, alive,
+                                          merged_fractions, sample_merged)
+            if fit is None:
+                bad = probe
+            else:
+                good, curve, alive = probe, fit, survivors
+
+        if curve != own:
+            keyframes[anchor].tween_type, keyframes[anchor].ease_type = _CANDIDATE_LIST[curve]
+        kept.append(keyframes[good])
+        anchor = good
+    return kept
+
+
+def _sample_checks(times: np.ndarray, values: np.ndarray,
+                   curve_indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray, List[int]]:
+    """
+    Sample the original curve at each keyframe after the first and inside
+    each segment (see _get_check_fractions). Checks between keyframes a
+    and b (ending at b) are check_start[a]:check_start[b].
+    """
+    count = len(times)
+    fraction_sets = _get_check_fractions()
+    spans = times[1:] - times[:-1]
+    set_sizes = np.array([len(fractions) for fractions in fraction_sets])
+    per_segment = np.where(spans > 0.0, set_sizes[curve_indices[:-1]], 1)
+    check_start = [0] + np.cumsum(per_segment).tolist()
+
+    # Zero-length segments only check the key itself
+    segment = np.repeat(np.arange(count - 1), per_segment)
+    position = np.arange(len(segment)) - np.repeat(np.array(check_start[:-1]), per_segment)
+    segment_curves = curve_indices[segment]
+    fraction = np.ones(len(segment), dtype=np.float64)
+    curved = np.empty(len(segment), dtype=np.float64)
+    for curve in np.unique(segment_curves):
+        mask = segment_curves == curve
+        fractions = fraction_sets[curve]
+        fraction[mask] = fractions[np.minimum(position[mask], len(fractions) - 1)]
+    fraction = np.where(spans[segment] > 0.0, fraction, 1.0)
+    for curve in np.unique(segment_curves):
+        mask = segment_curves == curve
+        tween_type, ease_type = _CANDIDATE_LIST[curve]
+        curved[mask] = Tween.apply_curve_array(fraction[mask], tween_type, ease_type)
+
+    start_values = values[segment]
+    check_values = start_values + (values[segment + 1] - start_values) * curved[:, None]
+    # At a key time the track holds the last keyframe with that time
+    at_key = fraction == 1.0
+    last_at_time = np.searchsorted(times, times, side="right") - 1
+    check_values[at_key] = values[last_at_time[segment[at_key] + 1]]
+    check_times = times[segment] + spans[segment] * fraction
+    return check_times, check_values, check_start
+
+
+def _sample_track(sample_times: np.ndarray, times: np.ndarray, values: np.ndarray,
+                  curve_indices: np.ndarray) -> np.ndarray:
+    """Sample the original curve at times strictly between its first and last keyframe"""
+    segment = np.minimum(np.searchsorted(times, sample_times, side="right") - 1, len(times) - 2)
+    start_times = times[segment]
+    fraction = (sample_times - start_times) / (times[segment + 1] - start_times)
+    curved = np.empty(len(segment), dtype=np.float64)
+    segment_curves = curve_indices[segment]
+    for curve in np.unique(segment_curves):
+        mask = segment_curves == curve
+        tween_type, ease_type = _CANDIDATE_LIST[curve]
+        curved[mask] = Tween.apply_curve_array(fraction[mask], tween_type, ease_type)
+    start_values = values[segment]
+    return start_values + (values[segment + 1] - start_values) * curved[:, None]
+
+
+def _fit_segment(start_time: float, end_time: float, start_value: np.ndarray, end_value: np.ndarray,
+                 check_times: np.ndarray, check_values: np.ndarray, tolerance: float, alive: List[int],
+                 merged_fractions: np.ndarray, sample_merged: Optional[Callable[[], np.ndarray]]
+                 ) -> Tuple[Optional[int], List[int]]:
+    """
+    Get the first curve in alive that fits a start->end segment, and the
+    curves that pass screening. A curve that fits the checks is confirmed
+    at merged_fractions of the segment against sample_merged(), the
+    original values there, when given.
+    """
+    span = end_time - start_time
+    if span <= 0.0:
+        return None, alive
+    progress = (check_times - start_time) / span
+    delta = end_value - start_value
+
+    # Screen the curves; a curve the tables wrongly reject only costs reduction, never accuracy
+    position = progress * (CURVE_TABLE_SIZE - 1)
+    lower = np.minimum(position.astype(np.intp), CURVE_TABLE_SIZE - 2)
+    fraction = position - lower
+    candidates = _get_curve_tables()[alive]
+    curved = candidates[:, lower] * (1.0 - fraction) + candidates[:, lower + 1] * fraction
+    errors = np.abs(start_value + delta * curved[:, :, None] - check_values).max(axis=(1, 2))
+    survivors = [index for index, error in zip(alive, errors.tolist()) if error <= tolerance * 1.01]
+
+    merged_values = None
+    for index in survivors:
+        tween_type, ease_type = _CANDIDATE_LIST[index]
+        exact = Tween.apply_curve_array(progress, tween_type, ease_type)
+        if float(np.abs(start_value + delta * exact[:, None] - check_values).max()) > tolerance:
+            continue
+        if sample_merged is not None:
+            if merged_values is None:
+                merged_values = sample_merged()
+            exact = Tween.apply_curve_array(merged_fractions, tween_type, ease_type)
+            if float(np.abs(start_value + delta * exact[:, None] - merged_values).max()) > tolerance:
+                continue
+        return index, survivors[survivors.index(index):]
+    return None, survivors
+
+
+def _get_check_fractions() -> List[np.ndarray]:
+    """
+    Get the fractions of an original segment that are checked, per curve
+    (ending at 1.0): CHECK_FRACTIONS for linear segments, the denser
+    EASED_CHECK_FRACTIONS for eased ones, whose shape three points would
+    not pin down, plus the corners of bounce curves, where a smooth
+    replacement strays furthest.
+    """
+    global _check_fraction_sets
+    if _check_fraction_sets is None:
+        linear = np.array(CHECK_FRACTIONS + (1.0,), dtype=np.float64)
+        eased = np.array(EASED_CHECK_FRACTIONS + (1.0,), dtype=np.float64)
+        progress = np.linspace(0.0, 1.0, CURVE_TABLE_SIZE * 4)
+        fraction_sets = []
+        for tween_type, ease_type in _CANDIDATE_LIST:
+            if tween_type == TweenType.LINEAR:
+                fraction_sets.append(linear)
+            elif tween_type == TweenType.BOUNCE:
+                # Easing is monotonic, so the corners map back through its inverse
+                eased_progress = np.array([Tween._apply_easing(p, ease_type, tween_type) for p in progress])
+                corners = np.interp(BOUNCE_KINKS, eased_progress, progress)
+                fraction_sets.append(np.union1d(eased, corners))
+            else:
+                fraction_sets.append(eased)
+        _check_fraction_sets = fraction_sets
+    return _check_fraction_sets
+
+
+def _get_curve_tables() -> np.ndarray:
+    """Get every candidate curve sampled at CURVE_TABLE_SIZE progress points (one row per curve)"""
+    global _curve_tables
+    if _curve_tables is None:
+        progress = np.linspace(0.0, 1.0, CURVE_TABLE_SIZE)
+        _curve_tables = np.array([Tween.apply_curve_array(progress, tween_type, ease_type)
+                                  for tween_type, ease_type in _CANDIDATE_LIST])
+    return _curve_tables
+
+
+def _to_row(value) -> List[float]:
+    """Convert a keyframe value to a row of floats"""
+    if isinstance(value, (list, tuple)):
+        return [float(component) for component in value]
+    return [float(value)]
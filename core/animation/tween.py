@@ -4,7 +4,9 @@ Tween and interpolation utilities for Lupine Engine animation system
 
 import math
 from enum import Enum
-from typing import Any, Union, List
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+import numpy as np
 
 
 class TweenType(Enum):
@@ -35,7 +37,7 @@ class Tween:
     
     @staticmethod
     def interpolate(start: Any, end: Any, progress: float, tween_type: TweenType = TweenType.LINEAR, 
-                   ease_type: EaseType = EaseType.IN_OUT) -> Any:
+                   ease_type: EaseType = EaseType.IN_OUT, use_lut: bool = False) -> Any:
         """
         Interpolate between start and end values with given progress (0.0 to 1.0)
         
@@ -45,6 +47,7 @@ class Tween:
             progress: Progress from 0.0 to 1.0
             tween_type: Type of interpolation curve
             ease_type: Easing function to apply
+            use_lut: Sample elastic and bounce curves from a lookup table
             
         Returns:
             Interpolated value
@@ -52,11 +55,8 @@ class Tween:
         # Clamp progress
         progress = max(0.0, min(1.0, progress))
         
-        # Apply easing
-        eased_progress = Tween._apply_easing(progress, ease_type, tween_type)
-        
-        # Apply tween curve
-        curved_progress = Tween._apply_tween_curve(eased_progress, tween_type)
+        # Apply easing and tween curve
+        curved_progress = get_easing_function(tween_type, ease_type, use_lut)(progress)
         
         # Interpolate based on value type
         return Tween._lerp_value(start, end, curved_progress)
@@ -64,55 +64,53 @@ class Tween:
     @staticmethod
     def _apply_easing(progress: float, ease_type: EaseType, tween_type: TweenType) -> float:
         """Apply easing function to progress"""
-        if ease_type == EaseType.LINEAR or tween_type == TweenType.LINEAR:
+        if tween_type == TweenType.LINEAR:
             return progress
-        elif ease_type == EaseType.IN:
-            return progress * progress
-        elif ease_type == EaseType.OUT:
-            return 1.0 - (1.0 - progress) * (1.0 - progress)
-        elif ease_type == EaseType.IN_OUT:
-            if progress < 0.5:
-                return 2.0 * progress * progress
-            else:
-                return 1.0 - 2.0 * (1.0 - progress) * (1.0 - progress)
-        elif ease_type == EaseType.OUT_IN:
-            if progress < 0.5:
-                return 0.5 * (1.0 - (1.0 - 2.0 * progress) * (1.0 - 2.0 * progress))
-            else:
-                return 0.5 + 0.5 * (2.0 * progress - 1.0) * (2.0 * progress - 1.0)
-
-        return progress
+        return _EASE_FUNCTIONS[ease_type](progress)
     
     @staticmethod
     def _apply_tween_curve(progress: float, tween_type: TweenType) -> float:
         """Apply tween curve to progress"""
-        if tween_type == TweenType.LINEAR:
-            return progress
-        elif tween_type == TweenType.SMOOTH:
-            return progress * progress * (3.0 - 2.0 * progress)
-        elif tween_type == TweenType.SMOOTHER:
-            return progress * progress * progress * (progress * (progress * 6.0 - 15.0) + 10.0)
-        elif tween_type == TweenType.SPRING:
-            return 1.0 - math.cos(progress * math.pi * 0.5)
-        elif tween_type == TweenType.BOUNCE:
-            if progress < 1.0 / 2.75:
-                return 7.5625 * progress * progress
-            elif progress < 2.0 / 2.75:
-                progress -= 1.5 / 2.75
-                return 7.5625 * progress * progress + 0.75
-            elif progress < 2.5 / 2.75:
-                progress -= 2.25 / 2.75
-                return 7.5625 * progress * progress + 0.9375
-            else:
-                progress -= 2.625 / 2.75
-                return 7.5625 * progress * progress + 0.984375
-        elif tween_type == TweenType.ELASTIC:
-            if progress == 0.0 or progress == 1.0:
-                return progress
-            return -(2.0 ** (10.0 * (progress - 1.0))) * math.sin((progress - 1.1) * 5.0 * math.pi)
-        
-        return progress
+        return _CURVE_FUNCTIONS[tween_type](progress)
     
+    @staticmethod
+    def apply_curve_array(progress: np.ndarray, tween_type: TweenType = TweenType.LINEAR,
+                          ease_type: EaseType = EaseType.IN_OUT) -> np.ndarray:
+        """Vectorized easing and tween curve: the curved progress of interpolate() for an array"""
+        p = np.clip(progress, 0.0, 1.0)
+
+        # Easing
+        if ease_type == EaseType.LINEAR or tween_type == TweenType.LINEAR:
+            pass
+        elif ease_type == EaseType.IN:
+            p = p * p
+        elif ease_type == EaseType.OUT:
+            p = 1.0 - (1.0 - p) * (1.0 - p)
+        elif ease_type == EaseType.IN_OUT:
+            p = np.where(p < 0.5, 2.0 * p * p, 1.0 - 2.0 * (1.0 - p) * (1.0 - p))
+        elif ease_type == EaseType.OUT_IN:
+            p = np.where(p < 0.5, 0.5 * (1.0 - (1.0 - 2.0 * p) * (1.0 - 2.0 * p)),
+                         0.5 + 0.5 * (2.0 * p - 1.0) * (2.0 * p - 1.0))
+
+        # Tween curve
+        if tween_type == TweenType.SMOOTH:
+            return p * p * (3.0 - 2.0 * p)
+        if tween_type == TweenType.SMOOTHER:
+            return p * p * p * (p * (p * 6.0 - 15.0) + 10.0)
+        if tween_type == TweenType.SPRING:
+            return 1.0 - np.cos(p * (math.pi * 0.5))
+        if tween_type == TweenType.BOUNCE:
+            return np.select(
+                [p < 1.0 / 2.75, p < 2.0 / 2.75, p < 2.5 / 2.75],
+                [7.5625 * p * p,
+                 7.5625 * (p - 1.5 / 2.75) ** 2 + 0.75,
+                 7.5625 * (p - 2.25 / 2.75) ** 2 + 0.9375],
+                7.5625 * (p - 2.625 / 2.75) ** 2 + 0.984375)
+        if tween_type == TweenType.ELASTIC:
+            curved = -(2.0 ** (10.0 * (p - 1.0))) * np.sin((p - 1.1) * 5.0 * math.pi)
+            return np.where((p == 0.0) | (p == 1.0), p, curved)
+        return p
+
     @staticmethod
     def _lerp_value(start: Any, end: Any, progress: float) -> Any:
         """Interpolate between values based on their type"""
@@ -153,6 +151,136 @@ class Tween:
         return start if progress < 0.5 else end
 
 
+# Easing functions (progress in 0..1)
+def _ease_linear(p: float) -> float:
+    return p
+
+
+def _ease_in(p: float) -> float:
+    return p * p
+
+
+def _ease_out(p: float) -> float:
+    return 1.0 - (1.0 - p) * (1.0 - p)
+
+
+def _ease_in_out(p: float) -> float:
+    if p < 0.5:
+        return 2.0 * p * p
+    return 1.0 - 2.0 * (1.0 - p) * (1.0 - p)
+
+
+def _ease_out_in(p: float) -> float:
+    if p < 0.5:
+        return 0.5 * (1.0 - (1.0 - 2.0 * p) * (1.0 - 2.0 * p))
+    return 0.5 + 0.5 * (2.0 * p - 1.0) * (2.0 * p - 1.0)
+
+
+# Tween curves (applied after easing)
+def _curve_smooth(p: float) -> float:
+    return p * p * (3.0 - 2.0 * p)
+
+
+def _curve_smoother(p: float) -> float:
+    return p * p * p * (p * (p * 6.0 - 15.0) + 10.0)
+
+
+def _curve_spring(p: float) -> float:
+    return 1.0 - math.cos(p * math.pi * 0.5)
+
+
+def _curve_bounce(p: float) -> float:
+    if p < 1.0 / 2.75:
+        return 7.5625 * p * p
+    elif p < 2.0 / 2.75:
+        p -= 1.5 / 2.75
+        return 7.5625 * p * p + 0.75
+    elif p < 2.5 / 2.75:
+        p -= 2.25 / 2.75
+        return 7.5625 * p * p + 0.9375
+    p -= 2.625 / 2.75
+    return 7.5625 * p * p + 0.984375
+
+
+def _curve_elastic(p: float) -> float:
+    if p == 0.0 or p == 1.0:
+        return p
+    return -(2.0 ** (10.0 * (p - 1.0))) * math.sin((p - 1.1) * 5.0 * math.pi)
+
+
+_EASE_FUNCTIONS: Dict[EaseType, Callable[[float], float]] = {
+    EaseType.LINEAR: _ease_linear,
+    EaseType.IN: _ease_in,
+    EaseType.OUT: _ease_out,
+    EaseType.IN_OUT: _ease_in_out,
+    EaseType.OUT_IN: _ease_out_in,
+}
+
+_CURVE_FUNCTIONS: Dict[TweenType, Callable[[float], float]] = {
+    TweenType.LINEAR: _ease_linear,
+    TweenType.SMOOTH: _curve_smooth,
+    TweenType.SMOOTHER: _curve_smoother,
+    TweenType.BEZIER: _ease_linear,  # No bezier curve yet: easing only
+    TweenType.SPRING: _curve_spring,
+    TweenType.BOUNCE: _curve_bounce,
+    TweenType.ELASTIC: _curve_elastic,
+}
+
+EASING_LUT_SIZE = 1024
+LUT_TWEEN_TYPES = (TweenType.BOUNCE, TweenType.ELASTIC)  # Curves worth a lookup table
+
+_easing_functions: Dict[Tuple[TweenType, EaseType, bool], Callable[[float], float]] = {}
+
+
+def get_easing_function(tween_type: TweenType, ease_type: EaseType,
+                        use_lut: bool = False) -> Callable[[float], float]:
+    """
+    Get the combined easing and tween curve for progress in 0..1.
+    With use_lut, bounce and elastic curves are sampled from a
+    1024-entry table with linear interpolation (error up to about 2e-3
+    at the bounce kinks, 1e-3 for elastic).
+    """
+    key = (tween_type, ease_type, use_lut)
+    function = _easing_functions.get(key)
+    if function is None:
+        function = _easing_functions[key] = _build_easing_function(tween_type, ease_type, use_lut)
+    return function
+
+
+def _build_easing_function(tween_type: TweenType, ease_type: EaseType, use_lut: bool) -> Callable[[float], float]:
+    """Compose the easing and curve functions for a (tween type, ease type) pair"""
+    if tween_type == TweenType.LINEAR:
+        return _ease_linear
+    ease = _EASE_FUNCTIONS[ease_type]
+    curve = _CURVE_FUNCTIONS[tween_type]
+    if ease is _ease_linear:
+        function = curve
+    elif curve is _ease_linear:
+        function = ease
+    else:
+        def function(p: float) -> float:
+            return curve(ease(p))
+
+    if use_lut and tween_type in LUT_TWEEN_TYPES:
+        return _build_lut(function, EASING_LUT_SIZE)
+    return function
+
+
+def _build_lut(function: Callable[[float], float], size: int) -> Callable[[float], float]:
+    """Tabulate a function over 0..1 and return a linearly interpolating sampler"""
+    last = size - 1
+    table = [function(i / last) for i in range(size)]
+    table.append(table[-1])  # Lets p == 1.0 read index + 1 without a bounds check
+
+    def sample(p: float) -> float:
+        position = p * last
+        index = int(position)
+        a = table[index]
+        return a + (table[index + 1] - a) * (position - index)
+
+    return sample
+
+
 def lerp(start: float, end: float, progress: float) -> float:
     """Simple linear interpolation function"""
     return start + (end - start) * progress
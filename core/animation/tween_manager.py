@@ -0,0 +1,221 @@
+"""
+Tween manager for Lupine Engine
+Runs many concurrent property tweens: active tweens live in numpy arrays
+grouped by curve (tween type, ease type and value size), each group is
+evaluated in one vectorized pass per frame, and results are written back
+through setters bound when the tween was created
+"""
+
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .tween import Tween, TweenType, EaseType
+
+
+class _TweenGroup:
+    """Active tweens sharing a curve and value size, stored as parallel arrays"""
+
+    __slots__ = ('tween_type', 'ease_type', 'size', 'count', 'start', 'delta', 'elapsed',
+                 'duration', 'ids', 'setters', 'kinds', 'callbacks', 'targets')
+
+    def __init__(self, tween_type: TweenType, ease_type: EaseType, size: int, capacity: int = 16):
+        self.tween_type = tween_type
+        self.ease_type = ease_type
+        self.size = size
+        self.count = 0
+        self.start = np.zeros((capacity, size))
+        self.delta = np.zeros((capacity, size))  # end - start
+        self.elapsed = np.zeros(capacity)  # Negative while delayed
+        self.duration = np.ones(capacity)
+        self.ids: List[int] = []
+        self.setters: List[Callable[[Any], None]] = []
+        self.kinds: List[str] = []  # "float", "list" or "tuple": the type passed to the setter
+        self.callbacks: List[Optional[Callable[[], None]]] = []
+        self.targets: List[Any] = []
+
+    def add(self, tween_id: int, start: List[float], end: List[float], duration: float, delay: float,
+            setter: Callable[[Any], None], kind: str, callback: Optional[Callable[[], None]], target: Any) -> int:
+        """Append a tween; returns its row"""
+        row = self.count
+        if row == len(self.elapsed):
+            self._grow(row * 2)
+        self.start[row] = start
+        self.delta[row] = [e - s for s, e in zip(start, end)]
+        self.elapsed[row] = -delay
+        self.duration[row] = duration
+        self.ids.append(tween_id)
+        self.setters.append(setter)
+        self.kinds.append(kind)
+        self.callbacks.append(callback)
+        self.targets.append(target)
+        self.count = row + 1
+        return row
+
+    def remove(self, row: int) -> Optional[int]:
+        """Swap-remove a row; returns the ID of the tween moved into it, if any"""
+        last = self.count - 1
+        moved = None
+        if row != last:
+            self.start[row] = self.start[last]
+            self.delta[row] = self.delta[last]
+            self.elapsed[row] = self.elapsed[last]
+            self.duration[row] = self.duration[last]
+            for column in (self.ids, self.setters, self.kinds, self.callbacks, self.targets):
+                column[row] = column[last]
+            moved = self.ids[row]
+        for column in (self.ids, self.setters, self.kinds, self.callbacks, self.targets):
+            column.pop()
+        self.count = last
+        return moved
+
+    def _grow(self, capacity: int) -> None:
+        """Reallocate the arrays with room for `capacity` tweens"""
+        def grown(array, fill):
+            new = np.full((capacity,) + array.shape[1:], fill, dtype=array.dtype)
+            new[:len(array)] = array
+            return new
+
+        self.start = grown(self.start, 0.0)
+        self.delta = grown(self.delta, 0.0)
+        self.elapsed = grown(self.elapsed, 0.0)
+        self.duration = grown(self.duration, 1.0)
+
+
+class TweenManager:
+    """
+    Drives property tweens for a whole game. Values must be numbers or
+    fixed-size lists/tuples of numbers (positions, scales, colors).
+
+    Example:
+        tweens.tween_property(sprite, "modulate", None, [1, 1, 1, 0], 0.5,
+                              on_complete=sprite.queue_free)
+    """
+
+    def __init__(self):
+        self._groups: Dict[Tuple[TweenType, EaseType, int], _TweenGroup] = {}
+        self._locations: Dict[int, Tuple[_TweenGroup, int]] = {}  # Tween ID -> (group, row)
+        self._next_id = 1
+
+    def tween_property(self, target: Any, property_name: str, start: Any, end: Any, duration: float,
+                       tween_type: TweenType = TweenType.LINEAR, ease_type: EaseType = EaseType.IN_OUT,
+                       delay: float = 0.0, on_complete: Optional[Callable[[], None]] = None) -> int:
+        """
+        Tween a property of an object from start (None: its current value)
+        to end over duration seconds. Returns the tween ID.
+        """
+        if start is None:
+            start = getattr(target, property_name)
+        return self._add(partial(setattr, target, property_name), start, end, duration,
+                         tween_type, ease_type, delay, on_complete, target)
+
+    def tween_method(self, method: Callable[[Any], None], start: Any, end: Any, duration: float,
+                     tween_type: TweenType = TweenType.LINEAR, ease_type: EaseType = EaseType.IN_OUT,
+                     delay: float = 0.0, on_complete: Optional[Callable[[], None]] = None) -> int:
+        """Call a method with the interpolated value every frame; returns the tween ID"""
+        return self._add(method, start, end, duration, tween_type, ease_type, delay, on_complete,
+                         getattr(method, '__self__', None))
+
+    def stop(self, tween_id: int) -> bool:
+        """Stop a tween where it is, without calling its completion callback"""
+        location = self._locations.pop(tween_id, None)
+        if location is None:
+            return False
+        group, row = location
+        moved = group.remove(row)
+        if moved is not None:
+            self._locations[moved] = (group, row)
+        return True
+
+    def stop_all(self, target: Any = None) -> int:
+        """Stop all tweens, or all tweens of one target; returns the number stopped"""
+        stopped = [tween_id for tween_id, (group, row) in self._locations.items()
+                   if target is None or group.targets[row] is target]
+        for tween_id in stopped:
+            self.stop(tween_id)
+        return len(stopped)
+
+    def is_active(self, tween_id: int) -> bool:
+        """Check whether a tween is still running (or waiting on its delay)"""
+        return tween_id in self._locations
+
+    def get_active_count(self) -> int:
+        """Get the number of running tweens"""
+        return len(self._locations)
+
+    def update(self, delta_time: float) -> int:
+        """Advance all tweens and apply their values; returns the number of tweens that finished"""
+        finished_callbacks = []
+        finished = 0
+        for group in list(self._groups.values()):
+            count = group.count
+            if not count:
+                continue
+
+            elapsed = group.elapsed[:count]
+            elapsed += delta_time
+            running = elapsed >= 0.0
+            progress = elapsed / group.duration[:count]
+            curved = Tween.apply_curve_array(progress, group.tween_type, group.ease_type)
+            values = (group.start[:count] + group.delta[:count] * curved[:, None]).tolist()
+
+            # Write back through the bound setters
+            setters, kinds = group.setters, group.kinds
+            for row in np.flatnonzero(running).tolist():
+                value = values[row]
+                kind = kinds[row]
+                try:
+                    setters[row](value[0] if kind == "float" else tuple(value) if kind == "tuple" else value)
+                except Exception as e:
+                    print(f"Error applying tween value: {e}")
+
+            # Remove finished tweens, highest row first so swap-removal doesn't move pending rows
+            done = np.flatnonzero(progress >= 1.0).tolist()
+            for row in reversed(done):
+                callback = group.callbacks[row]
+                if callback is not None:
+                    finished_callbacks.append(callback)
+                self._locations.pop(group.ids[row], None)
+                moved = group.remove(row)
+                if moved is not None:
+                    self._locations[moved] = (group, row)
+            finished += len(done)
+
+        # Callbacks run last so they can start or stop tweens freely
+        for callback in finished_callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"Error in tween completion callback: {e}")
+        return finished
+
+    def clear(self):
+        """Drop all tweens without calling their callbacks"""
+        self._groups.clear()
+        self._locations.clear()
+
+    def _add(self, setter: Callable[[Any], None], start: Any, end: Any, duration: float,
+             tween_type: TweenType, ease_type: EaseType, delay: float,
+             on_complete: Optional[Callable[[], None]], target: Any) -> int:
+        """Store a tween in the group for its curve and value size"""
+        if isinstance(start, (list, tuple)):
+            kind = "tuple" if isinstance(start, tuple) else "list"
+            start_row, end_row = [float(v) for v in start], [float(v) for v in end]
+            if len(start_row) != len(end_row):
+                raise ValueError("Cannot tween between sequences of different lengths")
+        else:
+            kind = "float"
+            start_row, end_row = [float(start)], [float(end)]
+
+        key = (tween_type, ease_type, len(start_row))
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = _TweenGroup(tween_type, ease_type, len(start_row))
+
+        tween_id = self._next_id
+        self._next_id += 1
+        row = group.add(tween_id, start_row, end_row, max(duration, 1e-9), max(delay, 0.0),
+                        setter, kind, on_complete, target)
+        self._locations[tween_id] = (group, row)
+        return tween_id
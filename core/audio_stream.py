@@ -0,0 +1,445 @@
+"""
+Streaming audio for Lupine Engine
+Decodes long sounds (music) in chunks on a background thread and plays them
+through a ring of OpenAL buffers queued on one source, so playback starts
+after the first chunk and only a few chunks of PCM are ever resident.
+"""
+
+import os
+import queue
+import threading
+import time
+import wave
+from collections import deque
+from typing import Callable, Deque, List, Optional, Tuple
+
+try:
+    import soundfile
+    SOUNDFILE_AVAILABLE = True
+except ImportError:
+    SOUNDFILE_AVAILABLE = False
+
+try:
+    from openal import al
+    OPENAL_AVAILABLE = True
+except ImportError:
+    OPENAL_AVAILABLE = False
+
+
+DEFAULT_CHUNK_SECONDS = 0.25  # PCM per OpenAL buffer
+DEFAULT_BUFFER_COUNT = 4  # Buffers in the ring queued on the source
+SOUNDFILE_FORMATS = ('ogg', 'flac', 'mp3')
+
+
+class WavChunkReader:
+    """Reads PCM frames from a WAV file in chunks"""
+
+    def __init__(self, path: str):
+        self._file = wave.open(path, 'rb')
+        self.sample_rate = self._file.getframerate()
+        self.channels = self._file.getnchannels()
+        self.sample_width = self._file.getsampwidth()
+        self.total_frames = self._file.getnframes()
+
+    def read(self, frames: int) -> bytes:
+        """Read up to frames PCM frames"""
+        return self._file.readframes(frames)
+
+    def seek(self, frame: int):
+        """Move to a frame"""
+        self._file.setpos(frame)
+
+    def close(self):
+        self._file.close()
+
+
+class SoundFileChunkReader:
+    """Reads compressed audio (OGG, FLAC, MP3) as 16-bit PCM in chunks through soundfile"""
+
+    def __init__(self, path: str):
+        self._file = soundfile.SoundFile(path)
+        self.sample_rate = self._file.samplerate
+        self.channels = self._file.channels
+        self.sample_width = 2
+        self.total_frames = self._file.frames
+
+    def read(self, frames: int) -> bytes:
+        """Read up to frames PCM frames"""
+        return self._file.read(frames, dtype='int16').tobytes()
+
+    def seek(self, frame: int):
+        """Move to a frame"""
+        self._file.seek(frame)
+
+    def close(self):
+        self._file.close()
+
+
+class MemoryChunkReader:
+    """Serves chunks of an already decoded sound (formats that can't be read incrementally)"""
+
+    def __init__(self, frames: bytes, sample_rate: int, channels: int, sample_width: int):
+        self._frames = memoryview(frames)
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.sample_width = sample_width
+        self._frame_size = channels * sample_width
+        self.total_frames = len(frames) // self._frame_size
+        self._position = 0
+
+    def read(self, frames: int) -> bytes:
+        """Read up to frames PCM frames"""
+        start = self._position * self._frame_size
+        frames = max(0, min(frames, self.total_frames - self._position))
+        self._position += frames
+        return bytes(self._frames[start:start + frames * self._frame_size])
+
+    def seek(self, frame: int):
+        """Move to a frame"""
+        self._position = max(0, min(frame, self.total_frames))
+
+    def close(self):
+        self._frames.release()
+
+
+def open_chunk_reader(path: str, decoder: Optional[Callable[[str], Optional[Tuple]]] = None):
+    """
+    Open a chunked PCM reader for a sound file. WAV is read incrementally,
+    as are OGG/FLAC/MP3 when soundfile is installed; other files are fully
+    decoded with decoder (e.g. OpenALAudioSystem.decode_sound), which
+    still keeps the decode off the calling thread when used by AudioStream.
+    """
+    file_ext = path.lower().split('.')[-1]
+    if file_ext == 'wav':
+        return WavChunkReader(path)
+    if SOUNDFILE_AVAILABLE and file_ext in SOUNDFILE_FORMATS:
+        try:
+            return SoundFileChunkReader(path)
+        except RuntimeError as e:
+            print(f"Error streaming {path} with soundfile: {e}")
+    if decoder is None:
+        return None
+    decoded = decoder(path)
+    if decoded is None:
+        return None
+    frames, sample_rate, channels, sample_width, _ = decoded
+    return MemoryChunkReader(frames, sample_rate, channels, sample_width)
+
+
+def get_al_format(channels: int, sample_width: int) -> Optional[int]:
+    """Get the OpenAL buffer format for PCM data, or None if unsupported"""
+    formats = {
+        (1, 1): al.AL_FORMAT_MONO8, (1, 2): al.AL_FORMAT_MONO16,
+        (2, 1): al.AL_FORMAT_STEREO8, (2, 2): al.AL_FORMAT_STEREO16,
+    }
+    return formats.get((channels, sample_width))
+
+
+class AudioStream:
+    """
+    A sound played from a ring of queued OpenAL buffers. A background
+    thread decodes chunk_seconds of PCM at a time into a small queue; each
+    update() unqueues the buffers OpenAL has played and refills them.
+    Looping jumps from loop_end back to loop_start inside the decoded data,
+    so the seam is sample-accurate. Volume fades (fade_in/fade_out) are
+    applied on update, which is how OpenALAudioSystem crossfades music.
+    """
+
+    def __init__(self, path: str, source_id: Optional[int] = None, volume: float = 1.0, loop: bool = False,
+                 loop_start: float = 0.0, loop_end: Optional[float] = None,
+                 decoder: Optional[Callable[[str], Optional[Tuple]]] = None,
+                 chunk_seconds: float = DEFAULT_CHUNK_SECONDS, buffer_count: int = DEFAULT_BUFFER_COUNT):
+        self.path = path
+        self.source_id = source_id
+        self.volume = volume
+        self.loop = loop
+        self.loop_start = loop_start
+        self.loop_end = loop_end  # None: end of file
+        self.chunk_seconds = chunk_seconds
+        self.buffer_count = buffer_count
+
+        self.sample_rate = 0
+        self.channels = 0
+        self.sample_width = 0
+        self.duration = 0.0
+        self.is_playing = False
+        self.is_paused = False
+        self.finished = False
+        self.underruns = 0  # Times the source ran dry and had to be restarted
+
+        self._decoder = decoder
+        self._chunks: "queue.Queue" = queue.Queue(maxsize=buffer_count)  # (start frame, PCM) or None at the end
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._end_of_stream = False
+        self._al_format = None
+        self._loop_frames = (0, 0)  # Loop start and end frames, set once the file is open
+
+        self._buffer_ids: List[int] = []
+        self._free_buffers: Deque[int] = deque()
+        self._queued: Deque[Tuple[int, int]] = deque()  # (buffer id, start frame) in play order
+
+        self._fade_gain = 1.0
+        self._fade_target = 1.0
+        self._fade_rate = 0.0  # Gain change per second; 0: no fade running
+        self._stop_after_fade = False
+        self._last_update = None
+
+    # Control
+    def start(self):
+        """Start decoding; playback begins on the first update() with data"""
+        if self._thread is not None:
+            return
+        if OPENAL_AVAILABLE and self.source_id is not None:
+            import ctypes
+            buffers = (ctypes.c_uint * self.buffer_count)()
+            al.alGenBuffers(self.buffer_count, buffers)
+            self._buffer_ids = list(buffers)
+            self._free_buffers.extend(self._buffer_ids)
+            al.alSourcei(self.source_id, al.AL_BUFFER, 0)
+            al.alSourcei(self.source_id, al.AL_LOOPING, al.AL_FALSE)  # Looping is done by the decoder
+        self.is_playing = True
+        self._apply_gain()
+        self._thread = threading.Thread(target=self._decode_loop, name=f"AudioStream:{os.path.basename(self.path)}",
+                                        daemon=True)
+        self._thread.start()
+
+    def pause(self):
+        """Pause playback (decoding stops once the queue is full)"""
+        if self.is_playing and not self.is_paused:
+            self.is_paused = True
+            if OPENAL_AVAILABLE and self.source_id is not None:
+                al.alSourcePause(self.source_id)
+
+    def resume(self):
+        """Resume after pause()"""
+        if self.is_paused:
+            self.is_paused = False
+            self._last_update = None
+            if OPENAL_AVAILABLE and self.source_id is not None and self._queued:
+                al.alSourcePlay(self.source_id)
+
+    def set_volume(self, volume: float):
+        """Set stream volume (0.0 to 1.0), before fades"""
+        self.volume = max(0.0, min(1.0, volume))
+        self._apply_gain()
+
+    def fade_in(self, duration: float):
+        """Start silent and fade up to volume"""
+        self._fade_gain = 0.0 if duration > 0 else 1.0
+        self._fade_to(1.0, duration)
+
+    def fade_out(self, duration: float, stop: bool = True):
+        """Fade to silence, then stop the stream (unless stop is False)"""
+        self._stop_after_fade = stop
+        self._fade_to(0.0, duration)
+
+    def get_position(self) -> float:
+        """Get the playback position in seconds within the file"""
+        if not self.sample_rate or not self._queued:
+            return 0.0
+        frame = self._queued[0][1]
+        if OPENAL_AVAILABLE and self.source_id is not None:
+            import ctypes
+            offset = ctypes.c_int()
+            al.alGetSourcei(self.source_id, al.AL_SAMPLE_OFFSET, ctypes.byref(offset))
+            frame += offset.value
+        loop_start, loop_end = self._loop_frames
+        if self.loop and loop_end > loop_start and frame >= loop_end:
+            frame = loop_start + (frame - loop_start) % (loop_end - loop_start)
+        return frame / self.sample_rate
+
+    # Main thread
+    def update(self) -> bool:
+        """Refill played buffers and advance fades; returns False once the stream has finished"""
+        if self.finished:
+            return False
+
+        now = time.perf_counter()
+        delta = now - self._last_update if self._last_update is not None else 0.0
+        self._last_update = now
+        if self.is_paused:
+            return True
+
+        if self._fade_rate:
+            self._advance_fade(delta)
+            if self.finished:
+                return False
+
+        if OPENAL_AVAILABLE and self.source_id is not None:
+            self._service_source()
+        return not self.finished
+
+    def close(self):
+        """Stop playback and decoding and release the ring buffers (the source stays with its owner)"""
+        self.finished = True
+        self.is_playing = False
+        self._stop_event.set()
+        self._drain_chunks()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+        if OPENAL_AVAILABLE and self.source_id is not None:
+            import ctypes
+            al.alSourceStop(self.source_id)
+            self._unqueue(len(self._queued))
+            al.alSourcei(self.source_id, al.AL_BUFFER, 0)
+            if self._buffer_ids:
+                al.alDeleteBuffers(len(self._buffer_ids), (ctypes.c_uint * len(self._buffer_ids))(*self._buffer_ids))
+        self._buffer_ids = []
+        self._free_buffers.clear()
+        self._queued.clear()
+
+    def _service_source(self):
+        """Unqueue played buffers, queue decoded chunks and keep the source playing"""
+        import ctypes
+        processed = ctypes.c_int()
+        al.alGetSourcei(self.source_id, al.AL_BUFFERS_PROCESSED, ctypes.byref(processed))
+        if processed.value:
+            self._unqueue(processed.value)
+
+        while self._free_buffers and not self._end_of_stream:
+            try:
+                chunk = self._chunks.get_nowait()
+            except queue.Empty:
+                break
+            if chunk is None:
+                self._end_of_stream = True
+                break
+            start_frame, data = chunk
+            buffer_id = self._free_buffers.popleft()
+            al.alBufferData(buffer_id, self._al_format, data, len(data), self.sample_rate)
+            al.alSourceQueueBuffers(self.source_id, 1, (ctypes.c_uint * 1)(buffer_id))
+            self._queued.append((buffer_id, start_frame))
+
+        state = ctypes.c_int()
+        al.alGetSourcei(self.source_id, al.AL_SOURCE_STATE, ctypes.byref(state))
+        if state.value != al.AL_PLAYING and state.value != al.AL_PAUSED:
+            if self._queued:
+                if state.value == al.AL_STOPPED:
+                    self.underruns += 1
+                al.alSourcePlay(self.source_id)
+            elif self._end_of_stream:
+                self.finished = True
+                self.is_playing = False
+
+    def _unqueue(self, count: int):
+        """Take played buffers off the source and return them to the free ring"""
+        if count <= 0:
+            return
+        import ctypes
+        buffers = (ctypes.c_uint * count)()
+        al.alSourceUnqueueBuffers(self.source_id, count, buffers)
+        for _ in range(count):
+            if self._queued:
+                self._queued.popleft()
+        self._free_buffers.extend(buffers)
+
+    # Fades
+    def _fade_to(self, target: float, duration: float):
+        self._fade_target = target
+        if duration <= 0:
+            self._fade_gain = target
+            self._fade_rate = 0.0
+            self._apply_gain()
+            if target == 0.0 and self._stop_after_fade:
+                self.close()
+            return
+        self._fade_rate = abs(target - self._fade_gain) / duration or 1.0
+        self._apply_gain()
+
+    def _advance_fade(self, delta: float):
+        step = self._fade_rate * delta
+        if abs(self._fade_target - self._fade_gain) <= step:
+            self._fade_gain = self._fade_target
+            self._fade_rate = 0.0
+        elif self._fade_target > self._fade_gain:
+            self._fade_gain += step
+        else:
+            self._fade_gain -= step
+        self._apply_gain()
+        if not self._fade_rate and self._fade_gain == 0.0 and self._stop_after_fade:
+            self.close()
+
+    def _apply_gain(self):
+        if OPENAL_AVAILABLE and self.source_id is not None:
+            al.alSourcef(self.source_id, al.AL_GAIN, self.volume * self._fade_gain)
+
+    # Decode thread
+    def _decode_loop(self):
+        """Fill the chunk queue until the end of the file (never, when looping) or close()"""
+        reader = None
+        try:
+            reader = open_chunk_reader(self.path, self._decoder)
+            if reader is None or not reader.total_frames:
+                return
+            if OPENAL_AVAILABLE:
+                self._al_format = get_al_format(reader.channels, reader.sample_width)
+                if self._al_format is None:
+                    print(f"Unsupported audio format for streaming: {self.path} "
+                          f"({reader.channels} channels, {reader.sample_width * 8}-bit)")
+                    return
+            self.sample_rate = reader.sample_rate
+            self.channels = reader.channels
+            self.sample_width = reader.sample_width
+            self.duration = reader.total_frames / reader.sample_rate
+
+            total = reader.total_frames
+            loop_end = min(total, int(self.loop_end * reader.sample_rate)) if self.loop_end else total
+            loop_start = min(max(0, int(self.loop_start * reader.sample_rate)), loop_end - 1)
+            self._loop_frames = (loop_start, loop_end)
+            frame_size = reader.channels * reader.sample_width
+            chunk_frames = max(1, int(reader.sample_rate * self.chunk_seconds))
+
+            position = 0
+            while not self._stop_event.is_set():
+                # Assemble a full chunk, wrapping at the loop end so the seam has no gap
+                chunk_start = position
+                pieces = []
+                needed = chunk_frames
+                while needed and not self._stop_event.is_set():
+                    end = loop_end if self.loop else total
+                    if position >= end:
+                        if not self.loop:
+                            break
+                        reader.seek(loop_start)
+                        position = loop_start
+                        continue
+                    data = reader.read(min(needed, end - position))
+                    frames = len(data) // frame_size
+                    if not frames:
+                        if not self.loop or position == loop_start:
+                            break
+                        position = end  # File shorter than reported: wrap now
+                        continue
+                    pieces.append(data)
+                    position += frames
+                    needed -= frames
+                if not pieces:
+                    break
+                if not self._put((chunk_start, b"".join(pieces))):
+                    return
+        except Exception as e:
+            print(f"Error streaming {self.path}: {e}")
+        finally:
+            if reader is not None:
+                reader.close()
+            self._put(None)
+
+    def _put(self, chunk) -> bool:
+        """Queue a chunk, waiting for space; False if the stream was closed meanwhile"""
+        while not self._stop_event.is_set():
+            try:
+                self._chunks.put(chunk, timeout=0.05)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _drain_chunks(self):
+        while True:
+            try:
+                self._chunks.get_nowait()
+            except queue.Empty:
+                return
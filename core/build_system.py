@@ -46,6 +46,7 @@ class GameBuilder:
             "icon_path": None,
             "additional_files": [],
             "exclude_modules": [],
+            "compact_animations": True,  # Reduce keyframes and pack .anim files in the build
             # Browser-specific settings
             "browser_width": 1920,
             "browser_height": 1080,
@@ -290,6 +291,9 @@ if __name__ == "__main__":
                 dst_dir = game_data_dir / dir_name
                 shutil.copytree(src_dir, dst_dir, dirs_exist_ok=True)
         
+        # Bake animation curves so the game loads them from the bake cache
+        self._bake_animations(game_data_dir)
+        
         # Copy project configuration
         dst_project_file = game_data_dir / "project.lupine"
         shutil.copy2(self.project_file, dst_project_file)
@@ -314,6 +318,66 @@ if __name__ == "__main__":
                 dst_file = engine_data_dir / file_name
                 shutil.copy2(src_file, dst_file)
 
+    def _bake_animations(self, game_data_dir: Path):
+        """
+        Compact every animation file in the collected game data, then write
+        its bake cache at the bake rate the scenes' AnimationPlayers use, so
+        the game loads the curves instead of baking them. Files no player
+        bakes get no cache.
+        """
+        try:
+            from core.animation.bake_cache import bake_animation_file
+            from core.animation.animation_file import compact_animation_file
+        except ImportError:
+            return
+        
+        compact = self.build_config.get("compact_animations", True)
+        bake_rates = self._collect_animation_bake_rates(game_data_dir)
+        for animation_path in game_data_dir.rglob("*.anim"):
+            try:
+                if compact:
+                    compact_animation_file(animation_path)
+                rates = bake_rates.get(animation_path.resolve())
+                if not rates:
+                    continue
+                if len(rates) > 1:
+                    # The bake cache holds one rate; players at the other rates bake at load
+                    print(f"Warning: {animation_path} is baked at several rates {rates}, "
+                          f"caching {rates[0]}")
+                bake_animation_file(animation_path, rates[0])
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Warning: Could not bake {animation_path}: {e}")
+
+    def _collect_animation_bake_rates(self, game_data_dir: Path) -> Dict[Path, List[float]]:
+        """Map each animation file baked by an AnimationPlayer in the collected scenes to its bake rates"""
+        try:
+            from core.scene.binary_scene import load_scene_data
+        except ImportError:
+            return {}
+
+        bake_rates: Dict[Path, List[float]] = {}
+        for scene_path in game_data_dir.rglob("*.scene"):
+            try:
+                stack = list(load_scene_data(scene_path).get("nodes", []))
+            except (OSError, ValueError) as e:
+                print(f"Warning: Could not read {scene_path}: {e}")
+                continue
+            while stack:
+                node = stack.pop()
+                stack.extend(node.get("children", []))
+                if node.get("type") != "AnimationPlayer":
+                    continue
+                animation_file = node.get("animation_file")
+                bake_rate = node.get("bake_rate", 0.0)
+                if not animation_file or not bake_rate or bake_rate <= 0:
+                    continue
+                # Animation files are relative to the project root
+                animation_path = (game_data_dir / animation_file).resolve()
+                rates = bake_rates.setdefault(animation_path, [])
+                if bake_rate not in rates:
+                    rates.append(bake_rate)
+        return bake_rates
+    
     def _create_pyinstaller_spec(self, build_dir: Path, launcher_path: Path) -> Path:
         """Create PyInstaller spec file"""
         project_name = self.project_config.get("name", "LupineGame").replace(" ", "")
@@ -841,6 +905,9 @@ if __name__ == "__main__":
                 dst_dir = game_data_dir / dir_name
                 shutil.copytree(src_dir, dst_dir, dirs_exist_ok=True)
 
+        # Bake animation curves so the game loads them from the bake cache
+        self._bake_animations(game_data_dir)
+
         # Copy project configuration
         dst_project_file = game_data_dir / "project.lupine"
         shutil.copy2(self.project_file, dst_project_file)
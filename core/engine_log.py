@@ -0,0 +1,299 @@
+"""
+Engine Logging for Lupine Engine
+Per-subsystem log levels, lazy formatting, rate limiting and a ring-buffered async sink
+"""
+
+import atexit
+import os
+import sys
+import threading
+import time
+from collections import deque
+from typing import Dict, Any, List, Optional, TextIO, Tuple
+
+
+# Log levels (compatible with the stdlib logging values)
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+OFF = 100
+
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR", OFF: "OFF"}
+_LEVELS_BY_NAME = {name: level for level, name in LEVEL_NAMES.items()}
+
+# Level used for subsystems without an explicit level
+DEFAULT_LEVEL = WARNING
+
+# Argument types the writer thread can format later; others (lists, vectors,
+# nodes) may change before it does, so their messages are formatted eagerly
+_IMMUTABLE_ARG_TYPES = frozenset((str, int, float, bool, bytes, type(None)))
+
+
+def parse_level(level: Any) -> int:
+    """Convert a level name or number to a level number"""
+    if isinstance(level, int):
+        return level
+    return _LEVELS_BY_NAME.get(str(level).strip().upper(), DEFAULT_LEVEL)
+
+
+def format_message(message: str, args: Tuple) -> str:
+    """Apply %-style arguments to a message, never raising"""
+    if not args:
+        return message
+    try:
+        return message % args
+    except Exception as e:
+        return f"{message} {args} (format error: {e})"
+
+
+class LogSink:
+    """
+    Ring buffer drained by a background thread.
+
+    Callers only append a raw record; formatting and writing happen on the
+    writer thread (records with mutable arguments arrive already formatted).
+    When the buffer is full the oldest records are dropped.
+    """
+
+    def __init__(self, capacity: int = 4096, stream: Optional[TextIO] = None,
+                 history_size: int = 500, flush_interval: float = 0.05):
+        self.capacity = capacity
+        self.stream = stream
+        self.flush_interval = flush_interval
+        self.dropped_count = 0
+
+        self._buffer: deque = deque()
+        self._history: deque = deque(maxlen=history_size)
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, record: Tuple):
+        """Queue a record (subsystem, level, message, args, timestamp, suppressed)"""
+        buffer = self._buffer
+        if len(buffer) >= self.capacity:
+            buffer.popleft()
+            self.dropped_count += 1
+        buffer.append(record)
+
+        if self._thread is None:
+            self._start()
+        if record[1] >= ERROR:
+            self._wake.set()
+
+    def _start(self):
+        """Start the writer thread on first use"""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="LupineLogSink", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        """Writer thread loop"""
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self):
+        """Format and write every queued record"""
+        with self._lock:
+            buffer = self._buffer
+            if not buffer and not self.dropped_count:
+                return
+
+            lines = []
+            while buffer:
+                lines.append(self.format_record(buffer.popleft()))
+            if self.dropped_count:
+                lines.append(f"[LOG] Dropped {self.dropped_count} messages (log buffer full)")
+                self.dropped_count = 0
+
+            self._history.extend(lines)
+            stream = self.stream or sys.stdout
+            try:
+                stream.write("\n".join(lines) + "\n")
+                stream.flush()
+            except Exception:
+                pass  # Never let logging break the caller
+
+    @staticmethod
+    def format_record(record: Tuple) -> str:
+        """Format a raw record into a console line"""
+        subsystem, level, message, args, _timestamp, suppressed = record
+        message = format_message(message, args)
+        prefix = f"[{subsystem.upper()}]"
+        if level >= WARNING:
+            prefix += f" {LEVEL_NAMES.get(level, level)}:"
+        line = f"{prefix} {message}"
+        if suppressed:
+            line += f" (suppressed {suppressed} repeats)"
+        return line
+
+    def get_recent(self, count: int = 100) -> List[str]:
+        """Get the most recently written lines"""
+        self.flush()
+        return list(self._history)[-count:]
+
+
+class EngineLogger:
+    """
+    Logger for one engine subsystem.
+
+    Messages use %-style arguments and are only formatted once enabled: by
+    the sink for immutable arguments, on the calling thread when an
+    argument could change before the sink gets to it. A disabled call costs
+    one level comparison. Guard expensive argument construction with
+    ``is_enabled_for``.
+    """
+
+    def __init__(self, subsystem: str, level: int, sink: LogSink):
+        self.subsystem = subsystem
+        self.level = level
+        self.sink = sink
+
+        # Rate limiting: at most rate_limit messages per template per second
+        self.rate_limit = 0
+        self._rate_windows: Dict[str, List] = {}
+
+    def is_enabled_for(self, level: int) -> bool:
+        """Check whether messages at a level would be logged"""
+        return level >= self.level
+
+    def log(self, level: int, message: str, *args):
+        """Log a message at the given level"""
+        if level < self.level:
+            return
+        self._emit(level, message, args)
+
+    def debug(self, message: str, *args):
+        """Log a debug message"""
+        if DEBUG < self.level:
+            return
+        self._emit(DEBUG, message, args)
+
+    def info(self, message: str, *args):
+        """Log an info message"""
+        if INFO < self.level:
+            return
+        self._emit(INFO, message, args)
+
+    def warning(self, message: str, *args):
+        """Log a warning"""
+        if WARNING < self.level:
+            return
+        self._emit(WARNING, message, args)
+
+    def error(self, message: str, *args):
+        """Log an error"""
+        if ERROR < self.level:
+            return
+        self._emit(ERROR, message, args)
+
+    def _emit(self, level: int, message: str, args: Tuple):
+        """Rate limit and hand a record to the sink"""
+        suppressed = 0
+        if self.rate_limit:
+            now = time.monotonic()
+            window = self._rate_windows.get(message)
+            if window is None or now - window[0] >= 1.0:
+                # New one-second window: report what the previous one dropped
+                suppressed = window[2] if window else 0
+                self._rate_windows[message] = [now, 1, 0]
+            elif window[1] >= self.rate_limit:
+                window[2] += 1
+                return
+            else:
+                window[1] += 1
+
+        for arg in args:
+            if arg.__class__ not in _IMMUTABLE_ARG_TYPES:
+                message = format_message(message, args)
+                args = ()
+                break
+
+        self.sink.submit((self.subsystem, level, message, args, time.time(), suppressed))
+
+
+class LogManager:
+    """Registry of subsystem loggers sharing one sink"""
+
+    def __init__(self):
+        self.sink = LogSink()
+        self.default_level = DEFAULT_LEVEL
+        self.default_rate_limit = 20
+        self._loggers: Dict[str, EngineLogger] = {}
+        self._levels: Dict[str, int] = {}
+
+        self._load_env_levels()
+
+    def _load_env_levels(self):
+        """Read levels from LUPINE_LOG, e.g. 'physics=debug,kinematic=info,*=warning'"""
+        spec = os.environ.get("LUPINE_LOG", "")
+        for entry in spec.split(","):
+            if "=" not in entry:
+                continue
+            subsystem, level = entry.split("=", 1)
+            subsystem = subsystem.strip().lower()
+            if subsystem == "*":
+                self.default_level = parse_level(level)
+            elif subsystem:
+                self._levels[subsystem] = parse_level(level)
+
+    def get_logger(self, subsystem: str) -> EngineLogger:
+        """Get (or create) the logger for a subsystem"""
+        key = subsystem.lower()
+        logger = self._loggers.get(key)
+        if logger is None:
+            logger = EngineLogger(key, self._levels.get(key, self.default_level), self.sink)
+            logger.rate_limit = self.default_rate_limit
+            self._loggers[key] = logger
+        return logger
+
+    def set_level(self, subsystem: str, level: Any):
+        """Set the level for one subsystem"""
+        key = subsystem.lower()
+        self._levels[key] = parse_level(level)
+        if key in self._loggers:
+            self._loggers[key].level = self._levels[key]
+
+    def set_default_level(self, level: Any):
+        """Set the level for every subsystem without an explicit level"""
+        self.default_level = parse_level(level)
+        for key, logger in self._loggers.items():
+            if key not in self._levels:
+                logger.level = self.default_level
+
+    def set_rate_limit(self, messages_per_second: int, subsystem: Optional[str] = None):
+        """Limit repeats of each message template (0 disables limiting)"""
+        if subsystem is None:
+            self.default_rate_limit = messages_per_second
+            for logger in self._loggers.values():
+                logger.rate_limit = messages_per_second
+        else:
+            self.get_logger(subsystem).rate_limit = messages_per_second
+
+    def get_levels(self) -> Dict[str, str]:
+        """Get the effective level name of every known subsystem"""
+        return {key: LEVEL_NAMES.get(logger.level, str(logger.level))
+                for key, logger in self._loggers.items()}
+
+    def flush(self):
+        """Write everything still queued"""
+        self.sink.flush()
+
+
+# Global instance
+log_manager = LogManager()
+atexit.register(log_manager.flush)
+
+
+def get_logger(subsystem: str) -> EngineLogger:
+    """Get the logger for an engine subsystem"""
+    return log_manager.get_logger(subsystem)
+
+
+def set_log_level(subsystem: str, level: Any):
+    """Set the log level for an engine subsystem"""
+    log_manager.set_level(subsystem, level)
@@ -5,6 +5,7 @@ Manages all game systems and provides a clean interface for game execution
 
 import pygame
 import json
+import posixpath
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Set, Tuple
 from pygame.locals import *
@@ -14,6 +15,12 @@ from OpenGL.GL import *
 from .shared_renderer import SharedRenderer
 from .openal_audio import OpenALAudioSystem
 from .scene import Scene, Node, Node2D, Camera2D
+from .scene.scene_streamer import SceneStreamer, StreamCancelledError
+from .scene.transform_store import TransformStore
+from .animation.tween_manager import TweenManager
+from .animation.animation_lod import AnimationLOD, set_animation_lod
+from .hot_reload import HotReloader
+from .project import get_current_project
 
 # Optional imports with fallbacks
 try:
@@ -53,6 +60,11 @@ try:
 except ImportError:
     INPUT_CONSTANTS_AVAILABLE = False
 
+# Physics profiler overlay text; drawing and releasing must use the same style,
+# since both make up the renderer's text texture cache key
+PHYSICS_OVERLAY_FONT_SIZE = 12
+PHYSICS_OVERLAY_TEXT_COLOR = (0.6, 1.0, 0.6, 1.0)
+
 
 class SimpleCamera:
     """Simple camera implementation for game rendering"""
@@ -166,10 +178,15 @@ class GameSystemManager:
         print("[OK] Game systems cleaned up")
 
 
+def _normalize_path(path: str) -> str:
+    """Normalize a project-relative path for comparison"""
+    return posixpath.normpath(path.replace('\\', '/'))
+
+
 class LupineGameEngine:
     """Main game engine class that orchestrates all systems and manages the game loop"""
     
-    def __init__(self, project_path: str, scene_path: str):
+    def __init__(self, project_path: str, scene_path: str, hot_reload: bool = False):
         self.project_path = Path(project_path)
         self.scene_path = scene_path
 
@@ -185,6 +202,7 @@ class LupineGameEngine:
         # Game state
         self.scene: Optional[Scene] = None
         self.camera: Optional[Any] = None
+        self.camera_node: Optional[Node] = None  # The current Camera2D, followed by the animation LOD
         self.clock = pygame.time.Clock()
         self.running = True
 
@@ -196,6 +214,33 @@ class LupineGameEngine:
         self.mouse_position: Tuple[float, float] = (0.0, 0.0)
         self.current_modifiers: Set[str] = set()
 
+        # Physics profiler overlay (toggled with F3)
+        self.show_physics_overlay = False
+        self._physics_overlay_lines: List[str] = []
+        self._physics_overlay_frame = 0
+
+        # Background scene streaming (finalized in _update within a frame budget)
+        self.scene_streamer = SceneStreamer(
+            path_resolver=lambda path: self.project_path / path,
+            renderer=self.systems.renderer,
+            audio_system=self.systems.audio_system,
+            node_finalizer=self._setup_streamed_node
+        )
+        self._scene_stream_request: Optional[str] = None
+
+        # Hot reload of changed scripts, scenes and assets (see enable_hot_reload)
+        self.hot_reloader: Optional[HotReloader] = None
+
+        # Structure-of-arrays global transforms (see enable_transform_store)
+        self.transform_store: Optional[TransformStore] = None
+
+        # Property tweens started by scripts, advanced once per frame
+        self.tween_manager = TweenManager()
+
+        # Slower or paused animation updates for small and off-screen nodes
+        self.animation_lod = AnimationLOD()
+        set_animation_lod(self.animation_lod)
+
         # Setup Python runtime integration
         if self.systems.python_runtime:
             self.systems.python_runtime.game_runtime = self
@@ -203,6 +248,9 @@ class LupineGameEngine:
 
         # Load the scene
         self._load_scene()
+
+        if hot_reload:
+            self.enable_hot_reload()
     
     def _initialize_pygame(self):
         """Initialize Pygame and OpenGL context"""
@@ -261,6 +309,9 @@ class LupineGameEngine:
             "get_delta_time": lambda: self.systems.python_runtime.delta_time if self.systems.python_runtime else 0.0,
             "get_runtime_time": lambda: self.systems.python_runtime.get_runtime_time() if self.systems.python_runtime else 0.0,
             "get_fps": lambda: 1.0 / self.systems.python_runtime.delta_time if self.systems.python_runtime and self.systems.python_runtime.delta_time > 0 else 0.0,
+            "tween_property": self.tween_manager.tween_property,
+            "tween_method": self.tween_manager.tween_method,
+            "stop_tween": self.tween_manager.stop,
         }
         
         # Input functions
@@ -307,6 +358,15 @@ class LupineGameEngine:
                 raise FileNotFoundError(f"Scene file not found: {scene_file}")
             
             if PYTHON_RUNTIME_AVAILABLE:
+                # The old scene's nodes must not stay in the transform store or the physics world
+                if self.scene is not None:
+                    for root_node in self.scene.root_nodes:
+                        if self.transform_store:
+                            self.transform_store.detach(root_node)
+                        self._remove_physics_recursive(root_node)
+
+                # The new scene's cameras are found during setup
+                self.camera_node = None
                 self.scene = Scene.load_from_file(str(scene_file))
                 print(f"[OK] Scene loaded: {self.scene.name} ({len(self.scene.root_nodes)} root nodes)")
                 self._setup_scene()
@@ -335,9 +395,23 @@ class LupineGameEngine:
         for root_node in self.scene.root_nodes:
             self._setup_node_recursive(root_node)
             self._find_cameras_recursive(root_node)
+            if self.transform_store:
+                self.transform_store.attach(root_node)
     
     def _setup_node_recursive(self, node: Node):
         """Setup a node and all its children"""
+        self._setup_node(node)
+
+        # Setup children
+        for child in node.children:
+            self._setup_node_recursive(child)
+
+    def _setup_streamed_node(self, node: Node):
+        """Setup a node of a streamed scene; its physics body is added when the scene is swapped in"""
+        self._setup_node(node, defer_physics=True)
+
+    def _setup_node(self, node: Node, defer_physics: bool = False):
+        """Setup a single node (scripts, type-specific systems, _ready)"""
         try:
             # Load and execute scripts (both legacy single script and new multiple scripts)
             has_legacy_script = hasattr(node, 'script_path') and node.script_path
@@ -347,7 +421,7 @@ class LupineGameEngine:
                 self._load_node_script(node)
 
             # Setup node-specific functionality
-            self._setup_node_type(node)
+            self._setup_node_type(node, defer_physics)
 
             # Call the node's _ready method if it exists (for custom node classes)
             if hasattr(node, '_ready') and callable(getattr(node, '_ready')):
@@ -356,10 +430,6 @@ class LupineGameEngine:
                 except Exception as e:
                     print(f"Error calling _ready on {node.name}: {e}")
 
-            # Setup children
-            for child in node.children:
-                self._setup_node_recursive(child)
-
         except Exception as e:
             print(f"Error setting up node {getattr(node, 'name', 'Unknown')}: {e}")
 
@@ -441,7 +511,7 @@ class LupineGameEngine:
             print(f"Error loading single script {script_path} for {node.name}: {e}")
             return False
 
-    def _setup_node_type(self, node: Node):
+    def _setup_node_type(self, node: Node, defer_physics: bool = False):
         """Setup node based on its type"""
         if not hasattr(node, 'type'):
             return
@@ -464,11 +534,9 @@ class LupineGameEngine:
             self._setup_camera_node(node)
 
         # Physics nodes - check both explicit types and physics_body_type property
-        elif self.systems.physics_world and (
-            node_type in ["RigidBody2D", "StaticBody2D", "KinematicBody2D", "Area2D"] or
-            hasattr(node, 'physics_body_type')
-        ):
-            self._setup_physics_node(node)
+        elif self._is_physics_node(node):
+            if not defer_physics:
+                self._setup_physics_node(node)
 
         # Light nodes
         elif node_type == "Light2D":
@@ -525,6 +593,7 @@ class LupineGameEngine:
         try:
             if getattr(node, 'current', False):
                 # Create a simple camera object
+                self.camera_node = node
                 self.camera = SimpleCamera()
                 if hasattr(node, 'position'):
                     self.camera.set_position(node.position[0], node.position[1])
@@ -535,6 +604,13 @@ class LupineGameEngine:
         except Exception as e:
             print(f"Error setting up camera node {node.name}: {e}")
 
+    def _is_physics_node(self, node: Node) -> bool:
+        """Check whether a node gets a body in the physics world"""
+        return bool(self.systems.physics_world) and (
+            getattr(node, 'type', None) in ["RigidBody2D", "StaticBody2D", "KinematicBody2D", "Area2D"] or
+            hasattr(node, 'physics_body_type')
+        )
+
     def _setup_physics_node(self, node: Node):
         """Setup a physics node"""
         try:
@@ -674,6 +750,8 @@ class LupineGameEngine:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
                 self.pressed_keys.add(event.key)
+                if event.key == pygame.K_F3:
+                    self.toggle_physics_overlay()
                 self._on_key_press(event.key, pygame.key.get_mods())
             elif event.type == pygame.KEYUP:
                 self.pressed_keys.discard(event.key)
@@ -692,6 +770,16 @@ class LupineGameEngine:
 
     def _update(self, delta_time: float):
         """Update game logic"""
+        # Apply changed files before scripts run this frame
+        if self.hot_reloader:
+            self.hot_reloader.update()
+
+        # Finalize streamed scenes within the frame budget
+        self.scene_streamer.update()
+        project = get_current_project()
+        if project is not None:
+            project.scene_manager.update_streaming()
+
         # Update systems
         if self.systems.audio_system:
             self.systems.audio_system.update()
@@ -705,17 +793,40 @@ class LupineGameEngine:
         if self.systems.python_runtime:
             self.systems.python_runtime.update_time(delta_time)
 
+        # Decide animation LOD from this frame's camera view
+        self._update_animation_lod()
+
         # Update scripts
         if self.systems.python_runtime and self.scene:
             for root_node in self.scene.root_nodes:
                 self._update_node_scripts_recursive(root_node, delta_time)
 
+        # Advance tweens (after scripts, so tweens started this frame apply immediately)
+        self.tween_manager.update(delta_time)
+
         # Update physics
         if self.systems.physics_world:
             self.systems.physics_world.step(delta_time)
 
+        # Recompute the global transforms moved this frame in one pass
+        if self.transform_store:
+            self.transform_store.update()
+
         # Sprite positions are now handled directly in rendering
 
+    def _update_animation_lod(self):
+        """Point the animation LOD at the current camera view"""
+        lod = self.animation_lod
+        if self.camera_node is not None:
+            lod.set_camera(self.camera_node, (self.width, self.height))
+        else:
+            # Without a camera the game bounds are shown, centered on the origin
+            bounds_width = self.systems.game_bounds_width
+            bounds_height = self.systems.game_bounds_height
+            lod.set_view(-bounds_width / 2, -bounds_height / 2, bounds_width, bounds_height,
+                         min(self.width / bounds_width, self.height / bounds_height))
+        lod.begin_frame()
+
     def _render(self):
         """Render the game using SharedRenderer like scene view"""
         if not self.systems.renderer:
@@ -732,6 +843,55 @@ class LupineGameEngine:
             for root_node in self.scene.root_nodes:
                 self._render_node_hierarchy(root_node)
 
+        if self.show_physics_overlay:
+            self._render_physics_overlay()
+
+    def toggle_physics_overlay(self):
+        """Show or hide the physics profiler overlay"""
+        physics_world = self.systems.physics_world
+        if not physics_world:
+            return
+
+        self.show_physics_overlay = not self.show_physics_overlay
+        if self.show_physics_overlay:
+            physics_world.enable_profiling()
+        else:
+            physics_world.disable_profiling()
+            self._set_physics_overlay_lines([])
+
+    def _set_physics_overlay_lines(self, lines: List[str]):
+        """Replace overlay text, freeing textures for lines that changed"""
+        renderer = self.systems.renderer
+        if renderer:
+            for line in self._physics_overlay_lines:
+                if line not in lines:
+                    renderer.release_text_texture(line, font_size=PHYSICS_OVERLAY_FONT_SIZE,
+                                                  color=PHYSICS_OVERLAY_TEXT_COLOR)
+        self._physics_overlay_lines = lines
+
+    def _render_physics_overlay(self):
+        """Draw physics profiler statistics in screen space"""
+        physics_world = self.systems.physics_world
+        profiler = physics_world.get_profiler() if physics_world else None
+        if not profiler:
+            return
+
+        # Refresh text twice a second so the numbers stay readable
+        if self._physics_overlay_frame % 30 == 0:
+            self._set_physics_overlay_lines(profiler.get_overlay_lines())
+        self._physics_overlay_frame += 1
+
+        renderer = self.systems.renderer
+        renderer.setup_2d_projection()
+
+        line_height = 16
+        width = 460
+        height = line_height * len(self._physics_overlay_lines) + 8
+        renderer.draw_rectangle(8 + width / 2, 8 + height / 2, width, height, (0.0, 0.0, 0.0, 0.6))
+        for i, line in enumerate(self._physics_overlay_lines):
+            renderer.draw_text(line, 12, 12 + i * line_height, font_size=PHYSICS_OVERLAY_FONT_SIZE,
+                               color=PHYSICS_OVERLAY_TEXT_COLOR)
+
     def _setup_unified_projection(self):
         """Setup unified projection matrix like scene view"""
         try:
@@ -837,6 +997,12 @@ class LupineGameEngine:
                 'vframes': getattr(node, 'vframes', 1),
                 'frame': getattr(node, 'frame', 0)
             })
+            if node_type == 'AnimatedSprite':
+                # Frame changes only move the UVs within the sheet or atlas
+                node_dict['frame_uv'] = node.get_frame_uv()
+                node_dict['atlas'] = node.get_atlas()
+                if node_dict['atlas'] is not None and node.region_enabled:
+                    node_dict['width'], node_dict['height'] = node.region_rect[2], node.region_rect[3]
         elif node_type in ['Control', 'Panel', 'Label', 'Button', 'ColorRect', 'TextureRect']:
             node_dict.update({
                 'size': getattr(node, 'size', getattr(node, 'rect_size', [100, 30])),
@@ -913,9 +1079,12 @@ class LupineGameEngine:
             x -= width / 2
             y -= height / 2
 
-        # Draw the sprite
+        # Draw the sprite (animation frames only select a region of the sheet or atlas)
+        atlas = node.get('atlas')
+        if atlas is not None:
+            atlas.upload(self.systems.renderer)
         self.systems.renderer.draw_sprite(
-            texture, x, y, width, height, 0, modulate[3]
+            texture, x, y, width, height, 0, modulate[3], region=node.get('frame_uv')
         )
 
     def _render_ui_node(self, node: Dict[str, Any]):
@@ -1289,26 +1458,26 @@ class LupineGameEngine:
 
     def _cleanup(self):
         """Cleanup resources"""
+        self.disable_hot_reload()
+        self.scene_streamer.shutdown()
         self.systems.cleanup()
         pygame.quit()
         print("[OK] Game engine cleaned up")
 
     # Input system integration methods
     def get_node(self, path: str) -> Optional[Node]:
-        """Get a node by path"""
+        """Get a node by path ("Root/Child", "%UniqueName/Child") or, failing that, by name"""
         if not self.scene:
             return None
-
-        # Simple implementation - find by name in root nodes
-        for root_node in self.scene.root_nodes:
-            if root_node.name == path:
-                return root_node
-            # Could add recursive search here
-        return None
+        return self.scene.find_node(path) or (None if "/" in path else self.scene.find_node_by_name(path))
 
     def find_node_by_name(self, name: str) -> Optional[Node]:
-        """Find a node by name"""
-        return self.get_node(name)
+        """Find a node by name anywhere in the current scene"""
+        if not self.scene:
+            return None
+        if name.startswith("%"):
+            return self.scene.find_node(name)
+        return self.scene.find_node_by_name(name)
 
     def get_scene(self) -> Optional[Scene]:
         """Get the current scene"""
@@ -1323,6 +1492,169 @@ class LupineGameEngine:
         except Exception as e:
             print(f"Error changing scene: {e}")
 
+    def change_scene_async(self, scene_path: str, priority: int = 0) -> str:
+        """
+        Stream a scene in the background and switch to it once it is set up.
+        The current scene keeps running meanwhile; a newer request cancels an
+        older one. Returns the stream request ID (see get_scene_load_progress).
+        """
+        if self._scene_stream_request:
+            self.scene_streamer.cancel(self._scene_stream_request)
+
+        request_id = self.scene_streamer.load(scene_path, priority, self._on_scene_streamed)
+        self._scene_stream_request = request_id
+        return request_id
+
+    def get_scene_load_progress(self) -> float:
+        """Get the progress (0.0 to 1.0) of the pending streamed scene change"""
+        if not self._scene_stream_request:
+            return 1.0
+        return self.scene_streamer.get_progress(self._scene_stream_request)
+
+    def _on_scene_streamed(self, scene: Optional[Scene], error: Optional[Exception], request_id: str):
+        """Switch to a streamed scene once it has been finalized"""
+        if request_id == self._scene_stream_request:
+            self._scene_stream_request = None
+        request = self.scene_streamer.get_request(request_id)
+        self.scene_streamer.forget(request_id)
+
+        if isinstance(error, StreamCancelledError):
+            return
+        if error is not None or scene is None:
+            print(f"Error streaming scene: {error}")
+            return
+
+        old_scene = self.scene
+        self.scene = scene
+        if old_scene is not None and old_scene is not scene:
+            self._release_scene(old_scene)
+        if request:
+            self.scene_path = request.scene_path
+        self.camera_node = None
+        for root_node in scene.root_nodes:
+            # Bodies join the world only now, so the old scene's never overlap them
+            self._add_physics_recursive(root_node)
+            self._find_cameras_recursive(root_node)
+            if self.transform_store:
+                self.transform_store.attach(root_node)
+        print(f"[OK] Scene changed to: {scene.name} ({len(scene.root_nodes)} root nodes)")
+
+    def _release_scene(self, scene: Scene):
+        """
+        Remove a discarded scene's physics bodies, then break its
+        parent/child and script links, so its nodes are freed by reference
+        counting instead of waiting for the cyclic GC, and its Node2D nodes
+        leave the transform store.
+        """
+        for root_node in scene.root_nodes:
+            self._remove_physics_recursive(root_node)
+
+        stack = list(scene.root_nodes)
+        while stack:
+            node = stack.pop()
+            stack.extend(node.children)
+            node.children = []
+            node.parent = None
+            node.script_instance = None
+            node.properties.pop('script_instances', None)
+            node.properties.pop('visual_script_instance', None)
+        scene.root_nodes = []
+
+    def enable_transform_store(self, capacity: int = 1024):
+        """Keep Node2D transforms in a TransformStore, updated once per frame"""
+        if self.transform_store is None:
+            self.transform_store = TransformStore(capacity)
+            if self.scene:
+                for root_node in self.scene.root_nodes:
+                    self.transform_store.attach(root_node)
+        return self.transform_store
+
+    def disable_transform_store(self):
+        """Go back to per-node cached global transforms"""
+        if self.transform_store is not None:
+            if self.scene:
+                for root_node in self.scene.root_nodes:
+                    self.transform_store.detach(root_node)
+            self.transform_store = None
+
+    def enable_hot_reload(self, interval: float = 0.1):
+        """Watch the project and apply changed scripts, scenes and assets while running"""
+        if self.hot_reloader is None:
+            self.hot_reloader = HotReloader(self, interval)
+            self.hot_reloader.start()
+
+    def disable_hot_reload(self):
+        """Stop watching the project for changes"""
+        if self.hot_reloader is not None:
+            self.hot_reloader.stop()
+            self.hot_reloader = None
+
+    def reload_scene_file(self, scene_path: str) -> bool:
+        """
+        Apply a changed scene file: the current scene is streamed in again,
+        and instances of the scene inside it are rebuilt in place.
+        """
+        if not self.scene:
+            return False
+
+        scene_path = _normalize_path(scene_path)
+        if _normalize_path(self.scene_path) == scene_path:
+            self.change_scene_async(self.scene_path)
+            return True
+
+        instances = []
+        stack = list(self.scene.root_nodes)
+        while stack:
+            node = stack.pop()
+            if node.type == "SceneInstance" and _normalize_path(getattr(node, 'scene_path', '') or '') == scene_path:
+                instances.append(node)
+            else:
+                stack.extend(node.children)
+        if not instances:
+            return False
+
+        scene = Scene.load_from_file(str(self.project_path / scene_path))
+        if scene is None:
+            return False
+
+        for instance in instances:
+            for child in list(instance.children):
+                self._remove_physics_recursive(child)
+                instance.remove_child(child)
+
+            instance.original_scene = scene
+            for root_node in scene.root_nodes:
+                instance.add_child(root_node.duplicate())
+            if hasattr(instance, 'apply_property_overrides'):
+                instance.apply_property_overrides()
+
+            for child in instance.children:
+                self._setup_node_recursive(child)
+                self._find_cameras_recursive(child)
+
+        print(f"[OK] Reloaded {len(instances)} instance(s) of {scene_path}")
+        return True
+
+    def _add_physics_recursive(self, node: Node):
+        """Add the physics bodies of a node and its children"""
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if self._is_physics_node(node):
+                self._setup_physics_node(node)
+            stack.extend(reversed(node.children))
+
+    def _remove_physics_recursive(self, node: Node):
+        """Remove the physics bodies of a node and its children"""
+        physics_world = self.systems.physics_world
+        if not physics_world:
+            return
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            physics_world.remove_node(f"{node.name}_{id(node)}")
+            stack.extend(node.children)
+
     def reload_scene(self):
         """Reload the current scene"""
         self.change_scene(self.scene_path)
@@ -0,0 +1,207 @@
+"""
+hot_reload.py
+
+Hot reload for running games. FileWatcher polls the project tree for
+changed files on a background thread (stdlib only, no inotify); the
+HotReloader applies the changes to the engine on the main thread:
+
+- scripts are recompiled and patched into their live instances, keeping
+  export values and other state
+- scenes are re-instantiated in place (or the whole current scene is
+  streamed in again)
+- textures and sounds are dropped from the caches and reload on next use
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .engine_log import get_logger
+
+log = get_logger("hot_reload")
+
+
+SCENE_EXTENSIONS = (".scene",)
+SCRIPT_EXTENSIONS = (".py",)
+TEXTURE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".tga", ".gif")
+SOUND_EXTENSIONS = (".wav", ".ogg", ".mp3", ".flac", ".m4a", ".aac")
+
+WATCHED_EXTENSIONS = SCENE_EXTENSIONS + SCRIPT_EXTENSIONS + TEXTURE_EXTENSIONS + SOUND_EXTENSIONS
+
+# Directories never scanned (hidden directories are skipped as well)
+IGNORED_DIRECTORIES = {"__pycache__", "node_modules", "build", "export"}
+
+
+class FileWatcher:
+    """
+    Polls a directory tree for created and modified files.
+
+    Scanning runs on a daemon thread every `interval` seconds; poll()
+    returns the changed paths on the caller's thread. Files are compared by
+    (mtime, size), so saves that keep the same size within the timestamp
+    resolution may be missed.
+    """
+
+    def __init__(self, root, extensions: Tuple[str, ...] = WATCHED_EXTENSIONS, interval: float = 0.1):
+        self.root = str(root)
+        self.extensions = tuple(ext.lower() for ext in extensions)
+        self.interval = interval
+
+        self._snapshot: Dict[str, Tuple[int, int]] = {}
+        self._changed: Dict[str, None] = {}  # ordered set
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Take the baseline snapshot and start polling"""
+        if self._thread is not None:
+            return
+        self._snapshot = self.scan()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="FileWatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop polling"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def poll(self) -> List[str]:
+        """Get (and clear) the files changed since the last poll"""
+        if not self._changed:
+            return []
+        with self._lock:
+            changed = list(self._changed)
+            self._changed.clear()
+        return changed
+
+    def check(self) -> List[str]:
+        """Scan now on the calling thread and return the changed files"""
+        self._compare(self.scan())
+        return self.poll()
+
+    def scan(self) -> Dict[str, Tuple[int, int]]:
+        """Get (mtime_ns, size) of every watched file under the root"""
+        snapshot = {}
+        extensions = self.extensions
+        stack = [self.root]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if entry.is_dir(follow_symlinks=False):
+                            if not name.startswith(".") and name not in IGNORED_DIRECTORIES:
+                                stack.append(entry.path)
+                        elif name.lower().endswith(extensions):
+                            try:
+                                stat = entry.stat()
+                            except OSError:
+                                continue  # Deleted while scanning
+                            snapshot[entry.path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                continue
+        return snapshot
+
+    def _run(self) -> None:
+        """Polling loop"""
+        while not self._stop.wait(self.interval):
+            try:
+                self._compare(self.scan())
+            except Exception as e:
+                log.error("File watcher scan failed: %s", e)
+
+    def _compare(self, snapshot: Dict[str, Tuple[int, int]]) -> None:
+        """Record files that are new or differ from the previous snapshot"""
+        previous = self._snapshot
+        changed = [path for path, signature in snapshot.items() if previous.get(path) != signature]
+        self._snapshot = snapshot
+        if changed:
+            with self._lock:
+                for path in changed:
+                    self._changed[path] = None
+
+
+class HotReloader:
+    """
+    Applies file changes to a running LupineGameEngine. Call update() once
+    per frame from the main thread.
+    """
+
+    def __init__(self, engine, interval: float = 0.1):
+        self.engine = engine
+        self.project_path = Path(engine.project_path).resolve()
+        self.watcher = FileWatcher(self.project_path, interval=interval)
+
+        self.reload_count = 0
+        self.last_reload_time = 0.0  # Seconds spent applying the last batch of changes
+
+    def start(self) -> None:
+        """Start watching the project"""
+        self.watcher.start()
+        log.info("Hot reload watching %s", self.project_path)
+
+    def stop(self) -> None:
+        """Stop watching the project"""
+        self.watcher.stop()
+
+    def update(self) -> int:
+        """Apply pending file changes; returns the number of files reloaded"""
+        changed = self.watcher.poll()
+        if not changed:
+            return 0
+
+        start = time.perf_counter()
+        reloaded = 0
+        for path in changed:
+            try:
+                if self.reload_file(path):
+                    reloaded += 1
+            except Exception as e:
+                log.error("Hot reload of %s failed: %s", path, e)
+
+        self.last_reload_time = time.perf_counter() - start
+        self.reload_count += reloaded
+        if reloaded:
+            log.info("Hot reloaded %d file(s) in %.1f ms", reloaded, self.last_reload_time * 1000.0)
+        return reloaded
+
+    def reload_file(self, path: str) -> bool:
+        """Apply one changed file to the running game"""
+        relative_path = self._relative_path(path)
+        extension = os.path.splitext(path)[1].lower()
+        systems = self.engine.systems
+
+        if extension in SCRIPT_EXTENSIONS:
+            runtime = systems.python_runtime
+            if not runtime:
+                return False
+            with open(path, 'r') as f:
+                script_content = f.read()
+            patched = runtime.reload_script(relative_path, script_content)
+            if patched:
+                log.info("Reloaded script %s (%d instance(s))", relative_path, patched)
+            return patched > 0
+
+        if extension in SCENE_EXTENSIONS:
+            return self.engine.reload_scene_file(relative_path)
+
+        if extension in TEXTURE_EXTENSIONS:
+            return bool(systems.renderer and systems.renderer.invalidate_texture(path))
+
+        if extension in SOUND_EXTENSIONS:
+            return bool(systems.audio_system and systems.audio_system.unload_sound(path))
+
+        return False
+
+    def _relative_path(self, path: str) -> str:
+        """Get a project-relative path with forward slashes"""
+        try:
+            return Path(path).resolve().relative_to(self.project_path).as_posix()
+        except ValueError:
+            return Path(path).as_posix()
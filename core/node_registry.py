@@ -11,6 +11,7 @@ from dataclasses import dataclass
 from enum import Enum
 from .scene.node_registry import NodeRegistry as BaseNodeRegistry
 from .scene.base_node import Node
+from .scene.node_factory import get_node_factory_registry
 
 
 class NodeCategory(Enum):
@@ -55,6 +56,7 @@ class DynamicNodeRegistry(BaseNodeRegistry):
             self._initialize_builtin_nodes()
             self.load_scene_files()
             self._initialized = True
+            get_node_factory_registry().invalidate()
 
     def _initialize_builtin_nodes(self):
         """Initialize built-in nodes by scanning the nodes directory"""
@@ -364,6 +366,9 @@ class DynamicNodeRegistry(BaseNodeRegistry):
         # Load scene files
         self.load_scene_files()
 
+        # Scene loading resolves node types again on next use
+        get_node_factory_registry().invalidate()
+
 
 # Global registry instance
 _node_registry: Optional[DynamicNodeRegistry] = None
@@ -3,12 +3,17 @@ OpenAL Audio System for Pygame-based Game Runner
 Replaces Arcade's audio system with OpenAL for better performance and control
 """
 
+import math
 import os
+import time
+from collections import deque
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Deque, Dict, List, Optional, Tuple
 import wave
 import numpy as np
 
+from .audio_stream import AudioStream
+
 # Try to import additional audio libraries
 try:
     import librosa
@@ -31,6 +36,11 @@ except ImportError:
     OPENAL_AVAILABLE = False
 
 
+DEFAULT_SOUND_PRIORITY = 50
+MAX_VIRTUAL_VOICES = 256  # Virtual voices kept before the least important sounds are dropped
+STEAL_AUDIBILITY_RATIO = 2.0  # At equal priority, a voice must be this much louder to take a source
+
+
 class AudioBuffer:
     """OpenAL audio buffer wrapper"""
     
@@ -40,65 +50,99 @@ class AudioBuffer:
 
 
 class AudioSource:
-    """OpenAL audio source wrapper"""
+    """
+    OpenAL audio source wrapper, one per playing sound (a voice). A voice
+    that lost or never got an OpenAL source is virtual (id None): it keeps
+    its playback clock and resumes at the right offset when OpenALAudioSystem
+    gives it a source again.
+    """
     
-    def __init__(self, source_id: int):
+    def __init__(self, source_id: Optional[int], path: str = "", duration: float = 0.0,
+                 priority: int = 0):
         self.id = source_id
         self.is_playing = False
         self.is_looping = False
         self.volume = 1.0
         self.pitch = 1.0
         self.position = [0.0, 0.0, 0.0]
+        self.path = path
+        self.duration = duration  # Length of the sound in seconds
+        self.priority = priority  # Higher keeps its source longer
+        self.start_time = time.perf_counter()  # Playback clock origin
+        self._audibility = 0.0  # Cached by OpenALAudioSystem, see _get_audibility
+        self._audibility_version = -1
+    
+    @property
+    def is_virtual(self) -> bool:
+        """Whether the voice is playing without an OpenAL source"""
+        return self.id is None
     
     def play(self):
         """Play the audio source"""
-        if OPENAL_AVAILABLE:
+        if OPENAL_AVAILABLE and self.id is not None:
             al.alSourcePlay(self.id)
             self.is_playing = True
     
     def stop(self):
         """Stop the audio source"""
-        if OPENAL_AVAILABLE:
+        if OPENAL_AVAILABLE and self.id is not None:
             al.alSourceStop(self.id)
-            self.is_playing = False
+        self.is_playing = False
     
     def pause(self):
         """Pause the audio source"""
-        if OPENAL_AVAILABLE:
+        if OPENAL_AVAILABLE and self.id is not None:
             al.alSourcePause(self.id)
             self.is_playing = False
     
     def set_volume(self, volume: float):
         """Set source volume (0.0 to 1.0)"""
         self.volume = max(0.0, min(1.0, volume))
-        if OPENAL_AVAILABLE:
+        self._audibility_version = -1
+        if OPENAL_AVAILABLE and self.id is not None:
             al.alSourcef(self.id, al.AL_GAIN, self.volume)
     
     def set_pitch(self, pitch: float):
         """Set source pitch (0.5 to 2.0 typically)"""
         self.pitch = max(0.1, min(4.0, pitch))
-        if OPENAL_AVAILABLE:
+        if OPENAL_AVAILABLE and self.id is not None:
             al.alSourcef(self.id, al.AL_PITCH, self.pitch)
     
     def set_looping(self, loop: bool):
         """Set whether the source should loop"""
         self.is_looping = loop
-        if OPENAL_AVAILABLE:
+        if OPENAL_AVAILABLE and self.id is not None:
             al.alSourcei(self.id, al.AL_LOOPING, al.AL_TRUE if loop else al.AL_FALSE)
     
     def set_position(self, x: float, y: float, z: float = 0.0):
         """Set 3D position of the source"""
         self.position = [x, y, z]
-        if OPENAL_AVAILABLE:
+        self._audibility_version = -1
+        if OPENAL_AVAILABLE and self.id is not None:
             al.alSource3f(self.id, al.AL_POSITION, x, y, z)
     
     def update_state(self):
         """Update playing state from OpenAL"""
-        if OPENAL_AVAILABLE:
+        if OPENAL_AVAILABLE and self.id is not None:
             import ctypes
             state = ctypes.c_int()
             al.alGetSourcei(self.id, al.AL_SOURCE_STATE, ctypes.byref(state))
             self.is_playing = (state.value == al.AL_PLAYING)
+    
+    def get_playback_position(self, now: Optional[float] = None) -> float:
+        """Get the offset into the sound in seconds, from the playback clock"""
+        elapsed = ((now if now is not None else time.perf_counter()) - self.start_time) * self.pitch
+        if self.is_looping and self.duration > 0:
+            return elapsed % self.duration
+        return elapsed
+    
+    def get_audibility(self, listener: List[float]) -> float:
+        """Estimate the gain heard at the listener (OpenAL's default inverse distance model)"""
+        dx = self.position[0] - listener[0]
+        dy = self.position[1] - listener[1]
+        dz = self.position[2] - listener[2]
+        distance = math.sqrt(dx * dx + dy * dy + dz * dz)
+        return self.volume / max(1.0, distance)
 
 
 class OpenALAudioSystem:
@@ -108,8 +152,16 @@ class OpenALAudioSystem:
         self.device = None
         self.context = None
         self.buffers: Dict[str, AudioBuffer] = {}
-        self.sources: Dict[str, AudioSource] = {}
-        self.available_sources = []
+        self.sources: Dict[str, AudioSource] = {}  # Voices with an OpenAL source
+        self.virtual_voices: List[AudioSource] = []  # Voices waiting for a source
+        self.available_sources: Deque[int] = deque()
+        self.sound_settings: Dict[str, Dict[str, int]] = {}  # Path -> priority, max_instances
+        self._instances: Dict[str, List[AudioSource]] = {}  # Path -> playing voices, oldest first
+        self.listener_position = [0.0, 0.0, 0.0]
+        self._listener_version = 0  # Bumped when the listener moves, invalidating cached audibility
+        self.voice_stats = self._new_voice_stats()
+        self.streams: List[AudioStream] = []
+        self.music: Optional[AudioStream] = None
         self.master_volume = 1.0
         
         if OPENAL_AVAILABLE:
@@ -164,21 +216,48 @@ class OpenALAudioSystem:
         if path in self.buffers:
             return self.buffers.get(path)
 
+        decoded = self.decode_sound(path)
+        if decoded is None:
+            return None
+        return self.upload_sound(path, decoded)
+
+    def decode_sound(self, path: str) -> Optional[Tuple]:
+        """
+        Decode a sound file to (frames, sample_rate, channels, sample_width, duration)
+        without touching OpenAL, so it can run on a worker thread.
+        """
         try:
             # Get file extension
             file_ext = path.lower().split('.')[-1]
 
             # Load audio data based on file format
             if file_ext == 'wav':
-                frames, sample_rate, channels, sample_width, duration = self._load_wav(path)
+                decoded = self._load_wav(path)
             elif file_ext in ['mp3', 'ogg', 'flac', 'm4a', 'aac']:
-                frames, sample_rate, channels, sample_width, duration = self._load_compressed_audio(path)
+                decoded = self._load_compressed_audio(path)
             else:
                 print(f"Unsupported audio format: {path} (extension: {file_ext})")
                 return None
 
+            frames, duration = decoded[0], decoded[4]
             if frames is None or duration is None:
                 return None
+            return decoded
+
+        except Exception as e:
+            print(f"Failed to load sound {path}: {e}")
+            return None
+
+    def upload_sound(self, path: str, decoded: Tuple) -> Optional[AudioBuffer]:
+        """Create an OpenAL buffer from decoded sound data and cache it under path"""
+        if not OPENAL_AVAILABLE:
+            return None
+
+        if path in self.buffers:
+            return self.buffers.get(path)
+
+        try:
+            frames, sample_rate, channels, sample_width, duration = decoded
 
             # Determine OpenAL format
             if channels == 1:
@@ -219,9 +298,44 @@ class OpenALAudioSystem:
             print(f"Failed to load sound {path}: {e}")
             return None
     
+    def unload_sound(self, path: str) -> int:
+        """
+        Drop cached sound buffers for a file so it is loaded again on next use.
+        Returns the number of buffers dropped.
+        """
+        target = Path(path).resolve()
+        dropped = 0
+        for key in list(self.buffers):
+            if key != path and Path(key).resolve() != target:
+                continue
+            audio_buffer = self.buffers.pop(key)
+            dropped += 1
+            if OPENAL_AVAILABLE:
+                try:
+                    import ctypes
+                    # OpenAL refuses to delete a buffer that a source still uses
+                    al.alDeleteBuffers(1, (ctypes.c_uint * 1)(audio_buffer.id))
+                except Exception as e:
+                    print(f"Failed to delete buffer for {key}: {e}")
+        return dropped
+
+    def set_sound_settings(self, path: str, priority: int = DEFAULT_SOUND_PRIORITY, max_instances: int = 0):
+        """
+        Set how a sound competes for sources: voices with a higher priority
+        keep their source longer, and at most max_instances copies of the
+        sound play at once (0: unlimited; a new copy replaces the oldest).
+        """
+        self.sound_settings[path] = {"priority": priority, "max_instances": max_instances}
+
     def play_sound(self, path: str, volume: float = 1.0, pitch: float = 1.0,
-                   loop: bool = False, x: float = 0.0, y: float = 0.0) -> Optional[AudioSource]:
-        """Play a sound effect"""
+                   loop: bool = False, x: float = 0.0, y: float = 0.0,
+                   priority: Optional[int] = None) -> Optional[AudioSource]:
+        """
+        Play a sound effect. When every source is busy the least important
+        voice (lowest priority, then quietest) gives up its source if the
+        new sound outranks it; otherwise the new sound starts virtual.
+        Returns None only if the sound can't be loaded or is dropped.
+        """
         if not OPENAL_AVAILABLE:
             return None
 
@@ -230,43 +344,264 @@ class OpenALAudioSystem:
         if not audio_buffer:
             return None
 
-        # Get an available source
-        if not self.available_sources:
-            print(f"No available audio sources")
-            return None
-
-        source_id = self.available_sources.pop(0)
-
-        # Configure source
-        final_volume = volume * self.master_volume
+        settings = self.sound_settings.get(path)
+        if priority is None:
+            priority = settings["priority"] if settings else DEFAULT_SOUND_PRIORITY
+
+        # Create the voice; OpenAL state is applied once it has a source
+        source = AudioSource(None, path, audio_buffer.duration, priority)
+        source.volume = max(0.0, min(1.0, volume))
+        source.pitch = max(0.1, min(4.0, pitch))
+        source.is_looping = loop
+        source.position = [x, y, 0.0]
+        source.is_playing = True
+
+        # Instance limit: the new copy replaces the oldest
+        instances = self._instances.setdefault(path, [])
+        if settings and settings["max_instances"] and len(instances) >= settings["max_instances"]:
+            self._stop_voice(instances[0])
+            self.voice_stats["limited"] += 1
+
+        source_id = self._take_source(source)
+        if source_id is None:
+            if not self._add_virtual_voice(source):
+                return None
+        else:
+            self._start_voice(source, source_id)
+        instances.append(source)
+        self.voice_stats["played"] += 1
+        return source
 
+    def get_voice_statistics(self) -> Dict[str, int]:
+        """
+        Get voice counts since startup: played, virtualized (started
+        without or lost their source), resumed (virtual voices that got a
+        source back), stolen (real voices that lost their source),
+        expired (one-shots that ended while virtual), dropped (sounds
+        discarded because the virtual voice list was full) and limited
+        (copies replaced by the max_instances limit)
+        """
+        stats = dict(self.voice_stats)
+        stats["real"] = len(self.sources)
+        stats["virtual"] = len(self.virtual_voices)
+        return stats
+
+    @staticmethod
+    def _new_voice_stats() -> Dict[str, int]:
+        return {"played": 0, "virtualized": 0, "resumed": 0, "stolen": 0,
+                "expired": 0, "dropped": 0, "limited": 0}
+
+    def _take_source(self, voice: AudioSource) -> Optional[int]:
+        """Get a free source, or steal the least important real voice's if voice outranks it"""
+        if self.available_sources:
+            return self.available_sources.popleft()
+        victim = self._get_least_important_voice()
+        if victim is None or not self._outranks(voice, victim):
+            return None
+        return self._virtualize_voice(victim)
+
+    def _get_least_important_voice(self) -> Optional[AudioSource]:
+        """Get the real voice that should lose its source first"""
+        return min(self.sources.values(), key=self._get_importance, default=None)
+
+    def _outranks(self, voice: AudioSource, other: AudioSource) -> bool:
+        """Whether voice should take other's source (priority first, then clearly louder)"""
+        if voice.priority != other.priority:
+            return voice.priority > other.priority
+        return self._get_audibility(voice) > self._get_audibility(other) * STEAL_AUDIBILITY_RATIO
+
+    def _get_importance(self, source: AudioSource) -> Tuple[int, float]:
+        """Sort key of voices: priority, then audibility"""
+        return source.priority, self._get_audibility(source)
+
+    def _get_audibility(self, source: AudioSource) -> float:
+        """Get a voice's audibility, recomputed only after it or the listener moved"""
+        if source._audibility_version != self._listener_version:
+            source._audibility = source.get_audibility(self.listener_position)
+            source._audibility_version = self._listener_version
+        return source._audibility
+
+    def _start_voice(self, source: AudioSource, source_id: int, offset: float = 0.0) -> bool:
+        """Give a voice an OpenAL source and start it at offset seconds; False if its sound was unloaded"""
+        audio_buffer = self.buffers.get(source.path)
+        if audio_buffer is None:
+            self.available_sources.append(source_id)
+            self._forget_voice(source)
+            return False
+        source.id = source_id
         al.alSourcei(source_id, al.AL_BUFFER, audio_buffer.id)
-        al.alSourcef(source_id, al.AL_GAIN, final_volume)
-        al.alSourcef(source_id, al.AL_PITCH, pitch)
-        al.alSourcei(source_id, al.AL_LOOPING, al.AL_TRUE if loop else al.AL_FALSE)
-        al.alSource3f(source_id, al.AL_POSITION, x, y, 0.0)
-
-        # Create source wrapper
-        source = AudioSource(source_id)
-        source.set_volume(volume)
-        source.set_pitch(pitch)
-        source.set_looping(loop)
-        source.set_position(x, y, 0.0)
-
-        # Play the source
+        source.set_volume(source.volume)
+        source.set_pitch(source.pitch)
+        source.set_looping(source.is_looping)
+        source.set_position(*source.position)
+        if offset > 0:
+            al.alSourcef(source_id, al.AL_SEC_OFFSET, offset)
         source.play()
+        self.sources[f"{source.path}_{id(source)}"] = source
+        return True
+
+    def _virtualize_voice(self, source: AudioSource) -> int:
+        """Take a real voice's source, keeping the voice virtual; returns the source id"""
+        source_id = source.id
+        al.alSourceStop(source_id)
+        al.alSourcei(source_id, al.AL_BUFFER, 0)
+        source.id = None
+        self.sources.pop(f"{source.path}_{id(source)}", None)
+        self.voice_stats["stolen"] += 1
+        if not self._add_virtual_voice(source):
+            self._forget_voice(source)
+        return source_id
+
+    def _add_virtual_voice(self, source: AudioSource) -> bool:
+        """Keep a voice without a source; False if it was dropped instead"""
+        if len(self.virtual_voices) >= MAX_VIRTUAL_VOICES:
+            # Full: drop the least important of the virtual voices and the new one
+            weakest = min(self.virtual_voices, key=lambda v: (v.priority, v.start_time))
+            if (source.priority, source.start_time) <= (weakest.priority, weakest.start_time):
+                self.voice_stats["dropped"] += 1
+                return False
+            self.virtual_voices.remove(weakest)
+            self._forget_voice(weakest)
+            self.voice_stats["dropped"] += 1
+        self.virtual_voices.append(source)
+        self.voice_stats["virtualized"] += 1
+        return True
+
+    def _stop_voice(self, source: AudioSource):
+        """Stop a voice, real or virtual, and free its source"""
+        if source.id is not None:
+            source.stop()
+            al.alSourcei(source.id, al.AL_BUFFER, 0)
+            self.sources.pop(f"{source.path}_{id(source)}", None)
+            self.available_sources.append(source.id)
+            source.id = None
+        elif source in self.virtual_voices:
+            self.virtual_voices.remove(source)
+        source.is_playing = False
+        self._forget_voice(source)
+
+    def _forget_voice(self, source: AudioSource):
+        """Remove a voice from the instance lists"""
+        source.is_playing = False
+        instances = self._instances.get(source.path)
+        if instances and source in instances:
+            instances.remove(source)
+
+    def _update_virtual_voices(self):
+        """End virtual one-shots that ran out, and resume the most important virtual voices"""
+        now = time.perf_counter()
+        waiting = []
+        for source in self.virtual_voices:
+            if not source.is_playing:  # Stopped by its owner
+                self._forget_voice(source)
+            elif not source.is_looping and source.get_playback_position(now) >= source.duration:
+                self._forget_voice(source)
+                self.voice_stats["expired"] += 1
+            else:
+                waiting.append(source)
+        self.virtual_voices = waiting
+        if not waiting:
+            return
 
-        # Store source with a unique key
-        source_key = f"{path}_{id(source)}"
-        self.sources[source_key] = source
+        # With no free source, only voices at least as important as the weakest real voice can take one
+        candidates = waiting
+        if not self.available_sources:
+            victim = self._get_least_important_voice()
+            if victim is None:
+                return
+            candidates = [source for source in waiting if source.priority >= victim.priority]
+            if not candidates:
+                return
+
+        candidates.sort(key=self._get_importance, reverse=True)
+        resumed = []
+        for source in list(candidates):
+            if self.available_sources:
+                source_id = self.available_sources.popleft()
+            else:
+                victim = self._get_least_important_voice()
+                if victim is None or not self._outranks(source, victim):
+                    break
+                source_id = self._virtualize_voice(victim)
+            resumed.append(source)
+            if self._start_voice(source, source_id, source.get_playback_position(now)):
+                self.voice_stats["resumed"] += 1
+        if resumed:
+            self.virtual_voices = [source for source in self.virtual_voices
+                                   if source.id is None and source.is_playing]
+
+    def open_stream(self, path: str, volume: float = 1.0, loop: bool = False, loop_start: float = 0.0,
+                    loop_end: Optional[float] = None, positional: bool = False) -> Optional[AudioStream]:
+        """
+        Play a long sound (music, ambience) by streaming it: it is decoded in
+        chunks on a background thread instead of being loaded whole, and
+        starts playing as soon as the first chunk is ready. Looping jumps
+        from loop_end (None: end of file) back to loop_start, in seconds.
+        """
+        if not OPENAL_AVAILABLE:
+            return None
+
+        # Streams outrank every sound effect
+        if self.available_sources:
+            source_id = self.available_sources.popleft()
+        else:
+            victim = self._get_least_important_voice()
+            if victim is None:
+                print(f"No available audio sources")
+                return None
+            source_id = self._virtualize_voice(victim)
+        # Non-positional streams follow the listener
+        al.alSourcei(source_id, al.AL_SOURCE_RELATIVE, al.AL_FALSE if positional else al.AL_TRUE)
+        al.alSource3f(source_id, al.AL_POSITION, 0.0, 0.0, 0.0)
+        al.alSourcef(source_id, al.AL_PITCH, 1.0)
+
+        stream = AudioStream(path, source_id, volume, loop, loop_start, loop_end, decoder=self.decode_sound)
+        stream.start()
+        self.streams.append(stream)
+        return stream
+
+    def play_music(self, path: str, volume: float = 1.0, loop: bool = True, loop_start: float = 0.0,
+                   loop_end: Optional[float] = None, crossfade: float = 0.0) -> Optional[AudioStream]:
+        """Stream a music track, replacing the current one (crossfading over crossfade seconds)"""
+        previous = self.music
+        stream = self.open_stream(path, volume, loop, loop_start, loop_end)
+        if stream is None:
+            return None
+
+        if previous is not None and not previous.finished:
+            if crossfade > 0:
+                previous.fade_out(crossfade)
+                stream.fade_in(crossfade)
+            else:
+                previous.close()
+        self.music = stream
+        return stream
+
+    def stop_music(self, fade_out: float = 0.0):
+        """Stop the current music track, optionally fading it out"""
+        if self.music is not None:
+            self.music.fade_out(fade_out)
+            self.music = None
+
+    def _release_stream(self, stream: AudioStream):
+        """Close a stream and return its source to the pool"""
+        stream.close()
+        self.streams.remove(stream)
+        if self.music is stream:
+            self.music = None
+        al.alSourcei(stream.source_id, al.AL_SOURCE_RELATIVE, al.AL_FALSE)
+        self.available_sources.append(stream.source_id)
 
-        return source
-    
     def update(self):
         """Update audio system - call this every frame"""
         if not OPENAL_AVAILABLE:
             return
         
+        # Keep streams fed and release the ones that ended
+        for stream in list(self.streams):
+            if not stream.update():
+                self._release_stream(stream)
+
         # Update source states and clean up finished sources
         finished_sources = []
         
@@ -282,6 +617,11 @@ class OpenALAudioSystem:
             # Return source to available pool
             al.alSourcei(source.id, al.AL_BUFFER, 0)  # Detach buffer
             self.available_sources.append(source.id)
+            source.id = None
+            self._forget_voice(source)
+
+        if self.virtual_voices:
+            self._update_virtual_voices()
     
     def set_master_volume(self, volume: float):
         """Set master volume for all audio"""
@@ -290,6 +630,8 @@ class OpenALAudioSystem:
     
     def set_listener_position(self, x: float, y: float, z: float = 0.0):
         """Set 3D position of the audio listener (usually the camera/player)"""
+        self.listener_position = [x, y, z]
+        self._listener_version += 1
         if OPENAL_AVAILABLE:
             al.alListener3f(al.AL_POSITION, x, y, z)
     
@@ -301,10 +643,12 @@ class OpenALAudioSystem:
         # Stop all sources
         for source in self.sources.values():
             source.stop()
+        for stream in list(self.streams):
+            self._release_stream(stream)
         
         # Delete sources
         import ctypes
-        all_source_ids = [s.id for s in self.sources.values()] + self.available_sources
+        all_source_ids = [s.id for s in self.sources.values()] + list(self.available_sources)
         if all_source_ids:
             sources_array = (ctypes.c_uint * len(all_source_ids))(*all_source_ids)
             al.alDeleteSources(len(all_source_ids), sources_array)
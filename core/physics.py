@@ -6,12 +6,56 @@ Integrates Pymunk physics engine with Lupine Engine nodes
 import pymunk
 import pymunk.pygame_util
 import math
+import time
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache, wraps
 
 # Import scene nodes
 from .scene import Node2D
+from .physics_profiler import PhysicsProfiler
+from .engine_log import get_logger, DEBUG
+
+log = get_logger("physics")
+collision_log = get_logger("collision")
+
+
+# Collision types used to key pymunk collision handlers. Areas get their own
+# type so overlap tracking runs through dedicated begin/separate handlers.
+BODY_COLLISION_TYPE = 1
+AREA_COLLISION_TYPE = 2
+
+# Collision layers and masks are 32-bit, matching Chipmunk's filter categories
+ALL_LAYERS = 0xFFFFFFFF
+
+
+@lru_cache(maxsize=None)
+def make_shape_filter(collision_layer: int = ALL_LAYERS, collision_mask: int = ALL_LAYERS) -> pymunk.ShapeFilter:
+    """Translate Lupine layer/mask bits into a pymunk ShapeFilter.
+
+    Chipmunk rejects a pair in its broadphase unless each shape's categories
+    intersect the other's mask, so non-interacting layers never reach Python.
+    """
+    return pymunk.ShapeFilter(categories=int(collision_layer) & ALL_LAYERS,
+                              mask=int(collision_mask) & ALL_LAYERS)
+
+
+def _profiled_query(query_type: str):
+    """Count and time a PhysicsWorld query while a profiler is attached"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            profiler = self.profiler
+            if profiler is None:
+                return func(self, *args, **kwargs)
+            start_time = profiler.begin_query(query_type)
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                profiler.end_query(start_time)
+        return wrapper
+    return decorator
 
 
 class PhysicsBodyType(Enum):
@@ -50,6 +94,15 @@ class PhysicsBody:
         # Collision filtering
         self.collision_layer = 1
         self.collision_mask = 1
+        self.collision_type = BODY_COLLISION_TYPE
+
+        # Static bodies merged into a shared per-subtree body keep their key here
+        self.baked_key: Optional[int] = None
+
+        # Last transform written to the node, used to skip unchanged bodies
+        self._synced_x = math.nan
+        self._synced_y = math.nan
+        self._synced_angle = math.nan
         
         # Create Pymunk body
         self._create_pymunk_body()
@@ -89,7 +142,7 @@ class PhysicsBody:
         """Add a collision shape to this body"""
         # Use duck typing instead of isinstance
         shape_type = getattr(shape_node, 'type', None)
-        print(f"[PHYSICS] Adding collision shape to {self.node.name}: {shape_type}")
+        log.debug("Adding collision shape to %s: %s", self.node.name, shape_type)
         if shape_type == "CollisionShape2D":
             self._add_collision_shape_2d(shape_node)
         elif shape_type == "CollisionPolygon2D":
@@ -98,7 +151,7 @@ class PhysicsBody:
     def _add_collision_shape_2d(self, shape_node: Node2D):
         """Add CollisionShape2D to body"""
         shape_type = getattr(shape_node, 'shape', 'rectangle')
-        print(f"[PHYSICS] Creating {shape_type} collision shape for {self.node.name}")
+        log.debug("Creating %s collision shape for %s", shape_type, self.node.name)
 
         # Get shape position relative to body (collision shape offset)
         shape_position = getattr(shape_node, 'position', [0.0, 0.0])
@@ -106,8 +159,8 @@ class PhysicsBody:
             shape_position = [0.0, 0.0]
 
         shape_offset = (float(shape_position[0]), float(shape_position[1]))
-        print(f"[PHYSICS] Shape offset: {shape_offset}")
-        print(f"[PHYSICS] Parent body position: {getattr(self.node, 'position', [0.0, 0.0])}")
+        log.debug("Shape offset: %s", shape_offset)
+        log.debug("Parent body position: %s", getattr(self.node, 'position', [0.0, 0.0]))
 
         if shape_type == 'rectangle':
             size = getattr(shape_node, 'size', [32, 32])
@@ -129,7 +182,7 @@ class PhysicsBody:
                 except (ValueError, TypeError):
                     width, height = 32.0, 32.0
 
-                print(f"[PHYSICS] Rectangle shape size: {width}x{height}")
+                log.debug("Rectangle shape size: %sx%s", width, height)
 
                 # Create box vertices manually to apply offset
                 half_width = width / 2.0
@@ -140,7 +193,7 @@ class PhysicsBody:
                     (shape_offset[0] + half_width, shape_offset[1] + half_height),  # top-right
                     (shape_offset[0] - half_width, shape_offset[1] + half_height)   # top-left
                 ]
-                print(f"[PHYSICS] Rectangle vertices: {vertices}")
+                log.debug("Rectangle vertices: %s", vertices)
                 shape = pymunk.Poly(self.pymunk_body, vertices)
             else:
                 # Default box with offset
@@ -190,7 +243,7 @@ class PhysicsBody:
                     shape = pymunk.Poly(self.pymunk_body, vertices)
                 except ValueError:
                     # Invalid polygon, fall back to box
-                    print(f"Warning: Invalid polygon shape, using box instead")
+                    log.warning("Invalid polygon shape, using box instead")
                     shape = pymunk.Poly.create_box(self.pymunk_body, (32, 32), radius=0.0)
             else:
                 shape = pymunk.Poly.create_box(self.pymunk_body, (32, 32), radius=0.0)
@@ -222,12 +275,7 @@ class PhysicsBody:
             shape = pymunk.Poly.create_box(self.pymunk_body, (32, 32), radius=0.0)
         
         # Set shape properties
-        shape.friction = self.friction
-        shape.elasticity = self.elasticity
-        shape.collision_type = self.collision_layer
-        shape.filter = pymunk.ShapeFilter(categories=self.collision_layer, mask=self.collision_mask)
-        shape.user_data = self
-        
+        self._apply_shape_properties(shape)
         self.pymunk_shapes.append(shape)
     
     def _add_collision_polygon_2d(self, polygon_node: Node2D):
@@ -243,28 +291,42 @@ class PhysicsBody:
         if len(vertices) >= 3:
             try:
                 shape = pymunk.Poly(self.pymunk_body, vertices)
-                shape.friction = self.friction
-                shape.elasticity = self.elasticity
-                shape.collision_type = self.collision_layer
-                shape.filter = pymunk.ShapeFilter(categories=self.collision_layer, mask=self.collision_mask)
-                shape.user_data = self
-                
+                self._apply_shape_properties(shape)
                 self.pymunk_shapes.append(shape)
             except Exception as e:
-                print(f"Error creating polygon shape: {e}")
+                log.error("Error creating polygon shape: %s", e)
                 # Fallback to box
                 shape = pymunk.Poly.create_box(self.pymunk_body, (32, 32))
-                shape.friction = self.friction
-                shape.elasticity = self.elasticity
-                shape.collision_type = self.collision_layer
-                shape.filter = pymunk.ShapeFilter(categories=self.collision_layer, mask=self.collision_mask)
-                shape.user_data = self
-                
+                self._apply_shape_properties(shape)
                 self.pymunk_shapes.append(shape)
     
+    def _apply_shape_properties(self, shape: pymunk.Shape):
+        """Apply material, collision type and layer filter to a new shape"""
+        shape.friction = self.friction
+        shape.elasticity = self.elasticity
+        shape.collision_type = self.collision_type
+        shape.filter = make_shape_filter(self.collision_layer, self.collision_mask)
+        shape.user_data = self
+
+    def update_collision_filter(self):
+        """Re-apply collision layer/mask to all shapes after they change"""
+        shape_filter = make_shape_filter(self.collision_layer, self.collision_mask)
+        for shape in self.pymunk_shapes:
+            shape.filter = shape_filter
+
+    def set_collision_layer(self, collision_layer: int):
+        """Set the layers this body occupies"""
+        self.collision_layer = collision_layer
+        self.update_collision_filter()
+
+    def set_collision_mask(self, collision_mask: int):
+        """Set the layers this body interacts with"""
+        self.collision_mask = collision_mask
+        self.update_collision_filter()
+
     def update_from_node(self):
         """Update physics body from node properties"""
-        if not self.pymunk_body:
+        if not self.pymunk_body or self.baked_key is not None:
             return
         
         # Update position
@@ -277,43 +339,56 @@ class PhysicsBody:
         if hasattr(self.node, 'rotation'):
             self.pymunk_body.angle = self.node.rotation
         
+        # Keep shape filters in sync with the node's layer/mask
+        collision_layer = getattr(self.node, 'collision_layer', self.collision_layer)
+        collision_mask = getattr(self.node, 'collision_mask', self.collision_mask)
+        if collision_layer != self.collision_layer or collision_mask != self.collision_mask:
+            self.collision_layer = collision_layer
+            self.collision_mask = collision_mask
+            self.update_collision_filter()
+
         # Update physics properties for dynamic bodies
         if hasattr(self.node, 'type') and self.node.type == "RigidBody2D":
             self.mass = getattr(self.node, 'mass', 1.0)
-            self.collision_layer = getattr(self.node, 'collision_layer', 1)
-            self.collision_mask = getattr(self.node, 'collision_mask', 1)
             
             if self.body_type == PhysicsBodyType.DYNAMIC:
                 self.pymunk_body.mass = self.mass
     
-    def update_node_from_physics(self):
-        """Update node from physics body"""
+    def update_node_from_physics(self) -> bool:
+        """Update node from physics body, returns False if the body had not moved"""
         if not self.pymunk_body:
-            return
+            return False
 
-        # Store old position for change detection
-        old_position = getattr(self.node, 'position', [0, 0]).copy() if hasattr(self.node, 'position') else [0, 0]
+        pos = self.pymunk_body.position
+        x, y = pos.x, pos.y
+        angle = self.pymunk_body.angle
+
+        # Skip the node write entirely when nothing changed since the last sync
+        if x == self._synced_x and y == self._synced_y and angle == self._synced_angle:
+            return False
+
+        moved = abs(x - self._synced_x) > 0.1 or abs(y - self._synced_y) > 0.1
+        self._synced_x = x
+        self._synced_y = y
+        self._synced_angle = angle
 
         # Update position
         if hasattr(self.node, 'position'):
-            pos = self.pymunk_body.position
-            self.node.position = [pos.x, pos.y]
+            self.node.position = [x, y]
 
         # Update rotation
         if hasattr(self.node, 'rotation'):
-            self.node.rotation = self.pymunk_body.angle
+            self.node.rotation = angle
+
+        # Position changed significantly - mark transform as dirty for redrawing
+        if moved and hasattr(self.node, '_mark_transform_dirty'):
+            self.node._mark_transform_dirty()
 
-        # Check if position changed significantly and mark transform dirty
-        new_position = getattr(self.node, 'position', [0, 0])
-        if (abs(new_position[0] - old_position[0]) > 0.1 or
-            abs(new_position[1] - old_position[1]) > 0.1):
-            # Position changed - mark transform as dirty for redrawing
-            if hasattr(self.node, '_mark_transform_dirty'):
-                self.node._mark_transform_dirty()
+        return True
 
     def update_physics_from_node(self):
         """Update physics body from node"""
-        if not self.pymunk_body:
+        if not self.pymunk_body or self.baked_key is not None:
             return
 
         # Update position
@@ -365,14 +440,40 @@ class PhysicsWorld:
         # Physics bodies
         self.bodies: Dict[str, PhysicsBody] = {}
         self.areas: Dict[str, Dict] = {}
+        self._areas_by_body: Dict[PhysicsBody, Dict] = {}
+
+        # Only dynamic bodies are moved by the simulation and need node sync
+        self._dynamic_bodies: Dict[str, PhysicsBody] = {}
+
+        # StaticBody2D shapes merged into one static pymunk body per scene subtree
+        self.static_baking_enabled = True
+        self._baked_static_bodies: Dict[int, Dict[str, Any]] = {}
+
+        # Body counters refreshed every step
+        self.awake_body_count = 0
+        self.sleeping_body_count = 0
+
+        # Optional step profiler (None when disabled)
+        self.profiler: Optional[PhysicsProfiler] = None
+
+        # Area enter/exit events collected during space.step and flushed afterwards
+        self._pending_area_events: Dict[Tuple[str, Any, bool], bool] = {}
         
         # Collision handlers
         self.collision_handlers: Dict[int, callable] = {}
+        self.debug_collision_logging = False
+        self._collision_log_level = None  # Level to restore when collision logging is turned off
         
         # Physics settings
         self.time_step = 1.0 / 60.0  # 60 FPS
         self.velocity_iterations = 10
         self.position_iterations = 10
+
+        # Sleeping: bodies idle for sleep_time_threshold seconds stop simulating
+        # and are skipped during node sync. An idle speed of 0 lets Chipmunk
+        # derive the threshold from gravity.
+        self.set_sleep_time_threshold(0.5)
+        self.set_idle_speed_threshold(0.0)
         
         # Setup default collision handler
         self._setup_collision_handlers()
@@ -385,96 +486,195 @@ class PhysicsWorld:
             body_a = shape_a.user_data if shape_a.user_data else None
             body_b = shape_b.user_data if shape_b.user_data else None
 
+            # Sensors without an area (e.g. temporary cast shapes) never report contacts
+            if shape_a.sensor or shape_b.sensor:
+                return True
+
+            # Nothing to do unless someone is listening for contacts
+            if not (self.debug_collision_logging or
+                    (body_a and body_a.collision_callbacks) or
+                    (body_b and body_b.collision_callbacks)):
+                return True
+
             if body_a and body_b:
-                print(f"[COLLISION] {body_a.node.name} collided with {body_b.node.name}")
+                if self.debug_collision_logging:
+                    collision_log.debug("%s collided with %s", body_a.node.name, body_b.node.name)
+
+                # Get contact information
+                contact_point_set = arbiter.contact_point_set
+                if len(contact_point_set.points) > 0:
+                    point = contact_point_set.points[0].point_a
+                    normal = contact_point_set.normal
+                    impulse = contact_point_set.points[0].distance
+
+                    # Create contact info
+                    contact = PhysicsContact(
+                        body_a=body_a,
+                        body_b=body_b,
+                        point=(point.x, point.y),
+                        normal=(normal.x, normal.y),
+                        impulse=impulse
+                    )
+
+                    # Notify bodies of collision
+                    self._notify_collision(body_a, body_b, contact)
+                    self._notify_collision(body_b, body_a, contact)
 
-                # Check if either shape is a sensor (Area2D)
-                if shape_a.sensor or shape_b.sensor:
-                    self._handle_sensor_collision(body_a, body_b, shape_a.sensor, shape_b.sensor, True)
-                else:
-                    # Regular collision
-                    # Get contact information
-                    contact_point_set = arbiter.contact_point_set
-                    if len(contact_point_set.points) > 0:
-                        point = contact_point_set.points[0].point_a
-                        normal = contact_point_set.normal
-                        impulse = contact_point_set.points[0].distance
-
-                        # Create contact info
-                        contact = PhysicsContact(
-                            body_a=body_a,
-                            body_b=body_b,
-                            point=(point.x, point.y),
-                            normal=(normal.x, normal.y),
-                            impulse=impulse
-                        )
-
-                        # Notify bodies of collision
-                        self._notify_collision(body_a, body_b, contact)
-                        self._notify_collision(body_b, body_a, contact)
+            return True
 
+        def area_begin_handler(arbiter, space, data):
+            """Track a shape pair starting to overlap an area"""
+            shape_a, shape_b = arbiter.shapes
+            self._track_area_contact(shape_a.user_data, shape_b.user_data, 1)
+            if shape_b.collision_type == AREA_COLLISION_TYPE:
+                self._track_area_contact(shape_b.user_data, shape_a.user_data, 1)
             return True
 
-        def sensor_separate_handler(arbiter, space, data):
-            """Handle sensor separation"""
+        def area_separate_handler(arbiter, space, data):
+            """Track a shape pair no longer overlapping an area"""
             shape_a, shape_b = arbiter.shapes
-            body_a = shape_a.user_data if shape_a.user_data else None
-            body_b = shape_b.user_data if shape_b.user_data else None
+            self._track_area_contact(shape_a.user_data, shape_b.user_data, -1)
+            if shape_b.collision_type == AREA_COLLISION_TYPE:
+                self._track_area_contact(shape_b.user_data, shape_a.user_data, -1)
+
+        self._collision_callbacks = {
+            'begin': collision_handler,
+            'area_begin': area_begin_handler,
+            'area_separate': area_separate_handler,
+        }
 
-            if body_a and body_b:
-                if shape_a.sensor or shape_b.sensor:
-                    self._handle_sensor_collision(body_a, body_b, shape_a.sensor, shape_b.sensor, False)
+        # Default collision handler (body vs body)
+        self._default_handler = self.space.add_default_collision_handler()
+
+        # Area overlap is driven entirely by handlers keyed on the area collision type
+        self._area_handlers = [
+            self.space.add_collision_handler(AREA_COLLISION_TYPE, other_type)
+            for other_type in (BODY_COLLISION_TYPE, AREA_COLLISION_TYPE)
+        ]
+
+        self._install_collision_callbacks()
+
+    def _install_collision_callbacks(self):
+        """Attach the collision callbacks, wrapped with timing when profiling"""
+        begin = self._collision_callbacks['begin']
+        area_begin = self._collision_callbacks['area_begin']
+        area_separate = self._collision_callbacks['area_separate']
+
+        if self.profiler is not None:
+            begin = self._profiled_callback(begin, counts_contact=True)
+            area_begin = self._profiled_callback(area_begin, counts_contact=True)
+            area_separate = self._profiled_callback(area_separate, counts_contact=False)
+
+        self._default_handler.begin = begin
+        for area_handler in self._area_handlers:
+            area_handler.begin = area_begin
+            area_handler.separate = area_separate
+
+    def _profiled_callback(self, callback, counts_contact: bool):
+        """Wrap a pymunk collision callback so the profiler sees its cost"""
+        profiler = self.profiler
+        perf_counter = time.perf_counter
+
+        def profiled(arbiter, space, data):
+            start_time = perf_counter()
+            result = callback(arbiter, space, data)
+            profiler.add_callback_time(perf_counter() - start_time)
+            if counts_contact:
+                profiler.current.contacts_begun += 1
+            return result
 
-            return True
+        return profiled
+
+    def enable_profiling(self, window_size: int = 300) -> PhysicsProfiler:
+        """Start collecting per-step statistics and return the profiler"""
+        if self.profiler is None or self.profiler.window_size != window_size:
+            self.profiler = PhysicsProfiler(window_size)
+            self._install_collision_callbacks()
+        return self.profiler
+
+    def disable_profiling(self):
+        """Stop collecting per-step statistics"""
+        if self.profiler is not None:
+            self.profiler = None
+            self._install_collision_callbacks()
+
+    def get_profiler(self) -> Optional[PhysicsProfiler]:
+        """Get the active profiler, if profiling is enabled"""
+        return self.profiler
+
+    def set_debug_collision_logging(self, enabled: bool):
+        """Enable or disable logging of every collision begin"""
+        if enabled and self._collision_log_level is None:
+            self._collision_log_level = collision_log.level
+            collision_log.level = min(collision_log.level, DEBUG)
+        elif not enabled and self._collision_log_level is not None:
+            collision_log.level = self._collision_log_level
+            self._collision_log_level = None
+        self.debug_collision_logging = enabled
+
+    def _track_area_contact(self, area_body: Optional[PhysicsBody], other_body: Optional[PhysicsBody], delta: int):
+        """Update the per-area shape contact count and queue enter/exit transitions"""
+        area_info = self._areas_by_body.get(area_body)
+        if area_info is None or other_body is None:
+            return
+
+        contacts = area_info['contacts']
+        previous = contacts.get(other_body, 0)
+        if delta < 0 and previous == 0:
+            return
+
+        count = previous + delta
+        if count > 0:
+            contacts[other_body] = count
+        else:
+            del contacts[other_body]
+
+        # Only the first and last shape pair of a body change its overlap state
+        if previous == 0 or count == 0:
+            is_area = other_body.collision_type == AREA_COLLISION_TYPE
+            key = (area_info['key'], other_body.node, is_area)
+            if key in self._pending_area_events:
+                # Entered and exited (or the reverse) within the same step
+                del self._pending_area_events[key]
+            else:
+                self._pending_area_events[key] = count > 0
+
+    def _flush_area_events(self) -> int:
+        """Apply queued area overlap changes and emit enter/exit signals"""
+        if not self._pending_area_events:
+            return 0
+
+        events = self._pending_area_events
+        self._pending_area_events = {}
+
+        for (area_key, other_node, is_area), entered in events.items():
+            area_info = self.areas.get(area_key)
+            if area_info is None:
+                continue
 
-        # Set default collision handler
-        default_handler = self.space.add_default_collision_handler()
-        default_handler.begin = collision_handler
-        default_handler.separate = sensor_separate_handler
-    
-    def _handle_sensor_collision(self, body_a: PhysicsBody, body_b: PhysicsBody,
-                                a_is_sensor: bool, b_is_sensor: bool, entering: bool):
-        """Handle sensor (Area2D) collision events"""
-        # Determine which is the sensor and which is the body
-        sensor_body = body_a if a_is_sensor else body_b
-        other_body = body_b if a_is_sensor else body_a
-
-        # Get the area node
-        area_name = sensor_body.node.name
-        if area_name in self.areas:
-            area_info = self.areas[area_name]
             area_node = area_info['node']
+            if is_area:
+                overlapping = area_info['overlapping_areas']
+                callback_name = '_on_area_entered' if entered else '_on_area_exited'
+                signal_name = "area_entered" if entered else "area_exited"
+            else:
+                overlapping = area_info['overlapping_bodies']
+                callback_name = '_on_body_entered' if entered else '_on_body_exited'
+                signal_name = "body_entered" if entered else "body_exited"
 
-            if entering:
-                # Body entered area
-                if hasattr(other_body.node, 'type'):
-                    if other_body.node.type == "Area2D":
-                        # Area entered area
-                        if other_body.node not in area_info['overlapping_areas']:
-                            area_info['overlapping_areas'].add(other_body.node)
-                            if hasattr(area_node, 'emit_signal'):
-                                area_node.emit_signal("area_entered", other_body.node)
-                    else:
-                        # Body entered area
-                        if other_body.node not in area_info['overlapping_bodies']:
-                            area_info['overlapping_bodies'].add(other_body.node)
-                            if hasattr(area_node, 'emit_signal'):
-                                area_node.emit_signal("body_entered", other_body.node)
+            if entered:
+                overlapping.add(other_node)
             else:
-                # Body exited area
-                if hasattr(other_body.node, 'type'):
-                    if other_body.node.type == "Area2D":
-                        # Area exited area
-                        if other_body.node in area_info['overlapping_areas']:
-                            area_info['overlapping_areas'].remove(other_body.node)
-                            if hasattr(area_node, 'emit_signal'):
-                                area_node.emit_signal("area_exited", other_body.node)
-                    else:
-                        # Body exited area
-                        if other_body.node in area_info['overlapping_bodies']:
-                            area_info['overlapping_bodies'].remove(other_body.node)
-                            if hasattr(area_node, 'emit_signal'):
-                                area_node.emit_signal("body_exited", other_body.node)
+                overlapping.discard(other_node)
+
+            # Area2D keeps its own overlap list and emits the signal itself
+            callback = getattr(area_node, callback_name, None)
+            if callable(callback):
+                callback(other_node)
+            elif hasattr(area_node, 'emit_signal'):
+                area_node.emit_signal(signal_name, other_node)
+
+        return len(events)
 
     def _notify_collision(self, body: PhysicsBody, other_body: PhysicsBody, contact: PhysicsContact):
         """Notify a body of collision"""
@@ -482,7 +682,7 @@ class PhysicsWorld:
             try:
                 callback(other_body, contact)
             except Exception as e:
-                print(f"Error in collision callback: {e}")
+                log.error("Error in collision callback: %s", e)
                 import traceback
                 traceback.print_exc()
     
@@ -530,7 +730,7 @@ class PhysicsWorld:
             elif isinstance(node, Area2D):
                 return self._add_area(node)
         except Exception as e:
-            print(f"[WARNING] Error checking physics inheritance for {node.name}: {e}")
+            log.error("Error checking physics inheritance for %s: %s", node.name, e)
 
         return None
     
@@ -556,74 +756,115 @@ class PhysicsWorld:
         # Use unique key to avoid name collisions
         unique_key = f"{node.name}_{id(node)}"
         self.bodies[unique_key] = body
+        self._dynamic_bodies[unique_key] = body
         return body
     
     def _add_static_body(self, node: Node2D) -> PhysicsBody:
         """Add StaticBody2D to physics world"""
-        print(f"[PHYSICS] Adding static body: {node.name}")
+        log.debug("Adding static body: %s", node.name)
         body = PhysicsBody(node, PhysicsBodyType.STATIC)
 
         body.collision_layer = getattr(node, 'collision_layer', 1)
         body.collision_mask = getattr(node, 'collision_mask', 1)
-        print(f"[PHYSICS] Static body collision layer: {body.collision_layer}, mask: {body.collision_mask}")
+        log.debug("Static body collision layer: %s, mask: %s", body.collision_layer, body.collision_mask)
 
         # Add collision shapes from children
         collision_shapes_found = 0
-        print(f"[PHYSICS] Static body has {len(node.children)} children:")
+        log.debug("Static body has %s children:", len(node.children))
         for child in node.children:
             child_type = getattr(child, 'type', 'NO_TYPE')
-            print(f"[PHYSICS]   Child: {child.name} (type: {child_type})")
+            log.debug("  Child: %s (type: %s)", child.name, child_type)
             if hasattr(child, 'type') and child.type in ["CollisionShape2D", "CollisionPolygon2D"]:
-                print(f"[PHYSICS] Found collision shape child: {child.name} ({child.type})")
+                log.debug("Found collision shape child: %s (%s)", child.name, child.type)
                 body.add_collision_shape(child)
                 collision_shapes_found += 1
 
-        print(f"[PHYSICS] Total collision shapes added: {collision_shapes_found}")
+        log.debug("Total collision shapes added: %s", collision_shapes_found)
 
         # Add to space
-        self.space.add(body.pymunk_body)
-        for shape in body.pymunk_shapes:
-            self.space.add(shape)
-            print(f"[PHYSICS] Added shape to physics space")
+        if self.static_baking_enabled:
+            self._bake_static_body(body)
+        else:
+            self.space.add(body.pymunk_body)
+            for shape in body.pymunk_shapes:
+                self.space.add(shape)
+                log.debug("Added shape to physics space")
 
         # Use unique key to avoid name collisions
         unique_key = f"{node.name}_{id(node)}"
         self.bodies[unique_key] = body
-        print(f"[PHYSICS] Static body registered with key: {unique_key}")
+        log.debug("Static body registered with key: %s", unique_key)
         return body
     
+    def _bake_static_body(self, body: PhysicsBody):
+        """Merge a static body's shapes into the shared static body of its scene subtree"""
+        root = body.node
+        while getattr(root, 'parent', None) is not None:
+            root = root.parent
+        bake_key = id(root)
+
+        baked = self._baked_static_bodies.get(bake_key)
+        if baked is None:
+            baked = {'body': pymunk.Body(body_type=pymunk.Body.STATIC), 'shape_count': 0}
+            self.space.add(baked['body'])
+            self._baked_static_bodies[bake_key] = baked
+
+        # Shapes were built in the body's local space; re-create them in world space
+        source = body.pymunk_body
+        if hasattr(body.node, 'rotation'):
+            source.angle = float(body.node.rotation)
+
+        baked_shapes = []
+        for shape in body.pymunk_shapes:
+            if isinstance(shape, pymunk.Circle):
+                baked_shape = pymunk.Circle(baked['body'], shape.radius, source.local_to_world(shape.offset))
+            elif isinstance(shape, pymunk.Segment):
+                baked_shape = pymunk.Segment(baked['body'], source.local_to_world(shape.a),
+                                             source.local_to_world(shape.b), shape.radius)
+            else:
+                vertices = [source.local_to_world(v) for v in shape.get_vertices()]
+                baked_shape = pymunk.Poly(baked['body'], vertices, radius=shape.radius)
+            body._apply_shape_properties(baked_shape)
+            baked_shapes.append(baked_shape)
+
+        body.pymunk_shapes = baked_shapes
+        body.baked_key = bake_key
+        if baked_shapes:
+            self.space.add(*baked_shapes)
+        baked['shape_count'] += len(baked_shapes)
+
     def _add_kinematic_body(self, node: Node2D) -> PhysicsBody:
         """Add KinematicBody2D to physics world"""
-        print(f"[PHYSICS] Adding kinematic body: {node.name}")
+        log.debug("Adding kinematic body: %s", node.name)
         body = PhysicsBody(node, PhysicsBodyType.KINEMATIC)
 
         body.collision_layer = getattr(node, 'collision_layer', 1)
         body.collision_mask = getattr(node, 'collision_mask', 1)
-        print(f"[PHYSICS] Kinematic body collision layer: {body.collision_layer}, mask: {body.collision_mask}")
+        log.debug("Kinematic body collision layer: %s, mask: %s", body.collision_layer, body.collision_mask)
 
         # Add collision shapes from children
         collision_shapes_found = 0
-        print(f"[PHYSICS] Kinematic body has {len(node.children)} children:")
+        log.debug("Kinematic body has %s children:", len(node.children))
         for child in node.children:
             child_type = getattr(child, 'type', 'NO_TYPE')
-            print(f"[PHYSICS]   Child: {child.name} (type: {child_type})")
+            log.debug("  Child: %s (type: %s)", child.name, child_type)
             if hasattr(child, 'type') and child.type in ["CollisionShape2D", "CollisionPolygon2D"]:
-                print(f"[PHYSICS] Found collision shape child: {child.name} ({child.type})")
+                log.debug("Found collision shape child: %s (%s)", child.name, child.type)
                 body.add_collision_shape(child)
                 collision_shapes_found += 1
 
-        print(f"[PHYSICS] Total collision shapes added: {collision_shapes_found}")
+        log.debug("Total collision shapes added: %s", collision_shapes_found)
 
         # Add to space
         self.space.add(body.pymunk_body)
         for shape in body.pymunk_shapes:
             self.space.add(shape)
-            print(f"[PHYSICS] Added shape to physics space")
+            log.debug("Added shape to physics space")
 
         # Use unique key to avoid name collisions
         unique_key = f"{node.name}_{id(node)}"
         self.bodies[unique_key] = body
-        print(f"[PHYSICS] Kinematic body registered with key: {unique_key}")
+        log.debug("Kinematic body registered with key: %s", unique_key)
         return body
     
     def _add_area(self, node: Node2D):
@@ -633,6 +874,7 @@ class PhysicsWorld:
 
         body.collision_layer = getattr(node, 'collision_layer', 1)
         body.collision_mask = getattr(node, 'collision_mask', 1)
+        body.collision_type = AREA_COLLISION_TYPE
 
         # Add collision shapes from children
         for child in node.children:
@@ -649,12 +891,16 @@ class PhysicsWorld:
         # Store area for sensor collision handling
         # Use unique key to avoid name collisions
         unique_key = f"{node.name}_{id(node)}"
-        self.areas[unique_key] = {
+        area_info = {
+            'key': unique_key,
             'node': node,
             'body': body,
+            'contacts': {},  # PhysicsBody -> number of touching shape pairs
             'overlapping_bodies': set(),
             'overlapping_areas': set()
         }
+        self.areas[unique_key] = area_info
+        self._areas_by_body[body] = area_info
 
         self.bodies[unique_key] = body
         return body
@@ -664,12 +910,27 @@ class PhysicsWorld:
         if node_name in self.bodies:
             body = self.bodies[node_name]
             
-            # Remove from space
+            # Remove from space (separate handlers queue exit events for areas)
             for shape in body.pymunk_shapes:
                 self.space.remove(shape)
-            self.space.remove(body.pymunk_body)
+
+            if body.baked_key is not None:
+                # Drop the shared static body once its last shape is gone
+                baked = self._baked_static_bodies.get(body.baked_key)
+                if baked is not None:
+                    baked['shape_count'] -= len(body.pymunk_shapes)
+                    if baked['shape_count'] <= 0:
+                        self.space.remove(baked['body'])
+                        del self._baked_static_bodies[body.baked_key]
+            else:
+                self.space.remove(body.pymunk_body)
             
             del self.bodies[node_name]
+            self._dynamic_bodies.pop(node_name, None)
+
+            area_info = self._areas_by_body.pop(body, None)
+            if area_info is not None:
+                self.areas.pop(area_info['key'], None)
     
     def step(self, dt: float):
         """Step the physics simulation"""
@@ -680,22 +941,103 @@ class PhysicsWorld:
             self._debug_frame_count = 0
 
         if self._debug_frame_count % 300 == 0:
-            print(f"[PHYSICS] Step: {len(self.bodies)} bodies, {len(self.space.shapes)} shapes in space")
+            log.debug("Step: %s bodies, %s shapes in space", len(self.bodies), len(self.space.shapes))
+
+        if self.profiler is not None:
+            self._profiled_step(dt)
+            return
 
         self.space.step(dt)
 
-        # Update nodes from physics (but not kinematic bodies - they control themselves)
-        for body in self.bodies.values():
-            # Only update dynamic and static bodies from physics
-            # Kinematic bodies are controlled by their nodes
-            if body.body_type != PhysicsBodyType.KINEMATIC:
-                body.update_node_from_physics()
+        # Emit area enter/exit signals once the space is unlocked
+        self._flush_area_events()
+
+        self._sync_dynamic_bodies()
+
+    def _profiled_step(self, dt: float):
+        """Step the simulation while recording phase timings into the profiler"""
+        profiler = self.profiler
+        perf_counter = time.perf_counter
+        step_start = perf_counter()
+
+        # Collision callbacks run inside space.step and report their own time
+        callback_time_before = profiler.current.callback_time
+        self.space.step(dt)
+        space_time = perf_counter() - step_start
+        solver_time = space_time - (profiler.current.callback_time - callback_time_before)
+
+        flush_start = perf_counter()
+        event_count = self._flush_area_events()
+        if event_count:
+            profiler.add_callback_time(perf_counter() - flush_start, event_count)
+
+        sync_start = perf_counter()
+        synced = self._sync_dynamic_bodies()
+        sync_end = perf_counter()
+
+        bodies = {
+            'total': len(self.bodies),
+            'dynamic': len(self._dynamic_bodies),
+            'awake': self.awake_body_count,
+            'sleeping': self.sleeping_body_count,
+            'areas': len(self.areas),
+            'baked_static': len(self._baked_static_bodies),
+        }
+        profiler.finish_step(sync_end - step_start, solver_time, sync_end - sync_start,
+                             synced, bodies)
+
+    def _sync_dynamic_bodies(self) -> int:
+        """Copy simulated transforms back to nodes and return how many were written"""
+        # Only dynamic bodies move under simulation; kinematic bodies are
+        # controlled by their nodes and static ones never move.
+        awake = 0
+        sleeping = 0
+        synced = 0
+        for body in self._dynamic_bodies.values():
+            if body.pymunk_body.is_sleeping:
+                sleeping += 1
+                continue
+            awake += 1
+            if body.update_node_from_physics():
+                synced += 1
 
+        self.awake_body_count = awake
+        self.sleeping_body_count = sleeping
+        return synced
 
     
     def set_gravity(self, gravity: Tuple[float, float]):
         """Set world gravity"""
         self.space.gravity = gravity
+
+    def set_sleep_time_threshold(self, seconds: float):
+        """Set how long a body must be idle before sleeping (math.inf disables sleeping)"""
+        self.sleep_time_threshold = seconds
+        self.space.sleep_time_threshold = seconds
+
+    def set_idle_speed_threshold(self, speed: float):
+        """Set the speed below which a body counts as idle (0 derives it from gravity)"""
+        self.idle_speed_threshold = speed
+        self.space.idle_speed_threshold = speed
+
+    def set_sleeping_enabled(self, enabled: bool, sleep_time_threshold: float = 0.5):
+        """Enable or disable body sleeping"""
+        self.set_sleep_time_threshold(sleep_time_threshold if enabled else math.inf)
+
+    def is_sleeping_enabled(self) -> bool:
+        """Check if bodies are allowed to sleep"""
+        return self.sleep_time_threshold != math.inf
+
+    def get_body_counts(self) -> Dict[str, int]:
+        """Get body counters, including awake/sleeping dynamic bodies from the last step"""
+        return {
+            'total': len(self.bodies),
+            'dynamic': len(self._dynamic_bodies),
+            'awake': self.awake_body_count,
+            'sleeping': self.sleeping_body_count,
+            'areas': len(self.areas),
+            'baked_static_bodies': len(self._baked_static_bodies),
+        }
     
     def get_body(self, node_name: str) -> Optional[PhysicsBody]:
         """Get physics body by node name"""
@@ -710,33 +1052,45 @@ class PhysicsWorld:
 
     def get_body_by_pymunk_shape(self, pymunk_shape) -> Optional[PhysicsBody]:
         """Get physics body associated with a pymunk shape"""
+        body = getattr(pymunk_shape, 'user_data', None)
+        if isinstance(body, PhysicsBody):
+            return body
         for body in self.bodies.values():
             if pymunk_shape in body.pymunk_shapes:
                 return body
         return None
     
-    def query_point(self, point: Tuple[float, float]) -> List[PhysicsBody]:
+    @_profiled_query("point")
+    def query_point(self, point: Tuple[float, float],
+                    collision_mask: int = ALL_LAYERS) -> List[PhysicsBody]:
         """Query bodies at a point"""
         results = []
-        point_query = self.space.point_query_nearest(point, 0, pymunk.ShapeFilter())
+        point_query = self.space.point_query_nearest(point, 0, make_shape_filter(collision_mask=collision_mask))
         if point_query:
             body = point_query.shape.user_data
             if body:
                 results.append(body)
         return results
     
+    @_profiled_query("raycast")
     def raycast(self, start: Tuple[float, float], end: Tuple[float, float],
-                collision_mask: int = 0xFFFFFFFF, exclude_sensors: bool = True) -> Optional[Dict]:
+                collision_mask: int = ALL_LAYERS, exclude_sensors: bool = True) -> Optional[Dict]:
         """Perform raycast and return hit information"""
         # Create shape filter
-        shape_filter = pymunk.ShapeFilter(mask=collision_mask)
+        shape_filter = make_shape_filter(collision_mask=collision_mask)
 
-        hit = self.space.segment_query_first(start, end, 0, shape_filter)
-        if hit:
-            # Skip sensors if requested
-            if exclude_sensors and hasattr(hit.shape, 'sensor') and hit.shape.sensor:
-                return None
+        if exclude_sensors:
+            # A sensor in front of a solid shape must not hide it
+            hit = None
+            for candidate in self.space.segment_query(start, end, 0, shape_filter):
+                if candidate.shape.sensor:
+                    continue
+                if hit is None or candidate.alpha < hit.alpha:
+                    hit = candidate
+        else:
+            hit = self.space.segment_query_first(start, end, 0, shape_filter)
 
+        if hit:
             body = hit.shape.user_data if hit.shape.user_data else None
             return {
                 'body': body,
@@ -746,10 +1100,11 @@ class PhysicsWorld:
             }
         return None
 
+    @_profiled_query("raycast_all")
     def raycast_all(self, start: Tuple[float, float], end: Tuple[float, float],
-                    collision_mask: int = 0xFFFFFFFF, exclude_sensors: bool = True) -> List[Dict]:
+                    collision_mask: int = ALL_LAYERS, exclude_sensors: bool = True) -> List[Dict]:
         """Perform raycast and return all hit information"""
-        shape_filter = pymunk.ShapeFilter(mask=collision_mask)
+        shape_filter = make_shape_filter(collision_mask=collision_mask)
         hits = self.space.segment_query(start, end, 0, shape_filter)
 
         results = []
@@ -768,9 +1123,10 @@ class PhysicsWorld:
 
         return results
 
+    @_profiled_query("shape_cast")
     def shape_cast(self, shape_type: str, size: Tuple[float, float],
                    start: Tuple[float, float], end: Tuple[float, float],
-                   collision_mask: int = 0xFFFFFFFF, exclude_body: Optional[PhysicsBody] = None) -> Optional[Dict]:
+                   collision_mask: int = ALL_LAYERS, exclude_body: Optional[PhysicsBody] = None) -> Optional[Dict]:
         """
         Cast a shape along a path and return first hit with proper swept collision detection.
 
@@ -815,7 +1171,7 @@ class PhysicsWorld:
         else:  # rectangle
             temp_shape = pymunk.Poly.create_box(temp_body, size)
 
-        temp_shape.filter = pymunk.ShapeFilter(mask=collision_mask)
+        temp_shape.filter = make_shape_filter(collision_mask=collision_mask)
         temp_shape.sensor = True  # Make it a sensor so it doesn't affect physics
 
         # Add to space temporarily for collision detection
@@ -846,15 +1202,16 @@ class PhysicsWorld:
         else:  # rectangle
             temp_shape = pymunk.Poly.create_box(temp_body, size)
 
-        temp_shape.filter = pymunk.ShapeFilter(mask=collision_mask)
+        temp_shape.filter = make_shape_filter(collision_mask=collision_mask)
         temp_shape.sensor = True
 
         # Add to space temporarily
         self.space.add(temp_body, temp_shape)
 
         try:
-            # Query for overlapping shapes using more precise collision detection
-            for shape in self.space.shapes:
+            # Query the spatial index for overlapping shapes
+            for query in self.space.shape_query(temp_shape):
+                shape = query.shape
                 if shape == temp_shape:
                     continue
 
@@ -898,7 +1255,7 @@ class PhysicsWorld:
                 # Ensure the normal points away from shape2 towards shape1
                 return (normal.x, normal.y)
         except Exception as e:
-            print(f"[PHYSICS] Error getting contact normal: {e}")
+            log.error("Error getting contact normal: %s", e)
 
         # Fallback: calculate normal based on shape centers and edges
         try:
@@ -922,7 +1279,7 @@ class PhysicsWorld:
             else:
                 return (dx/length, dy/length)
         except Exception as e:
-            print(f"[PHYSICS] Error calculating center-based normal: {e}")
+            log.error("Error calculating center-based normal: %s", e)
 
         # Final fallback: use upward normal
         return (0.0, -1.0)
@@ -955,7 +1312,7 @@ class PhysicsWorld:
                 return (0.0, -1.0)  # Push down
 
         except Exception as e:
-            print(f"[PHYSICS] Error calculating edge-based normal: {e}")
+            log.error("Error calculating edge-based normal: %s", e)
             return None
 
     def _perform_swept_collision(self, temp_body, temp_shape, start: Tuple[float, float],
@@ -1011,7 +1368,7 @@ class PhysicsWorld:
                                    collision_mask: int, exclude_body: Optional[PhysicsBody] = None) -> Optional[Dict]:
         """Check for collision at a specific position and return detailed collision info"""
         # Query for shapes at this position
-        point_queries = self.space.point_query(position, 0, pymunk.ShapeFilter(mask=collision_mask))
+        point_queries = self.space.point_query(position, 0, make_shape_filter(collision_mask=collision_mask))
 
         for query in point_queries:
             shape = query.shape
@@ -1040,8 +1397,9 @@ class PhysicsWorld:
                     'distance': 0.0  # Will be set by caller
                 }
 
-        # Also check for shape-to-shape collision using more precise method
-        for shape in self.space.shapes:
+        # Also check for shape-to-shape collision through the spatial index
+        for query in self.space.shape_query(temp_shape):
+            shape = query.shape
             if shape == temp_shape:
                 continue
 
@@ -1105,10 +1463,10 @@ class PhysicsWorld:
                     collision_point = [position[0], position[1]]
 
                     normal = collision_shape_node.get_best_collision_normal(collision_point, temp_center)
-                    print(f"[PHYSICS] Using collision shape edge normal: {normal}")
+                    log.debug("Using collision shape edge normal: %s", normal)
                     return (normal[0], normal[1])
         except Exception as e:
-            print(f"[PHYSICS] Error using collision shape normals: {e}")
+            log.error("Error using collision shape normals: %s", e)
 
         try:
             # Try to get contact points and normal from pymunk
@@ -1118,19 +1476,19 @@ class PhysicsWorld:
                 normal = contact_set.normal
                 # The normal from pymunk should point from colliding_shape towards temp_shape
                 # which is the direction to push temp_shape to resolve the collision
-                print(f"[PHYSICS] Using pymunk contact normal: {(normal.x, normal.y)}")
+                log.debug("Using pymunk contact normal: %s", (normal.x, normal.y))
                 return (normal.x, normal.y)
         except Exception as e:
-            print(f"[PHYSICS] Error getting collision normal: {e}")
+            log.error("Error getting collision normal: %s", e)
 
         # Fallback: Use edge-based calculation first for better accuracy
         try:
             edge_normal = self._calculate_edge_based_normal(temp_shape, colliding_shape)
             if edge_normal:
-                print(f"[PHYSICS] Using edge-based normal: {edge_normal}")
+                log.debug("Using edge-based normal: %s", edge_normal)
                 return edge_normal
         except Exception as e:
-            print(f"[PHYSICS] Error calculating edge-based normal: {e}")
+            log.error("Error calculating edge-based normal: %s", e)
 
         # Final fallback: calculate normal based on shape centers
         try:
@@ -1145,19 +1503,20 @@ class PhysicsWorld:
             length = math.sqrt(dx*dx + dy*dy)
             if length > 0.001:
                 normal = (dx / length, dy / length)
-                print(f"[PHYSICS] Using center-based normal: {normal}")
+                log.debug("Using center-based normal: %s", normal)
                 return normal
             else:
                 # If centers are at same position, default to pushing upward
-                print(f"[PHYSICS] Using default upward normal: (0.0, 1.0)")
+                log.debug("Using default upward normal: (0.0, 1.0)")
                 return (0.0, 1.0)
         except Exception as e:
-            print(f"[PHYSICS] Error calculating fallback normal: {e}")
+            log.error("Error calculating fallback normal: %s", e)
             return (0.0, 1.0)
 
+    @_profiled_query("shape_cast_all")
     def shape_cast_all(self, shape_type: str, size: Tuple[float, float],
                       start: Tuple[float, float], end: Tuple[float, float],
-                      collision_mask: int = 0xFFFFFFFF, exclude_body: Optional[PhysicsBody] = None) -> List[Dict]:
+                      collision_mask: int = ALL_LAYERS, exclude_body: Optional[PhysicsBody] = None) -> List[Dict]:
         """
         Cast a shape and return all hits along the path, sorted by distance.
 
@@ -1188,7 +1547,7 @@ class PhysicsWorld:
         else:  # rectangle
             temp_shape = pymunk.Poly.create_box(temp_body, size)
 
-        temp_shape.filter = pymunk.ShapeFilter(mask=collision_mask)
+        temp_shape.filter = make_shape_filter(collision_mask=collision_mask)
         temp_shape.sensor = True
 
         # Add to space temporarily
@@ -1248,6 +1607,7 @@ class PhysicsWorld:
 
         return collisions
 
+    @_profiled_query("test_move")
     def test_move(self, body: PhysicsBody, move_delta: Tuple[float, float]) -> Optional[Dict]:
         """
         Test if a body can move by the given delta without collision.
@@ -1288,39 +1648,27 @@ class PhysicsWorld:
             exclude_body=body
         )
 
+    @_profiled_query("overlap")
     def get_overlapping_bodies(self, body: PhysicsBody) -> List[PhysicsBody]:
         """Get all bodies currently overlapping with the given body"""
         if not body or not body.pymunk_body:
             return []
 
-        overlapping = []
-        current_pos = body.pymunk_body.position
+        # Areas track their overlaps incrementally from the collision handlers
+        area_info = self._areas_by_body.get(body)
+        if area_info is not None:
+            return [other for other in area_info['contacts']
+                    if other.collision_type != AREA_COLLISION_TYPE]
 
-        # Determine shape type and size
-        shape_type = "rectangle"
-        shape_size = (32.0, 32.0)
-
-        if body.pymunk_shapes:
-            shape = body.pymunk_shapes[0]
-            if hasattr(shape, 'radius'):
-                shape_type = "circle"
-                shape_size = (shape.radius * 2, shape.radius * 2)  # Diameter for both dimensions
-            elif hasattr(shape, 'get_vertices'):
-                vertices = shape.get_vertices()
-                if vertices:
-                    min_x = min(v.x for v in vertices)
-                    max_x = max(v.x for v in vertices)
-                    min_y = min(v.y for v in vertices)
-                    max_y = max(v.y for v in vertices)
-                    shape_size = (max_x - min_x, max_y - min_y)
-
-        # Check for overlaps at current position
-        overlap_info = self._check_shape_overlap(
-            shape_type, shape_size, (current_pos[0], current_pos[1]),
-            body.collision_mask, exclude_body=body
-        )
-
-        if overlap_info and overlap_info['body']:
-            overlapping.append(overlap_info['body'])
+        # Other bodies ask the spatial index for shapes touching their own shapes
+        overlapping = []
+        seen = {body}
+        for shape in body.pymunk_shapes:
+            for query in self.space.shape_query(shape):
+                other = query.shape.user_data
+                if other is None or other in seen or query.shape.sensor:
+                    continue
+                seen.add(other)
+                overlapping.append(other)
 
         return overlapping
@@ -0,0 +1,174 @@
+"""
+Physics Step Profiler for Lupine Engine
+Records per-step timings and counters for PhysicsWorld.step
+"""
+
+import csv
+import json
+import time
+from collections import deque
+from dataclasses import dataclass, field, asdict
+from typing import Dict, Any, List, Optional
+
+
+# Query types tracked by the profiler, in display order
+QUERY_TYPES = ("point", "raycast", "raycast_all", "shape_cast", "shape_cast_all",
+               "overlap", "test_move")
+
+
+@dataclass
+class PhysicsStepStats:
+    """Timings (seconds) and counters collected for a single physics step"""
+    timestamp: float = 0.0
+    step_time: float = 0.0       # Whole PhysicsWorld.step call
+    solver_time: float = 0.0     # space.step minus Python collision callbacks
+    callback_time: float = 0.0   # Python collision callbacks and area signal flush
+    sync_time: float = 0.0       # Writing body transforms back to nodes
+    query_time: float = 0.0      # Queries issued since the previous step
+    contacts_begun: int = 0      # New contact pairs reported by collision handlers
+    callbacks: int = 0
+    synced_bodies: int = 0
+    queries: Dict[str, int] = field(default_factory=dict)
+    bodies: Dict[str, int] = field(default_factory=dict)
+
+
+class PhysicsProfiler:
+    """
+    Rolling-window profiler for the physics world.
+
+    The world only calls into the profiler while one is attached, so a
+    disabled profiler costs a single ``is None`` check per instrumented call.
+    """
+
+    def __init__(self, window_size: int = 300):
+        self.window_size = window_size
+        self.history: deque = deque(maxlen=window_size)
+
+        # Stats being accumulated for the step in progress. Queries issued
+        # between steps are attributed to the next step.
+        self.current = PhysicsStepStats()
+        self._query_depth = 0
+
+    # Collection hooks (called by PhysicsWorld)
+    def begin_query(self, query_type: str) -> float:
+        """Count a query and return its start time"""
+        queries = self.current.queries
+        queries[query_type] = queries.get(query_type, 0) + 1
+        self._query_depth += 1
+        return time.perf_counter()
+
+    def end_query(self, start_time: float):
+        """Finish a query; nested queries only count toward the outermost time"""
+        self._query_depth -= 1
+        if self._query_depth == 0:
+            self.current.query_time += time.perf_counter() - start_time
+
+    def add_callback_time(self, elapsed: float, count: int = 1):
+        """Record time spent in Python collision callbacks"""
+        self.current.callback_time += elapsed
+        self.current.callbacks += count
+
+    def finish_step(self, step_time: float, solver_time: float, sync_time: float,
+                    synced_bodies: int, bodies: Dict[str, int]):
+        """Close the current step and push it into the rolling window"""
+        stats = self.current
+        stats.timestamp = time.time()
+        stats.step_time = step_time
+        stats.solver_time = max(solver_time, 0.0)
+        stats.sync_time = sync_time
+        stats.synced_bodies = synced_bodies
+        stats.bodies = bodies
+        self.history.append(stats)
+        self.current = PhysicsStepStats()
+
+    # Reporting
+    def get_latest(self) -> Optional[PhysicsStepStats]:
+        """Get the most recently completed step"""
+        return self.history[-1] if self.history else None
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Get averages and peaks over the rolling window (times in milliseconds)"""
+        if not self.history:
+            return {}
+
+        count = len(self.history)
+        summary: Dict[str, Any] = {'steps': count}
+        for name in ('step_time', 'solver_time', 'callback_time', 'sync_time', 'query_time'):
+            values = [getattr(s, name) for s in self.history]
+            summary[f'avg_{name}_ms'] = sum(values) / count * 1000.0
+            summary[f'max_{name}_ms'] = max(values) * 1000.0
+
+        summary['avg_contacts_begun'] = sum(s.contacts_begun for s in self.history) / count
+        summary['avg_callbacks'] = sum(s.callbacks for s in self.history) / count
+
+        queries: Dict[str, int] = {}
+        for s in self.history:
+            for query_type, n in s.queries.items():
+                queries[query_type] = queries.get(query_type, 0) + n
+        summary['queries'] = queries
+        summary['bodies'] = dict(self.history[-1].bodies)
+        return summary
+
+    def get_overlay_lines(self) -> List[str]:
+        """Get short text lines for the on-screen overlay"""
+        summary = self.get_summary()
+        if not summary:
+            return ["Physics: no samples"]
+
+        bodies = summary['bodies']
+        queries = summary['queries']
+        query_text = " ".join(f"{q}:{queries[q]}" for q in QUERY_TYPES if queries.get(q))
+        return [
+            f"Physics step {summary['avg_step_time_ms']:.2f} ms (max {summary['max_step_time_ms']:.2f})",
+            f"  solver {summary['avg_solver_time_ms']:.2f}  callbacks {summary['avg_callback_time_ms']:.2f}"
+            f"  sync {summary['avg_sync_time_ms']:.2f}  queries {summary['avg_query_time_ms']:.2f}",
+            f"  contacts/step {summary['avg_contacts_begun']:.1f}  callbacks/step {summary['avg_callbacks']:.1f}",
+            "  bodies " + " ".join(f"{k}:{v}" for k, v in bodies.items()),
+            f"  queries ({summary['steps']} steps) {query_text or 'none'}",
+        ]
+
+    def reset(self):
+        """Clear collected samples"""
+        self.history.clear()
+        self.current = PhysicsStepStats()
+        self._query_depth = 0
+
+    # Export
+    def export_json(self, filepath: str) -> bool:
+        """Export the rolling window and summary to a JSON file"""
+        try:
+            data = {
+                'export_timestamp': time.time(),
+                'window_size': self.window_size,
+                'summary': self.get_summary(),
+                'steps': [asdict(s) for s in self.history]
+            }
+            with open(filepath, 'w') as f:
+                json.dump(data, f, indent=2)
+            return True
+        except Exception as e:
+            print(f"Error exporting physics profile: {e}")
+            return False
+
+    def export_csv(self, filepath: str) -> bool:
+        """Export one row per step to a CSV file"""
+        try:
+            body_types = sorted({k for s in self.history for k in s.bodies})
+            header = ['timestamp', 'step_time', 'solver_time', 'callback_time', 'sync_time',
+                      'query_time', 'contacts_begun', 'callbacks', 'synced_bodies']
+            header += [f'queries_{q}' for q in QUERY_TYPES]
+            header += [f'bodies_{b}' for b in body_types]
+
+            with open(filepath, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(header)
+                for s in self.history:
+                    row = [s.timestamp, s.step_time, s.solver_time, s.callback_time, s.sync_time,
+                           s.query_time, s.contacts_begun, s.callbacks, s.synced_bodies]
+                    row += [s.queries.get(q, 0) for q in QUERY_TYPES]
+                    row += [s.bodies.get(b, 0) for b in body_types]
+                    writer.writerow(row)
+            return True
+        except Exception as e:
+            print(f"Error exporting physics profile: {e}")
+            return False
@@ -19,6 +19,7 @@ class LupineProject:
         self.scenes: List[str] = []
         self.main_scene: Optional[str] = None
         self._scene_manager = None
+        self._scene_index = None
         
     def create_new_project(self, name: str, description: str = "") -> bool:
         """Create a new project with standard folder structure"""
@@ -159,13 +160,9 @@ class LupineProject:
             return False
     
     def load_scenes(self) -> None:
-        """Load list of available scenes"""
-        scenes_dir = self.project_path / "scenes"
-        if scenes_dir.exists():
-            self.scenes = [
-                str(scene_file.relative_to(self.project_path))
-                for scene_file in scenes_dir.glob("*.scene")
-            ]
+        """Load list of available scenes (from the scene index, re-reading only changed files)"""
+        self.scene_index.refresh()
+        self.scenes = self.scene_index.list_scenes()
     
     def get_project_name(self) -> str:
         """Get project name"""
@@ -267,6 +264,15 @@ class LupineProject:
         except ValueError:
             return str(abs_path)
 
+    @property
+    def scene_index(self):
+        """Get the persistent index of the project's scenes."""
+        if self._scene_index is None:
+            from .scene.scene_index import SceneIndex
+            self._scene_index = SceneIndex(self.project_path)
+            self._scene_index.refresh()
+        return self._scene_index
+
     @property
     def scene_manager(self):
         """Get the scene manager for this project."""
@@ -8,9 +8,16 @@ import re
 import sys
 import types
 import inspect
+import posixpath
+import weakref
 from typing import Dict, Any, Optional, List, Callable
 from pathlib import Path
 
+from .engine_log import get_logger
+from .scene.node_path import NodePath
+
+log = get_logger("script")
+
 
 class PythonScriptRuntime:
     """Optimized runtime system for executing Python scripts in the game engine"""
@@ -25,6 +32,9 @@ class PythonScriptRuntime:
         # Performance optimization: cache compiled scripts
         self.compiled_scripts = {}
 
+        # Live script instances by normalized script path, for hot reload
+        self.live_instances: Dict[str, weakref.WeakSet] = {}
+
         # Setup built-in functions
         self.setup_builtins()
     
@@ -48,6 +58,7 @@ class PythonScriptRuntime:
             'sum': sum,
             'any': any,
             'all': all,
+            'NodePath': NodePath,
 
             # Game engine specific functions (will be added by game_runtime)
             'get_node': None,
@@ -77,19 +88,46 @@ class PythonScriptRuntime:
         """Add a built-in function to the global scope"""
         self.global_scope[name] = func
     
+    def compile_script(self, script_content: str, script_path: str = "<script>"):
+        """Parse and compile a script once; returns (code, export variables, export groups)"""
+        entry = self.compiled_scripts.get(script_content)
+        if entry is None:
+            parsed_data = self.parse_export_variables(script_content)
+            processed_content = self.process_script_content(script_content)
+            code = compile(processed_content, script_path, 'exec')
+            entry = (code, parsed_data['variables'], parsed_data['groups'])
+            self.compiled_scripts[script_content] = entry
+        return entry
+
     def execute_script(self, script_content: str, script_instance: 'PythonScriptInstance'):
         """Execute a Python script in the context of a script instance"""
         try:
-            # Parse export variables and groups
-            parsed_data = self.parse_export_variables(script_content)
-            export_vars = parsed_data['variables']
-            export_groups = parsed_data['groups']
+            compiled = self.compile_script(script_content, script_instance.script_path or "<script>")
+        except Exception as e:
+            print(f"Error executing script {script_instance.script_path}: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+        return self.execute_compiled(compiled, script_instance)
+
+    def execute_compiled(self, compiled, script_instance: 'PythonScriptInstance',
+                         export_values: Optional[Dict[str, Any]] = None):
+        """Run already-compiled script code in a fresh namespace for a script instance"""
+        try:
+            code, export_template, export_groups = compiled
+
+            # Each instance gets its own export variable records
+            export_vars = {}
+            for var_name, var_info in export_template.items():
+                var_info = dict(var_info)
+                value = var_info['value']
+                if isinstance(value, (list, dict, set)):
+                    var_info['value'] = value.copy()
+                export_vars[var_name] = var_info
 
             script_instance.export_variables = export_vars
             script_instance.export_groups = export_groups
-
-            # Convert script content to valid Python by replacing '!' prefix
-            processed_content = self.process_script_content(script_content)
+            script_instance.compiled = compiled
 
             # Create execution namespace
             namespace = self.global_scope.copy()
@@ -104,17 +142,31 @@ class PythonScriptRuntime:
             for var_name, var_info in export_vars.items():
                 namespace[var_name] = var_info['value']
 
-            # Execute the processed script
-            exec(processed_content, namespace)
+            # Execute the compiled script
+            exec(code, namespace)
 
             # Update export variables with any changes from script execution
             for var_name in export_vars.keys():
                 if var_name in namespace:
                     export_vars[var_name]['value'] = namespace[var_name]
 
+            # Values carried over from another instance win over the script's defaults
+            if export_values:
+                for var_name, value in export_values.items():
+                    if var_name in export_vars:
+                        export_vars[var_name]['value'] = value
+                        namespace[var_name] = value
+
             # Store the namespace for later method calls
             script_instance.namespace = namespace
 
+            if script_instance.script_path:
+                key = normalize_script_path(script_instance.script_path)
+                instances = self.live_instances.get(key)
+                if instances is None:
+                    instances = self.live_instances[key] = weakref.WeakSet()
+                instances.add(script_instance)
+
             return True
 
         except Exception as e:
@@ -123,6 +175,93 @@ class PythonScriptRuntime:
             traceback.print_exc()
             return False
 
+    def reload_script(self, script_path: str, script_content: str) -> int:
+        """
+        Recompile a changed script and patch it into every live instance of
+        it. Returns the number of instances patched; on a compile error the
+        old code keeps running.
+        """
+        instances = self.live_instances.get(normalize_script_path(script_path))
+        if not instances:
+            return 0
+        instances = list(instances)
+
+        try:
+            compiled = self.compile_script(script_content, script_path)
+        except Exception as e:
+            print(f"Error reloading script {script_path}: {e}")
+            return 0
+
+        # Drop the cached code of the previous version(s)
+        old_versions = {id(instance.compiled) for instance in instances if instance.compiled is not compiled}
+        if old_versions:
+            for content, entry in list(self.compiled_scripts.items()):
+                if id(entry) in old_versions:
+                    del self.compiled_scripts[content]
+
+        # Only names the old or new top-level code binds need to be looked at
+        names = set(compiled[0].co_names) | set(compiled[1])
+        for instance in instances:
+            if instance.compiled is not None:
+                names.update(instance.compiled[0].co_names)
+                names.update(instance.compiled[1])
+        names.difference_update(self.global_scope)
+
+        patched = 0
+        for instance in instances:
+            if self.patch_instance(instance, compiled, names):
+                patched += 1
+        return patched
+
+    def patch_instance(self, script_instance: 'PythonScriptInstance', compiled,
+                       names: Optional[set] = None) -> bool:
+        """
+        Run new script code in a live instance's namespace. Functions and
+        classes are replaced; export values and module-level state keep
+        their current values. `names` limits the scan to the names the
+        script binds (default: the whole namespace).
+        """
+        namespace = script_instance.namespace
+        backup = dict(namespace)
+        if names is None:
+            names = set(namespace).difference(self.global_scope)
+
+        state = {}
+        for name in names:
+            if name in namespace:
+                value = namespace[name]
+                if _is_script_code(value, namespace):
+                    # Removed so functions deleted from the script do not linger
+                    del namespace[name]
+                elif not name.startswith('__') and _is_state(value):
+                    state[name] = value
+        for name, info in script_instance.export_variables.items():
+            state[name] = info['value']
+
+        code, export_template, export_groups = compiled
+        try:
+            exec(code, namespace)
+        except Exception as e:
+            namespace.clear()
+            namespace.update(backup)
+            print(f"Error reloading script {script_instance.script_path}: {e}")
+            return False
+
+        for name, value in state.items():
+            if name in namespace and _is_state(namespace[name]):
+                namespace[name] = value
+
+        export_vars = {}
+        for var_name, var_info in export_template.items():
+            var_info = dict(var_info)
+            var_info['value'] = namespace.get(var_name, var_info['value'])
+            export_vars[var_name] = var_info
+
+        script_instance.export_variables = export_vars
+        script_instance.export_groups = export_groups
+        script_instance.compiled = compiled
+        return True
+
     def process_script_content(self, script_content: str) -> str:
         """Process script content to convert '!' prefix variables to regular Python variables"""
         lines = script_content.split('\n')
@@ -229,6 +368,25 @@ class PythonScriptRuntime:
         return {'variables': export_vars, 'groups': export_groups}
 
 
+def normalize_script_path(script_path: str) -> str:
+    """Normalize a script path so the same file always maps to the same key"""
+    return posixpath.normpath(script_path.replace('\\', '/'))
+
+
+def _is_state(value: Any) -> bool:
+    """Check whether a namespace value is data (kept across reloads) rather than code"""
+    return not callable(value) and not isinstance(value, types.ModuleType)
+
+
+def _is_script_code(value: Any, namespace: Dict[str, Any]) -> bool:
+    """Check whether a namespace value is a function or class defined by the script itself"""
+    if isinstance(value, types.FunctionType):
+        return value.__globals__ is namespace
+    if isinstance(value, type):
+        return value.__module__ == namespace.get('__name__')
+    return False
+
+
 class PythonScriptInstance:
     """Represents an instance of a Python script attached to a node"""
 
@@ -241,10 +399,27 @@ class PythonScriptInstance:
         self.export_variables = {}
         self.export_groups = {}
         self.ready_called = False
+        self.compiled = None  # (code, export variables, export groups) from compile_script
         
         # Bind the script instance to the node
         node.script_instance = self
     
+    def duplicate(self, node) -> Optional['PythonScriptInstance']:
+        """Create an instance of this script for another node from the already-compiled code"""
+        if self.compiled is None:
+            return None
+
+        # Carry over the current export values; containers are copied, not shared
+        export_values = {}
+        for name, info in self.export_variables.items():
+            value = info['value']
+            export_values[name] = value.copy() if isinstance(value, (list, dict, set)) else value
+
+        clone = PythonScriptInstance(node, self.script_path, self.runtime, self.base_class)
+        if not self.runtime.execute_compiled(self.compiled, clone, export_values):
+            return None
+        return clone
+
     def get_script_methods(self) -> Dict[str, Callable]:
         """Get methods that should be available in the script namespace"""
         return {
@@ -279,16 +454,18 @@ class PythonScriptInstance:
     
     def emit_signal(self, signal_name: str, *args):
         """Emit a signal (placeholder implementation)"""
-        print(f"Signal emitted: {signal_name} with args: {args}")
+        log.debug("Signal emitted: %s with args: %s", signal_name, args)
         # TODO: Implement proper signal system
     
     def connect(self, signal_name: str, target_method: Callable):
         """Connect a signal to a method (placeholder implementation)"""
-        print(f"Connected signal {signal_name} to {target_method}")
+        log.debug("Connected signal %s to %s", signal_name, target_method)
         # TODO: Implement proper signal system
     
-    def get_node(self, path: str):
-        """Get a node by path"""
+    def get_node(self, path):
+        """Get a node by path; a NodePath is resolved relative to this script's node"""
+        if isinstance(path, NodePath):
+            return path.resolve(self.node)
         if self.runtime.game_runtime:
             return self.runtime.game_runtime.get_node(path)
         return None
@@ -303,7 +480,7 @@ class PythonScriptInstance:
         """Change to a different scene"""
         if self.runtime.game_runtime:
             return self.runtime.game_runtime.change_scene(scene_path)
-        print(f"Changing scene to: {scene_path}")
+        log.debug("Changing scene to: %s", scene_path)
 
     def get_export_variable(self, name: str):
         """Get the value of an export variable"""
@@ -323,9 +500,9 @@ class PythonScriptInstance:
 def change_scene(scene_path: str):
     """Built-in function to change scenes"""
     # This will be replaced by the actual game runtime implementation
-    print(f"Changing scene to: {scene_path}")
+    log.debug("Changing scene to: %s", scene_path)
 
 
 def emit_signal(signal_name: str, *args):
     """Built-in function to emit signals"""
-    print(f"Signal emitted: {signal_name} with args: {args}")
+    log.debug("Signal emitted: %s with args: %s", signal_name, args)
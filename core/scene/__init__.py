@@ -5,11 +5,17 @@ Package for scene graph and node definitions in Lupine Engine.
 """
 
 from .base_node import Node
+from .node_path import NodePath
 
 from .scene import Scene
 from .scene_manager import SceneManager
 from .node_registry import NodeRegistry
+from .node_factory import NodeFactoryRegistry, get_node_factory_registry, register_node_type
+from .scene_streamer import SceneStreamer, StreamRequest, StreamCancelledError
+from .scene_prototype import ScenePrototype
+from .scene_index import SceneIndex
 
 from .node2d import Node2D
+from .transform_store import TransformStore
 from .sprite import Sprite
 from .camera import Camera2D
@@ -9,14 +9,315 @@ import copy
 from typing import Dict, Any, List, Optional, Union
 
 
+# Values that duplicate() can share between the original and the copy
+_IMMUTABLE_TYPES = frozenset((int, float, bool, str, bytes, complex, type(None)))
+
+# Properties holding per-node runtime objects; duplicate() rebuilds these
+_RUNTIME_PROPERTIES = ('script_instances', 'visual_script_instance')
+
+
+def _copy_value(value: Any) -> Any:
+    """
+    Copy a value for Node.duplicate: mutable containers are copied
+    recursively, everything else (immutables, nodes, resources) is shared.
+    """
+    cls = value.__class__
+    if cls in _IMMUTABLE_TYPES:
+        return value
+    if cls is list:
+        return [v if v.__class__ in _IMMUTABLE_TYPES else _copy_value(v) for v in value]
+    if cls is dict:
+        return {k: v if v.__class__ in _IMMUTABLE_TYPES else _copy_value(v) for k, v in value.items()}
+    if cls is tuple:
+        return tuple(_copy_value(v) for v in value)
+    if cls is set:
+        return set(value)
+    if isinstance(value, list):
+        # List subclasses bound to a node (e.g. Node2D transform vectors) copy as plain lists
+        return [_copy_value(v) for v in value]
+    return value
+
+
+# Marks a prototype property removed from a PropertyOverlay
+_DELETED = object()
+
+
+class PropertyOverlay(dict):
+    """
+    Copy-on-write node properties. The dict itself holds only the node's own
+    (overridden or mutated) values; everything else is read from a shared,
+    read-only prototype mapping. Mutable prototype values are copied into
+    the node when read through [] or get(), so in-place edits never reach
+    the prototype. items() and values() return prototype values as-is and
+    must be treated as read-only. Iteration reads a merged view that is
+    cached until the next write.
+    """
+
+    __slots__ = ('prototype', '_merged')
+
+    def __init__(self, prototype, own: Optional[Dict[str, Any]] = None):
+        dict.__init__(self, own or ())
+        self.prototype = prototype
+        self._merged = None
+
+    def __getitem__(self, key):
+        if dict.__contains__(self, key):
+            value = dict.__getitem__(self, key)
+            if value is _DELETED:
+                raise KeyError(key)
+            return value
+        value = self.prototype[key]
+        if value.__class__ not in _IMMUTABLE_TYPES:
+            copied = _copy_value(value)
+            if copied is not value:
+                self._merged = None
+                dict.__setitem__(self, key, copied)
+            return copied
+        return value
+
+    def __setitem__(self, key, value) -> None:
+        self._merged = None
+        dict.__setitem__(self, key, value)
+
+    def __contains__(self, key) -> bool:
+        if dict.__contains__(self, key):
+            return dict.__getitem__(self, key) is not _DELETED
+        return key in self.prototype
+
+    def __delitem__(self, key) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._merged = None
+        if key in self.prototype:
+            dict.__setitem__(self, key, _DELETED)
+        else:
+            dict.__delitem__(self, key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+    def update(self, *args, **kwargs) -> None:
+        self._merged = None
+        dict.update(self, *args, **kwargs)
+
+    def popitem(self):
+        self._merged = None
+        return dict.popitem(self)
+
+    def pop(self, key, *default):
+        if key in self:
+            value = self[key]
+            del self[key]
+            return value
+        if default:
+            return default[0]
+        raise KeyError(key)
+
+    def clear(self) -> None:
+        self._merged = None
+        dict.clear(self)
+        for key in self.prototype:
+            dict.__setitem__(self, key, _DELETED)
+
+    def merged(self) -> Dict[str, Any]:
+        """Get all properties as a plain dict (prototype values are not copied)"""
+        return dict(self._merged_view())
+
+    def _merged_view(self) -> Dict[str, Any]:
+        """Get the cached merged properties; never modify the result"""
+        merged = self._merged
+        if merged is None:
+            merged = dict(self.prototype)
+            for key, value in dict.items(self):
+                if value is _DELETED:
+                    merged.pop(key, None)
+                else:
+                    merged[key] = value
+            self._merged = merged
+        return merged
+
+    def own(self) -> Dict[str, Any]:
+        """Get only the values this node overrides"""
+        return {key: value for key, value in dict.items(self) if value is not _DELETED}
+
+    def fork(self, exclude=()) -> "PropertyOverlay":
+        """Copy for a duplicated node: same prototype, own values copied"""
+        own = {key: value if value is _DELETED or value.__class__ in _IMMUTABLE_TYPES else _copy_value(value)
+               for key, value in dict.items(self) if key not in exclude}
+        return PropertyOverlay(self.prototype, own)
+
+    def copy(self) -> "PropertyOverlay":
+        return PropertyOverlay(self.prototype, dict(dict.items(self)))
+
+    def __copy__(self) -> "PropertyOverlay":
+        return self.copy()
+
+    def __deepcopy__(self, memo) -> Dict[str, Any]:
+        return copy.deepcopy(self.merged(), memo)
+
+    def __reduce__(self):
+        return (dict, (self.merged(),))
+
+    def __iter__(self):
+        return iter(self._merged_view())
+
+    def __len__(self) -> int:
+        return len(self._merged_view())
+
+    def __eq__(self, other) -> bool:
+        return self._merged_view() == other
+
+    def __ne__(self, other) -> bool:
+        # dict.__ne__ would only compare the node's own values
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def keys(self):
+        return self._merged_view().keys()
+
+    def values(self):
+        return self._merged_view().values()
+
+    def items(self):
+        return self._merged_view().items()
+
+    def __repr__(self) -> str:
+        return f"PropertyOverlay({self.merged()!r})"
+
+
+# Node attributes kept in __dict__ rather than in properties
+_NODE_ATTRIBUTES = frozenset(('name', 'type', 'parent', 'children', 'properties',
+                              'script_path', 'script_instance', 'visible', 'process_mode'))
+
+# Bumped on every structural change (children added/removed, renames, unique
+# name changes); NodePath and other lookup caches compare against it
+_tree_version = 0
+
+
+def _tree_changed() -> None:
+    global _tree_version
+    _tree_version += 1
+
+
+def get_tree_version() -> int:
+    """Get the current tree version; it changes whenever any node tree changes"""
+    return _tree_version
+
+
+class ChildList(list):
+    """
+    A node's children. Keeps a lazily built name -> child index for
+    get_child/find_node; every mutation (including direct list edits)
+    drops the index and notifies the owning node.
+    """
+
+    __slots__ = ('owner', '_names')
+
+    def __init__(self, owner: "Node" = None, children=()):
+        list.__init__(self, children)
+        self.owner = owner
+        self._names = None
+
+    def by_name(self, name: str) -> Optional["Node"]:
+        """Get the first child with a name"""
+        names = self._names
+        if names is None:
+            names = {}
+            for child in self:
+                names.setdefault(child.name, child)
+            self._names = names
+        return names.get(name)
+
+    def _changed(self) -> None:
+        self._names = None
+        owner = getattr(self, 'owner', None)  # Unset while unpickling
+        if owner is not None:
+            owner._structure_changed()
+        else:
+            _tree_changed()
+
+    def append(self, item) -> None:
+        list.append(self, item)
+        self._changed()
+
+    def insert(self, index, item) -> None:
+        list.insert(self, index, item)
+        self._changed()
+
+    def extend(self, items) -> None:
+        list.extend(self, items)
+        self._changed()
+
+    def remove(self, item) -> None:
+        list.remove(self, item)
+        self._changed()
+
+    def pop(self, index=-1):
+        item = list.pop(self, index)
+        self._changed()
+        return item
+
+    def clear(self) -> None:
+        list.clear(self)
+        self._changed()
+
+    def sort(self, *args, **kwargs) -> None:
+        list.sort(self, *args, **kwargs)
+        self._changed()
+
+    def reverse(self) -> None:
+        list.reverse(self)
+        self._changed()
+
+    def __setitem__(self, index, value) -> None:
+        list.__setitem__(self, index, value)
+        self._changed()
+
+    def __delitem__(self, index) -> None:
+        list.__delitem__(self, index)
+        self._changed()
+
+    def __iadd__(self, items):
+        list.extend(self, items)
+        self._changed()
+        return self
+
+    def __imul__(self, count):
+        list.__imul__(self, count)
+        self._changed()
+        return self
+
+
 class Node:
     """Base node class for scene hierarchy."""
 
+    # Flags for duplicate()
+    DUPLICATE_SIGNALS = 1   # Copy signal connections
+    DUPLICATE_GROUPS = 2    # Copy group membership
+    DUPLICATE_SCRIPTS = 4   # Re-attach script instances
+    DUPLICATE_DEFAULT = DUPLICATE_SIGNALS | DUPLICATE_GROUPS | DUPLICATE_SCRIPTS
+
+    # Lookup state, stored per node only once set (see get_path and get_unique_node)
+    _path: Optional[str] = None  # Cached get_path()
+    _unique_name: bool = False  # Reachable as "%Name" in its scene
+    _unique_names: Optional[Dict[str, "Node"]] = None  # Unique-name index, on scene owners
+
     def __init__(self, name: str = "Node", node_type: str = "Node"):
         self.name = name
         self.type = node_type
         self.parent: Optional["Node"] = None
-        self.children: List["Node"] = []
+        self.children: List["Node"] = ChildList(self)
         self.properties: Dict[str, Any] = {}
         self.script_path: Optional[str] = None
         self.script_instance = None
@@ -164,36 +465,210 @@ class Node:
             if child.visible and child.process_mode != "disabled":
                 child._physics_process(delta)
 
+    def _on_pool_acquire(self) -> None:
+        """Called when a pooled instance containing this node is handed out. Override in subclasses."""
+        self._call_script_hook('_on_pool_acquire')
+
+    def _on_pool_release(self) -> None:
+        """Called when a pooled instance containing this node is returned, before it is reset. Override in subclasses."""
+        self._call_script_hook('_on_pool_release')
+
+    def _call_script_hook(self, method_name: str, *args) -> None:
+        """Call a method on the attached script instances that define it."""
+        script_instances = self.properties.get('script_instances') or (
+            [self.script_instance] if self.script_instance else ())
+        for script_instance in script_instances:
+            if hasattr(script_instance, 'call_method'):
+                try:
+                    if script_instance.has_method(method_name):
+                        script_instance.call_method(method_name, *args)
+                except Exception as e:
+                    print(f"Error calling {method_name} in {getattr(script_instance, 'script_path', self.script_path)}: {e}")
+
     def get_child(self, name: str) -> Optional["Node"]:
         """Get a direct child by name."""
-        for child in self.children:
+        children = self.children
+        if children.__class__ is ChildList:
+            return children.by_name(name)
+        for child in children:
             if child.name == name:
                 return child
         return None
 
-    def find_node(self, path: str) -> Optional["Node"]:
+    def find_node(self, path) -> Optional["Node"]:
         """
-        Recursively find a descendant node by slash-separated path
-        (e.g. "Child/Grandchild").
+        Find a node by slash-separated path relative to this node
+        (e.g. "Child/Grandchild"). ".." steps to the parent and a leading
+        "%Name" starts at a unique-named node of this node's scene. A
+        NodePath is resolved through its cache.
         """
+        if not isinstance(path, str):
+            return path.resolve(self)
         if not path:
             return self
-
-        if "/" not in path:
+        if "/" not in path and path[0] != "%" and path != "..":
             return self.get_child(path)
+        return self._resolve_names(path.split("/"))
 
-        parts = path.split("/", 1)
-        first, rest = parts[0], parts[1]
-        child = self.get_child(first)
-        if child:
-            return child.find_node(rest)
-        return None
+    def _resolve_names(self, names) -> Optional["Node"]:
+        """Follow a sequence of path segments from this node."""
+        node = self
+        for i, name in enumerate(names):
+            if not name or name == ".":
+                continue
+            if name == "..":
+                node = node.parent
+            elif i == 0 and name[0] == "%":
+                node = self.get_unique_node(name[1:])
+            else:
+                node = node.get_child(name)
+            if node is None:
+                return None
+        return node
 
     def get_path(self) -> str:
-        """Return the full path from the root to this node."""
-        if not self.parent:
-            return self.name
-        return f"{self.parent.get_path()}/{self.name}"
+        """Return the full path from the root to this node (cached until a rename or reparent)."""
+        path = self._path
+        if path is None:
+            parent = self.parent
+            path = self.name if parent is None else f"{parent.get_path()}/{self.name}"
+            self.__dict__['_path'] = path
+        return path
+
+    # Unique names
+    def set_unique_name(self, enabled: bool = True) -> None:
+        """Mark this node as reachable by "%Name" from anywhere in its scene."""
+        if self._unique_name != enabled:
+            self._unique_name = enabled
+            self._structure_changed()
+
+    def is_unique_name(self) -> bool:
+        """Check if this node is marked as a unique name in its scene."""
+        return self._unique_name
+
+    def get_scene_owner(self) -> "Node":
+        """Get the root of the scene this node belongs to: the nearest scene instance or the tree root."""
+        node = self
+        while node.parent is not None and node.type != "SceneInstance":
+            node = node.parent
+        return node
+
+    def get_unique_node(self, name: str) -> Optional["Node"]:
+        """Get the node marked with a unique name in this node's scene."""
+        owner = self.get_scene_owner()
+        index = owner._unique_names
+        if index is None:
+            index = {}
+            stack = list(owner.children)
+            while stack:
+                node = stack.pop()
+                if node._unique_name:
+                    index.setdefault(node.name, node)
+                # Nested scene instances own their unique names
+                if node.type != "SceneInstance":
+                    stack.extend(node.children)
+            owner.__dict__['_unique_names'] = index
+        return index.get(name)
+
+    def _structure_changed(self) -> None:
+        """Drop the unique-name indexes that may include this node's subtree."""
+        _tree_changed()
+        node = self
+        while node is not None:
+            if node._unique_names is not None:
+                node.__dict__['_unique_names'] = None
+            node = node.__dict__.get('parent')
+
+    def _invalidate_path(self) -> None:
+        """Forget the cached paths of this node and its descendants."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            state = node.__dict__
+            # A node only caches its path if its parent did, so uncached subtrees can be skipped
+            if state.get('_path') is not None:
+                state['_path'] = None
+                stack.extend(node.children)
+
+    def duplicate(self, flags: int = DUPLICATE_DEFAULT) -> "Node":
+        """
+        Create a copy of this node and its subtree without a serialization
+        round trip. Each class resets its own runtime state in
+        _duplicate_state; script instances are re-created from their
+        already-compiled code. Signal connections to nodes inside the
+        subtree are moved to their copies; other targets are kept.
+        """
+        if not flags & Node.DUPLICATE_SIGNALS:
+            return self._duplicate_node(flags, None)
+
+        clones: Dict[int, "Node"] = {}
+        clone = self._duplicate_node(flags, clones)
+        for node_clone in clones.values():
+            for connections in node_clone._signals.values():
+                for connection in connections:
+                    target = clones.get(id(connection['target']))
+                    if target is not None:
+                        connection['target'] = target
+        return clone
+
+    def _duplicate_node(self, flags: int, clones: Optional[Dict[int, "Node"]]) -> "Node":
+        """Copy this node and its subtree, recording id(original) -> copy in clones."""
+        clone = self.__class__.__new__(self.__class__)
+        state = clone.__dict__
+        for key, value in self.__dict__.items():
+            if key == 'children' or key == 'parent':
+                continue
+            if key == 'properties':
+                if value.__class__ is PropertyOverlay:
+                    state[key] = value.fork(_RUNTIME_PROPERTIES)
+                    continue
+                value = {k: v for k, v in value.items() if k not in _RUNTIME_PROPERTIES}
+            state[key] = value if value.__class__ in _IMMUTABLE_TYPES else _copy_value(value)
+        state['parent'] = None
+        state['children'] = ChildList(clone)
+        state['_path'] = None
+        state['_unique_names'] = None
+
+        self._duplicate_state(clone, flags)
+        if clones is not None:
+            clones[id(self)] = clone
+
+        for child in self.children:
+            clone.add_child(child._duplicate_node(flags, clones))
+
+        if flags & Node.DUPLICATE_SCRIPTS:
+            self._duplicate_scripts(clone)
+        return clone
+
+    def _duplicate_state(self, clone: "Node", flags: int) -> None:
+        """Reset state on a fresh copy that must not carry over. Subclasses extend this."""
+        clone._in_tree = False
+        clone._ready_called = False
+        clone.script_instance = None
+
+        if not flags & Node.DUPLICATE_SIGNALS:
+            clone._signals = {name: [] for name in self._signals}
+        if not flags & Node.DUPLICATE_GROUPS:
+            clone._groups = []
+
+    def _duplicate_scripts(self, clone: "Node") -> None:
+        """Attach copies of this node's script instances to a duplicate."""
+        script_instances = self.properties.get('script_instances')
+        if script_instances is not None:
+            copies = []
+            for script_instance in script_instances:
+                if hasattr(script_instance, 'duplicate'):
+                    copy_instance = script_instance.duplicate(clone)
+                    if copy_instance is not None:
+                        copies.append(copy_instance)
+            clone.properties['script_instances'] = copies
+            clone.script_instance = copies[0] if copies else None
+        elif self.script_instance is not None and hasattr(self.script_instance, 'duplicate'):
+            clone.script_instance = self.script_instance.duplicate(clone)
+
+        visual_script_instance = self.properties.get('visual_script_instance')
+        if visual_script_instance is not None and hasattr(visual_script_instance, 'duplicate'):
+            clone.properties['visual_script_instance'] = visual_script_instance.duplicate(clone)
 
     def is_in_tree(self) -> bool:
         """Check if node is in the scene tree."""
@@ -322,8 +797,14 @@ class Node:
     def __setattr__(self, name: str, value: Any) -> None:
         """Set attribute with fallback to script variables."""
         # Handle special internal attributes normally
-        if name.startswith('_') or name in ['name', 'type', 'parent', 'children', 'properties',
-                                           'script_path', 'script_instance', 'visible', 'process_mode']:
+        if name.startswith('_') or name in _NODE_ATTRIBUTES:
+            if name == 'children':
+                if value.__class__ is not ChildList or value.owner is not self:
+                    value = ChildList(self, value)
+                if 'children' in self.__dict__:
+                    self._structure_changed()
+            elif (name == 'name' or name == 'parent') and 'parent' in self.__dict__:
+                self._node_moved(name == 'name')
             super().__setattr__(name, value)
             return
 
@@ -348,6 +829,18 @@ class Node:
         else:
             super().__setattr__(name, value)
 
+    def _node_moved(self, renamed: bool) -> None:
+        """Update lookup caches before this node is renamed or reparented."""
+        state = self.__dict__
+        if state.get('_path') is not None:
+            self._invalidate_path()
+        if renamed:
+            parent = state.get('parent')
+            if parent is not None and parent.children.__class__ is ChildList:
+                parent.children._names = None
+            if parent is not None or state.get('_unique_name', False):
+                self._structure_changed()
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get a property value with default fallback."""
         try:
@@ -404,6 +897,8 @@ class Node:
             data["visual_script"] = self.visual_script_path
         if self._groups:
             data["groups"] = list(self._groups)  # Convert set to list
+        if self.is_unique_name():
+            data["unique_name"] = True
 
         # Ensure all data is JSON serializable
         return convert_to_json_serializable(data)
@@ -440,6 +935,9 @@ class Node:
         for group in groups:
             node.add_to_group(group)
 
+        if data.get("unique_name"):
+            node.set_unique_name(True)
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Node":
         """
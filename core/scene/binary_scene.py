@@ -0,0 +1,867 @@
+"""
+scene/binary_scene.py
+
+Compact binary encoding for scene files.
+
+The JSON `.scene` file stays the source format; a `.scenebin` file next to it
+holds the same data with:
+  - a string table (node types, property names and string values are stored once)
+  - a table of dict "shapes" (key order plus the kind of each value), so the
+    scalar fields of a dict are read with a single struct unpack
+  - packed little-endian arrays for homogeneous numeric lists and tile tables
+  - node records prefixed with their byte length plus a child offset table,
+    so readers can index or skip whole subtrees without decoding them
+
+Decoding reproduces exactly what `json.load` returns for the source file.
+"""
+
+import gc
+import json
+import os
+import struct
+import sys
+import threading
+from array import array
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+MAGIC = b"LSCB"
+VERSION = 1
+BINARY_SCENE_EXTENSION = ".scenebin"
+
+# Value tags
+TAG_NONE = 0
+TAG_FALSE = 1
+TAG_TRUE = 2
+TAG_INT32 = 3
+TAG_INT64 = 4
+TAG_BIGINT = 5       # Decimal string in the string table
+TAG_FLOAT = 6
+TAG_STR = 7
+TAG_LIST = 8
+TAG_DICT = 9         # Shape index, packed scalar fields, then nested values
+TAG_FLOAT_ARRAY = 10
+TAG_INT32_ARRAY = 11
+TAG_INT64_ARRAY = 12
+TAG_TABLE = 13       # Dict of flat dicts sharing one shape, stored column-wise
+TAG_NODE = 14
+
+# Field kinds inside a shape. Scalar kinds double as struct format characters.
+KIND_NONE = "n"
+KIND_BOOL = "?"
+KIND_INT32 = "i"
+KIND_INT64 = "q"
+KIND_FLOAT = "d"
+KIND_STR = "I"         # String table index
+KIND_VALUE = "v"       # Tagged value stored after the packed scalars
+KIND_NODE_FIELD = "x"  # Node name/type/children, stored in the node record itself
+# "1".."9": a list of that many floats (positions, scales, colors) packed inline
+_SCALAR_KINDS = "?iqdI123456789"
+_MAX_INLINE_FLOATS = 9
+_NODE_FIELDS = ("name", "type", "children")
+
+_INT32_MIN, _INT32_MAX = -(1 << 31), (1 << 31) - 1
+_INT64_MIN, _INT64_MAX = -(1 << 63), (1 << 63) - 1
+_MIN_TABLE_ROWS = 4
+_SMALL_ARRAY = 16
+
+_HEADER = struct.Struct("<4sHHIIII")  # magic, version, flags, node_count, strings, shapes, body
+_U32 = struct.Struct("<I")
+_U32_PAIR = struct.Struct("<II")
+_I32 = struct.Struct("<i")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_TAG_U32 = struct.Struct("<BI")
+_NODE_HEAD = struct.Struct("<IIII")   # record length, name index, type index, shape index
+
+# Small numeric lists (positions, colors) are cheaper to read with struct than array
+_SMALL_FLOATS = [struct.Struct(f"<{n}d") for n in range(_SMALL_ARRAY + 1)]
+_SMALL_INTS = [struct.Struct(f"<{n}i") for n in range(_SMALL_ARRAY + 1)]
+
+_NEEDS_BYTESWAP = sys.byteorder != "little"
+
+
+class BinarySceneError(Exception):
+    """Raised when a binary scene file is malformed or cannot be encoded."""
+
+
+def get_binary_scene_path(scene_path: Union[str, Path]) -> Path:
+    """Return the `.scenebin` path that belongs to a `.scene` file."""
+    return Path(scene_path).with_suffix(BINARY_SCENE_EXTENSION)
+
+
+def is_binary_scene_current(scene_path: Union[str, Path]) -> bool:
+    """True if a binary copy exists and is at least as new as the JSON source."""
+    binary_path = get_binary_scene_path(scene_path)
+    try:
+        binary_mtime = binary_path.stat().st_mtime
+    except OSError:
+        return False
+    try:
+        return binary_mtime >= Path(scene_path).stat().st_mtime
+    except OSError:
+        # Source missing (e.g. exported build): the binary file is all we have
+        return True
+
+
+def _pack_array(typecode: str, values: List) -> bytes:
+    """Pack numbers as a little-endian array."""
+    packed = array(typecode, values)
+    if _NEEDS_BYTESWAP:
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _unpack_array(typecode: str, data: bytes) -> List:
+    """Unpack a little-endian array into a list."""
+    unpacked = array(typecode)
+    unpacked.frombytes(data)
+    if _NEEDS_BYTESWAP:
+        unpacked.byteswap()
+    return unpacked.tolist()
+
+
+def _json_key(key: Any) -> str:
+    """Convert a dict key the same way json.dump does."""
+    if isinstance(key, str):
+        return str(key)
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, (int, float)):
+        return json.dumps(key)
+    raise BinarySceneError(f"Cannot encode dict key of type {type(key).__name__}")
+
+
+def _normalize(value: Any) -> Any:
+    """Reduce subclasses of JSON types to the plain type json.load would return."""
+    if isinstance(value, bool):
+        return bool(value)
+    if isinstance(value, int):
+        return int(value)
+    if isinstance(value, float):
+        return float(value)
+    if isinstance(value, str):
+        return str(value)
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    raise BinarySceneError(f"Cannot encode value of type {type(value).__name__}")
+
+
+class _Encoder:
+    """Builds the string table, shape table and body for one scene."""
+
+    def __init__(self):
+        self.strings: List[str] = []
+        self.string_index: Dict[str, int] = {}
+        self.shapes: List[Tuple[Tuple[str, ...], str]] = []
+        self.shape_index: Dict[Tuple[Tuple[str, ...], str], int] = {}
+        self.packers: Dict[str, struct.Struct] = {}
+        self.body = bytearray()
+        self.node_count = 0
+
+    def intern(self, text: str) -> int:
+        index = self.string_index.get(text)
+        if index is None:
+            index = len(self.strings)
+            self.strings.append(text)
+            self.string_index[text] = index
+        return index
+
+    def shape(self, keys: Tuple[str, ...], kinds: str) -> int:
+        shape_key = (keys, kinds)
+        index = self.shape_index.get(shape_key)
+        if index is None:
+            index = len(self.shapes)
+            self.shapes.append(shape_key)
+            self.shape_index[shape_key] = index
+            for key in keys:
+                self.intern(key)
+        return index
+
+    def encode_value(self, value: Any) -> None:
+        body = self.body
+        value_type = type(value)
+
+        if value is None:
+            body.append(TAG_NONE)
+        elif value_type is bool:
+            body.append(TAG_TRUE if value else TAG_FALSE)
+        elif value_type is int:
+            if _INT32_MIN <= value <= _INT32_MAX:
+                body.append(TAG_INT32)
+                body += _I32.pack(value)
+            elif _INT64_MIN <= value <= _INT64_MAX:
+                body.append(TAG_INT64)
+                body += _I64.pack(value)
+            else:
+                body += _TAG_U32.pack(TAG_BIGINT, self.intern(str(value)))
+        elif value_type is float:
+            body.append(TAG_FLOAT)
+            body += _F64.pack(value)
+        elif value_type is str:
+            body += _TAG_U32.pack(TAG_STR, self.intern(value))
+        elif value_type is list or value_type is tuple:
+            self.encode_list(value)
+        elif value_type is dict:
+            self.encode_dict(value)
+        else:
+            self.encode_value(_normalize(value))
+
+    def encode_list(self, values) -> None:
+        body = self.body
+        if values:
+            first_type = type(values[0])
+            if first_type is float and all(type(v) is float for v in values):
+                body += _TAG_U32.pack(TAG_FLOAT_ARRAY, len(values))
+                body += _pack_array("d", values)
+                return
+            if first_type is int and all(type(v) is int for v in values):
+                low, high = min(values), max(values)
+                if _INT32_MIN <= low and high <= _INT32_MAX:
+                    body += _TAG_U32.pack(TAG_INT32_ARRAY, len(values))
+                    body += _pack_array("i", values)
+                    return
+                if _INT64_MIN <= low and high <= _INT64_MAX:
+                    body += _TAG_U32.pack(TAG_INT64_ARRAY, len(values))
+                    body += _pack_array("q", values)
+                    return
+
+        body += _TAG_U32.pack(TAG_LIST, len(values))
+        for item in values:
+            self.encode_value(item)
+
+    @staticmethod
+    def value_kind(value: Any) -> str:
+        """Pick the shape kind used to store a dict value."""
+        value_type = type(value)
+        if value is None:
+            return KIND_NONE
+        if value_type is bool:
+            return KIND_BOOL
+        if value_type is int:
+            if _INT32_MIN <= value <= _INT32_MAX:
+                return KIND_INT32
+            if _INT64_MIN <= value <= _INT64_MAX:
+                return KIND_INT64
+            return KIND_VALUE
+        if value_type is float:
+            return KIND_FLOAT
+        if value_type is str:
+            return KIND_STR
+        if value_type is list and 0 < len(value) <= _MAX_INLINE_FLOATS and \
+                all(type(v) is float for v in value):
+            return str(len(value))
+        return KIND_VALUE
+
+    @staticmethod
+    def struct_format(kinds: str) -> str:
+        """Struct format for the scalar fields of a shape."""
+        return "".join(f"{k}d" if k.isdigit() else k for k in kinds if k in _SCALAR_KINDS)
+
+    def encode_fields(self, data: Dict[str, Any], node_fields: bool = False) -> Tuple[int, List[Any]]:
+        """
+        Append the packed scalar fields of a dict and return its shape index
+        plus the nested values the caller must encode next, in key order.
+        """
+        kinds = []
+        scalars = []
+        nested = []
+        value_kind = self.value_kind
+        for key, value in data.items():
+            if node_fields and key in _NODE_FIELDS:
+                kinds.append(KIND_NODE_FIELD)
+                continue
+            kind = value_kind(value)
+            kinds.append(kind)
+            if kind == KIND_STR:
+                scalars.append(self.intern(value))
+            elif kind == KIND_VALUE:
+                nested.append(value)
+            elif kind.isdigit():
+                scalars.extend(value)
+            elif kind != KIND_NONE:
+                scalars.append(value)
+
+        kinds_text = "".join(kinds)
+        shape_index = self.shape(tuple(data), kinds_text)
+
+        scalar_format = self.struct_format(kinds_text)
+        if scalar_format:
+            packer = self.packers.get(scalar_format)
+            if packer is None:
+                packer = self.packers[scalar_format] = struct.Struct("<" + scalar_format)
+            self.body += packer.pack(*scalars)
+        return shape_index, nested
+
+    def encode_dict(self, data: Dict) -> None:
+        if any(type(key) is not str for key in data):
+            data = {_json_key(key): value for key, value in data.items()}
+
+        if len(data) >= _MIN_TABLE_ROWS and self.try_encode_table(data):
+            return
+
+        body = self.body
+        body.append(TAG_DICT)
+        shape_pos = len(body)
+        body += bytes(4)
+        shape_index, nested = self.encode_fields(data)
+        _U32.pack_into(body, shape_pos, shape_index)
+        for value in nested:
+            self.encode_value(value)
+
+    def try_encode_table(self, data: Dict) -> bool:
+        """Encode a dict of uniform flat dicts (tile data) column-wise."""
+        rows = list(data.values())
+        first = rows[0]
+        if type(first) is not dict or not first:
+            return False
+        keys = tuple(first)
+        if any(type(key) is not str for key in keys):
+            return False
+        for row in rows:
+            if type(row) is not dict or tuple(row) != keys:
+                return False
+
+        kinds = []
+        columns = []
+        for key in keys:
+            column = [row[key] for row in rows]
+            column_type = type(column[0])
+            if any(type(v) is not column_type for v in column):
+                return False
+            if column_type is float:
+                kinds.append(KIND_FLOAT)
+                columns.append(_pack_array("d", column))
+            elif column_type is int:
+                low, high = min(column), max(column)
+                if _INT32_MIN <= low and high <= _INT32_MAX:
+                    kinds.append(KIND_INT32)
+                    columns.append(_pack_array("i", column))
+                elif _INT64_MIN <= low and high <= _INT64_MAX:
+                    kinds.append(KIND_INT64)
+                    columns.append(_pack_array("q", column))
+                else:
+                    return False
+            elif column_type is str:
+                kinds.append(KIND_STR)
+                columns.append(_pack_array("I", [self.intern(v) for v in column]))
+            else:
+                return False
+
+        body = self.body
+        body += _TAG_U32.pack(TAG_TABLE, len(rows))
+        body += _U32.pack(self.shape(keys, "".join(kinds)))
+        body += _pack_array("I", [self.intern(key) for key in data])
+        for packed in columns:
+            body += packed
+        return True
+
+    def encode_node(self, node_data: Any) -> None:
+        """Encode a node dict as a skippable record; other values encode normally."""
+        if (type(node_data) is not dict or type(node_data.get("name")) is not str
+                or type(node_data.get("type")) is not str
+                or type(node_data.get("children", [])) is not list
+                or any(type(key) is not str for key in node_data)):
+            self.encode_value(node_data)
+            return
+
+        self.node_count += 1
+        body = self.body
+        body.append(TAG_NODE)
+        record_start = len(body)
+        body += bytes(_NODE_HEAD.size)
+        shape_index, nested = self.encode_fields(node_data, node_fields=True)
+        for value in nested:
+            self.encode_value(value)
+
+        children = node_data.get("children", [])
+        body += _U32.pack(len(children))
+        offsets_start = len(body)
+        body += bytes(4 * len(children))
+        children_start = len(body)
+        for i, child in enumerate(children):
+            _U32.pack_into(body, offsets_start + 4 * i, len(body) - children_start)
+            self.encode_node(child)
+
+        _NODE_HEAD.pack_into(body, record_start, len(body) - record_start - 4,
+                             self.intern(node_data["name"]), self.intern(node_data["type"]),
+                             shape_index)
+
+    def encode_scene(self, scene_data: Dict[str, Any]) -> bytes:
+        if type(scene_data) is not dict:
+            raise BinarySceneError("Scene data must be a dict")
+
+        # The scene dict is stored as a flat key/value list so root nodes become records
+        body = self.body
+        body += _TAG_U32.pack(TAG_LIST, 2 * len(scene_data))
+        for key, value in scene_data.items():
+            body += _TAG_U32.pack(TAG_STR, self.intern(_json_key(key)))
+            if key == "nodes" and type(value) is list:
+                body += _TAG_U32.pack(TAG_LIST, len(value))
+                for node_data in value:
+                    self.encode_node(node_data)
+            else:
+                self.encode_value(value)
+
+        encoded_strings = [s.encode("utf-8", "surrogatepass") for s in self.strings]
+        string_table = (_U32.pack(len(encoded_strings)) +
+                        _pack_array("I", [len(s) for s in encoded_strings]) +
+                        b"".join(encoded_strings))
+
+        shape_table = bytearray(_U32.pack(len(self.shapes)))
+        for keys, kinds in self.shapes:
+            shape_table += _U32.pack(len(keys))
+            shape_table += _pack_array("I", [self.string_index[key] for key in keys])
+            shape_table += kinds.encode("ascii")
+
+        strings_offset = _HEADER.size
+        shapes_offset = strings_offset + len(string_table)
+        body_offset = shapes_offset + len(shape_table)
+        header = _HEADER.pack(MAGIC, VERSION, 0, self.node_count,
+                              strings_offset, shapes_offset, body_offset)
+        return b"".join((header, string_table, bytes(shape_table), bytes(body)))
+
+
+def encode_scene_data(scene_data: Dict[str, Any]) -> bytes:
+    """Encode a scene dict (as produced by Scene.to_dict or json.load) to bytes."""
+    return _Encoder().encode_scene(scene_data)
+
+
+class _Shape:
+    """
+    Decoder-side view of a dict shape.
+
+    Each shape gets a small generated reader that unpacks all scalar fields
+    with one struct call and builds the dict from a literal, which is several
+    times faster than decoding field by field.
+    """
+
+    __slots__ = ("keys", "kinds", "unpacker", "nested_count", "read", "_build_rows")
+
+    def __init__(self, keys: Tuple[str, ...], kinds: str):
+        if len(keys) != len(kinds) or any(k not in _SCALAR_KINDS + "nvx" for k in kinds):
+            raise BinarySceneError(f"Malformed shape {kinds!r}")
+        self.keys = keys
+        self.kinds = kinds
+        scalar_format = _Encoder.struct_format(kinds)
+        self.unpacker = struct.Struct("<" + scalar_format) if scalar_format else None
+        self.nested_count = kinds.count(KIND_VALUE)
+        self.read = self._build_reader()
+        self._build_rows = None
+
+    def _build_reader(self):
+        """Generate read(data, pos, strings, read_value) -> (dict, pos)."""
+        scalar_names: List[str] = []
+        items: List[str] = []
+        nested = 0
+        for key, kind in zip(self.keys, self.kinds):
+            if kind in (KIND_NONE, KIND_NODE_FIELD):
+                expr = "None"
+            elif kind == KIND_VALUE:
+                expr = f"v{nested}"
+                nested += 1
+            elif kind.isdigit():
+                names = [f"s{len(scalar_names) + i}" for i in range(int(kind))]
+                scalar_names.extend(names)
+                expr = "[" + ", ".join(names) + "]"
+            else:
+                name = f"s{len(scalar_names)}"
+                scalar_names.append(name)
+                expr = f"strings[{name}]" if kind == KIND_STR else name
+            items.append(f"{key!r}: {expr}")
+
+        lines = ["def read(data, pos, strings, read_value, unpack_from=_unpack_from):"]
+        if scalar_names:
+            lines.append(f"    {', '.join(scalar_names)}, = unpack_from(data, pos)")
+            lines.append(f"    pos += {self.unpacker.size}")
+        for i in range(nested):
+            lines.append(f"    v{i}, pos = read_value(pos)")
+        lines.append("    return {" + ", ".join(items) + "}, pos")
+
+        namespace: Dict[str, Any] = {"_unpack_from": self.unpacker.unpack_from if self.unpacker else None}
+        exec("\n".join(lines), namespace)
+        return namespace["read"]
+
+    def build_rows(self, columns: List[List[Any]]) -> List[Dict[str, Any]]:
+        """Turn table columns into row dicts (generated on first use)."""
+        if self._build_rows is None:
+            names = [f"c{i}" for i in range(len(self.keys))]
+            items = ", ".join(f"{key!r}: {name}" for key, name in zip(self.keys, names))
+            source = (f"def build_rows(columns):\n"
+                      f"    return [{{{items}}} for {', '.join(names)}, in zip(*columns)]")
+            namespace: Dict[str, Any] = {}
+            exec(source, namespace)
+            self._build_rows = namespace["build_rows"]
+        return self._build_rows(columns)
+
+
+class BinarySceneReader:
+    """
+    Decoder for `.scenebin` data.
+
+    Besides full decoding, the reader can index node records (name, type,
+    offset, child count) and decode single subtrees, skipping everything else.
+    """
+
+    def __init__(self, data: bytes):
+        if len(data) < _HEADER.size:
+            raise BinarySceneError("File too small for a binary scene header")
+        magic, version, _flags, node_count, strings_offset, shapes_offset, body_offset = \
+            _HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise BinarySceneError("Not a binary scene file")
+        if version != VERSION:
+            raise BinarySceneError(f"Unsupported binary scene version {version}")
+        if max(strings_offset, shapes_offset, body_offset) >= len(data):
+            raise BinarySceneError("Binary scene is truncated")
+
+        self.data = data
+        self.version = version
+        self.node_count = node_count
+        self.body_offset = body_offset
+
+        # String table
+        count = _U32.unpack_from(data, strings_offset)[0]
+        pos = strings_offset + 4
+        lengths = _unpack_array("I", data[pos:pos + 4 * count])
+        pos += 4 * count
+        strings: List[str] = []
+        append = strings.append
+        for length in lengths:
+            end = pos + length
+            append(data[pos:end].decode("utf-8", "surrogatepass"))
+            pos = end
+        self.strings = strings
+
+        # Shape table
+        count = _U32.unpack_from(data, shapes_offset)[0]
+        pos = shapes_offset + 4
+        shapes: List[_Shape] = []
+        for _ in range(count):
+            key_count = _U32.unpack_from(data, pos)[0]
+            pos += 4
+            indices = _unpack_array("I", data[pos:pos + 4 * key_count])
+            pos += 4 * key_count
+            kinds = data[pos:pos + key_count].decode("ascii")
+            pos += key_count
+            shapes.append(_Shape(tuple(strings[i] for i in indices), kinds))
+        self.shapes = shapes
+
+    @classmethod
+    def from_file(cls, file_path: Union[str, Path]) -> "BinarySceneReader":
+        with open(file_path, "rb") as f:
+            return cls(f.read())
+
+    def read_scene(self) -> Dict[str, Any]:
+        """Decode the whole scene into the same dict json.load would return."""
+        items, _ = self._read_value(self.body_offset)
+        return dict(zip(items[::2], items[1::2]))
+
+    def _read_value(self, pos: int) -> Tuple[Any, int]:
+        data = self.data
+        tag = data[pos]
+        pos += 1
+
+        if tag == TAG_DICT:
+            return self.shapes[_U32.unpack_from(data, pos)[0]].read(
+                data, pos + 4, self.strings, self._read_value)
+        if tag == TAG_FLOAT_ARRAY:
+            count = _U32.unpack_from(data, pos)[0]
+            pos += 4
+            if count <= _SMALL_ARRAY:
+                return list(_SMALL_FLOATS[count].unpack_from(data, pos)), pos + 8 * count
+            end = pos + 8 * count
+            return _unpack_array("d", data[pos:end]), end
+        if tag == TAG_STR:
+            return self.strings[_U32.unpack_from(data, pos)[0]], pos + 4
+        if tag == TAG_NODE:
+            return self._read_node(pos)
+        if tag == TAG_LIST:
+            count = _U32.unpack_from(data, pos)[0]
+            pos += 4
+            result = []
+            append = result.append
+            read_value = self._read_value
+            for _ in range(count):
+                item, pos = read_value(pos)
+                append(item)
+            return result, pos
+        if tag == TAG_INT32_ARRAY:
+            count = _U32.unpack_from(data, pos)[0]
+            pos += 4
+            if count <= _SMALL_ARRAY:
+                return list(_SMALL_INTS[count].unpack_from(data, pos)), pos + 4 * count
+            end = pos + 4 * count
+            return _unpack_array("i", data[pos:end]), end
+        if tag == TAG_FLOAT:
+            return _F64.unpack_from(data, pos)[0], pos + 8
+        if tag == TAG_INT32:
+            return _I32.unpack_from(data, pos)[0], pos + 4
+        if tag == TAG_TRUE:
+            return True, pos
+        if tag == TAG_FALSE:
+            return False, pos
+        if tag == TAG_NONE:
+            return None, pos
+        if tag == TAG_TABLE:
+            return self._read_table(pos)
+        if tag == TAG_INT64:
+            return _I64.unpack_from(data, pos)[0], pos + 8
+        if tag == TAG_INT64_ARRAY:
+            count = _U32.unpack_from(data, pos)[0]
+            pos += 4
+            end = pos + 8 * count
+            return _unpack_array("q", data[pos:end]), end
+        if tag == TAG_BIGINT:
+            return int(self.strings[_U32.unpack_from(data, pos)[0]]), pos + 4
+
+        raise BinarySceneError(f"Unknown value tag {tag} at offset {pos - 1}")
+
+    def _read_node(self, pos: int) -> Tuple[Dict[str, Any], int]:
+        data = self.data
+        record_length, name_index, type_index, shape_index = _NODE_HEAD.unpack_from(data, pos)
+        end = pos + 4 + record_length
+        node, pos = self.shapes[shape_index].read(data, pos + _NODE_HEAD.size,
+                                                  self.strings, self._read_value)
+
+        # Node fields come back as None placeholders, so key order is kept
+        node["name"] = self.strings[name_index]
+        node["type"] = self.strings[type_index]
+
+        child_count = _U32.unpack_from(data, pos)[0]
+        if child_count:
+            pos += 4 + 4 * child_count
+            read_value = self._read_value
+            children = []
+            for _ in range(child_count):
+                child, pos = read_value(pos)
+                children.append(child)
+            node["children"] = children
+        elif "children" in node:
+            node["children"] = []
+
+        return node, end
+
+    def _read_table(self, pos: int) -> Tuple[Dict[str, Any], int]:
+        data = self.data
+        strings = self.strings
+        count, shape_index = _U32_PAIR.unpack_from(data, pos)
+        pos += 8
+        shape = self.shapes[shape_index]
+        end = pos + 4 * count
+        outer_keys = [strings[i] for i in _unpack_array("I", data[pos:end])]
+        pos = end
+
+        columns = []
+        for kind in shape.kinds:
+            if kind == KIND_FLOAT:
+                end = pos + 8 * count
+                columns.append(_unpack_array("d", data[pos:end]))
+            elif kind == KIND_INT32:
+                end = pos + 4 * count
+                columns.append(_unpack_array("i", data[pos:end]))
+            elif kind == KIND_INT64:
+                end = pos + 8 * count
+                columns.append(_unpack_array("q", data[pos:end]))
+            elif kind == KIND_STR:
+                end = pos + 4 * count
+                columns.append([strings[i] for i in _unpack_array("I", data[pos:end])])
+            else:
+                raise BinarySceneError(f"Unknown table column kind {kind!r}")
+            pos = end
+
+        return dict(zip(outer_keys, shape.build_rows(columns))), pos
+
+    # Random access
+    def _root_node_offsets(self) -> List[int]:
+        """Offsets of the root node values in the scene's "nodes" list."""
+        data = self.data
+        pos = self.body_offset
+        item_count = _U32.unpack_from(data, pos + 1)[0]
+        pos += 5
+        for _ in range(item_count // 2):
+            key, pos = self._read_value(pos)
+            if key == "nodes" and data[pos] == TAG_LIST:
+                count = _U32.unpack_from(data, pos + 1)[0]
+                pos += 5
+                offsets = []
+                for _ in range(count):
+                    offsets.append(pos)
+                    pos = self._skip_value(pos)
+                return offsets
+            pos = self._skip_value(pos)
+        return []
+
+    def _skip_value(self, pos: int) -> int:
+        """Return the offset just past the value at pos."""
+        if self.data[pos] == TAG_NODE:
+            return pos + 5 + _U32.unpack_from(self.data, pos + 1)[0]
+        return self._read_value(pos)[1]
+
+    def _node_children(self, pos: int) -> List[int]:
+        """Offsets of a node record's children, found without decoding its fields."""
+        data = self.data
+        record_length, _name, _type, shape_index = _NODE_HEAD.unpack_from(data, pos + 1)
+        end = pos + 5 + record_length
+        shape = self.shapes[shape_index]
+
+        # Skip the packed scalars and nested values to reach the child table
+        field_pos = pos + 1 + _NODE_HEAD.size
+        if shape.unpacker is not None:
+            field_pos += shape.unpacker.size
+        for _ in range(shape.nested_count):
+            field_pos = self._skip_value(field_pos)
+
+        child_count = _U32.unpack_from(data, field_pos)[0]
+        table = field_pos + 4
+        children_start = table + 4 * child_count
+        offsets = _unpack_array("I", data[table:children_start])
+        if offsets and children_start + offsets[-1] >= end:
+            raise BinarySceneError("Corrupt child offset table")
+        return [children_start + offset for offset in offsets]
+
+    def _node_label(self, pos: int) -> Tuple[str, str]:
+        """Name and type of the node record at pos."""
+        _length, name_index, type_index, _shape = _NODE_HEAD.unpack_from(self.data, pos + 1)
+        return self.strings[name_index], self.strings[type_index]
+
+    def get_node_index(self) -> List[Dict[str, Any]]:
+        """
+        List every node record as {"path", "type", "offset", "child_count"}
+        without decoding node properties beyond what is needed to find children.
+        """
+        index: List[Dict[str, Any]] = []
+        data = self.data
+
+        def visit(pos: int, parent_path: str):
+            if data[pos] != TAG_NODE:
+                return
+            name, node_type = self._node_label(pos)
+            path = f"{parent_path}/{name}" if parent_path else name
+            children = self._node_children(pos)
+            index.append({
+                "path": path,
+                "type": node_type,
+                "offset": pos,
+                "child_count": len(children)
+            })
+            for child_pos in children:
+                visit(child_pos, path)
+
+        for root_pos in self._root_node_offsets():
+            visit(root_pos, "")
+        return index
+
+    def read_node_at(self, offset: int) -> Dict[str, Any]:
+        """Decode the node record (and its subtree) starting at offset."""
+        return self._read_value(offset)[0]
+
+    def read_subtree(self, node_path: str) -> Optional[Dict[str, Any]]:
+        """Decode only the subtree at a slash-separated path, e.g. "Level/Enemies"."""
+        data = self.data
+        parts = node_path.split("/")
+        candidates = self._root_node_offsets()
+        for depth, part in enumerate(parts):
+            match = None
+            for pos in candidates:
+                if data[pos] == TAG_NODE and self._node_label(pos)[0] == part:
+                    match = pos
+                    break
+            if match is None:
+                return None
+            if depth == len(parts) - 1:
+                return self.read_node_at(match)
+            candidates = self._node_children(match)
+        return None
+
+
+def save_binary_scene(scene_data: Dict[str, Any], file_path: Union[str, Path]) -> None:
+    """Write scene data to a binary scene file."""
+    encoded = encode_scene_data(scene_data)
+    path = Path(file_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(temp_path, "wb") as f:
+        f.write(encoded)
+    os.replace(temp_path, path)
+
+
+def load_binary_scene(file_path: Union[str, Path]) -> Dict[str, Any]:
+    """Read a binary scene file into a scene dict."""
+    reader = BinarySceneReader.from_file(file_path)
+
+    # Decoding only allocates acyclic containers; pausing the cyclic GC avoids
+    # repeated full-heap scans while tens of thousands of dicts are created.
+    # The pause is process-wide, so worker threads (scene streaming) leave it alone
+    if threading.current_thread() is not threading.main_thread():
+        return reader.read_scene()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return reader.read_scene()
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def load_scene_data(file_path: Union[str, Path], prefer_binary: bool = True) -> Dict[str, Any]:
+    """
+    Load scene data from a `.scene` or `.scenebin` path. For a `.scene` path
+    the binary copy is used when it is at least as new as the JSON source.
+    """
+    path = Path(file_path)
+    if path.suffix == BINARY_SCENE_EXTENSION:
+        return load_binary_scene(path)
+
+    if prefer_binary and is_binary_scene_current(path):
+        try:
+            return load_binary_scene(get_binary_scene_path(path))
+        # Corrupt data surfaces as whatever the decoder trips over first
+        # (ValueError covers UnicodeDecodeError and short arrays)
+        except (BinarySceneError, OSError, struct.error, IndexError, ValueError, TypeError) as e:
+            print(f"Binary scene {get_binary_scene_path(path)} unusable, falling back to JSON: {e}")
+
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def convert_scene_to_binary(scene_path: Union[str, Path],
+                            binary_path: Optional[Union[str, Path]] = None) -> bool:
+    """Convert a JSON `.scene` file to its binary form."""
+    try:
+        with open(scene_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        save_binary_scene(data, binary_path or get_binary_scene_path(scene_path))
+        return True
+    except Exception as e:
+        print(f"Error converting {scene_path} to binary: {e}")
+        return False
+
+
+def convert_binary_to_scene(binary_path: Union[str, Path],
+                            scene_path: Optional[Union[str, Path]] = None) -> bool:
+    """Convert a binary scene file back to a JSON `.scene` file."""
+    try:
+        data = load_binary_scene(binary_path)
+        target = Path(scene_path) if scene_path else Path(binary_path).with_suffix(".scene")
+        with open(target, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        return True
+    except Exception as e:
+        print(f"Error converting {binary_path} to JSON: {e}")
+        return False
+
+
+def convert_project_scenes(scenes_dir: Union[str, Path], force: bool = False) -> Dict[str, bool]:
+    """Convert every `.scene` file under a directory whose binary copy is stale."""
+    results: Dict[str, bool] = {}
+    for scene_file in Path(scenes_dir).rglob("*.scene"):
+        if force or not is_binary_scene_current(scene_file):
+            results[str(scene_file)] = convert_scene_to_binary(scene_file)
+    return results
@@ -2,12 +2,44 @@
 Node2D - Base class for 2D nodes with transform
 """
 
+import math
 from typing import Dict, Any, List, Optional, Tuple
 from .base_node import Node
 
 
+# Attributes whose assignment changes a Node2D's global transform
+_TRANSFORM_ATTRIBUTES = frozenset(('position', 'rotation', 'scale', 'properties', 'parent'))
+
+
+class TransformVector(list):
+    """A Node2D position or scale list that reports in-place edits to its node."""
+
+    __slots__ = ('node', 'attribute')
+
+    def __init__(self, values, node: "Node2D", attribute: str):
+        list.__init__(self, values)
+        self.node = node
+        self.attribute = attribute
+
+    def __setitem__(self, index, value) -> None:
+        list.__setitem__(self, index, value)
+        self.node._transform_changed(self.attribute)
+
+    def __reduce_ex__(self, protocol):
+        # Copies and pickles are plain lists, detached from the node
+        return (list, (list(self),))
+
+
 class Node2D(Node):
     """Base class for 2D nodes with position, rotation, and scale"""
+
+    # Transform state, stored per node only once set
+    _transform_dirty: bool = True
+    _global_position: Optional[List[float]] = None
+    _global_rotation: Optional[float] = None
+    _global_scale: Optional[List[float]] = None
+    _transform_store = None  # TransformStore holding this node's transform, if attached
+    _transform_slot: int = -1
     
     def __init__(self, name: str = "Node2D", node_type: str = "Node2D"):
         super().__init__(name, node_type)
@@ -18,17 +50,45 @@ class Node2D(Node):
         self.scale: List[float] = [1.0, 1.0]
         self.z_index: int = 0
         self.z_as_relative: bool = True
-        
-        # Global transform cache
-        self._global_position: Optional[List[float]] = None
-        self._global_rotation: Optional[float] = None
-        self._global_scale: Optional[List[float]] = None
-        self._transform_dirty: bool = True
+
+    # position and scale are kept in properties; reads wrap them so in-place edits are seen
+    @property
+    def position(self) -> List[float]:
+        return self._get_transform_vector('position')
+
+    @property
+    def scale(self) -> List[float]:
+        return self._get_transform_vector('scale')
+
+    def _get_transform_vector(self, attribute: str) -> List[float]:
+        """Get a position/scale list from properties, bound to this node"""
+        try:
+            value = self.properties[attribute]
+        except KeyError:
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{attribute}'")
+        if value.__class__ is not TransformVector or value.node is not self:
+            value = TransformVector(value, self, attribute)
+            self.properties[attribute] = value
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set attribute; transform changes are tracked for the global transform."""
+        if name not in _TRANSFORM_ATTRIBUTES:
+            Node.__setattr__(self, name, value)
+            return
+
+        initialized = name in self.__dict__ or name not in ('parent', 'properties')
+        Node.__setattr__(self, name, value)
+        if not initialized:
+            return  # Set by Node.__init__; a new node starts out dirty
+        if name == 'parent':
+            self._parent_changed()
+        else:
+            self._transform_changed(None if name == 'properties' else name)
     
     def set_position(self, x: float, y: float):
         """Set the position of the node"""
         self.position = [x, y]
-        self._mark_transform_dirty()
     
     def get_position(self) -> List[float]:
         """Get the position of the node"""
@@ -37,7 +97,6 @@ class Node2D(Node):
     def set_rotation(self, rotation: float):
         """Set the rotation of the node in radians"""
         self.rotation = rotation
-        self._mark_transform_dirty()
     
     def get_rotation(self) -> float:
         """Get the rotation of the node in radians"""
@@ -46,7 +105,6 @@ class Node2D(Node):
     def set_scale(self, x: float, y: float):
         """Set the scale of the node"""
         self.scale = [x, y]
-        self._mark_transform_dirty()
     
     def get_scale(self) -> List[float]:
         """Get the scale of the node"""
@@ -54,83 +112,127 @@ class Node2D(Node):
     
     def translate(self, x: float, y: float):
         """Translate the node by the given offset"""
-        self.position[0] += x
-        self.position[1] += y
-        self._mark_transform_dirty()
+        position = self.position
+        self.position = [position[0] + x, position[1] + y]
     
     def rotate(self, angle: float):
         """Rotate the node by the given angle in radians"""
         self.rotation += angle
-        self._mark_transform_dirty()
     
     def look_at(self, target: List[float]):
         """Make the node look at the target position"""
-        import math
         dx = target[0] - self.position[0]
         dy = target[1] - self.position[1]
         self.rotation = math.atan2(dy, dx)
-        self._mark_transform_dirty()
     
     def get_global_position(self) -> List[float]:
         """Get the global position of the node"""
-        if self._transform_dirty or self._global_position is None:
-            self._update_global_transform()
-        return self._global_position.copy()
+        return list(self._get_global_transform()[0])
     
     def get_global_rotation(self) -> float:
         """Get the global rotation of the node"""
-        if self._transform_dirty or self._global_rotation is None:
-            self._update_global_transform()
-        return self._global_rotation
+        return self._get_global_transform()[1]
     
     def get_global_scale(self) -> List[float]:
         """Get the global scale of the node"""
-        if self._transform_dirty or self._global_scale is None:
+        return list(self._get_global_transform()[2])
+
+    def _get_global_transform(self) -> Tuple[List[float], float, List[float]]:
+        """Get (position, rotation, scale) in global space"""
+        store = self._transform_store
+        if store is not None:
+            if not store.needs_update:
+                return store.get_global_transform(self._transform_slot)
+            # Changed since the store's last update: compute this chain directly
+            return self._compute_global_transform()
+        if self._transform_dirty or self._global_position is None:
             self._update_global_transform()
-        return self._global_scale.copy()
+        return self._global_position, self._global_rotation, self._global_scale
+
+    def _transform_changed(self, attribute: Optional[str] = None) -> None:
+        """Called when position, rotation or scale changed (attribute None: possibly all)"""
+        store = self._transform_store
+        if store is not None:
+            store.write(self, attribute)
+        self._mark_transform_dirty()
+
+    def _parent_changed(self) -> None:
+        """Re-link the transform after the node was reparented"""
+        store = self._transform_store
+        new_store = self._find_ancestor_store()
+        if store is not None and store is not new_store:
+            store.detach(self)
+        elif store is not None:
+            store.reparent(self)
+        if new_store is not None and store is not new_store:
+            new_store.attach(self)
+        self._mark_transform_dirty()
+
+    def _find_ancestor_store(self):
+        """Get the TransformStore of the nearest attached ancestor or attached root above this node"""
+        ancestor = self.parent
+        while ancestor is not None:
+            state = ancestor.__dict__
+            store = state.get('_transform_store') or state.get('_transform_root')
+            if store is not None:
+                return store
+            ancestor = state.get('parent')
+        return None
     
     def _mark_transform_dirty(self):
-        """Mark transform as dirty and propagate to children"""
-        self._transform_dirty = True
-        for child in self.children:
-            if isinstance(child, Node2D):
-                child._mark_transform_dirty()
+        """Mark transform as dirty and propagate to Node2D descendants"""
+        if self._transform_store is not None or self._transform_dirty:
+            # The store propagates changes in update(); a dirty node's descendants are dirty too
+            return
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            node.__dict__['_transform_dirty'] = True
+            for child in node.children:
+                if isinstance(child, Node2D) and not child._transform_dirty:
+                    stack.append(child)
     
     def _update_global_transform(self):
-        """Update global transform from parent chain"""
-        if self.parent and isinstance(self.parent, Node2D):
-            parent_pos = self.parent.get_global_position()
-            parent_rot = self.parent.get_global_rotation()
-            parent_scale = self.parent.get_global_scale()
-            
-            # Apply parent transform
-            import math
-            cos_rot = math.cos(parent_rot)
-            sin_rot = math.sin(parent_rot)
-            
-            # Transform position
-            local_x = self.position[0] * parent_scale[0]
-            local_y = self.position[1] * parent_scale[1]
-            
-            self._global_position = [
-                parent_pos[0] + (local_x * cos_rot - local_y * sin_rot),
-                parent_pos[1] + (local_x * sin_rot + local_y * cos_rot)
-            ]
-            
-            # Transform rotation and scale
-            self._global_rotation = parent_rot + self.rotation
-            self._global_scale = [
-                parent_scale[0] * self.scale[0],
-                parent_scale[1] * self.scale[1]
-            ]
-        else:
-            # No parent, use local transform
-            self._global_position = self.position.copy()
-            self._global_rotation = self.rotation
-            self._global_scale = self.scale.copy()
-        
-        self._transform_dirty = False
+        """Update the cached global transform of this node and its dirty ancestors"""
+        chain = []
+        node = self
+        while isinstance(node, Node2D) and (node._transform_dirty or node._global_position is None):
+            chain.append(node)
+            node = node.parent
+
+        for node in reversed(chain):
+            parent = node.parent
+            if isinstance(parent, Node2D):
+                transform = _combine_transform(parent._global_position, parent._global_rotation,
+                                               parent._global_scale, node)
+            else:
+                transform = (list(node.position), node.rotation, list(node.scale))
+            state = node.__dict__
+            state['_global_position'], state['_global_rotation'], state['_global_scale'] = transform
+            state['_transform_dirty'] = False
+
+    def _compute_global_transform(self) -> Tuple[List[float], float, List[float]]:
+        """Compute the global transform from the local transforms up the parent chain (uncached)"""
+        chain = []
+        node = self
+        while isinstance(node, Node2D):
+            chain.append(node)
+            node = node.parent
+
+        root = chain.pop()
+        transform = (list(root.position), root.rotation, list(root.scale))
+        for node in reversed(chain):
+            transform = _combine_transform(transform[0], transform[1], transform[2], node)
+        return transform
     
+    def _duplicate_state(self, clone: "Node", flags: int) -> None:
+        """Drop the cached global transform; the copy has no parent yet."""
+        super()._duplicate_state(clone, flags)
+        state = clone.__dict__
+        for key in ('_global_position', '_global_rotation', '_global_scale', '_transform_dirty',
+                    '_transform_store', '_transform_slot'):
+            state.pop(key, None)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
         data = super().to_dict()
@@ -177,3 +279,18 @@ class Node2D(Node):
                 node.add_child(child)
         
         return node
+
+
+def _combine_transform(parent_position: List[float], parent_rotation: float, parent_scale: List[float],
+                       node: Node2D) -> Tuple[List[float], float, List[float]]:
+    """Apply a parent's global transform to a node's local transform"""
+    position = node.position
+    scale = node.scale
+    cos_rot = math.cos(parent_rotation)
+    sin_rot = math.sin(parent_rotation)
+    local_x = position[0] * parent_scale[0]
+    local_y = position[1] * parent_scale[1]
+    return ([parent_position[0] + (local_x * cos_rot - local_y * sin_rot),
+             parent_position[1] + (local_x * sin_rot + local_y * cos_rot)],
+            parent_rotation + node.rotation,
+            [parent_scale[0] * scale[0], parent_scale[1] * scale[1]])
@@ -0,0 +1,211 @@
+"""
+scene/node_factory.py
+
+Maps serialized node type names to the functions that build nodes from
+scene data, so loading a scene dispatches each node with one dict lookup.
+"""
+
+import importlib
+from typing import Dict, Any, Callable, Optional, Type
+
+from .base_node import Node
+
+
+# Built-in node types: type name -> (module, class name)
+BUILTIN_NODE_TYPES: Dict[str, tuple] = {
+    "Node2D": ("core.scene.node2d", "Node2D"),
+    "Sprite": ("nodes.node2d.Sprite", "Sprite"),
+    "Sprite2D": ("nodes.node2d.Sprite", "Sprite"),
+    "Camera2D": ("nodes.node2d.Camera2D", "Camera2D"),
+    "AnimatedSprite": ("nodes.node2d.AnimatedSprite", "AnimatedSprite"),
+    "AnimationPlayer": ("nodes.base.AnimationPlayer", "AnimationPlayer"),
+    "KinematicBody2D": ("nodes.node2d.KinematicBody2D", "KinematicBody2D"),
+    "StaticBody2D": ("nodes.node2d.StaticBody2D", "StaticBody2D"),
+    "RigidBody2D": ("nodes.node2d.Rigidbody2D", "RigidBody2D"),
+    "Area2D": ("nodes.node2d.Area2D", "Area2D"),
+    "CollisionShape2D": ("nodes.node2d.CollisionShape2D", "CollisionShape2D"),
+    "CollisionPolygon2D": ("nodes.node2d.CollisionPolygon2D", "CollisionPolygon2D"),
+    "TopDown4DirPlayerController": ("nodes.prefabs.TopDown4DirPlayerController", "TopDown4DirPlayerController"),
+    "TopDown8DirPlayerController": ("nodes.prefabs.TopDown8DirPlayerController", "TopDown8DirPlayerController"),
+    "PlatformerPlayerController": ("nodes.prefabs.PlatformerPlayerController", "PlatformerPlayerController"),
+    # UI node types
+    "Button": ("nodes.ui.Button", "Button"),
+    "Label": ("nodes.ui.Label", "Label"),
+    "Control": ("nodes.ui.Control", "Control"),
+    "Panel": ("nodes.ui.Panel", "Panel"),
+    "ColorRect": ("nodes.ui.ColorRect", "ColorRect"),
+    "TextureRect": ("nodes.ui.TextureRect", "TextureRect"),
+    "NinePatchRect": ("nodes.ui.NinePatchRect", "NinePatchRect"),
+    "VBoxContainer": ("nodes.ui.VBoxContainer", "VBoxContainer"),
+    "HBoxContainer": ("nodes.ui.HBoxContainer", "HBoxContainer"),
+    "ProgressBar": ("nodes.ui.ProgressBar", "ProgressBar"),
+    "CenterContainer": ("nodes.ui.CenterContainer", "CenterContainer"),
+    "LineEdit": ("nodes.ui.LineEdit", "LineEdit"),
+    "CheckBox": ("nodes.ui.CheckBox", "CheckBox"),
+    "AudioStreamPlayer": ("nodes.audio.AudioStreamPlayer", "AudioStreamPlayer"),
+    "SceneInstance": ("core.scene.scene_instance", "SceneInstance"),
+}
+
+# Scripts that replace the node type they are attached to: file name -> type name
+SCRIPT_NODE_TYPES: Dict[str, str] = {
+    "TopDown4DirPlayerController.py": "TopDown4DirPlayerController",
+    "TopDown8DirPlayerController.py": "TopDown8DirPlayerController",
+    "PlatformerPlayerController.py": "PlatformerPlayerController",
+}
+
+NodeFactory = Callable[[Dict[str, Any]], Node]
+
+
+class NodeFactoryRegistry:
+    """
+    Registry mapping node-type strings to factories that build a node (and
+    its subtree) from serialized data.
+
+    Built-in types and the types known to the DynamicNodeRegistry are
+    resolved once, on first use. Classes registered with register_class or
+    register_factory take precedence and survive invalidate().
+    """
+
+    def __init__(self):
+        self._factories: Dict[str, NodeFactory] = {}
+        self._custom: Dict[str, NodeFactory] = {}
+        self._populated = False
+
+    def register_class(self, type_name: str, cls: Type[Node]) -> None:
+        """Register a node class; it is built with its own from_dict if it defines one."""
+        self.register_factory(type_name, class_factory(cls))
+
+    def register_factory(self, type_name: str, factory: NodeFactory) -> None:
+        """Register a function that builds a node from serialized data."""
+        self._custom[type_name] = factory
+        self._factories[type_name] = factory
+
+    def unregister(self, type_name: str) -> None:
+        """Remove a custom registration; built-in types are restored on the next lookup."""
+        if self._custom.pop(type_name, None) is not None:
+            self.invalidate()
+
+    def invalidate(self) -> None:
+        """Forget resolved types so they are looked up again (e.g. after a node rescan)."""
+        self._factories = dict(self._custom)
+        self._populated = False
+
+    def get_factory(self, type_name: str) -> Optional[NodeFactory]:
+        """Get the factory for a node type, or None if the type is unknown."""
+        if not self._populated:
+            self._populate()
+        return self._factories.get(type_name)
+
+    def is_registered(self, type_name: str) -> bool:
+        """Check whether a node type has a factory."""
+        return self.get_factory(type_name) is not None
+
+    def create_node(self, data: Dict[str, Any]) -> Node:
+        """Build a node and its subtree from serialized data."""
+        if not self._populated:
+            self._populate()
+
+        # A script can replace the node type (player controller prefabs)
+        script_path = data.get("script_path")
+        if script_path:
+            script_type = SCRIPT_NODE_TYPES.get(script_path.replace("\\", "/").rsplit("/", 1)[-1])
+            if script_type:
+                factory = self._factories.get(script_type)
+                if factory:
+                    return factory(data)
+
+        factory = self._factories.get(data.get("type", "Node"))
+        if factory is None:
+            return build_generic_node(Node, data)
+        return factory(data)
+
+    def _populate(self) -> None:
+        """Resolve the built-in and dynamically registered node types once."""
+        factories: Dict[str, NodeFactory] = {}
+
+        # Types the project's DynamicNodeRegistry knows about (custom nodes, prefabs)
+        try:
+            from core.node_registry import get_node_registry
+            registry = get_node_registry()
+            for type_name in list(registry._node_definitions):
+                factories[type_name] = dynamic_factory(registry, type_name)
+        except Exception as e:
+            print(f"Node registry unavailable for scene loading: {e}")
+
+        # Built-in classes override the registry's placeholders
+        for type_name, (module_name, class_name) in BUILTIN_NODE_TYPES.items():
+            try:
+                cls = getattr(importlib.import_module(module_name), class_name)
+                factories[type_name] = class_factory(cls)
+            except (ImportError, AttributeError) as e:
+                print(f"Could not import node class {type_name}: {e}")
+
+        factories.update(self._custom)
+        self._factories = factories
+        self._populated = True
+
+
+def build_generic_node(cls: Type[Node], data: Dict[str, Any], node: Optional[Node] = None) -> Node:
+    """Build a node of a class without its own from_dict: common properties plus children."""
+    if node is None:
+        if cls is Node:
+            node = Node(data.get("name", "Node"), data.get("type", "Node"))
+        else:
+            node = cls(data.get("name", cls.__name__))
+    Node._apply_node_properties(node, data)
+
+    create_node = _node_factory_registry.create_node
+    for child_data in data.get("children", []):
+        node.add_child(create_node(child_data))
+    return node
+
+
+def class_factory(cls: Type[Node]) -> NodeFactory:
+    """Get the factory for a node class."""
+    if cls.from_dict.__func__ is not Node.from_dict.__func__:
+        return cls.from_dict
+    return lambda data: build_generic_node(cls, data)
+
+
+def dynamic_factory(registry, type_name: str) -> NodeFactory:
+    """Factory for a DynamicNodeRegistry type; the class is resolved on first use."""
+    resolved = []
+
+    def create(data: Dict[str, Any]) -> Node:
+        if resolved:
+            return resolved[0](data)
+
+        node = registry.create_node_instance(type_name, data.get("name", type_name))
+        if node is None:
+            node = Node(data.get("name", "Node"), type_name)
+
+        # Later nodes of this type skip the registry (and its module loading)
+        cls = node.__class__
+        if cls is Node:
+            script_path = node.script_path
+
+            def create_plain(plain_data: Dict[str, Any]) -> Node:
+                plain = Node(plain_data.get("name", type_name), type_name)
+                plain.script_path = script_path
+                return build_generic_node(Node, plain_data, plain)
+
+            resolved.append(create_plain)
+        else:
+            resolved.append(class_factory(cls))
+        return build_generic_node(cls, data, node)
+
+    return create
+
+
+# Global instance
+_node_factory_registry = NodeFactoryRegistry()
+
+
+def get_node_factory_registry() -> NodeFactoryRegistry:
+    """Get the global node factory registry"""
+    return _node_factory_registry
+
+
+def register_node_type(type_name: str, cls: Type[Node]) -> None:
+    """Register a custom node class for scene loading"""
+    _node_factory_registry.register_class(type_name, cls)
@@ -0,0 +1,64 @@
+"""
+scene/node_path.py
+
+Pre-parsed node paths. A NodePath splits its path once and remembers the
+node it resolved to from a given base node until any node tree changes,
+so scripts can keep one and resolve it every frame.
+"""
+
+import weakref
+from typing import Optional
+
+from .base_node import Node, get_tree_version
+
+
+class NodePath:
+    """A slash-separated node path ("Child/Grandchild", "../Sibling", "%Unique/Child")."""
+
+    __slots__ = ('path', 'names', '_base', '_target', '_version')
+
+    def __init__(self, path: str):
+        self.path = str(path)
+        self.names = tuple(name for name in self.path.split("/") if name and name != ".")
+        self._base = None
+        self._target = None
+        self._version = -1
+
+    def resolve(self, base: Node) -> Optional[Node]:
+        """Get the node this path points to from base, or None"""
+        if self._version == get_tree_version() and self._base is not None and self._base() is base:
+            return self._target() if self._target is not None else None
+
+        target = base._resolve_names(self.names) if self.names else base
+        self._base = weakref.ref(base)
+        self._target = weakref.ref(target) if target is not None else None
+        self._version = get_tree_version()
+        return target
+
+    def is_empty(self) -> bool:
+        """Check if the path points at the base node itself"""
+        return not self.names
+
+    def get_name(self, index: int) -> str:
+        """Get one segment of the path"""
+        return self.names[index]
+
+    def get_name_count(self) -> int:
+        """Get the number of segments in the path"""
+        return len(self.names)
+
+    def __str__(self) -> str:
+        return self.path
+
+    def __repr__(self) -> str:
+        return f"NodePath({self.path!r})"
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, NodePath):
+            return self.names == other.names
+        if isinstance(other, str):
+            return self.names == NodePath(other).names
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.names)
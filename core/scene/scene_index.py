@@ -0,0 +1,282 @@
+"""
+scene/scene_index.py
+
+Persistent index of a project's scene files: size, node count, scene
+dependencies and content hash per scene. The index is saved next to the
+project and updated incrementally, so opening a project only stats the
+scene files and re-reads the ones that changed.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional, Set, Tuple
+
+from .binary_scene import (BinarySceneReader, BinarySceneError, get_binary_scene_path,
+                           is_binary_scene_current)
+
+
+SCENE_INDEX_FILE = ".scene_index.json"
+SCENE_INDEX_VERSION = 1
+
+# Node types that weigh more in the complexity score
+_COMPLEX_NODE_TYPES = {"SceneInstance": 5, "AnimationPlayer": 5, "ParticleSystem": 5,
+                       "Sprite": 2, "AudioStreamPlayer": 2}
+
+
+def index_scene_file(full_path: Path) -> Dict[str, Any]:
+    """
+    Build the index entry of one scene file. The binary copy's node index
+    is used when it is current, so only SceneInstance records are decoded.
+    """
+    with open(full_path, "rb") as f:
+        content = f.read()
+    stat = full_path.stat()
+
+    name = full_path.stem
+    node_types: List[str] = []
+    dependencies: List[str] = []
+
+    data = None
+    if is_binary_scene_current(full_path):
+        try:
+            reader = BinarySceneReader.from_file(get_binary_scene_path(full_path))
+            for record in reader.get_node_index():
+                node_types.append(record["type"])
+                if record["type"] == "SceneInstance":
+                    scene_path = reader.read_node_at(record["offset"]).get("scene_path", "")
+                    if scene_path and scene_path not in dependencies:
+                        dependencies.append(scene_path)
+        except (BinarySceneError, OSError, IndexError, ValueError):
+            node_types, dependencies = [], []
+            data = json.loads(content)
+    else:
+        data = json.loads(content)
+
+    if data is not None:
+        name = data.get("name", name)
+        stack = list(data.get("nodes", []))
+        while stack:
+            node = stack.pop()
+            node_type = node.get("type", "Node")
+            node_types.append(node_type)
+            if node_type == "SceneInstance":
+                scene_path = node.get("scene_path", "")
+                if scene_path and scene_path not in dependencies:
+                    dependencies.append(scene_path)
+            stack.extend(node.get("children", []))
+
+    return {
+        "name": name,
+        "file_size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "modified_time": stat.st_mtime,
+        "node_count": len(node_types),
+        "dependencies": dependencies,
+        "complexity_score": len(node_types) + sum(_COMPLEX_NODE_TYPES.get(t, 0) for t in node_types),
+        "hash": hashlib.blake2b(content, digest_size=16).hexdigest(),
+    }
+
+
+class SceneIndex:
+    """
+    Project-wide scene metadata, keyed by project-relative scene path.
+
+    refresh() brings the whole index up to date by stat'ing the scene files;
+    get() checks a single scene. Dependency queries (dependents, cycles,
+    load order) are answered from the index without loading scenes.
+    """
+
+    def __init__(self, project_path, scenes_dir: str = "scenes", index_file: str = SCENE_INDEX_FILE):
+        self.project_path = Path(project_path)
+        self.scenes_dir = scenes_dir
+        self.index_path = self.project_path / index_file
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._dependents: Optional[Dict[str, Set[str]]] = None
+        self._cycles: Dict[str, bool] = {}
+        self._dirty = False
+        self.load()
+
+    # Persistence
+    def load(self) -> bool:
+        """Load the saved index; a missing or outdated file leaves it empty"""
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if data.get("version") != SCENE_INDEX_VERSION:
+            return False
+        self.entries = data.get("scenes", {})
+        self._invalidate()
+        return True
+
+    def save(self) -> bool:
+        """Write the index if it changed"""
+        if not self._dirty:
+            return True
+        try:
+            temp_path = self.index_path.with_suffix(".tmp")
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": SCENE_INDEX_VERSION, "scenes": self.entries}, f)
+            os.replace(temp_path, self.index_path)
+            self._dirty = False
+            return True
+        except OSError as e:
+            print(f"Error saving scene index: {e}")
+            return False
+
+    # Updates
+    def refresh(self, save: bool = True) -> List[str]:
+        """Re-index new and changed scenes, drop deleted ones; returns the changed paths"""
+        changed = []
+        seen = set()
+        for scene_path, stat in self._scan():
+            seen.add(scene_path)
+            if self._is_stale(scene_path, stat) and self.update_scene(scene_path):
+                changed.append(scene_path)
+
+        for scene_path in [path for path in self.entries if path not in seen]:
+            self.remove_scene(scene_path)
+            changed.append(scene_path)
+
+        if save:
+            self.save()
+        return changed
+
+    def update_scene(self, scene_path: str) -> bool:
+        """Re-index one scene; returns True if its entry changed"""
+        full_path = self.project_path / scene_path
+        try:
+            old = self.entries.get(scene_path)
+            entry = index_scene_file(full_path)
+        except FileNotFoundError:
+            return self.remove_scene(scene_path)
+        except (OSError, ValueError) as e:
+            print(f"Error indexing scene {scene_path}: {e}")
+            return False
+
+        self.entries[scene_path] = entry
+        self._dirty = True
+        if old is None or old["hash"] != entry["hash"]:
+            self._invalidate()
+            return True
+        return False
+
+    def remove_scene(self, scene_path: str) -> bool:
+        """Drop a scene from the index"""
+        if self.entries.pop(scene_path, None) is None:
+            return False
+        self._dirty = True
+        self._invalidate()
+        return True
+
+    # Queries
+    def get(self, scene_path: str) -> Optional[Dict[str, Any]]:
+        """Get the up-to-date entry of a scene (indexing it if needed), or None"""
+        try:
+            stat = (self.project_path / scene_path).stat()
+        except OSError:
+            self.remove_scene(scene_path)
+            return None
+        if self._is_stale(scene_path, stat):
+            self.update_scene(scene_path)
+        return self.entries.get(scene_path)
+
+    def list_scenes(self) -> List[str]:
+        """Get all indexed scene paths, sorted"""
+        return sorted(self.entries)
+
+    def get_dependencies(self, scene_path: str) -> List[str]:
+        """Get the scenes a scene instances directly"""
+        entry = self.get(scene_path)
+        return list(entry["dependencies"]) if entry else []
+
+    def get_dependents(self, scene_path: str) -> List[str]:
+        """Get the indexed scenes that instance a scene directly"""
+        if self._dependents is None:
+            dependents: Dict[str, Set[str]] = {}
+            for path, entry in self.entries.items():
+                for dependency in entry["dependencies"]:
+                    dependents.setdefault(dependency, set()).add(path)
+            self._dependents = dependents
+        return sorted(self._dependents.get(scene_path, ()))
+
+    def has_cycle(self, scene_path: str) -> bool:
+        """Check whether instancing a scene can reach a dependency cycle"""
+        result = self._cycles.get(scene_path)
+        if result is None:
+            result = self._find_cycle(scene_path)
+            self._cycles[scene_path] = result
+        return result
+
+    def get_load_order(self, scene_path: str) -> List[str]:
+        """Get a scene's dependencies (transitively) followed by the scene, dependencies first"""
+        order: List[str] = []
+        visited: Set[str] = set()
+        stack: List[Tuple[str, bool]] = [(scene_path, False)]
+        while stack:
+            path, expanded = stack.pop()
+            if expanded:
+                order.append(path)
+                continue
+            if path in visited:
+                continue
+            visited.add(path)
+            stack.append((path, True))
+            for dependency in reversed(self.get_dependencies(path)):
+                if dependency not in visited:
+                    stack.append((dependency, False))
+        return order
+
+    # Internals
+    def _find_cycle(self, scene_path: str) -> bool:
+        """Depth-first search for a back edge in the dependency graph"""
+        on_path: Set[str] = set()
+        done: Set[str] = set()
+        stack: List[Tuple[str, Iterator[str]]] = [(scene_path, iter(self.get_dependencies(scene_path)))]
+        on_path.add(scene_path)
+        while stack:
+            path, dependencies = stack[-1]
+            for dependency in dependencies:
+                if dependency in on_path:
+                    return True
+                if dependency not in done:
+                    on_path.add(dependency)
+                    stack.append((dependency, iter(self.get_dependencies(dependency))))
+                    break
+            else:
+                stack.pop()
+                on_path.discard(path)
+                done.add(path)
+        return False
+
+    def _scan(self):
+        """Yield (scene path, stat) for every scene file under the scenes directory"""
+        root = self.project_path / self.scenes_dir
+        stack = [str(root)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith(".scene"):
+                            try:
+                                stat = entry.stat()
+                            except OSError:
+                                continue
+                            yield Path(entry.path).relative_to(self.project_path).as_posix(), stat
+            except OSError:
+                continue
+
+    def _is_stale(self, scene_path: str, stat: os.stat_result) -> bool:
+        """Check an entry against the file's current size and modification time"""
+        entry = self.entries.get(scene_path)
+        return entry is None or entry["mtime_ns"] != stat.st_mtime_ns or entry["file_size"] != stat.st_size
+
+    def _invalidate(self) -> None:
+        """Forget derived data after the dependency graph changed"""
+        self._dependents = None
+        self._cycles.clear()
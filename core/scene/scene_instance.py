@@ -5,7 +5,7 @@ Represents an instance of another scene that can be embedded in the current scen
 
 import uuid
 from typing import Dict, Any, Optional, List
-from .base_node import Node
+from .base_node import Node, _copy_value
 
 
 class SceneInstance(Node):
@@ -23,6 +23,8 @@ class SceneInstance(Node):
         self.instance_id: str = str(uuid.uuid4())  # Unique identifier for this instance
         self.property_overrides: Dict[str, Any] = {}  # Properties that override the original scene
         self.editable_children: bool = False  # Whether children can be edited in this instance
+        self._prototype = None  # Shared ScenePrototype when instanced in prototype mode
+        self._pool_baseline = None  # (node, properties, children, name, visible, process_mode) per node when pooled
         
         # Export variables for editor
         self.export_variables = {
@@ -168,9 +170,14 @@ class SceneInstance(Node):
         self.original_scene = scene
         
         # Clone the scene's root nodes as children
-        for root_node in scene.root_nodes:
-            cloned_node = scene_manager._clone_node_tree(root_node)
-            self.add_child(cloned_node)
+        if self._prototype is not None:
+            self._prototype = scene_manager.get_scene_prototype(self.scene_path)
+            for cloned_node in self._prototype.instantiate():
+                self.add_child(cloned_node)
+        else:
+            for root_node in scene.root_nodes:
+                cloned_node = scene_manager._clone_node_tree(root_node)
+                self.add_child(cloned_node)
         
         # Reapply property overrides
         self.apply_property_overrides()
@@ -185,6 +192,7 @@ class SceneInstance(Node):
         variant.scene_path = self.scene_path
         variant.property_overrides = self.property_overrides.copy()
         variant.editable_children = self.editable_children
+        variant._prototype = self._prototype
 
         # Load the scene content
         if self.scene_path:
@@ -265,6 +273,11 @@ class SceneInstance(Node):
 
     def reset_to_default_state(self) -> None:
         """Reset the instance to its default state (for pooling)"""
+        # Pooled instances only undo what changed since they were handed out
+        if self._pool_baseline is not None:
+            self.reset_pool_changes()
+            return
+
         # Clear property overrides
         self.property_overrides.clear()
 
@@ -275,6 +288,78 @@ class SceneInstance(Node):
         # Reset instance-specific properties
         self.editable_children = False
 
+    # ========== POOLING ==========
+
+    def capture_pool_baseline(self) -> None:
+        """Record the state this instance is reset to whenever it returns to its pool"""
+        baseline = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            # Raw dict items: the own values of a PropertyOverlay, including deletions
+            values = {key: _copy_value(value) for key, value in dict.items(node.properties)}
+            baseline.append((node, values, tuple(node.children), node.name, node.visible, node.process_mode))
+            stack.extend(node.children)
+        self._pool_baseline = baseline
+
+    def reset_pool_changes(self) -> int:
+        """Restore only the properties and children changed since the baseline; returns the number restored"""
+        restored = 0
+        for node, values, children, name, visible, process_mode in self._pool_baseline:
+            properties = node.properties
+            if not dict.__eq__(properties, values):
+                for key in [key for key in dict.keys(properties) if key not in values]:
+                    dict.__delitem__(properties, key)
+                    restored += 1
+                for key, value in values.items():
+                    if not dict.__contains__(properties, key) or dict.__getitem__(properties, key) != value:
+                        dict.__setitem__(properties, key, _copy_value(value))
+                        restored += 1
+                if hasattr(node, '_transform_changed'):
+                    node._transform_changed()
+
+            if node.children != list(children):
+                for child in list(node.children):
+                    if child not in children:
+                        node.remove_child(child)
+                for child in children:
+                    if child.parent is not node:
+                        node.add_child(child)
+                node.children[:] = children
+                restored += 1
+
+            if node.name != name or node.visible != visible or node.process_mode != process_mode:
+                node.name, node.visible, node.process_mode = name, visible, process_mode
+                restored += 1
+        return restored
+
+    def acquire_from_pool(self, instance_name: Optional[str] = None) -> None:
+        """Hand this pooled instance out and notify its nodes and scripts"""
+        self._is_active = True
+        if instance_name:
+            self.name = instance_name
+        for node in self._walk_nodes():
+            node._on_pool_acquire()
+
+    def release_to_pool(self) -> None:
+        """Detach this instance, notify its nodes and scripts, and reset it for reuse"""
+        if self.parent:
+            self.parent.remove_child(self)
+        for node in self._walk_nodes():
+            node._on_pool_release()
+        self._is_active = False
+        self.reset_to_default_state()
+
+    def _walk_nodes(self) -> List[Node]:
+        """Get this instance and all its descendants"""
+        nodes = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            stack.extend(node.children)
+        return nodes
+
     def _get_scene_manager(self):
         """Get the scene manager from the current project"""
         try:
@@ -285,11 +370,27 @@ class SceneInstance(Node):
             return None
 
     def get_memory_usage(self) -> Dict[str, Any]:
-        """Get memory usage statistics for this instance"""
+        """
+        Get memory usage statistics for this instance. owned_bytes estimates
+        the memory of this instance's nodes; shared_bytes is the prototype
+        memory shared with other instances of the scene (prototype mode).
+        """
         import sys
+        from .scene_prototype import estimate_node_memory
+
+        owned = 0
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            owned += estimate_node_memory(node)
+            stack.extend(node.children)
 
+        prototype = self._prototype
         stats = {
             'instance_size': sys.getsizeof(self),
+            'owned_bytes': owned,
+            'shared_bytes': prototype.get_memory_usage()['shared_bytes'] if prototype else 0,
+            'uses_prototype': prototype is not None,
             'children_count': len(self.children),
             'override_count': len(self.property_overrides),
             'total_nodes': self._count_total_nodes(),
@@ -30,6 +30,17 @@ class SceneInstanceManager:
         self.instances_by_scene: Dict[str, Set[str]] = {}  # scene_path -> set of instance_ids
         self.instance_pools: Dict[str, List[SceneInstance]] = {}  # scene_path -> pooled instances
         
+        # Pool sizing
+        self.pool_usage: Dict[str, Dict[str, int]] = {}  # scene_path -> hits, misses, high-water marks
+        self.pool_targets: Dict[str, int] = {}  # scene_path -> pool size chosen by optimize_pools
+        self.pool_prototypes: Dict[str, bool] = {}  # scene_path -> pooled instances use prototypes
+        self.default_pool_limit: int = 10
+        self.max_pool_size: int = 4096
+        
+        # Incremental warm-up (scene_path -> instances still to create)
+        self.warm_up_queue: Dict[str, int] = {}
+        self.warm_up_budget_ms: float = 2.0
+        
         # Performance monitoring
         self.performance_metrics: Dict[str, Any] = {}
         self.memory_usage: Dict[str, Any] = {}
@@ -51,7 +62,7 @@ class SceneInstanceManager:
     # ========== INSTANCE LIFECYCLE MANAGEMENT ==========
     
     def create_instance(self, scene_path: str, instance_name: Optional[str] = None, 
-                       use_pool: bool = True) -> Optional[SceneInstance]:
+                       use_pool: bool = True, use_prototype: bool = False) -> Optional[SceneInstance]:
         """Create a new scene instance with advanced options"""
         start_time = time.time()
         
@@ -59,25 +70,31 @@ class SceneInstanceManager:
             # Try to get from pool first if enabled
             if use_pool and scene_path in self.instance_pools and self.instance_pools[scene_path]:
                 instance = self.instance_pools[scene_path].pop()
-                instance._is_active = True
-                if instance_name:
-                    instance.name = instance_name
+                instance.acquire_from_pool(instance_name)
                 
                 # Update tracking
                 self._register_instance(instance)
+                self._record_pool_use(scene_path, hit=True)
                 
                 # Record performance
                 self.load_times[instance.instance_id] = time.time() - start_time
                 
                 return instance
             
-            # Create new instance
-            instance = self.scene_manager.instantiate_scene(scene_path, instance_name)
+            # Create new instance (pooled, if this scene has a pool)
+            if use_pool and scene_path in self.instance_pools:
+                instance = self._create_pooled_instance(scene_path, instance_name)
+                if instance:
+                    instance.acquire_from_pool()
+            else:
+                instance = self.scene_manager.instantiate_scene(scene_path, instance_name, use_prototype)
             if not instance:
                 return None
             
             # Register and track
             self._register_instance(instance)
+            if use_pool and scene_path in self.instance_pools:
+                self._record_pool_use(scene_path, hit=False)
             
             # Record performance
             self.load_times[instance.instance_id] = time.time() - start_time
@@ -105,18 +122,12 @@ class SceneInstanceManager:
             if (return_to_pool and hasattr(instance, '_is_pooled') and 
                 instance._is_pooled and scene_path):
                 
-                # Reset instance state
-                instance.reset_to_default_state()
-                instance._is_active = False
-                
-                # Return to pool
-                if scene_path not in self.instance_pools:
-                    self.instance_pools[scene_path] = []
-                
-                # Limit pool size
-                if len(self.instance_pools[scene_path]) < 10:
-                    self.instance_pools[scene_path].append(instance)
+                # Return to pool, up to the pool's size limit
+                pool = self.instance_pools.setdefault(scene_path, [])
+                if len(pool) < self.get_pool_limit(scene_path):
                     self._unregister_instance(instance)
+                    instance.release_to_pool()
+                    pool.append(instance)
                     return True
             
             # Actually destroy the instance
@@ -226,20 +237,17 @@ class SceneInstanceManager:
 
     # ========== POOL MANAGEMENT ==========
     
-    def create_instance_pool(self, scene_path: str, pool_size: int = 5) -> bool:
+    def create_instance_pool(self, scene_path: str, pool_size: int = 5,
+                             use_prototype: bool = False) -> bool:
         """Create a pool of pre-instantiated instances"""
         try:
-            if scene_path not in self.instance_pools:
-                self.instance_pools[scene_path] = []
+            self.instance_pools.setdefault(scene_path, [])
+            self.pool_prototypes[scene_path] = use_prototype
             
             # Create pooled instances
             for i in range(pool_size):
-                instance = self.scene_manager.instantiate_scene(
-                    scene_path, f"pooled_{scene_path}_{i}"
-                )
+                instance = self._create_pooled_instance(scene_path)
                 if instance:
-                    instance._is_pooled = True
-                    instance._is_active = False
                     self.instance_pools[scene_path].append(instance)
             
             return True
@@ -248,32 +256,134 @@ class SceneInstanceManager:
             print(f"Error creating instance pool for {scene_path}: {e}")
             return False
 
-    def warm_up_pools(self, scene_priorities: Dict[str, int]) -> None:
-        """Warm up instance pools based on priority"""
+    def _create_pooled_instance(self, scene_path: str, instance_name: Optional[str] = None) -> Optional[SceneInstance]:
+        """Instantiate a scene for a pool and record the state it is reset to"""
+        pool = self.instance_pools.get(scene_path, ())
+        instance = self.scene_manager.instantiate_scene(
+            scene_path, instance_name or f"pooled_{scene_path}_{len(pool)}",
+            self.pool_prototypes.get(scene_path, False)
+        )
+        if instance:
+            instance._is_pooled = True
+            instance._is_active = False
+            instance.capture_pool_baseline()
+        return instance
+
+    def warm_up_pools(self, scene_priorities: Dict[str, int], incremental: bool = False) -> None:
+        """
+        Warm up instance pools based on priority. With incremental, the
+        instances are queued and created by update() within a per-frame budget.
+        """
         for scene_path, priority in sorted(scene_priorities.items(), 
                                          key=lambda x: x[1], reverse=True):
             pool_size = max(2, min(priority // 10, 10))  # 2-10 instances based on priority
-            self.create_instance_pool(scene_path, pool_size)
+            if incremental:
+                self.schedule_warm_up(scene_path, pool_size)
+            else:
+                self.create_instance_pool(scene_path, pool_size)
+
+    def schedule_warm_up(self, scene_path: str, count: int, use_prototype: Optional[bool] = None) -> None:
+        """Queue pooled instances to be created incrementally by update()"""
+        self.instance_pools.setdefault(scene_path, [])
+        if use_prototype is not None:
+            self.pool_prototypes[scene_path] = use_prototype
+        self.warm_up_queue[scene_path] = self.warm_up_queue.get(scene_path, 0) + count
 
-    def optimize_pools(self) -> Dict[str, Any]:
-        """Optimize instance pools by removing unused instances"""
+    def update(self, budget_ms: Optional[float] = None) -> int:
+        """
+        Create queued pool instances until the frame budget (milliseconds) is
+        spent; call once per frame. At least one instance is created per call
+        so warm-up always progresses. Returns the number of instances created.
+        """
+        if not self.warm_up_queue:
+            return 0
+        
+        budget = (self.warm_up_budget_ms if budget_ms is None else budget_ms) / 1000.0
+        start = time.perf_counter()
+        created = 0
+        
+        while self.warm_up_queue:
+            scene_path, remaining = next(iter(self.warm_up_queue.items()))
+            pool = self.instance_pools.setdefault(scene_path, [])
+            
+            instance = None
+            if len(pool) < self.get_pool_limit(scene_path):
+                instance = self._create_pooled_instance(scene_path)
+            if instance:
+                pool.append(instance)
+                created += 1
+                remaining -= 1
+            else:
+                remaining = 0  # Pool is full or the scene failed to load
+            
+            if remaining > 0:
+                self.warm_up_queue[scene_path] = remaining
+            else:
+                del self.warm_up_queue[scene_path]
+            
+            if time.perf_counter() - start >= budget:
+                break
+        
+        return created
+
+    def get_pool_limit(self, scene_path: str) -> int:
+        """Get the number of idle instances a scene's pool may hold"""
+        return self.pool_targets.get(scene_path, self.default_pool_limit)
+
+    def _record_pool_use(self, scene_path: str, hit: bool) -> None:
+        """Track pool hits/misses and the peak number of active instances"""
+        usage = self.pool_usage.get(scene_path)
+        if usage is None:
+            usage = self.pool_usage[scene_path] = {
+                'hits': 0, 'misses': 0, 'high_water_mark': 0, 'window_high_water_mark': 0
+            }
+        usage['hits' if hit else 'misses'] += 1
+        
+        active = len(self.instances_by_scene.get(scene_path, ()))
+        if active > usage['window_high_water_mark']:
+            usage['window_high_water_mark'] = active
+            if active > usage['high_water_mark']:
+                usage['high_water_mark'] = active
+
+    def optimize_pools(self, headroom: float = 0.25, min_size: int = 2) -> Dict[str, Any]:
+        """
+        Size each pool from its usage since the last call: the pool should
+        cover the peak number of active instances (the high-water mark) plus
+        headroom. Pools are trimmed, or grown through incremental warm-up,
+        towards that target, and the usage window starts over.
+        """
         optimization_report = {
             'pools_optimized': 0,
             'instances_removed': 0,
-            'memory_freed': 0
+            'instances_scheduled': 0,
+            'memory_freed': 0,
+            'targets': {}
         }
         
         for scene_path, pool in list(self.instance_pools.items()):
-            # Remove excess instances (keep max 5 per pool)
-            if len(pool) > 5:
-                excess = pool[5:]
-                self.instance_pools[scene_path] = pool[:5]
-                optimization_report['instances_removed'] += len(excess)
+            usage = self.pool_usage.get(scene_path)
+            peak = usage['window_high_water_mark'] if usage else 0
+            target = min(self.max_pool_size, max(min_size, int(peak * (1.0 + headroom) + 0.999)))
+            self.pool_targets[scene_path] = target
+            optimization_report['targets'][scene_path] = target
             
-            # Remove empty pools
-            if not self.instance_pools[scene_path]:
-                del self.instance_pools[scene_path]
+            # Instances in use come back to the pool; only the idle ones are missing
+            active = len(self.instances_by_scene.get(scene_path, ()))
+            missing = target - len(pool) - active - self.warm_up_queue.get(scene_path, 0)
+            if len(pool) > target:
+                excess = pool[target:]
+                del pool[target:]
+                optimization_report['instances_removed'] += len(excess)
                 optimization_report['pools_optimized'] += 1
+            elif missing > 0 and usage and usage['misses']:
+                self.schedule_warm_up(scene_path, missing)
+                optimization_report['instances_scheduled'] += missing
+                optimization_report['pools_optimized'] += 1
+            
+            if usage:
+                usage['window_high_water_mark'] = active
+                usage['misses'] = 0
+                usage['hits'] = 0
         
         return optimization_report
 
@@ -319,10 +429,17 @@ class SceneInstanceManager:
         pool_stats = {}
         
         for scene_path, pool in self.instance_pools.items():
+            usage = self.pool_usage.get(scene_path, {})
             pool_stats[scene_path] = {
                 'pool_size': len(pool),
+                'pool_limit': self.get_pool_limit(scene_path),
                 'active_instances': len(self.instances_by_scene.get(scene_path, set())),
-                'total_created': self.performance_metrics.get(scene_path, {}).get('total_created', 0)
+                'total_created': self.performance_metrics.get(scene_path, {}).get('total_created', 0),
+                'hits': usage.get('hits', 0),
+                'misses': usage.get('misses', 0),
+                'high_water_mark': usage.get('high_water_mark', 0),
+                'window_high_water_mark': usage.get('window_high_water_mark', 0),
+                'pending_warm_up': self.warm_up_queue.get(scene_path, 0)
             }
         
         return pool_stats
@@ -367,6 +484,10 @@ class SceneInstanceManager:
         
         # Clear pools
         self.instance_pools.clear()
+        self.pool_usage.clear()
+        self.pool_targets.clear()
+        self.pool_prototypes.clear()
+        self.warm_up_queue.clear()
         
         # Clear tracking
         self.instances_by_scene.clear()
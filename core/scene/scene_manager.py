@@ -4,12 +4,14 @@ scene/scene_manager.py
 Defines Scene and SceneManager for loading/saving entire scenes.
 """
 
-import json
 import time
+import weakref
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Union
 
-from .base_node import Node
+from .base_node import Node, get_tree_version, _tree_changed
+from .node_factory import get_node_factory_registry
+from ..hot_reload import FileWatcher, SCENE_EXTENSIONS
 
 
 class Scene:
@@ -19,21 +21,32 @@ class Scene:
         self.name: str = name
         self.root_nodes: List[Node] = []
         self.metadata: Dict[str, Any] = {}
+        self._name_cache: Dict[str, Any] = {}  # name -> (tree version, node) for find_node_by_name
 
     def add_root_node(self, node: Node) -> None:
         """Add a node as a new root in the scene."""
         self.root_nodes.append(node)
+        _tree_changed()
 
     def remove_root_node(self, node: Node) -> None:
         """Remove a root node if present."""
         if node in self.root_nodes:
             self.root_nodes.remove(node)
+            _tree_changed()
 
     def find_node(self, path: str) -> Optional[Node]:
         """
-        Find a node by path, where path is either a single root name
-        or "Root/Child/Subchild".
+        Find a node by path, where path is either a single root name,
+        "Root/Child/Subchild" or "%UniqueName/Child".
         """
+        if path.startswith("%"):
+            unique_name, _, remainder = path[1:].partition("/")
+            for root in self.root_nodes:
+                node = root.get_unique_node(unique_name)
+                if node is not None:
+                    return node.find_node(remainder)
+            return None
+
         if "/" not in path:
             for root in self.root_nodes:
                 if root.name == path:
@@ -47,6 +60,39 @@ class Scene:
                 return root.find_node(remainder)
         return None
 
+    def find_node_by_name(self, name: str) -> Optional[Node]:
+        """
+        Find a node with a name anywhere in the scene (the first one
+        breadth-first). A found node is cached and returned again for as long
+        as it keeps the name and stays in the scene.
+        """
+        cached = self._name_cache.get(name)
+        version = get_tree_version()
+        if cached is not None:
+            node = cached[1]
+            if cached[0] == version:
+                return node
+            if node is not None and node.name == name:
+                root = node
+                while root.parent is not None:
+                    root = root.parent
+                if root in self.root_nodes:
+                    self._name_cache[name] = (version, node)
+                    return node
+
+        found = None
+        queue = list(self.root_nodes)
+        for node in queue:  # The list grows while iterating: breadth-first
+            if node.name == name:
+                found = node
+                break
+            queue.extend(node.children)
+
+        if len(self._name_cache) > 256:
+            self._name_cache.clear()
+        self._name_cache[name] = (version, found)
+        return found
+
     def get_all_nodes(self) -> List[Node]:
         """Return a flattened list of all nodes in the scene."""
         nodes: List[Node] = []
@@ -78,195 +124,8 @@ class Scene:
 
     @classmethod
     def _create_node_from_dict(cls, data: Dict[str, Any]) -> Node:
-        """Create a node from dictionary data using proper node definitions"""
-        node_type = data.get("type", "Node")
-        node_name = data.get("name", "Node")
-
-        # Check if this node has a script that should replace the node type
-        script_path = data.get('script_path', '')
-        if script_path:
-            # Check if the script is one of our player controllers
-            if 'TopDown4DirPlayerController.py' in script_path:
-                try:
-                    from nodes.prefabs.TopDown4DirPlayerController import TopDown4DirPlayerController
-                    print(f"[DEBUG] Creating TopDown4DirPlayerController instance for {node_name}")
-                    return TopDown4DirPlayerController.from_dict(data)
-                except ImportError as e:
-                    print(f"[WARNING] Failed to import TopDown4DirPlayerController: {e}")
-                    pass
-            elif 'TopDown8DirPlayerController.py' in script_path:
-                try:
-                    from nodes.prefabs.TopDown8DirPlayerController import TopDown8DirPlayerController
-                    print(f"[DEBUG] Creating TopDown8DirPlayerController instance for {node_name}")
-                    return TopDown8DirPlayerController.from_dict(data)
-                except ImportError as e:
-                    print(f"[WARNING] Failed to import TopDown8DirPlayerController: {e}")
-                    pass
-            elif 'PlatformerPlayerController.py' in script_path:
-                try:
-                    from nodes.prefabs.PlatformerPlayerController import PlatformerPlayerController
-                    print(f"[DEBUG] Creating PlatformerPlayerController instance for {node_name}")
-                    return PlatformerPlayerController.from_dict(data)
-                except ImportError as e:
-                    print(f"[WARNING] Failed to import PlatformerPlayerController: {e}")
-                    pass
-
-        # Try to use the proper node class from the nodes directory
-        try:
-            # Import the specific node class based on type
-            if node_type == "Sprite":
-                from nodes.node2d.Sprite import Sprite
-                return Sprite.from_dict(data)
-            elif node_type == "Sprite2D":
-                from nodes.node2d.Sprite import Sprite
-                return Sprite.from_dict(data)
-            elif node_type == "Node2D":
-                from core.scene.node2d import Node2D
-                return Node2D.from_dict(data)
-            elif node_type == "Camera2D":
-                from nodes.node2d.Camera2D import Camera2D
-                return Camera2D.from_dict(data)
-            elif node_type == "AnimatedSprite":
-                from nodes.node2d.AnimatedSprite import AnimatedSprite
-                return AnimatedSprite.from_dict(data)
-            elif node_type == "AnimationPlayer":
-                from nodes.base.AnimationPlayer import AnimationPlayer
-                return AnimationPlayer.from_dict(data)
-            elif node_type == "KinematicBody2D":
-                from nodes.node2d.KinematicBody2D import KinematicBody2D
-                return KinematicBody2D.from_dict(data)
-            elif node_type == "TopDown4DirPlayerController":
-                from nodes.prefabs.TopDown4DirPlayerController import TopDown4DirPlayerController
-                return TopDown4DirPlayerController.from_dict(data)
-            elif node_type == "TopDown8DirPlayerController":
-                from nodes.prefabs.TopDown8DirPlayerController import TopDown8DirPlayerController
-                return TopDown8DirPlayerController.from_dict(data)
-            elif node_type == "PlatformerPlayerController":
-                from nodes.prefabs.PlatformerPlayerController import PlatformerPlayerController
-                return PlatformerPlayerController.from_dict(data)
-            elif node_type == "StaticBody2D":
-                from nodes.node2d.StaticBody2D import StaticBody2D
-                return StaticBody2D.from_dict(data)
-            elif node_type == "RigidBody2D":
-                from nodes.node2d.Rigidbody2D import RigidBody2D
-                return RigidBody2D.from_dict(data)
-            elif node_type == "Area2D":
-                from nodes.node2d.Area2D import Area2D
-                return Area2D.from_dict(data)
-            elif node_type == "CollisionShape2D":
-                from nodes.node2d.CollisionShape2D import CollisionShape2D
-                return CollisionShape2D.from_dict(data)
-            elif node_type == "CollisionPolygon2D":
-                from nodes.node2d.CollisionPolygon2D import CollisionPolygon2D
-                return CollisionPolygon2D.from_dict(data)
-            # UI node types
-            elif node_type == "Button":
-                from nodes.ui.Button import Button
-                return Button.from_dict(data)
-            elif node_type == "Label":
-                from nodes.ui.Label import Label
-                return Label.from_dict(data)
-            elif node_type == "Control":
-                from nodes.ui.Control import Control
-                return Control.from_dict(data)
-            elif node_type == "Panel":
-                from nodes.ui.Panel import Panel
-                return Panel.from_dict(data)
-            elif node_type == "ColorRect":
-                from nodes.ui.ColorRect import ColorRect
-                return ColorRect.from_dict(data)
-            elif node_type == "TextureRect":
-                from nodes.ui.TextureRect import TextureRect
-                return TextureRect.from_dict(data)
-            elif node_type == "NinePatchRect":
-                from nodes.ui.NinePatchRect import NinePatchRect
-                return NinePatchRect.from_dict(data)
-            elif node_type == "VBoxContainer":
-                from nodes.ui.VBoxContainer import VBoxContainer
-                return VBoxContainer.from_dict(data)
-            elif node_type == "HBoxContainer":
-                from nodes.ui.HBoxContainer import HBoxContainer
-                return HBoxContainer.from_dict(data)
-            elif node_type == "ProgressBar":
-                from nodes.ui.ProgressBar import ProgressBar
-                return ProgressBar.from_dict(data)
-            elif node_type == "CenterContainer":
-                from nodes.ui.CenterContainer import CenterContainer
-                return CenterContainer.from_dict(data)
-            elif node_type == "LineEdit":
-                from nodes.ui.LineEdit import LineEdit
-                return LineEdit.from_dict(data)
-            elif node_type == "CheckBox":
-                from nodes.ui.CheckBox import CheckBox
-                return CheckBox.from_dict(data)
-            elif node_type == "AudioStreamPlayer":
-                from nodes.audio.AudioStreamPlayer import AudioStreamPlayer
-                return AudioStreamPlayer.from_dict(data)
-            elif node_type == "SceneInstance":
-                from .scene_instance import SceneInstance
-                return SceneInstance.from_dict(data)
-            elif node_type == "CollisionShape2D":
-                from nodes.node2d.CollisionShape2D import CollisionShape2D
-                return CollisionShape2D.from_dict(data)
-            elif node_type == "CollisionPolygon2D":
-                from nodes.node2d.CollisionPolygon2D import CollisionPolygon2D
-                return CollisionPolygon2D.from_dict(data)
-            elif node_type == "StaticBody2D":
-                from nodes.node2d.StaticBody2D import StaticBody2D
-                return StaticBody2D.from_dict(data)
-            elif node_type == "KinematicBody2D":
-                from nodes.node2d.KinematicBody2D import KinematicBody2D
-                return KinematicBody2D.from_dict(data)
-            elif node_type == "RigidBody2D":
-                from nodes.node2d.Rigidbody2D import RigidBody2D
-                return RigidBody2D.from_dict(data)
-            elif node_type == "Area2D":
-                from nodes.node2d.Area2D import Area2D
-                return Area2D.from_dict(data)
-            # Add more node types as needed
-            else:
-                # Fallback to base Node class
-                node = Node(node_name, node_type)
-                Node._apply_node_properties(node, data)
-
-                # Handle children recursively
-                for child_data in data.get("children", []):
-                    child = cls._create_node_from_dict(child_data)
-                    node.add_child(child)
-
-                return node
-
-        except ImportError as e:
-            print(f"Could not import node class {node_type}: {e}")
-
-            # Try to use the node registry for dynamic node creation
-            try:
-                from core.node_registry import get_node_registry
-                registry = get_node_registry()
-                node = registry.create_node_instance(node_type, node_name)
-                if node:
-                    # Apply properties from the data
-                    Node._apply_node_properties(node, data)
-
-                    # Handle children recursively
-                    for child_data in data.get("children", []):
-                        child = cls._create_node_from_dict(child_data)
-                        node.add_child(child)
-
-                    return node
-            except Exception as registry_error:
-                print(f"Node registry failed for {node_type}: {registry_error}")
-
-            # Final fallback to base Node class
-            node = Node(node_name, node_type)
-            Node._apply_node_properties(node, data)
-
-            # Handle children recursively
-            for child_data in data.get("children", []):
-                child = cls._create_node_from_dict(child_data)
-                node.add_child(child)
-
-            return node
+        """Create a node from dictionary data using the registered node factories"""
+        return get_node_factory_registry().create_node(data)
 
     def save_to_file(self, file_path: str) -> None:
         from ..json_utils import safe_json_dump
@@ -276,11 +135,21 @@ class Scene:
         with open(p, "w", encoding="utf-8") as f:
             safe_json_dump(self.to_dict(), f, indent=2)
 
+    def save_binary(self, file_path: str) -> None:
+        """Save the scene in the compact binary format (see binary_scene.py)."""
+        from .binary_scene import save_binary_scene
+        save_binary_scene(self.to_dict(), file_path)
+
     @classmethod
-    def load_from_file(cls, file_path: str) -> Optional["Scene"]:
+    def load_from_file(cls, file_path: str, prefer_binary: bool = True) -> Optional["Scene"]:
+        """
+        Load a scene from a `.scene` (JSON) or `.scenebin` file. For `.scene`
+        paths a binary copy that is at least as new as the JSON is used instead.
+        """
+        from .binary_scene import load_scene_data
+
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = load_scene_data(file_path, prefer_binary)
             return cls.from_dict(data)
         except Exception as e:
             print(f"Failed to load scene from {file_path}: {e}")
@@ -299,11 +168,18 @@ class SceneManager:
         # Enhanced caching and optimization
         self.scene_cache: Dict[str, Dict[str, Any]] = {}  # Cached scene metadata
         self.instance_pool: Dict[str, List[Any]] = {}  # Pooled instances for reuse
+        self.prototypes: Dict[str, Any] = {}  # maps scene-path → shared ScenePrototype
         self.dependency_graph: Dict[str, set] = {}  # Scene dependency tracking
+        self.scene_index = None  # Persistent project scene index (see get_scene_index)
         self.file_watchers: Dict[str, Any] = {}  # File system watchers for auto-reload
+        self.live_instances: Dict[str, weakref.WeakSet] = {}  # maps scene-path → live SceneInstance objects
         self.loading_queue: List[str] = []  # Async loading queue
         self.performance_metrics: Dict[str, Any] = {}  # Performance tracking
 
+        # Background streaming (created on first use, driven by update_streaming)
+        self.streamer = None
+        self._stream_callbacks: List[Any] = []  # Main-thread callbacks for already-loaded scenes
+
     def load_scene(self, scene_path: str) -> Optional[Scene]:
         """
         Load a scene from the given project‐relative path (e.g. "scenes/Main.scene").
@@ -323,6 +199,10 @@ class SceneManager:
         full_path = self.project.get_absolute_path(scene_path)
         scene.save_to_file(str(full_path))
         self.loaded_scenes[scene_path] = scene
+        self.prototypes.pop(scene_path, None)
+        if self.scene_index is not None:
+            self.scene_index.update_scene(scene_path)
+            self.scene_index.save()
 
     def set_current_scene(self, scene_path: str) -> bool:
         """Set (and load, if necessary) the current active scene."""
@@ -344,10 +224,14 @@ class SceneManager:
         scene.add_root_node(root)
         return scene
 
-    def instantiate_scene(self, scene_path: str, instance_name: Optional[str] = None) -> Optional[Node]:
+    def instantiate_scene(self, scene_path: str, instance_name: Optional[str] = None,
+                          use_prototype: bool = False) -> Optional[Node]:
         """
         Instantiate a scene as a node that can be added to another scene.
         Returns the root node of the instantiated scene with scene instance metadata.
+
+        With use_prototype, the instance's nodes share the scene's read-only
+        ScenePrototype property dicts and only store values they change.
         """
         # Load the scene
         scene = self.load_scene(scene_path)
@@ -366,91 +250,120 @@ class SceneManager:
         instance.original_scene = scene
 
         # Clone the scene's root nodes as children of the instance
-        for root_node in scene.root_nodes:
-            cloned_node = self._clone_node_tree(root_node)
-            instance.add_child(cloned_node)
+        if use_prototype:
+            instance._prototype = self.get_scene_prototype(scene_path)
+            for cloned_node in instance._prototype.instantiate():
+                instance.add_child(cloned_node)
+        else:
+            for root_node in scene.root_nodes:
+                cloned_node = self._clone_node_tree(root_node)
+                instance.add_child(cloned_node)
 
         # Track this instance for change detection
         if scene_path not in self.scene_instances:
             self.scene_instances[scene_path] = []
         self.scene_instances[scene_path].append(instance.get_instance_id())
+        self.live_instances.setdefault(scene_path, weakref.WeakSet()).add(instance)
 
         return instance
 
-    def _has_circular_dependency(self, scene_path: str, visited: Optional[set] = None) -> bool:
-        """Check if loading this scene would create a circular dependency."""
-        if visited is None:
-            visited = set()
-
-        if scene_path in visited:
-            return True
-
-        visited.add(scene_path)
-
-        # Load scene and check for scene instances
-        scene = self.load_scene(scene_path)
-        if not scene:
-            return False
-
-        # Recursively check all scene instances in this scene
-        for root_node in scene.root_nodes:
-            if self._check_node_for_scene_instances(root_node, visited):
-                return True
-
-        visited.remove(scene_path)
-        return False
-
-    def _check_node_for_scene_instances(self, node: Node, visited: set) -> bool:
-        """Recursively check a node tree for scene instances that could cause circular dependencies."""
-        # Check if this node is a scene instance
-        if hasattr(node, 'scene_path') and node.scene_path:
-            if self._has_circular_dependency(node.scene_path, visited.copy()):
-                return True
-
-        # Check children
-        for child in node.children:
-            if self._check_node_for_scene_instances(child, visited):
-                return True
+    def get_scene_prototype(self, scene_path: str):
+        """Get (building on first use) the shared prototype of a scene"""
+        prototype = self.prototypes.get(scene_path)
+        if prototype is None:
+            scene = self.load_scene(scene_path)
+            if not scene:
+                return None
+            from .scene_prototype import ScenePrototype
+            prototype = ScenePrototype(scene, scene_path)
+            self.prototypes[scene_path] = prototype
+        return prototype
+
+    def get_scene_index(self):
+        """Get the project's persistent scene index (brought up to date on first use)"""
+        if self.scene_index is None:
+            if hasattr(self.project, 'scene_index'):
+                self.scene_index = self.project.scene_index
+            else:
+                from .scene_index import SceneIndex
+                self.scene_index = SceneIndex(self.project.get_absolute_path("."))
+                self.scene_index.refresh()
+        return self.scene_index
 
-        return False
+    def _has_circular_dependency(self, scene_path: str) -> bool:
+        """Check if loading this scene would create a circular dependency."""
+        return self.get_scene_index().has_cycle(scene_path)
 
     def _clone_node_tree(self, node: Node) -> Node:
         """Create a deep copy of a node and its entire subtree."""
-        # Convert to dict and back to create a deep copy
-        node_data = node.to_dict()
-        cloned_node = Scene._create_node_from_dict(node_data)
-        return cloned_node
+        return node.duplicate()
 
     def get_available_scenes(self) -> List[str]:
         """Get a list of all available scene files in the project."""
-        scenes_dir = self.project.get_absolute_path("scenes")
-        if not scenes_dir.exists():
-            return []
-
-        scene_files = []
-        for scene_file in scenes_dir.glob("*.scene"):
-            # Get relative path from project root
-            relative_path = f"scenes/{scene_file.name}"
-            scene_files.append(relative_path)
+        return self.get_scene_index().list_scenes()
 
-        return sorted(scene_files)
-
-    def reload_scene_instances(self, scene_path: str) -> None:
-        """Reload all instances of a scene when the original scene changes."""
-        if scene_path not in self.scene_instances:
-            return
+    def reload_scene_instances(self, scene_path: str) -> int:
+        """
+        Reload a scene from disk and rebuild all live instances of it in
+        place. Returns the number of instances rebuilt.
+        """
+        self.loaded_scenes.pop(scene_path, None)
+        self.scene_cache.pop(scene_path, None)
+        self.prototypes.pop(scene_path, None)
+        if self.scene_index is not None:
+            self.scene_index.update_scene(scene_path)
 
-        # Reload the original scene
-        if scene_path in self.loaded_scenes:
-            del self.loaded_scenes[scene_path]
+        instances = list(self.live_instances.get(scene_path, ()))
+        if not instances:
+            return 0
 
         updated_scene = self.load_scene(scene_path)
         if not updated_scene:
+            return 0
+
+        reloaded = 0
+        for instance in instances:
+            if instance.reload_from_scene(self):
+                reloaded += 1
+        print(f"Scene {scene_path} changed, reloaded {reloaded} instance(s)")
+        return reloaded
+
+    def watch_for_changes(self, interval: float = 0.5) -> None:
+        """Start watching the project's scene files; check_for_changes() applies edits"""
+        if "scenes" in self.file_watchers:
             return
-
-        # TODO: Update all instances of this scene
-        # This would require tracking actual instance objects, not just IDs
-        print(f"Scene {scene_path} changed, instances should be updated")
+        watcher = FileWatcher(self.project.get_absolute_path("."), SCENE_EXTENSIONS, interval)
+        watcher.start()
+        self.file_watchers["scenes"] = watcher
+
+    def stop_watching(self) -> None:
+        """Stop all file watchers"""
+        for watcher in self.file_watchers.values():
+            watcher.stop()
+        self.file_watchers.clear()
+
+    def check_for_changes(self) -> List[str]:
+        """Reload scenes whose files changed since the last check; returns their paths"""
+        changed = []
+        for watcher in self.file_watchers.values():
+            root = Path(watcher.root)
+            for path in watcher.poll():
+                try:
+                    scene_path = Path(path).relative_to(root).as_posix()
+                except ValueError:
+                    continue
+                changed.append(scene_path)
+                if self.scene_index is not None:
+                    self.scene_index.update_scene(scene_path)
+                if scene_path in self.live_instances:
+                    self.reload_scene_instances(scene_path)
+                else:
+                    self.loaded_scenes.pop(scene_path, None)
+                    self.scene_cache.pop(scene_path, None)
+                    self.prototypes.pop(scene_path, None)
+        if changed and self.scene_index is not None:
+            self.scene_index.save()
+        return changed
 
     # ========== ENHANCED SCENE MANAGEMENT ==========
 
@@ -473,8 +386,10 @@ class SceneManager:
             if metadata:
                 self.scene_cache[scene_path] = metadata
 
-            # Load the actual scene
-            scene = self.load_scene(scene_path)
+            # Load the scenes it instances first, then the scene itself
+            scene = None
+            for path in self.get_scene_index().get_load_order(scene_path):
+                scene = self.load_scene(path)
             return scene is not None
 
         except Exception as e:
@@ -492,104 +407,20 @@ class SceneManager:
         return min(50 + usage_count, 99)
 
     def _load_scene_metadata(self, scene_path: str) -> Optional[Dict[str, Any]]:
-        """Load lightweight scene metadata without full scene loading"""
-        try:
-            full_path = self.project.get_absolute_path(scene_path)
-            if not full_path.exists():
-                return None
-
-            # Read just the header of the scene file for metadata
-            with open(full_path, 'r') as f:
-                import json
-                data = json.load(f)
-
-            metadata = {
-                'name': data.get('name', ''),
-                'node_count': self._count_nodes_recursive(data.get('nodes', [])),
-                'dependencies': self._extract_scene_dependencies(data),
-                'file_size': full_path.stat().st_size,
-                'modified_time': full_path.stat().st_mtime,
-                'complexity_score': self._calculate_complexity_score(data)
-            }
-
-            return metadata
-
-        except Exception as e:
-            print(f"Error loading metadata for {scene_path}: {e}")
-            return None
-
-    def _count_nodes_recursive(self, nodes: List[Dict]) -> int:
-        """Count total nodes in a scene hierarchy"""
-        count = len(nodes)
-        for node in nodes:
-            count += self._count_nodes_recursive(node.get('children', []))
-        return count
-
-    def _extract_scene_dependencies(self, scene_data: Dict) -> List[str]:
-        """Extract scene dependencies (other scenes referenced by this scene)"""
-        dependencies = []
-
-        def find_scene_instances(nodes):
-            for node in nodes:
-                if node.get('type') == 'SceneInstance':
-                    scene_path = node.get('scene_path', '')
-                    if scene_path and scene_path not in dependencies:
-                        dependencies.append(scene_path)
-
-                # Recursively check children
-                find_scene_instances(node.get('children', []))
-
-        find_scene_instances(scene_data.get('nodes', []))
-        return dependencies
-
-    def _calculate_complexity_score(self, scene_data: Dict) -> int:
-        """Calculate a complexity score for the scene (for optimization decisions)"""
-        score = 0
-
-        # Base score from node count
-        node_count = self._count_nodes_recursive(scene_data.get('nodes', []))
-        score += node_count
-
-        # Additional score for complex node types
-        def add_complexity(nodes):
-            nonlocal score
-            for node in nodes:
-                node_type = node.get('type', '')
-                if node_type in ['SceneInstance', 'AnimationPlayer', 'ParticleSystem']:
-                    score += 5
-                elif node_type in ['Sprite', 'AudioStreamPlayer']:
-                    score += 2
-
-                add_complexity(node.get('children', []))
-
-        add_complexity(scene_data.get('nodes', []))
-        return score
+        """Get lightweight scene metadata from the scene index without loading the scene"""
+        entry = self.get_scene_index().get(scene_path)
+        return dict(entry) if entry else None
 
     def build_dependency_graph(self) -> None:
         """Build a dependency graph of all scenes in the project"""
-        self.dependency_graph.clear()
-
-        # Get all scene files
-        scenes = self.get_available_scenes()
-
-        for scene_path in scenes:
-            metadata = self.scene_cache.get(scene_path)
-            if not metadata:
-                metadata = self._load_scene_metadata(scene_path)
-                if metadata:
-                    self.scene_cache[scene_path] = metadata
-
-            if metadata:
-                dependencies = metadata.get('dependencies', [])
-                self.dependency_graph[scene_path] = set(dependencies)
+        index = self.get_scene_index()
+        index.refresh()
+        self.dependency_graph = {scene_path: set(entry['dependencies'])
+                                 for scene_path, entry in index.entries.items()}
 
     def get_scene_dependents(self, scene_path: str) -> List[str]:
         """Get all scenes that depend on the given scene"""
-        dependents = []
-        for scene, deps in self.dependency_graph.items():
-            if scene_path in deps:
-                dependents.append(scene)
-        return dependents
+        return self.get_scene_index().get_dependents(scene_path)
 
     def validate_scene_dependencies(self) -> Dict[str, List[str]]:
         """Validate all scene dependencies and return any issues"""
@@ -626,6 +457,7 @@ class SceneManager:
                 if instance:
                     instance._is_pooled = True
                     instance._is_active = False
+                    instance.capture_pool_baseline()
                     self.instance_pool[scene_path].append(instance)
 
             return True
@@ -639,9 +471,7 @@ class SceneManager:
         # Try to get from pool first
         if scene_path in self.instance_pool and self.instance_pool[scene_path]:
             instance = self.instance_pool[scene_path].pop()
-            instance._is_active = True
-            if instance_name:
-                instance.name = instance_name
+            instance.acquire_from_pool(instance_name)
             return instance
 
         # Create new instance if pool is empty
@@ -655,9 +485,8 @@ class SceneManager:
         try:
             scene_path = getattr(instance, 'scene_path', '')
             if scene_path and scene_path in self.instance_pool:
-                # Reset instance state
-                instance._is_active = False
-                instance.reset_to_default_state()
+                # Detach, run the release hooks and reset changed state
+                instance.release_to_pool()
 
                 # Return to pool
                 self.instance_pool[scene_path].append(instance)
@@ -668,30 +497,73 @@ class SceneManager:
 
         return False
 
-    def instantiate_scene_async(self, scene_path: str, callback=None, instance_name: Optional[str] = None) -> str:
+    def get_streamer(self):
+        """Get the background scene streamer, creating it on first use."""
+        if self.streamer is None:
+            from .scene_streamer import SceneStreamer
+            self.streamer = SceneStreamer(path_resolver=self.project.get_absolute_path)
+        return self.streamer
+
+    def stream_scene(self, scene_path: str, priority: int = 0, callback=None) -> str:
         """
-        Asynchronously instantiate a scene and call callback when complete.
-        Returns a request ID for tracking.
+        Load a scene into the cache on a worker thread. The callback
+        (scene, error, request_id) runs on the main thread from update_streaming.
+        Returns a request ID for progress, priority and cancellation.
         """
-        import threading
-        import uuid
+        def on_streamed(scene, error, request_id):
+            if scene is not None:
+                self.loaded_scenes.setdefault(scene_path, scene)
+                scene = self.loaded_scenes[scene_path]
+            if callback:
+                callback(scene, error, request_id)
 
-        request_id = str(uuid.uuid4())
+        return self.get_streamer().load(scene_path, priority, on_streamed)
 
-        def load_async():
-            try:
-                instance = self.instantiate_scene(scene_path, instance_name)
-                if callback:
-                    callback(instance, None, request_id)
-            except Exception as e:
-                if callback:
-                    callback(None, e, request_id)
-
-        thread = threading.Thread(target=load_async)
-        thread.daemon = True
-        thread.start()
+    def instantiate_scene_async(self, scene_path: str, callback=None, instance_name: Optional[str] = None,
+                                priority: int = 0) -> str:
+        """
+        Asynchronously instantiate a scene and call callback when complete.
+        Loading happens on a worker thread; the instance is created and the
+        callback (instance, error, request_id) runs on the main thread from
+        update_streaming, which the engine and editor loops call every frame.
+        Returns a request ID for tracking.
+        """
+        def on_loaded(scene, error, request_id):
+            instance = None
+            if error is None:
+                try:
+                    instance = self.instantiate_scene(scene_path, instance_name)
+                except Exception as e:
+                    error = e
+            if callback:
+                callback(instance, error, request_id)
 
-        return request_id
+        if scene_path in self.loaded_scenes:
+            import uuid
+            request_id = str(uuid.uuid4())
+            self._stream_callbacks.append(lambda: on_loaded(self.loaded_scenes.get(scene_path), None, request_id))
+            return request_id
+
+        return self.stream_scene(scene_path, priority, on_loaded)
+
+    def update_streaming(self, budget_ms: Optional[float] = None) -> int:
+        """Finalize streamed scenes and run their callbacks; call once per frame on the main thread."""
+        pending, self._stream_callbacks = self._stream_callbacks, []
+        for pending_callback in pending:
+            pending_callback()
+        if self.streamer is None:
+            return len(pending)
+        return len(pending) + self.streamer.update(budget_ms)
+
+    def cancel_streaming(self, request_id: str) -> bool:
+        """Cancel a stream_scene / instantiate_scene_async request."""
+        return self.streamer is not None and self.streamer.cancel(request_id)
+
+    def get_streaming_progress(self, request_id: str) -> float:
+        """Get the progress (0.0 to 1.0) of a streaming request."""
+        if self.streamer is None:
+            return 0.0
+        return self.streamer.get_progress(request_id)
 
     def batch_instantiate_scenes(self, scene_requests: List[Dict[str, Any]]) -> List[Optional[Node]]:
         """
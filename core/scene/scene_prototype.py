@@ -0,0 +1,108 @@
+"""
+scene/scene_prototype.py
+
+Shared, immutable templates of a scene's node tree. Nodes instantiated from
+a prototype keep their properties in a PropertyOverlay over the template's
+read-only property dicts, so each instance only stores the values it
+overrides or mutates.
+"""
+
+import sys
+from types import MappingProxyType
+from typing import Dict, Any, List
+
+from .base_node import Node, PropertyOverlay, _RUNTIME_PROPERTIES
+
+
+class ScenePrototype:
+    """Pre-parsed, read-only node tree of a scene that instances are stamped from."""
+
+    def __init__(self, scene, scene_path: str = ""):
+        self.scene_path = scene_path
+        self.name = scene.name
+        # Scripts are attached per instance at setup, never to the template
+        flags = Node.DUPLICATE_SIGNALS | Node.DUPLICATE_GROUPS
+        self.root_nodes: List[Node] = [self._freeze(node.duplicate(flags)) for node in scene.root_nodes]
+        self.node_count = sum(self._count(node) for node in self.root_nodes)
+
+    def instantiate(self) -> List[Node]:
+        """Create the nodes of a new instance; their properties are copy-on-write overlays"""
+        return [node.duplicate() for node in self.root_nodes]
+
+    def get_memory_usage(self) -> Dict[str, Any]:
+        """Estimate the memory shared by every instance of this prototype"""
+        shared = 0
+        stack = list(self.root_nodes)
+        while stack:
+            node = stack.pop()
+            shared += _deep_size(node.properties.prototype)
+            stack.extend(node.children)
+        return {'scene_path': self.scene_path, 'node_count': self.node_count, 'shared_bytes': shared}
+
+    def _freeze(self, root: Node) -> Node:
+        """Move a template tree's properties into read-only prototype mappings"""
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            properties = node.properties
+            if properties.__class__ is PropertyOverlay:
+                properties = properties.merged()
+            frozen = {key: value for key, value in properties.items() if key not in _RUNTIME_PROPERTIES}
+            node.properties = PropertyOverlay(MappingProxyType(frozen))
+            stack.extend(node.children)
+        return root
+
+    @staticmethod
+    def _count(node: Node) -> int:
+        """Count the nodes in a subtree"""
+        count = 0
+        stack = [node]
+        while stack:
+            count += 1
+            stack.extend(stack.pop().children)
+        return count
+
+
+def estimate_node_memory(node: Node) -> int:
+    """
+    Approximate the memory a node owns: the node object, its attributes and
+    its own property values. Children, the parent and prototype values
+    shared with other instances are not counted.
+    """
+    seen = set()
+    size = sys.getsizeof(node) + sys.getsizeof(node.__dict__)
+    for key, value in node.__dict__.items():
+        if key == 'parent':
+            continue
+        if key == 'children':
+            size += sys.getsizeof(value)
+        elif key == 'properties':
+            if value.__class__ is PropertyOverlay:
+                size += sys.getsizeof(value)
+                for own_key, own_value in value.own().items():
+                    size += _deep_size(own_key, seen) + _deep_size(own_value, seen)
+            else:
+                size += _deep_size(value, seen)
+        else:
+            size += _deep_size(value, seen)
+    return size
+
+
+def _deep_size(value: Any, seen=None) -> int:
+    """Approximate the size of a value and the containers it holds"""
+    if seen is None:
+        seen = set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, (dict, MappingProxyType)):
+        if isinstance(value, MappingProxyType):
+            value = dict(value)
+            size += sys.getsizeof(value)
+        for key, item in value.items():
+            size += _deep_size(key, seen) + _deep_size(item, seen)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += _deep_size(item, seen)
+    return size
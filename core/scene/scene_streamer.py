@@ -0,0 +1,381 @@
+"""
+scene/scene_streamer.py
+
+Background scene streaming. Worker threads do the work that is safe off the
+main thread (file I/O, JSON/binary decode, node construction, image and
+audio decode); the main thread finalizes loaded scenes (texture upload,
+sound buffers, physics and script setup) in small steps within a per-frame
+time budget.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Callable, Tuple
+
+from ..engine_log import get_logger
+
+log = get_logger("streaming")
+
+
+# Request states
+QUEUED = "queued"
+LOADING = "loading"
+FINALIZING = "finalizing"
+DONE = "done"
+CANCELLED = "cancelled"
+FAILED = "failed"
+
+# Node properties that reference assets decoded on the workers
+TEXTURE_PROPERTIES = ("texture", "normal_map")
+SOUND_PROPERTIES = ("stream",)
+
+# Share of the progress bar taken by the worker stages
+_WORKER_PROGRESS = 0.5
+
+
+class StreamCancelledError(Exception):
+    """Passed to the callback of a request that was cancelled"""
+    pass
+
+
+@dataclass
+class StreamRequest:
+    """A scene being streamed in"""
+    request_id: str
+    scene_path: str
+    priority: int = 0
+    callback: Optional[Callable] = None   # callback(scene, error, request_id)
+    status: str = QUEUED
+    progress: float = 0.0
+    scene: Any = None
+    error: Optional[Exception] = None
+    submitted_at: float = 0.0
+    finished_at: float = 0.0
+
+    # Worker output consumed by finalization
+    textures: Dict[str, Any] = field(default_factory=dict)
+    sounds: Dict[str, Any] = field(default_factory=dict)
+    steps: deque = field(default_factory=deque)
+    total_steps: int = 0
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (DONE, CANCELLED, FAILED)
+
+
+class SceneStreamer:
+    """
+    Streams scenes in on a pool of worker threads and finalizes them on the
+    main thread. Call update() once per frame from the main (GL) thread;
+    it spends at most frame_budget_ms on finalization and runs callbacks.
+
+    Higher priority requests are loaded and finalized first.
+
+    The cyclic GC is left alone, so the budget does not cover collector
+    pauses: building a large scene still sets off full collections, and one
+    of them can land in a frame (one 140-260 ms frame for the 12,500-node
+    level in benchmarks/scene_streaming.py).
+    """
+
+    def __init__(self, path_resolver: Optional[Callable[[str], Any]] = None, workers: int = 1,
+                 frame_budget_ms: float = 2.0, renderer=None, audio_system=None,
+                 node_finalizer: Optional[Callable] = None):
+        self.path_resolver = path_resolver
+        self.frame_budget_ms = frame_budget_ms
+        self.renderer = renderer
+        self.audio_system = audio_system
+        self.node_finalizer = node_finalizer
+
+        self.requests: Dict[str, StreamRequest] = {}
+
+        # Worker queue and main-thread completion queue, both ordered by
+        # (-priority, submission order)
+        self._counter = itertools.count()
+        self._pending: List[Tuple[int, int, StreamRequest]] = []
+        self._completed: List[Tuple[int, int, StreamRequest]] = []
+        self._lock = threading.Lock()
+        self._work_available = threading.Condition(self._lock)
+        self._shutdown = False
+
+        self._threads = []
+        for i in range(max(1, workers)):
+            thread = threading.Thread(target=self._worker_loop, name=f"SceneStreamer-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+        # Finalization stats
+        self.last_update_time = 0.0
+        self.max_update_time = 0.0
+
+    # Public API
+    def load(self, scene_path: str, priority: int = 0, callback: Optional[Callable] = None) -> str:
+        """Queue a scene for streaming and return its request ID"""
+        request = StreamRequest(str(uuid.uuid4()), scene_path, priority, callback,
+                                submitted_at=time.perf_counter())
+        with self._lock:
+            self.requests[request.request_id] = request
+            heapq.heappush(self._pending, (-priority, next(self._counter), request))
+            self._work_available.notify()
+        return request.request_id
+
+    def cancel(self, request_id: str) -> bool:
+        """Cancel a request; work already done is discarded and the callback gets a StreamCancelledError"""
+        with self._lock:
+            request = self.requests.get(request_id)
+            if request is None or request.finished:
+                return False
+            request.status = CANCELLED
+            request.finished_at = time.perf_counter()
+            request.steps.clear()
+
+        log.info("Cancelled streaming %s", request.scene_path)
+        if request.callback:
+            try:
+                request.callback(None, StreamCancelledError(f"Streaming {request.scene_path} was cancelled"),
+                                 request.request_id)
+            except Exception as e:
+                log.error("Stream callback failed for %s: %s", request.scene_path, e)
+        request.scene = None
+        return True
+
+    def set_priority(self, request_id: str, priority: int) -> bool:
+        """Change the priority of a queued or finalizing request"""
+        request = self.requests.get(request_id)
+        if request is None or request.finished:
+            return False
+        with self._lock:
+            request.priority = priority
+            for queue in (self._pending, self._completed):
+                for i, entry in enumerate(queue):
+                    if entry[2] is request:
+                        queue[i] = (-priority, entry[1], request)
+                        heapq.heapify(queue)
+                        break
+        return True
+
+    def get_request(self, request_id: str) -> Optional[StreamRequest]:
+        """Get a request by ID"""
+        return self.requests.get(request_id)
+
+    def get_progress(self, request_id: str) -> float:
+        """Get the progress of a request from 0.0 to 1.0"""
+        request = self.requests.get(request_id)
+        return request.progress if request else 0.0
+
+    def get_status(self, request_id: str) -> Optional[str]:
+        """Get the state of a request"""
+        request = self.requests.get(request_id)
+        return request.status if request else None
+
+    def is_idle(self) -> bool:
+        """Check whether nothing is queued, loading or finalizing"""
+        return all(request.finished for request in self.requests.values())
+
+    def forget(self, request_id: str) -> None:
+        """Drop a finished request from the request table"""
+        request = self.requests.get(request_id)
+        if request is not None and request.finished:
+            del self.requests[request_id]
+
+    def shutdown(self) -> None:
+        """Stop the worker threads (queued requests are cancelled)"""
+        with self._lock:
+            self._shutdown = True
+            for _, _, request in self._pending:
+                request.status = CANCELLED
+            self._pending.clear()
+            self._work_available.notify_all()
+
+    # Main thread
+    def update(self, budget_ms: Optional[float] = None) -> int:
+        """Finalize loaded scenes for up to budget_ms; returns the number of steps run"""
+        start = time.perf_counter()
+        deadline = start + (self.frame_budget_ms if budget_ms is None else budget_ms) / 1000.0
+        steps_run = 0
+
+        while True:
+            with self._lock:
+                # Skip requests cancelled while waiting
+                while self._completed and self._completed[0][2].status == CANCELLED:
+                    heapq.heappop(self._completed)
+                if not self._completed:
+                    break
+                request = self._completed[0][2]
+
+            # Always make some progress, even with a tiny budget
+            steps = request.steps
+            while steps:
+                step = steps.popleft()
+                try:
+                    step()
+                except Exception as e:
+                    log.error("Finalization step failed for %s: %s", request.scene_path, e)
+                steps_run += 1
+                request.progress = _WORKER_PROGRESS + (1.0 - _WORKER_PROGRESS) * (
+                    1.0 - len(steps) / request.total_steps)
+                if time.perf_counter() >= deadline:
+                    break
+
+            if not steps:
+                with self._lock:
+                    if self._completed and self._completed[0][2] is request:
+                        heapq.heappop(self._completed)
+                if request.status == FINALIZING:
+                    self._finish(request)
+
+            if time.perf_counter() >= deadline:
+                break
+
+        self.last_update_time = time.perf_counter() - start
+        self.max_update_time = max(self.max_update_time, self.last_update_time)
+        return steps_run
+
+    def _finish(self, request: StreamRequest, error: Optional[Exception] = None) -> None:
+        """Mark a request finished and run its callback"""
+        request.finished_at = time.perf_counter()
+        if error is not None:
+            request.status = FAILED
+            request.error = error
+        else:
+            request.status = DONE
+            request.progress = 1.0
+        # Decoded asset data is no longer needed once uploaded
+        request.textures = {}
+        request.sounds = {}
+
+        log.info("Streamed %s in %.1f ms (%s)", request.scene_path,
+                 (request.finished_at - request.submitted_at) * 1000.0, request.status)
+        if request.callback:
+            try:
+                request.callback(request.scene if error is None else None, error, request.request_id)
+            except Exception as e:
+                log.error("Stream callback failed for %s: %s", request.scene_path, e)
+
+        # The request record stays for progress queries; the scene belongs to the callback
+        request.scene = None
+
+    # Worker threads
+    def _worker_loop(self) -> None:
+        """Take the highest priority request and run its off-thread stages"""
+        while True:
+            with self._lock:
+                while not self._pending and not self._shutdown:
+                    self._work_available.wait()
+                if self._shutdown:
+                    return
+                _, order, request = heapq.heappop(self._pending)
+                if request.status == CANCELLED:
+                    continue
+                request.status = LOADING
+
+            try:
+                self._load(request)
+            except Exception as e:
+                log.error("Failed to stream %s: %s", request.scene_path, e)
+                with self._lock:
+                    if request.status != CANCELLED:
+                        request.error = e
+                        request.steps.clear()
+                        request.steps.append(lambda r=request, e=e: self._finish(r, e))
+                        request.status = FINALIZING
+
+            with self._lock:
+                if request.status != FINALIZING:
+                    continue  # Cancelled while loading
+                request.total_steps = max(1, len(request.steps))
+                heapq.heappush(self._completed, (-request.priority, order, request))
+
+    def _load(self, request: StreamRequest) -> None:
+        """Off-thread stages: read and decode the scene, decode assets, build nodes"""
+        from .binary_scene import load_scene_data
+        from .scene_manager import Scene
+
+        path = self.path_resolver(request.scene_path) if self.path_resolver else request.scene_path
+        data = load_scene_data(str(path))
+        request.progress = 0.2 * _WORKER_PROGRESS
+        if request.status == CANCELLED:
+            return
+
+        texture_paths, sound_paths = self._collect_assets(data)
+        self._decode_assets(request, texture_paths, sound_paths)
+        request.progress = 0.6 * _WORKER_PROGRESS
+        if request.status == CANCELLED:
+            return
+
+        request.scene = Scene.from_dict(data)
+        request.progress = _WORKER_PROGRESS
+        if request.status == CANCELLED:
+            return
+
+        self._plan_finalization(request)
+        # cancel() may have run since the last check; it must win
+        with self._lock:
+            if request.status != CANCELLED:
+                request.status = FINALIZING
+
+    def _collect_assets(self, data: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+        """Find texture and sound paths referenced by the scene's nodes"""
+        textures: Dict[str, None] = {}
+        sounds: Dict[str, None] = {}
+        stack = list(data.get("nodes", []))
+        while stack:
+            node = stack.pop()
+            for source in (node, node.get("properties") or {}):
+                for key in TEXTURE_PROPERTIES:
+                    value = source.get(key)
+                    if value and isinstance(value, str):
+                        textures[value] = None
+                for key in SOUND_PROPERTIES:
+                    value = source.get(key)
+                    if value and isinstance(value, str):
+                        sounds[value] = None
+            stack.extend(node.get("children", []))
+        return list(textures), list(sounds)
+
+    def _decode_assets(self, request: StreamRequest, texture_paths: List[str], sound_paths: List[str]) -> None:
+        """Decode images and audio so the main thread only uploads them"""
+        renderer = self.renderer
+        if renderer is not None and hasattr(renderer, "decode_texture"):
+            for texture_path in texture_paths:
+                if request.status == CANCELLED:
+                    return
+                if texture_path in renderer.texture_cache:
+                    continue
+                decoded = renderer.decode_texture(texture_path)
+                if decoded is not None:
+                    request.textures[texture_path] = decoded
+
+        audio = self.audio_system
+        if audio is not None and hasattr(audio, "decode_sound"):
+            for sound_path in sound_paths:
+                if request.status == CANCELLED:
+                    return
+                if sound_path in audio.buffers:
+                    continue
+                decoded = audio.decode_sound(sound_path)
+                if decoded is not None:
+                    request.sounds[sound_path] = decoded
+
+    def _plan_finalization(self, request: StreamRequest) -> None:
+        """Queue the main-thread steps: uploads first, then one step per node"""
+        steps = request.steps
+        renderer = self.renderer
+        for texture_path, decoded in request.textures.items():
+            steps.append(lambda p=texture_path, d=decoded: renderer.upload_texture(p, d))
+
+        audio = self.audio_system
+        for sound_path, decoded in request.sounds.items():
+            steps.append(lambda p=sound_path, d=decoded: audio.upload_sound(p, d))
+
+        finalizer = self.node_finalizer
+        if finalizer is not None:
+            stack = list(reversed(request.scene.root_nodes))
+            while stack:
+                node = stack.pop()
+                steps.append(lambda n=node: finalizer(n))
+                stack.extend(reversed(node.children))
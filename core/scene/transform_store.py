@@ -0,0 +1,267 @@
+"""
+scene/transform_store.py
+
+Structure-of-arrays transform backend for Node2D. Attached nodes mirror
+their local position, rotation and scale into contiguous numpy arrays
+indexed by slot; update() recomputes every changed global transform in
+one vectorized pass per hierarchy level, parents before children.
+
+Rendering, culling and physics sync can read global_position,
+global_rotation and global_scale (and the `changed` mask of the last
+update) directly instead of asking each node.
+"""
+
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+
+class TransformStore:
+    """Slot-indexed transform arrays for a set of Node2D hierarchies."""
+
+    def __init__(self, capacity: int = 1024):
+        self.capacity = 0
+        self.count = 0  # Slots in use (including freed ones below the high-water mark)
+        self.nodes: List[Optional[Any]] = []  # slot -> node
+        self._free: List[int] = []
+
+        # Local transform (written through by the nodes)
+        self.position = np.zeros((0, 2))
+        self.rotation = np.zeros(0)
+        self.scale = np.zeros((0, 2))
+
+        # Global transform (computed by update)
+        self.global_position = np.zeros((0, 2))
+        self.global_rotation = np.zeros(0)
+        self.global_scale = np.zeros((0, 2))
+
+        self.parent = np.zeros(0, dtype=np.int64)  # Parent slot, -1 for roots
+        self.alive = np.zeros(0, dtype=bool)
+        self.dirty = np.zeros(0, dtype=bool)  # Local transform changed since the last update
+        self.changed = np.zeros(0, dtype=bool)  # Global transform changed in the last update
+
+        self.needs_update = False
+        self._levels: Optional[List[Tuple[np.ndarray, np.ndarray]]] = None  # (slots, parent slots) per depth
+
+        self._grow(capacity)
+
+    # Attachment
+    def attach(self, root) -> int:
+        """Attach the Node2D nodes of a subtree; returns the number attached"""
+        # Marked so Node2Ds later added anywhere below it (even under plain Nodes) attach too
+        root._transform_root = self
+        attached = 0
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if getattr(node, '_transform_store', False) is None:  # An unattached Node2D
+                self._add(node)
+                attached += 1
+            stack.extend(reversed(node.children))
+        return attached
+
+    def detach(self, root) -> int:
+        """Detach the nodes of a subtree from this store; returns the number detached"""
+        if root.__dict__.get('_transform_root') is self:
+            del root._transform_root
+        detached = 0
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if getattr(node, '_transform_store', None) is self:
+                self._remove(node)
+                detached += 1
+            stack.extend(node.children)
+        return detached
+
+    def reparent(self, node) -> None:
+        """Update a node's parent slot after its parent changed"""
+        slot = node._transform_slot
+        self.parent[slot] = self._parent_slot(node)
+        self.dirty[slot] = True
+        self.needs_update = True
+        self._levels = None
+
+    def _add(self, node) -> None:
+        """Give a node a slot and copy its local transform in"""
+        if self._free:
+            slot = self._free.pop()
+        else:
+            if self.count == self.capacity:
+                self._grow(self.capacity * 2)
+            slot = self.count
+            self.count += 1
+
+        self.nodes[slot] = node
+        node._transform_store = self
+        node._transform_slot = slot
+        self.alive[slot] = True
+        self.parent[slot] = self._parent_slot(node)
+        self.write(node)
+        self._levels = None
+
+        # Children attached before their parent now have a parent slot
+        for child in node.children:
+            if getattr(child, '_transform_store', None) is self:
+                self.parent[child._transform_slot] = slot
+
+    def _remove(self, node) -> None:
+        """Free a node's slot"""
+        slot = node._transform_slot
+        self.nodes[slot] = None
+        self.alive[slot] = False
+        self.dirty[slot] = False
+        self.parent[slot] = -1
+        node._transform_store = None
+        node._transform_slot = -1
+        node._transform_dirty = True  # Its cached global transform predates the store
+        self._free.append(slot)
+        self._levels = None
+
+        # Attached children become roots
+        for child in node.children:
+            if getattr(child, '_transform_store', None) is self:
+                self.reparent(child)
+
+    def _parent_slot(self, node) -> int:
+        """Get the slot of a node's parent, or -1 if it is not attached here"""
+        parent = node.parent
+        if parent is not None and getattr(parent, '_transform_store', None) is self:
+            return parent._transform_slot
+        return -1
+
+    # Writes from nodes
+    def write(self, node, attribute: Optional[str] = None) -> None:
+        """Copy a node's local transform (or one attribute of it) into the arrays"""
+        slot = node._transform_slot
+        if attribute is None or attribute == 'position':
+            position = node.position
+            self.position[slot] = position[0], position[1]
+        if attribute is None or attribute == 'rotation':
+            self.rotation[slot] = node.rotation
+        if attribute is None or attribute == 'scale':
+            scale = node.scale
+            self.scale[slot] = scale[0], scale[1]
+        self.dirty[slot] = True
+        self.needs_update = True
+
+    # Frame update
+    def update(self) -> int:
+        """
+        Recompute the global transforms of dirty nodes and their descendants.
+        Returns the number of nodes updated; `changed` marks them.
+        """
+        if not self.needs_update:
+            if self.changed.any():
+                self.changed[:] = False
+            return 0
+
+        if self._levels is None:
+            self._levels = self._build_levels()
+
+        changed = self.dirty.copy()
+        updated = 0
+        position, rotation, scale = self.position, self.rotation, self.scale
+        global_position, global_rotation, global_scale = self.global_position, self.global_rotation, self.global_scale
+
+        for depth, (slots, parents) in enumerate(self._levels):
+            if depth == 0:
+                update_slots = slots[changed[slots]]
+                global_position[update_slots] = position[update_slots]
+                global_rotation[update_slots] = rotation[update_slots]
+                global_scale[update_slots] = scale[update_slots]
+                updated += len(update_slots)
+                continue
+
+            # A node changes if it or any ancestor changed
+            mask = changed[slots] | changed[parents]
+            changed[slots] = mask
+            update_slots = slots[mask]
+            if not len(update_slots):
+                continue
+            update_parents = parents[mask]
+
+            parent_scale = global_scale[update_parents]
+            parent_rotation = global_rotation[update_parents]
+            cos_rot = np.cos(parent_rotation)
+            sin_rot = np.sin(parent_rotation)
+            local_x = position[update_slots, 0] * parent_scale[:, 0]
+            local_y = position[update_slots, 1] * parent_scale[:, 1]
+
+            parent_position = global_position[update_parents]
+            global_position[update_slots, 0] = parent_position[:, 0] + (local_x * cos_rot - local_y * sin_rot)
+            global_position[update_slots, 1] = parent_position[:, 1] + (local_x * sin_rot + local_y * cos_rot)
+            global_rotation[update_slots] = parent_rotation + rotation[update_slots]
+            global_scale[update_slots] = parent_scale * scale[update_slots]
+            updated += len(update_slots)
+
+        self.changed = changed
+        self.dirty[:] = False
+        self.needs_update = False
+        return updated
+
+    def _build_levels(self) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """Group the live slots by depth (roots first) with their parent slots"""
+        count = self.count
+        alive = np.flatnonzero(self.alive[:count])
+        parent = self.parent[:count]
+
+        depth = np.zeros(count, dtype=np.int64)
+        ancestor = parent[alive]
+        while True:
+            has_parent = ancestor >= 0
+            if not has_parent.any():
+                break
+            depth[alive[has_parent]] += 1
+            ancestor = np.where(has_parent, parent[np.maximum(ancestor, 0)], -1)
+
+        order = alive[np.argsort(depth[alive], kind='stable')]
+        bounds = np.cumsum(np.bincount(depth[order]))
+        levels = []
+        start = 0
+        for end in bounds:
+            slots = order[start:end]
+            levels.append((slots, parent[slots]))
+            start = end
+        return levels
+
+    # Queries
+    def get_global_transform(self, slot: int) -> Tuple[List[float], float, List[float]]:
+        """Get (position, rotation, scale) of a slot from the last update"""
+        return (self.global_position[slot].tolist(), float(self.global_rotation[slot]),
+                self.global_scale[slot].tolist())
+
+    def get_live_slots(self) -> np.ndarray:
+        """Get the slots currently holding a node"""
+        return np.flatnonzero(self.alive[:self.count])
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get slot usage and hierarchy depth"""
+        if self._levels is None:
+            self._levels = self._build_levels()
+        return {
+            'capacity': self.capacity,
+            'live_nodes': int(self.alive[:self.count].sum()),
+            'free_slots': len(self._free),
+            'depth': len(self._levels),
+        }
+
+    def _grow(self, capacity: int) -> None:
+        """Reallocate the arrays with room for `capacity` slots"""
+        def grown(array, fill=0):
+            new = np.full((capacity,) + array.shape[1:], fill, dtype=array.dtype)
+            new[:len(array)] = array
+            return new
+
+        self.position = grown(self.position)
+        self.rotation = grown(self.rotation)
+        self.scale = grown(self.scale, 1.0)
+        self.global_position = grown(self.global_position)
+        self.global_rotation = grown(self.global_rotation)
+        self.global_scale = grown(self.global_scale, 1.0)
+        self.parent = grown(self.parent, -1)
+        self.alive = grown(self.alive, False)
+        self.dirty = grown(self.dirty, False)
+        self.changed = grown(self.changed, False)
+        self.nodes.extend([None] * (capacity - self.capacity))
+        self.capacity = capacity
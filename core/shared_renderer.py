@@ -10,6 +10,10 @@ from pathlib import Path
 from OpenGL.GL import *
 import numpy as np
 
+from .engine_log import get_logger
+
+log = get_logger("renderer")
+
 try:
     import pygame
     pygame.init()
@@ -107,6 +111,11 @@ class SharedRenderer:
     
     def _load_texture_pil(self, full_path: Path, texture_path: str) -> Optional[Tuple[int, int, int]]:
         """Load texture using PIL/Pillow"""
+        return self.upload_texture(texture_path, self._decode_texture_pil(full_path))
+
+    @staticmethod
+    def _decode_texture_pil(full_path: Path) -> Tuple[int, int, bytes]:
+        """Decode an image file into (width, height, RGBA bytes) ready for upload"""
         # Load image using PIL
         pil_image = Image.open(str(full_path))
         
@@ -119,7 +128,33 @@ class SharedRenderer:
         
         # Flip image vertically for OpenGL (PIL loads top-to-bottom, OpenGL expects bottom-to-top)
         pil_image = pil_image.transpose(Image.FLIP_TOP_BOTTOM)
-        image_data = pil_image.tobytes()
+        return width, height, pil_image.tobytes()
+
+    def decode_texture(self, texture_path: str) -> Optional[Tuple[int, int, bytes]]:
+        """
+        Decode a texture file without touching OpenGL, so it can run on a
+        worker thread. Pass the result to upload_texture on the GL thread.
+        """
+        if not texture_path or not PIL_AVAILABLE:
+            return None
+        try:
+            if not Path(texture_path).is_absolute() and self.project_path:
+                full_path = self.project_path / texture_path
+            else:
+                full_path = Path(texture_path)
+            if not full_path.exists():
+                return None
+            return self._decode_texture_pil(full_path)
+        except Exception as e:
+            log.warning("Error decoding texture %s: %s", texture_path, e)
+            return None
+
+    def upload_texture(self, texture_path: str, decoded: Tuple[int, int, bytes]) -> Optional[Tuple[int, int, int]]:
+        """Upload decoded RGBA data as a texture and cache it under texture_path"""
+        if texture_path in self.texture_cache:
+            return self.texture_cache[texture_path]
+
+        width, height, image_data = decoded
         
         # Generate OpenGL texture
         texture_id = glGenTextures(1)
@@ -148,6 +183,29 @@ class SharedRenderer:
         print(f"Successfully loaded texture: {texture_path} ({width}x{height})")
         return texture_info
     
+    def invalidate_texture(self, texture_path: str) -> int:
+        """
+        Drop a cached texture so it is loaded again on next use (e.g. after
+        the file changed). Cache keys naming the same file by a different
+        relative or absolute path are dropped too. Returns the number dropped.
+        """
+        target = self._resolve_texture_path(texture_path)
+        dropped = 0
+        for key in list(self.texture_cache):
+            if key == texture_path or self._resolve_texture_path(key) == target:
+                texture_info = self.texture_cache.pop(key)
+                if texture_info:
+                    glDeleteTextures(1, [texture_info[0]])
+                dropped += 1
+        return dropped
+
+    def _resolve_texture_path(self, texture_path: str) -> Path:
+        """Get the absolute, normalized path of a texture"""
+        path = Path(texture_path)
+        if not path.is_absolute() and self.project_path:
+            path = self.project_path / path
+        return path.resolve()
+
     def _load_texture_pygame(self, full_path: Path, texture_path: str) -> Optional[Tuple[int, int, int]]:
         """Load texture using pygame as fallback"""
         if not PYGAME_AVAILABLE:
@@ -188,8 +246,9 @@ class SharedRenderer:
     
     def draw_sprite(self, texture_path: str, x: float, y: float,
                    width: Optional[float] = None, height: Optional[float] = None,
-                   rotation: float = 0.0, alpha: float = 1.0):
-        """Draw a sprite at the given position"""
+                   rotation: float = 0.0, alpha: float = 1.0,
+                   region: Optional[Tuple[float, float, float, float]] = None):
+        """Draw a sprite at the given position (region: normalized u, v, width, height of the texture to draw)"""
         texture_info = self.load_texture(texture_path)
         if not texture_info:
             # Draw a colored rectangle as fallback (light gray instead of pink)
@@ -220,15 +279,21 @@ class SharedRenderer:
         glBindTexture(GL_TEXTURE_2D, texture_id)
         glColor4f(1.0, 1.0, 1.0, alpha)
 
+        if region is None:
+            u1, v1, u2, v2 = 0.0, 0.0, 1.0, 1.0
+        else:
+            u1, v1 = region[0], region[1]
+            u2, v2 = region[0] + region[2], region[1] + region[3]
+
         # Draw textured quad
         glBegin(GL_QUADS)
-        glTexCoord2f(0.0, 0.0)
+        glTexCoord2f(u1, v1)
         glVertex2f(-half_width, -half_height)
-        glTexCoord2f(1.0, 0.0)
+        glTexCoord2f(u2, v1)
         glVertex2f(half_width, -half_height)
-        glTexCoord2f(1.0, 1.0)
+        glTexCoord2f(u2, v2)
         glVertex2f(half_width, half_height)
-        glTexCoord2f(0.0, 1.0)
+        glTexCoord2f(u1, v2)
         glVertex2f(-half_width, half_height)
         glEnd()
 
@@ -508,12 +573,12 @@ class SharedRenderer:
                     if font_path.exists() and font_path.suffix.lower() in ['.ttf', '.otf', '.ttc']:
                         # Load custom font file
                         font = pygame.font.Font(str(font_path), font_size)
-                        print(f"[OK] Loaded custom font: {font_path}")
+                        log.debug("Loaded custom font: %s", font_path)
                     else:
                         # Try as system font name
                         try:
                             font = pygame.font.SysFont(font_name, font_size)
-                            print(f"[OK] Loaded system font: {font_name}")
+                            log.debug("Loaded system font: %s", font_name)
                         except:
                             # If system font fails, try common font names
                             common_fonts = [
@@ -526,7 +591,7 @@ class SharedRenderer:
                             for common_font in common_fonts:
                                 try:
                                     font = pygame.font.SysFont(common_font, font_size)
-                                    print(f"[OK] Fallback to system font: {common_font}")
+                                    log.debug("Fallback to system font: %s", common_font)
                                     break
                                 except:
                                     continue
@@ -534,20 +599,20 @@ class SharedRenderer:
                             if font is None:
                                 # Final fallback to default font
                                 font = pygame.font.Font(None, font_size)
-                                print(f"[OK] Using default font")
+                                log.debug("Using default font")
                 else:
                     # Use default font
                     font = pygame.font.Font(None, font_size)
 
                 self.font_cache[font_key] = font
             except Exception as e:
-                print(f"Error loading font {font_name}: {e}")
+                log.error("Error loading font %s: %s", font_name, e)
                 # Fallback to default font
                 try:
                     font = pygame.font.Font(None, font_size)
                     self.font_cache[font_key] = font
                 except Exception as e2:
-                    print(f"Error loading default font: {e2}")
+                    log.error("Error loading default font: %s", e2)
                     return None
 
         return self.font_cache[font_key]
@@ -698,6 +763,18 @@ class SharedRenderer:
             glBindTexture(GL_TEXTURE_2D, 0)
             glDisable(GL_TEXTURE_2D)
 
+    def release_text_texture(self, text: str, font_name: Optional[str] = None, font_size: int = 14,
+                             color: Tuple[float, float, float, float] = (1.0, 1.0, 1.0, 1.0)):
+        """Free the cached texture for text that will not be drawn again"""
+        pygame_color = (int(color[0] * 255), int(color[1] * 255),
+                       int(color[2] * 255), int(color[3] * 255))
+        texture_info = self.text_texture_cache.pop((text, font_name, font_size, pygame_color), None)
+        if texture_info:
+            try:
+                glDeleteTextures(1, [texture_info[0]])
+            except Exception as e:
+                print(f"Error releasing text texture: {e}")
+
     def draw_textured_quad(self, texture_id: int, left: float, bottom: float,
                           right: float, top: float, tex_left: float = 0.0,
                           tex_bottom: float = 0.0, tex_right: float = 1.0,
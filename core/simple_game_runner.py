@@ -24,7 +24,8 @@ def setup_paths(project_path: str, lupine_engine_path: str):
     sys.path.insert(0, lupine_engine_path)
     sys.path.insert(0, project_path)
 
-def run_game(project_path: str, scene_path: str, lupine_engine_path: Optional[str] = None):
+def run_game(project_path: str, scene_path: str, lupine_engine_path: Optional[str] = None,
+             hot_reload: bool = False):
     """Run a game with the specified project and scene"""
 
     print(f"[SIMPLE_GAME_RUNNER] run_game called")
@@ -57,7 +58,7 @@ def run_game(project_path: str, scene_path: str, lupine_engine_path: Optional[st
 
         # Create and run the game engine
         print(f"[SIMPLE_GAME_RUNNER] Creating LupineGameEngine instance...")
-        engine = LupineGameEngine(project_path, scene_path)
+        engine = LupineGameEngine(project_path, scene_path, hot_reload=hot_reload)
         print(f"[SIMPLE_GAME_RUNNER] LupineGameEngine created, calling run()...")
         engine.run()
 
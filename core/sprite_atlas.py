@@ -0,0 +1,135 @@
+"""
+Sprite frame atlases for Lupine Engine
+Packs the frame images of an animation set into one texture so animated
+sprites change frames by changing UVs, never textures. Atlases are shared
+by every sprite that uses the same list of frame images.
+"""
+
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+
+ATLAS_KEY_PREFIX = "atlas://"
+MAX_ATLAS_WIDTH = 4096
+ATLAS_PADDING = 1  # Transparent pixels between frames, so filtering doesn't bleed
+
+UV = Tuple[float, float, float, float]
+
+
+class SpriteFrameAtlas:
+    """
+    Frame images packed into one texture.
+    regions are pixel rectangles (x, y, width, height) from the top-left of
+    the atlas; uvs are the same rectangles in normalized texture space as
+    expected by SharedRenderer.draw_sprite (textures are flipped
+    vertically on upload, so v runs bottom-up).
+    """
+
+    def __init__(self, key: str, width: int, height: int, regions: List[List[float]],
+                 pixels: Optional[bytes] = None):
+        self.key = key  # Texture cache key in SharedRenderer
+        self.width = width
+        self.height = height
+        self.regions = regions
+        self.uvs: List[UV] = [(x / width, 1.0 - (y + h) / height, w / width, h / height)
+                              for x, y, w, h in regions]
+        self._pixels = pixels  # RGBA rows, bottom-up, ready for upload
+
+    def get_frame_count(self) -> int:
+        """Get the number of frames in the atlas"""
+        return len(self.regions)
+
+    def upload(self, renderer) -> bool:
+        """Make the atlas texture available to a SharedRenderer; False if there is nothing to upload"""
+        if self.key in renderer.texture_cache:
+            return True
+        if self._pixels is None:
+            return False
+        return renderer.upload_texture(self.key, (self.width, self.height, self._pixels)) is not None
+
+
+_atlases: Dict[Tuple[str, ...], SpriteFrameAtlas] = {}
+
+
+def get_frame_atlas(texture_paths: Sequence[str]) -> Optional[SpriteFrameAtlas]:
+    """Get the shared atlas for a list of frame images, building it on first use"""
+    key = tuple(str(path) for path in texture_paths)
+    atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = build_frame_atlas(key)
+        if atlas is not None:
+            _atlases[key] = atlas
+    return atlas
+
+
+def clear_frame_atlases():
+    """Forget all shared atlases (e.g. after frame images changed on disk)"""
+    _atlases.clear()
+
+
+def build_frame_atlas(texture_paths: Sequence[str], max_width: int = MAX_ATLAS_WIDTH) -> Optional[SpriteFrameAtlas]:
+    """Pack frame images into a new atlas; a path listed twice shares one region"""
+    if not PIL_AVAILABLE:
+        print("Error building sprite atlas: PIL is not available")
+        return None
+    if not texture_paths:
+        return None
+
+    unique_paths = list(dict.fromkeys(texture_paths))
+    images = []
+    for path in unique_paths:
+        try:
+            with Image.open(Path(path)) as image:
+                images.append(image.convert('RGBA'))
+        except OSError as e:
+            print(f"Error loading sprite frame {path}: {e}")
+            return None
+
+    positions, width, height = pack_rectangles([image.size for image in images], max_width)
+    atlas_image = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+    for image, position in zip(images, positions):
+        atlas_image.paste(image, position)
+
+    unique_regions = {path: [float(x), float(y), float(image.width), float(image.height)]
+                      for path, image, (x, y) in zip(unique_paths, images, positions)}
+    regions = [list(unique_regions[path]) for path in texture_paths]
+    key = ATLAS_KEY_PREFIX + hashlib.blake2b("\n".join(texture_paths).encode("utf-8"), digest_size=8).hexdigest()
+    pixels = atlas_image.transpose(Image.FLIP_TOP_BOTTOM).tobytes()
+    return SpriteFrameAtlas(key, width, height, regions, pixels)
+
+
+def pack_rectangles(sizes: List[Tuple[int, int]], max_width: int = MAX_ATLAS_WIDTH,
+                    padding: int = ATLAS_PADDING) -> Tuple[List[Tuple[int, int]], int, int]:
+    """
+    Shelf-pack rectangles, tallest first. Returns the top-left position of
+    each rectangle (in input order) and the atlas size.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    positions: List[Tuple[int, int]] = [(0, 0)] * len(sizes)
+    x = y = shelf_height = width = 0
+    for i in order:
+        w, h = sizes[i]
+        if x and x + w > max_width:
+            y += shelf_height + padding
+            x = shelf_height = 0
+        positions[i] = (x, y)
+        x += w + padding
+        shelf_height = max(shelf_height, h)
+        width = max(width, x - padding)
+    return positions, max(width, 1), max(y + shelf_height, 1)
+
+
+@lru_cache(maxsize=None)
+def get_grid_uvs(hframes: int, vframes: int) -> Tuple[UV, ...]:
+    """Get the normalized UV rectangle of every frame of an hframes x vframes sprite sheet"""
+    w, h = 1.0 / hframes, 1.0 / vframes
+    return tuple(((i % hframes) * w, 1.0 - (i // hframes + 1) * h, w, h)
+                 for i in range(hframes * vframes))
@@ -67,6 +67,27 @@ class VisualScriptInstance:
             print(f"Error compiling visual script: {e}")
             print(f"Generated code:\n{self.generated_code}")
     
+    def duplicate(self, node) -> 'VisualScriptInstance':
+        """Create an instance of this visual script for another node, reusing the compiled class"""
+        clone = VisualScriptInstance.__new__(VisualScriptInstance)
+        clone.script_data = self.script_data
+        clone.node = node
+        clone.variables = dict(self.variables)
+        clone.generator = self.generator
+        clone.blocks = self.blocks
+        clone.connections = self.connections
+        clone.generated_code = self.generated_code
+        clone.compiled_code = self.compiled_code
+        clone.script_class = self.script_class
+        clone.script_instance = None
+
+        if self.script_class is not None:
+            try:
+                clone.script_instance = self.script_class(node)
+            except Exception as e:
+                print(f"Error instantiating visual script: {e}")
+        return clone
+
     def execute(self):
         """Execute the visual script"""
         if self.script_instance and hasattr(self.script_instance, 'execute'):
@@ -87,8 +87,8 @@ try:
     print("[RUNNER] Successfully imported run_game")
 
     print("[RUNNER] Calling run_game...")
-    # Run the game using the new streamlined engine
-    exit_code = run_game(r"{project_path}", r"{scene_path}", r"{lupine_engine_path}")
+    # Run the game using the new streamlined engine (changed files are hot reloaded)
+    exit_code = run_game(r"{project_path}", r"{scene_path}", r"{lupine_engine_path}", hot_reload=True)
     print(f"[RUNNER] run_game returned with exit code: {{exit_code}}")
     sys.exit(exit_code)
 
@@ -10,7 +10,7 @@ from PyQt6.QtWidgets import (
     QDockWidget, QMenuBar, QMenu, QToolBar, QStatusBar, QSplitter,
     QMessageBox, QFileDialog, QApplication, QDialog
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QAction, QIcon, QKeySequence
 
 from core.project import LupineProject
@@ -51,6 +51,11 @@ class MainEditor(QMainWindow):
 
         # Setup global editor shortcuts
         setup_editor_shortcuts(self)
+
+        # Finalize streamed scenes and run their callbacks on the GUI thread
+        self.streaming_timer = QTimer()
+        self.streaming_timer.timeout.connect(self.project.scene_manager.update_streaming)
+        self.streaming_timer.start(16)  # ~60 FPS
         
         # Load main scene if available
         main_scene = self.project.get_main_scene()
@@ -201,6 +201,13 @@ class AudioStreamPlayer(Node):
         """Check if autoplay is enabled"""
         return self.autoplay
 
+    def _duplicate_state(self, clone, flags: int):
+        """A copy gets its own audio source when it loads its stream"""
+        super()._duplicate_state(clone, flags)
+        clone._audio_loaded = False
+        clone._audio_source = None
+        clone._stream_position = 0.0
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
         data = super().to_dict()
@@ -5,11 +5,13 @@ Node for playing and managing animations on other nodes
 
 from typing import Dict, Any, List, Optional
 import os
-import json
-from pathlib import Path
 
 from .Node import Node
 from core.animation import Animation, AnimationLibrary
+from core.animation.bake_cache import bake_animation_library
+from core.animation.animation_file import load_animation_library, save_animation_library
+from core.animation.animation_lod import get_animation_lod, LOD_OFFSCREEN
+from core.scene.base_node import get_tree_version
 
 
 class AnimationPlayer(Node):
@@ -39,6 +41,18 @@ class AnimationPlayer(Node):
         
         # Animation file path (relative to project)
         self.animation_file: str = ""
+
+        # Bake loaded animation files into fixed-rate curves (0 disables baking)
+        self.bake_rate: float = 0.0
+
+        # Let the animation LOD slow or pause updates when the animated node is small or off-screen
+        self.lod_enabled: bool = True
+        self._lod_delta = 0.0  # Time skipped by LOD, applied on the next update
+        self._lod_cache = None  # [tree version, bound targets, anchors, last level, its view], see AnimationLOD.get_level
+
+        # Scene root, re-found only after the tree structure changed
+        self._scene_root = None
+        self._scene_root_version = -1
         
         # Signals
         self.add_signal("animation_finished")
@@ -63,6 +77,18 @@ class AnimationPlayer(Node):
                 "type": "path",
                 "value": "",
                 "description": "Path to animation file (.anim)"
+            },
+            "bake_rate": {
+                "type": "number",
+                "value": 0.0,
+                "min": 0.0,
+                "max": 960.0,
+                "description": "Samples per second for baked animation curves (0 disables baking)"
+            },
+            "lod_enabled": {
+                "type": "bool",
+                "value": True,
+                "description": "Update less often when the animated node is small or off-screen"
             }
         })
     
@@ -82,14 +108,31 @@ class AnimationPlayer(Node):
         """Update animation playback"""
         super()._process(delta)
         
-        if self.current_animation and self.current_animation.is_playing:
+        animation = self.current_animation
+        if animation and animation.is_playing:
+            visual = True
+            lod = get_animation_lod() if self.lod_enabled else None
+            if lod is not None:
+                level = lod.get_level(self, animation._bound_targets)
+                if level == LOD_OFFSCREEN:
+                    # Keep time, signals, audio and transforms running; other visual tracks catch up when visible
+                    delta = lod.flush(self, delta)
+                    lod.count_offscreen()
+                    visual = False
+                else:
+                    delta = lod.step(self, delta, level)
+                    if delta is None:
+                        return
+
             # Update animation with scaled delta time
-            self.current_animation.update(delta * self.playback_speed)
+            animation.update(delta * self.playback_speed)
             
-            # Apply animation to scene
-            scene_root = self.get_scene_root()
+            # Apply animation to scene; a finished animation leaves every track at its final value
+            if not visual and not animation.is_playing:
+                visual = True
+            scene_root = self._get_cached_scene_root()
             if scene_root:
-                self.current_animation.apply_to_scene(scene_root)
+                animation.apply_to_scene(scene_root, visual)
     
     def get_scene_root(self):
         """Get the root node of the current scene"""
@@ -97,6 +140,14 @@ class AnimationPlayer(Node):
         while current.parent:
             current = current.parent
         return current
+
+    def _get_cached_scene_root(self):
+        """Get the scene root, walking up only when the tree structure changed"""
+        version = get_tree_version()
+        if self._scene_root is None or self._scene_root_version != version:
+            self._scene_root = self.get_scene_root()
+            self._scene_root_version = version
+        return self._scene_root
     
     # Animation Management
     def add_animation(self, animation: Animation):
@@ -145,8 +196,10 @@ class AnimationPlayer(Node):
         
         # Start new animation
         self.current_animation = animation
+        self._lod_delta = 0.0
         self.current_animation.speed_scale = self.playback_speed
         self.current_animation.play(from_position)
+        self.current_animation.bind(self._get_cached_scene_root())
         
         self.emit_signal("animation_started", name)
         self.emit_signal("animation_changed", name)
@@ -189,16 +242,10 @@ class AnimationPlayer(Node):
         return self.current_animation.length if self.current_animation else 0.0
     
     # File Operations
-    def save_animation_file(self, file_path: str):
-        """Save animations to file"""
+    def save_animation_file(self, file_path: str, compact: bool = True):
+        """Save animations to file (compact writes packed keyframes without indentation)"""
         try:
-            # Ensure directory exists
-            Path(file_path).parent.mkdir(parents=True, exist_ok=True)
-            
-            # Save animation library
-            data = self.animation_library.to_dict()
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            save_animation_library(self.animation_library, file_path, compact)
             
             self.animation_file = file_path
             
@@ -211,22 +258,45 @@ class AnimationPlayer(Node):
             if not os.path.exists(file_path):
                 return
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
             # Load animation library
-            self.animation_library = AnimationLibrary.from_dict(data)
+            self.animation_library = load_animation_library(file_path)
+            if self.bake_rate > 0:
+                bake_animation_library(self.animation_library, file_path, self.bake_rate)
             
             # Set up callbacks for all animations
-            for animation in self.animation_library.animations.values():
-                animation.on_animation_finished = lambda name=animation.name: self._on_animation_finished(name)
-                animation.on_animation_looped = lambda name=animation.name: self._on_animation_looped(name)
+            self._connect_animation_callbacks()
             
             self.animation_file = file_path
             
         except Exception as e:
             print(f"Error loading animation file: {e}")
     
+    def _connect_animation_callbacks(self):
+        """Route the callbacks of every animation in the library to this player"""
+        for animation in self.animation_library.animations.values():
+            animation.on_animation_finished = lambda name=animation.name: self._on_animation_finished(name)
+            animation.on_animation_looped = lambda name=animation.name: self._on_animation_looped(name)
+
+    def _duplicate_state(self, clone, flags: int):
+        """A copy gets its own library (bound to its own targets) and starts stopped"""
+        super()._duplicate_state(clone, flags)
+        clone.animation_library = AnimationLibrary.from_dict(self.animation_library.to_dict())
+
+        # Baked curves are read-only, so the copy shares them instead of re-baking
+        for name, animation in self.animation_library.animations.items():
+            copy_animation = clone.animation_library.get_animation(name)
+            if copy_animation is None:
+                continue
+            for track, copy_track in zip(animation.tracks, copy_animation.tracks):
+                copy_track.baked = track.baked
+
+        clone._connect_animation_callbacks()
+        clone.current_animation = None
+        clone._lod_delta = 0.0
+        clone._lod_cache = None
+        clone._scene_root = None
+        clone._scene_root_version = -1
+
     # Event Handlers
     def _on_animation_finished(self, animation_name: str):
         """Called when an animation finishes"""
@@ -247,6 +317,8 @@ class AnimationPlayer(Node):
             "autoplay_animation": self.autoplay_animation,
             "playback_speed": self.playback_speed,
             "animation_file": self.animation_file,
+            "bake_rate": self.bake_rate,
+            "lod_enabled": self.lod_enabled,
             "animation_library": self.animation_library.to_dict()
         })
         
@@ -264,14 +336,14 @@ class AnimationPlayer(Node):
         node.autoplay_animation = data.get("autoplay_animation", "")
         node.playback_speed = data.get("playback_speed", 1.0)
         node.animation_file = data.get("animation_file", "")
+        node.bake_rate = data.get("bake_rate", 0.0)
+        node.lod_enabled = data.get("lod_enabled", True)
         
         # Load animation library
         if "animation_library" in data:
             node.animation_library = AnimationLibrary.from_dict(data["animation_library"])
             
             # Set up callbacks
-            for animation in node.animation_library.animations.values():
-                animation.on_animation_finished = lambda name=animation.name: node._on_animation_finished(name)
-                animation.on_animation_looped = lambda name=animation.name: node._on_animation_looped(name)
+            node._connect_animation_callbacks()
         
         return node
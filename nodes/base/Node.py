@@ -168,17 +168,6 @@ class Node(BaseNode):
             to_index = max(0, min(to_index, len(self.children)))
             self.children.insert(to_index, child)
     
-    def duplicate(self, flags: int = 0) -> "Node":
-        """Create a duplicate of this node and its subtree"""
-        # Convert to dict and back to create a deep copy
-        data = self.to_dict()
-        duplicate = Node.from_dict(data)
-        
-        # Clear parent reference for the duplicate
-        duplicate.parent = None
-        
-        return duplicate
-    
     def queue_free(self):
         """Mark this node for deletion at the end of the frame"""
         # In a full implementation, this would add to a deletion queue
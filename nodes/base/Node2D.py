@@ -66,21 +66,9 @@ class Node2D(BaseNode2D):
         self.add_signal("global_transform_changed")
     
     def _mark_transform_dirty(self):
-        """Mark transform as dirty and notify children"""
+        """Mark transform as dirty (the base class propagates to children) and notify"""
         super()._mark_transform_dirty()
         self.emit_signal("transform_changed")
-        
-        # Mark all children as dirty too
-        for child in self.children:
-            if isinstance(child, Node2D):
-                child._mark_transform_dirty()
-    
-    def set_position(self, x: float, y: float):
-        """Set the position of the node"""
-        old_pos = self.position.copy()
-        super().set_position(x, y)
-        if old_pos != self.position:
-            self._mark_transform_dirty()
     
     def set_global_position(self, x: float, y: float):
         """Set the global position of the node"""
@@ -104,13 +92,6 @@ class Node2D(BaseNode2D):
         else:
             self.set_position(x, y)
     
-    def set_rotation(self, rotation: float):
-        """Set the rotation of the node in radians"""
-        old_rot = self.rotation
-        super().set_rotation(rotation)
-        if old_rot != self.rotation:
-            self._mark_transform_dirty()
-    
     def set_rotation_degrees(self, degrees: float):
         """Set the rotation of the node in degrees"""
         self.set_rotation(math.radians(degrees))
@@ -128,13 +109,6 @@ class Node2D(BaseNode2D):
         else:
             self.set_rotation(rotation)
     
-    def set_scale(self, x: float, y: float):
-        """Set the scale of the node"""
-        old_scale = self.scale.copy()
-        super().set_scale(x, y)
-        if old_scale != self.scale:
-            self._mark_transform_dirty()
-    
     def set_global_scale(self, x: float, y: float):
         """Set the global scale of the node"""
         if self.parent and isinstance(self.parent, Node2D):
@@ -4,8 +4,9 @@ AnimatedSprite node implementation for Lupine Engine
 """
 
 from nodes.node2d.Sprite import Sprite
-from typing import Dict, Any, List, Optional
-import time
+from core.sprite_atlas import SpriteFrameAtlas, get_frame_atlas, get_grid_uvs
+from core.animation.animation_lod import get_animation_lod
+from typing import Dict, Any, List, Optional, Tuple
 
 
 class AnimatedSprite(Sprite):
@@ -17,9 +18,14 @@ class AnimatedSprite(Sprite):
     - Multiple animation sequences
     - Configurable frame rate and timing
     - Animation playback control (play, pause, stop)
-    - Loop and one-shot animations
+    - Loop, ping-pong and one-shot animations
     - Frame change signals
     - Animation finished signals
+    - Separate frame images packed into a shared atlas (set_frame_textures)
+
+    The current frame is computed from the time since the animation
+    started, so any delta (hitches, high frame rates, speed changes) lands
+    on the right frame in constant time.
     """
     
     def __init__(self, name: str = "AnimatedSprite"):
@@ -62,6 +68,11 @@ class AnimatedSprite(Sprite):
                 "type": "bool",
                 "value": False,
                 "description": "Whether animation is playing"
+            },
+            "lod_enabled": {
+                "type": "bool",
+                "value": True,
+                "description": "Update less often when small or off-screen"
             }
         })
         
@@ -72,6 +83,8 @@ class AnimatedSprite(Sprite):
         self.frame: int = 0
         self.speed_scale: float = 1.0
         self.playing: bool = False
+        self.lod_enabled: bool = True
+        self.frame_textures: List[str] = []  # Frame images packed into the atlas, if any
         
         # Animation sequences
         self._animations: Dict[str, Dict[str, Any]] = {}
@@ -79,10 +92,14 @@ class AnimatedSprite(Sprite):
         self._default_animation: str = ""
         
         # Playback state
-        self._frame_time: float = 0.0
-        self._animation_time: float = 0.0
-        self._last_frame_time: float = 0.0
+        self._animation_time: float = 0.0  # Seconds into the animation, scaled by speed_scale
+        self._next_frame_time: float = 0.0  # _animation_time at which the frame changes next
+        self._frame_index: int = 0  # Index into the current animation's frame list
+        self._backwards: bool = False
         self._animation_finished: bool = False
+        self._lod_delta: float = 0.0  # Time skipped by LOD, applied on the next update
+        self._lod_cache = None  # [tree version, bound targets, anchors, last level, its view], see AnimationLOD.get_level
+        self._atlas: Optional[SpriteFrameAtlas] = None
         
         # Built-in signals
         self.add_signal("animation_finished")
@@ -94,72 +111,97 @@ class AnimatedSprite(Sprite):
         super()._process(delta)
         
         if self.playing and self._current_animation:
+            lod = get_animation_lod() if self.lod_enabled else None
+            if lod is not None:
+                # Frames are computed from time, so skipped updates land on the right frame later
+                delta = lod.step(self, delta, lod.get_level(self))
+                if delta is None:
+                    return
             self._update_animation(delta)
     
     def _update_animation(self, delta: float):
         """Update the current animation"""
-        if not self._current_animation or self._current_animation not in self._animations:
+        self._animation_time += delta * self.speed_scale
+        if self._animation_time < self._next_frame_time:
             return
         
-        animation = self._animations[self._current_animation]
-        frame_count = len(animation.get("frames", []))
+        animation = self._animations.get(self._current_animation)
+        if animation is None:
+            return
         
+        frames = animation.get("frames", [])
+        frame_count = len(frames)
         if frame_count == 0:
             return
         
-        # Calculate frame duration
         fps = animation.get("fps", 10.0)
-        frame_duration = 1.0 / (fps * self.speed_scale) if fps > 0 else 0.1
-        
-        # Update animation time
-        self._animation_time += delta
-        
-        # Check if we need to advance frame
-        if self._animation_time >= frame_duration:
-            self._animation_time -= frame_duration
-            self._advance_frame()
+        if fps <= 0:
+            fps = 10.0
+        
+        index, finished = self._get_frame_index_at(
+            self._animation_time, fps, frame_count,
+            animation.get("loop", True), animation.get("ping_pong", False))
+        if self._backwards:
+            index = frame_count - 1 - index
+        self._show_frame_index(index, frames)
+        
+        if finished:
+            self.playing = False
+            self._animation_finished = True
+            self.emit_signal("animation_finished", self._current_animation)
+    
+    def _get_frame_index_at(self, time: float, fps: float, frame_count: int,
+                            loop: bool, ping_pong: bool) -> Tuple[int, bool]:
+        """Get (frame index, finished) at a time into an animation, and note when the frame changes next"""
+        step = int(time * fps)  # Frames advanced since the start
+        
+        # Ping-pong plays 0..n-1 then back down to 1 (0 starts the next cycle)
+        cycle = 2 * frame_count - 2 if ping_pong and frame_count > 1 else frame_count
+        if step >= cycle:
+            if not loop:
+                return (0 if cycle != frame_count else frame_count - 1), True
+            # Keep the time bounded; the phase within the cycle is unchanged
+            self._animation_time = time % (cycle / fps)
+            step %= cycle
+        
+        self._next_frame_time = (step + 1) / fps
+        if step >= frame_count:
+            step = cycle - step
+        return step, False
+    
+    def _show_frame_index(self, index: int, frames: List[int]):
+        """Switch to a frame of the current animation"""
+        self._frame_index = index
+        old_frame = self.frame
+        new_frame = frames[index]
+        if old_frame != new_frame:
+            self.frame = new_frame
+            self._update_region_for_frame()
+            self.emit_signal("frame_changed", old_frame, new_frame)
     
     def _advance_frame(self):
         """Advance to the next frame"""
-        if not self._current_animation or self._current_animation not in self._animations:
+        animation = self._animations.get(self._current_animation)
+        if animation is None:
             return
         
-        animation = self._animations[self._current_animation]
-        frames = animation.get("frames", [])
-        
-        if not frames:
-            return
-        
-        current_index = 0
-        try:
-            current_index = frames.index(self.frame)
-        except ValueError:
-            current_index = 0
-        
-        # Advance to next frame
-        next_index = current_index + 1
-        
-        # Handle looping
-        if next_index >= len(frames):
-            if animation.get("loop", True):
-                next_index = 0
-            else:
-                # Animation finished
-                self.playing = False
-                self._animation_finished = True
-                self.emit_signal("animation_finished", self._current_animation)
-                return
-        
-        # Set new frame
-        old_frame = self.frame
-        self.frame = frames[next_index]
-        
-        if old_frame != self.frame:
-            self._update_region_for_frame()
-            self.emit_signal("frame_changed", old_frame, self.frame)
+        # Skip to the start of the next frame
+        fps = animation.get("fps", 10.0)
+        if fps <= 0:
+            fps = 10.0
+        self._animation_time = (int(self._animation_time * fps) + 1) / fps
+        self._next_frame_time = 0.0
+        self._update_animation(0.0)
     
     def _update_region_for_frame(self):
         """Update texture region based on current frame"""
+        atlas = self._atlas
+        if atlas is not None:
+            if 0 <= self.frame < len(atlas.regions):
+                self.region_enabled = True
+                self.region_rect = list(atlas.regions[self.frame])
+            return
+        
         if not self._texture_loaded or self.frames <= 1:
             return
         
@@ -175,13 +217,61 @@ class AnimatedSprite(Sprite):
         self.region_enabled = True
         self.region_rect = [frame_x, frame_y, frame_width, frame_height]
     
-    def add_animation(self, name: str, frames: List[int], fps: float = 10.0, loop: bool = True):
-        """Add an animation sequence"""
+    def get_frame_uv(self) -> Optional[Tuple[float, float, float, float]]:
+        """Get the normalized texture rectangle of the current frame, or None to draw the whole texture"""
+        if self._atlas is not None:
+            uvs = self._atlas.uvs
+        elif self.hframes * self.vframes > 1:
+            uvs = get_grid_uvs(self.hframes, self.vframes)
+        else:
+            return None
+        return uvs[self.frame] if 0 <= self.frame < len(uvs) else None
+    
+    def get_atlas(self) -> Optional[SpriteFrameAtlas]:
+        """Get the frame atlas in use, if any"""
+        return self._atlas
+    
+    def set_frame_textures(self, texture_paths: List[str]) -> bool:
+        """
+        Use separate images as frames. They are packed into an atlas shared
+        with every sprite using the same images; animation frame numbers
+        index into texture_paths.
+        """
+        self.frame_textures = list(texture_paths)
+        self._atlas = get_frame_atlas(self.frame_textures) if self.frame_textures else None
+        if self._atlas is None:
+            if self.texture.startswith("atlas://"):
+                self.texture = ""
+            self._load_texture()
+            return not self.frame_textures
+        
+        self.texture = self._atlas.key
+        self._load_texture()
+        self.frames = self._atlas.get_frame_count()
+        self.frame = min(self.frame, self.frames - 1)
+        self._update_region_for_frame()
+        return True
+    
+    def _load_texture(self):
+        """Load texture information, using the atlas size when the texture is the frame atlas"""
+        atlas = self._atlas
+        if atlas is not None and self.texture == atlas.key:
+            self._texture_loaded = True
+            self._texture_size = [atlas.width, atlas.height]
+            return
+        super()._load_texture()
+    
+    def add_animation(self, name: str, frames: List[int], fps: float = 10.0, loop: bool = True,
+                      ping_pong: bool = False):
+        """Add an animation sequence; ping_pong plays it forward then backward"""
         self._animations[name] = {
             "frames": frames.copy(),
             "fps": fps,
-            "loop": loop
+            "loop": loop,
+            "ping_pong": ping_pong
         }
+        if name == self._current_animation:
+            self._next_frame_time = 0.0
         
         if not self._default_animation:
             self._default_animation = name
@@ -217,6 +307,9 @@ class AnimatedSprite(Sprite):
         self._current_animation = name
         self.playing = True
         self._animation_time = 0.0
+        self._next_frame_time = 0.0
+        self._lod_delta = 0.0
+        self._backwards = backwards
         self._animation_finished = False
         
         # Set to first frame
@@ -224,10 +317,8 @@ class AnimatedSprite(Sprite):
         frames = animation.get("frames", [])
         
         if frames:
-            if backwards:
-                self.frame = frames[-1]
-            else:
-                self.frame = frames[0]
+            self._frame_index = len(frames) - 1 if backwards else 0
+            self.frame = frames[self._frame_index]
             self._update_region_for_frame()
         
         if old_animation != name:
@@ -238,6 +329,8 @@ class AnimatedSprite(Sprite):
         self.playing = False
         self._current_animation = ""
         self._animation_time = 0.0
+        self._next_frame_time = 0.0
+        self._frame_index = 0
         self._animation_finished = False
     
     def pause(self):
@@ -306,6 +399,18 @@ class AnimatedSprite(Sprite):
         """Get the animation speed scale"""
         return self.speed_scale
     
+    def seek(self, time: float):
+        """Jump to a time (in seconds at speed_scale 1) in the current animation"""
+        if self._current_animation in self._animations:
+            self._animation_time = max(0.0, time)
+            self._next_frame_time = 0.0
+            self._animation_finished = False
+            self._update_animation(0.0)
+    
+    def get_animation_time(self) -> float:
+        """Get the time into the current animation"""
+        return self._animation_time
+    
     def is_animation_finished(self) -> bool:
         """Check if the current animation has finished"""
         return self._animation_finished
@@ -320,6 +425,7 @@ class AnimatedSprite(Sprite):
         """Set the FPS of an animation"""
         if name in self._animations:
             self._animations[name]["fps"] = max(0.1, fps)
+            self._next_frame_time = 0.0
     
     def is_animation_looping(self, name: str) -> bool:
         """Check if an animation is set to loop"""
@@ -331,7 +437,26 @@ class AnimatedSprite(Sprite):
         """Set whether an animation should loop"""
         if name in self._animations:
             self._animations[name]["loop"] = loop
+            self._next_frame_time = 0.0
     
+    def is_animation_ping_pong(self, name: str) -> bool:
+        """Check if an animation plays forward then backward"""
+        if name in self._animations:
+            return self._animations[name].get("ping_pong", False)
+        return False
+    
+    def set_animation_ping_pong(self, name: str, ping_pong: bool):
+        """Set whether an animation plays forward then backward"""
+        if name in self._animations:
+            self._animations[name]["ping_pong"] = ping_pong
+            self._next_frame_time = 0.0
+    
+    def _duplicate_state(self, clone, flags: int):
+        """A copy measures its own LOD anchors"""
+        super()._duplicate_state(clone, flags)
+        clone._lod_delta = 0.0
+        clone._lod_cache = None
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
         data = super().to_dict()
@@ -342,10 +467,14 @@ class AnimatedSprite(Sprite):
             "frame": self.frame,
             "speed_scale": self.speed_scale,
             "playing": self.playing,
+            "lod_enabled": self.lod_enabled,
+            "frame_textures": list(self.frame_textures),
             "_animations": self._animations.copy(),
             "_current_animation": self._current_animation,
             "_default_animation": self._default_animation
         })
+        if self._atlas is not None:
+            data["texture"] = ""  # The atlas is rebuilt from frame_textures
         return data
     
     @classmethod
@@ -380,12 +509,15 @@ class AnimatedSprite(Sprite):
         sprite.frame = data.get("frame", 0)
         sprite.speed_scale = data.get("speed_scale", 1.0)
         sprite.playing = data.get("playing", False)
+        sprite.lod_enabled = data.get("lod_enabled", True)
         sprite._animations = data.get("_animations", {})
         sprite._current_animation = data.get("_current_animation", "")
         sprite._default_animation = data.get("_default_animation", "")
         
         # Load texture if specified
-        if sprite.texture:
+        if data.get("frame_textures"):
+            sprite.set_frame_textures(data["frame_textures"])
+        elif sprite.texture:
             sprite._load_texture()
             sprite._update_region_for_frame()
         
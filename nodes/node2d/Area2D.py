@@ -83,17 +83,18 @@ class Area2D(Node2D):
         self.add_signal("area_entered")
         self.add_signal("area_exited")
 
-        # Internal tracking of overlapping bodies and areas
-        self._overlapping_bodies: List['Node2D'] = []
-        self._overlapping_areas: List['Area2D'] = []
+        # Internal tracking of overlapping bodies and areas (insertion-ordered sets,
+        # kept up to date by the physics world's area collision handlers)
+        self._overlapping_bodies: Dict['Node2D', None] = {}
+        self._overlapping_areas: Dict['Area2D', None] = {}
 
     def get_overlapping_bodies(self) -> List['Node2D']:
         """Get list of bodies currently overlapping this area"""
-        return self._overlapping_bodies.copy()
+        return list(self._overlapping_bodies)
 
     def get_overlapping_areas(self) -> List['Area2D']:
         """Get list of areas currently overlapping this area"""
-        return self._overlapping_areas.copy()
+        return list(self._overlapping_areas)
 
     def overlaps_body(self, body: 'Node2D') -> bool:
         """Check if a specific body is overlapping this area"""
@@ -106,25 +107,25 @@ class Area2D(Node2D):
     def _on_body_entered(self, body: 'Node2D'):
         """Internal method called when a body enters the area"""
         if body not in self._overlapping_bodies:
-            self._overlapping_bodies.append(body)
+            self._overlapping_bodies[body] = None
             self.emit_signal("body_entered", body)
 
     def _on_body_exited(self, body: 'Node2D'):
         """Internal method called when a body exits the area"""
         if body in self._overlapping_bodies:
-            self._overlapping_bodies.remove(body)
+            del self._overlapping_bodies[body]
             self.emit_signal("body_exited", body)
 
     def _on_area_entered(self, area: 'Area2D'):
         """Internal method called when an area enters this area"""
         if area not in self._overlapping_areas:
-            self._overlapping_areas.append(area)
+            self._overlapping_areas[area] = None
             self.emit_signal("area_entered", area)
 
     def _on_area_exited(self, area: 'Area2D'):
         """Internal method called when an area exits this area"""
         if area in self._overlapping_areas:
-            self._overlapping_areas.remove(area)
+            del self._overlapping_areas[area]
             self.emit_signal("area_exited", area)
 
     def set_monitoring(self, enabled: bool):
@@ -143,6 +144,12 @@ class Area2D(Node2D):
         """Check if this area can be monitored"""
         return self.monitorable
 
+    def _duplicate_state(self, clone, flags: int):
+        """A copy starts with no overlaps; the physics world reports them once it is added"""
+        super()._duplicate_state(clone, flags)
+        clone._overlapping_bodies = {}
+        clone._overlapping_areas = {}
+
     def to_dict(self) -> Dict[str, Any]:
         """Serialize Area2D to a dictionary."""
         data = super().to_dict()
@@ -4,8 +4,11 @@ Manually-controlled physics body (move_and_collide, move_and_slide)
 """
 
 from nodes.base.Node2D import Node2D
+from core.engine_log import get_logger
 from typing import Dict, Any, List, Optional
 
+log = get_logger("kinematic")
+
 
 class KinematicBody2D(Node2D):
     """
@@ -93,7 +96,7 @@ class KinematicBody2D(Node2D):
         Move the body and slide along collisions.
         Returns the remaining velocity after collisions.
         """
-        print(f"[KINEMATIC] move_and_slide called with velocity: {velocity}, floor_normal: {floor_normal}")
+        log.debug("move_and_slide called with velocity: %s, floor_normal: %s", velocity, floor_normal)
 
         self._velocity = velocity.copy()
 
@@ -104,7 +107,7 @@ class KinematicBody2D(Node2D):
         # Get physics world from scene
         physics_world = self._get_physics_world()
         if not physics_world:
-            print(f"[KINEMATIC] No physics world found, using fallback movement")
+            log.debug("No physics world found, using fallback movement")
             # Fallback to simple movement
             delta_x = velocity[0] * (1.0/60.0)
             delta_y = velocity[1] * (1.0/60.0)
@@ -114,14 +117,14 @@ class KinematicBody2D(Node2D):
         # Get our physics body by node reference
         physics_body = physics_world.get_body_by_node(self)
         if not physics_body:
-            print(f"[KINEMATIC] No physics body found for {self.name}, using fallback movement")
+            log.debug("No physics body found for %s, using fallback movement", self.name)
             # Fallback to simple movement if no physics body
             delta_x = velocity[0] * (1.0/60.0)
             delta_y = velocity[1] * (1.0/60.0)
             self.translate(delta_x, delta_y)
             return velocity.copy()
 
-        print(f"[KINEMATIC] Found physics body for {self.name}")
+        log.debug("Found physics body for %s", self.name)
 
         # Update physics body position to match node position
         physics_body.update_physics_from_node()
@@ -132,7 +135,7 @@ class KinematicBody2D(Node2D):
 
         # If movement is very small, just allow it without collision checking
         if abs(move_delta[0]) < 0.1 and abs(move_delta[1]) < 0.1:
-            print(f"[KINEMATIC] Very small movement {move_delta}, allowing without collision check")
+            log.debug("Very small movement %s, allowing without collision check", move_delta)
             self.translate(move_delta[0], move_delta[1])
             physics_body.update_physics_from_node()
             return velocity.copy()
@@ -141,7 +144,7 @@ class KinematicBody2D(Node2D):
         if abs(move_delta[0]) > 0.01 or abs(move_delta[1]) > 0.01:
             self._last_motion = move_delta.copy()
 
-        print(f"[KINEMATIC] Calling _test_move with delta: {move_delta}")
+        log.debug("Calling _test_move with delta: %s", move_delta)
         # Try to move and check for collisions using shape casting
         collision_result = self._test_move(physics_body, move_delta, physics_world)
 
@@ -159,7 +162,7 @@ class KinematicBody2D(Node2D):
             if isinstance(collision_point, tuple):
                 collision_point = list(collision_point)
 
-            print(f"[KINEMATIC] Collision: normal={normal}, point={collision_point}, distance={distance}")
+            log.debug("Collision: normal=%s, point=%s, distance=%s", normal, collision_point, distance)
 
             # Update collision state based on normal direction
             self._update_collision_state(normal)
@@ -172,7 +175,7 @@ class KinematicBody2D(Node2D):
             # Positive dot product means moving away from collision (same direction as normal)
             # Negative dot product means moving into collision (opposite direction to normal)
             if dot_product < -0.001:
-                print(f"[KINEMATIC] Collision blocking movement: dot_product={dot_product:.3f}")
+                log.debug("Collision blocking movement: dot_product=%.3f", dot_product)
 
                 # Calculate slide velocity by removing the normal component
                 slide_velocity = [
@@ -180,23 +183,23 @@ class KinematicBody2D(Node2D):
                     velocity[1] - dot_product * normal[1]
                 ]
 
-                print(f"[KINEMATIC] Original velocity: {velocity}, Slide velocity: {slide_velocity}")
+                log.debug("Original velocity: %s, Slide velocity: %s", velocity, slide_velocity)
 
                 # Apply slide movement - this allows perpendicular movement
                 slide_delta = [slide_velocity[0] * (1.0/60.0), slide_velocity[1] * (1.0/60.0)]
 
                 # Only apply slide movement if it's significant
                 if abs(slide_delta[0]) > 0.01 or abs(slide_delta[1]) > 0.01:
-                    print(f"[KINEMATIC] Applying slide movement: {slide_delta}")
+                    log.debug("Applying slide movement: %s", slide_delta)
                     self.translate(slide_delta[0], slide_delta[1])
                     physics_body.update_physics_from_node()
                     return slide_velocity
                 else:
-                    print(f"[KINEMATIC] No significant slide movement, stopping")
+                    log.debug("No significant slide movement, stopping")
                     physics_body.update_physics_from_node()
                     return [0.0, 0.0]
             else:
-                print(f"[KINEMATIC] Collision detected but not blocking movement (dot_product={dot_product:.3f})")
+                log.debug("Collision detected but not blocking movement (dot_product=%.3f)", dot_product)
                 # We're moving away from the collision (positive dot product) or parallel to it, allow full movement
                 self.translate(move_delta[0], move_delta[1])
                 physics_body.update_physics_from_node()
@@ -219,7 +222,7 @@ class KinematicBody2D(Node2D):
         current_pos = physics_body.pymunk_body.position
         target_pos = (current_pos[0] + move_delta[0], current_pos[1] + move_delta[1])
 
-        print(f"[KINEMATIC] Testing move from {current_pos} to {target_pos}, delta: {move_delta}")
+        log.debug("Testing move from %s to %s, delta: %s", current_pos, target_pos, move_delta)
 
         # Get the collision shape size for shape casting
         shape_size = (32.0, 32.0)  # Default size, should get from actual collision shape
@@ -235,15 +238,15 @@ class KinematicBody2D(Node2D):
                     min_y = min(v.y for v in vertices)
                     max_y = max(v.y for v in vertices)
                     shape_size = (abs(max_x - min_x), abs(max_y - min_y))
-                    print(f"[KINEMATIC] Using shape size: {shape_size}")
+                    log.debug("Using shape size: %s", shape_size)
             elif hasattr(shape, 'radius'):
                 # Circle shape
                 radius = shape.radius
                 shape_size = (radius * 2, radius * 2)
-                print(f"[KINEMATIC] Using circle shape size: {shape_size}")
+                log.debug("Using circle shape size: %s", shape_size)
 
         # Log shape size for debugging but don't override - collision shapes can be legitimately large
-        print(f"[KINEMATIC] Using collision shape size: {shape_size}")
+        log.debug("Using collision shape size: %s", shape_size)
 
         # Special case: if we're only moving horizontally and the movement is small,
         # start the shape cast from a slightly offset position to avoid immediate overlap detection
@@ -252,7 +255,7 @@ class KinematicBody2D(Node2D):
             # For horizontal movement, start the cast from slightly above current position
             start_pos = (current_pos[0], current_pos[1] - 2.0)
             target_pos = (start_pos[0] + move_delta[0], start_pos[1])
-            print(f"[KINEMATIC] Horizontal movement detected, using offset start: {start_pos}")
+            log.debug("Horizontal movement detected, using offset start: %s", start_pos)
 
         # Use shape cast instead of simple raycast to account for body size
         # Exclude our own physics body from collision detection
@@ -266,7 +269,7 @@ class KinematicBody2D(Node2D):
         )
 
         if hit:
-            print(f"[KINEMATIC] Shape cast hit detected: {hit}")
+            log.debug("Shape cast hit detected: %s", hit)
             return {
                 'distance': hit['distance'],
                 'normal': hit['normal'],
@@ -274,7 +277,7 @@ class KinematicBody2D(Node2D):
                 'body': hit['body']
             }
         else:
-            print(f"[KINEMATIC] No shape cast hit detected")
+            log.debug("No shape cast hit detected")
 
         return None
 
@@ -284,7 +287,7 @@ class KinematicBody2D(Node2D):
             # Try to get physics world from global game engine
             from core.game_engine import get_global_game_engine
             game_engine = get_global_game_engine()
-            print(f"[KINEMATIC] Game engine: {game_engine}")
+            log.debug("Game engine: %s", game_engine)
 
             if game_engine:
                 # Try multiple access patterns for physics world
@@ -293,22 +296,22 @@ class KinematicBody2D(Node2D):
                 # Method 1: Direct access to physics_world
                 if hasattr(game_engine, 'physics_world') and game_engine.physics_world:
                     physics_world = game_engine.physics_world
-                    print(f"[KINEMATIC] Found physics_world directly: {physics_world}")
+                    log.debug("Found physics_world directly: %s", physics_world)
 
                 # Method 2: Through systems.physics_world
                 elif hasattr(game_engine, 'systems') and hasattr(game_engine.systems, 'physics_world') and game_engine.systems.physics_world:
                     physics_world = game_engine.systems.physics_world
-                    print(f"[KINEMATIC] Found physics_world in systems: {physics_world}")
+                    log.debug("Found physics_world in systems: %s", physics_world)
 
                 if physics_world:
                     return physics_world
                 else:
-                    print(f"[KINEMATIC] No physics_world found in game engine")
+                    log.debug("No physics_world found in game engine")
             else:
-                print(f"[KINEMATIC] No global game engine found")
+                log.debug("No global game engine found")
 
         except Exception as e:
-            print(f"[KINEMATIC] Exception getting physics world from game engine: {e}")
+            log.error("Exception getting physics world from game engine: %s", e)
             import traceback
             traceback.print_exc()
 
@@ -333,20 +336,20 @@ class KinematicBody2D(Node2D):
                 shape_size = (radius * 2, radius * 2)
 
         # Log shape size for debugging but don't override - collision shapes can be legitimately large
-        print(f"[KINEMATIC] _get_shape_size returning: {shape_size}")
+        log.debug("_get_shape_size returning: %s", shape_size)
 
         return shape_size
 
     def _emergency_escape(self, physics_body, physics_world):
         """Emergency escape mechanism - move backwards from last motion with small distance"""
-        print(f"[KINEMATIC] Executing emergency escape")
+        log.debug("Executing emergency escape")
 
         current_pos = physics_body.pymunk_body.position
         original_node_pos = self.position.copy()
         shape_size = self._get_shape_size(physics_body)
 
-        print(f"[KINEMATIC] Emergency escape: current_pos={current_pos}, node_pos={original_node_pos}")
-        print(f"[KINEMATIC] Last motion was: {self._last_motion}")
+        log.debug("Emergency escape: current_pos=%s, node_pos=%s", current_pos, original_node_pos)
+        log.debug("Last motion was: %s", self._last_motion)
 
         # First try: move backwards from last motion (inverse direction)
         if abs(self._last_motion[0]) > 0.01 or abs(self._last_motion[1]) > 0.01:
@@ -357,11 +360,11 @@ class KinematicBody2D(Node2D):
                 -self._last_motion[1] / max(abs(self._last_motion[0]), abs(self._last_motion[1])) * backwards_distance
             ]
 
-            print(f"[KINEMATIC] Trying backwards escape: {backwards_move}")
+            log.debug("Trying backwards escape: %s", backwards_move)
             test_result = self._test_move(physics_body, backwards_move, physics_world)
             if not test_result:
                 self.translate(backwards_move[0], backwards_move[1])
-                print(f"[KINEMATIC] Backwards emergency escape successful: moved {backwards_move}")
+                log.debug("Backwards emergency escape successful: moved %s", backwards_move)
                 return
 
         # Second try: small movements in cardinal directions
@@ -377,13 +380,13 @@ class KinematicBody2D(Node2D):
             test_result = self._test_move(physics_body, direction, physics_world)
             if not test_result:
                 self.translate(direction[0], direction[1])
-                print(f"[KINEMATIC] Cardinal direction escape successful: moved {direction}")
+                log.debug("Cardinal direction escape successful: moved %s", direction)
                 return
 
         # Final fallback: tiny upward movement
         emergency_move = [0.0, -escape_distance]
         self.translate(emergency_move[0], emergency_move[1])
-        print(f"[KINEMATIC] Emergency escape fallback: moved {emergency_move} from {original_node_pos} to {self.position}")
+        log.debug("Emergency escape fallback: moved %s from %s to %s", emergency_move, original_node_pos, self.position)
 
     def _update_collision_state(self, normal: List[float]):
         """Update collision state based on collision normal"""
@@ -407,17 +410,17 @@ class KinematicBody2D(Node2D):
             self._collision_state['on_floor'] = True
             self._collision_state['floor_normal'] = normal.copy()
             self._collision_state['last_floor_time'] = current_time
-            print(f"[KINEMATIC] Floor collision detected: normal={normal}")
+            log.debug("Floor collision detected: normal=%s", normal)
         elif normal[1] < -math.cos(max_angle_rad):  # Ceiling collision
             self._collision_state['on_ceiling'] = True
             self._collision_state['ceiling_normal'] = normal.copy()
             self._collision_state['last_ceiling_time'] = current_time
-            print(f"[KINEMATIC] Ceiling collision detected: normal={normal}")
+            log.debug("Ceiling collision detected: normal=%s", normal)
         else:  # Wall collision (more horizontal than vertical)
             self._collision_state['on_wall'] = True
             self._collision_state['wall_normal'] = normal.copy()
             self._collision_state['last_wall_time'] = current_time
-            print(f"[KINEMATIC] Wall collision detected: normal={normal}")
+            log.debug("Wall collision detected: normal=%s", normal)
 
     def _clear_collision_state(self):
         """Clear collision state when no collision occurs"""
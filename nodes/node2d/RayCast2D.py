@@ -142,6 +142,14 @@ class RayCast2D(Node2D):
         # In a full implementation, clear exclusion list
         pass
 
+    def _duplicate_state(self, clone, flags: int):
+        """A copy starts without hit info"""
+        super()._duplicate_state(clone, flags)
+        clone._is_colliding = False
+        clone._collision_point = [0.0, 0.0]
+        clone._collision_normal = [0.0, 0.0]
+        clone._collider = None
+
     def to_dict(self) -> Dict[str, Any]:
         """Serialize RayCast2D to a dictionary."""
         data = super().to_dict()
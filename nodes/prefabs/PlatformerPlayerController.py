@@ -407,6 +407,13 @@ class PlatformerPlayerController(KinematicBody2D):
         """Get the sprite child node"""
         return self._sprite
 
+    def _duplicate_state(self, clone, flags: int):
+        """Child references are looked up again on the copy's own children in _ready"""
+        super()._duplicate_state(clone, flags)
+        clone._collision_shape = None
+        clone._interaction_area = None
+        clone._sprite = None
+
     def to_dict(self) -> Dict[str, Any]:
         """Serialize PlatformerPlayerController to a dictionary"""
         data = super().to_dict()
@@ -286,6 +286,13 @@ class TopDown8DirPlayerController(KinematicBody2D):
         direction = int((degrees + 22.5) / 45) % 8
         return direction
 
+    def _duplicate_state(self, clone, flags: int):
+        """Child references are looked up again on the copy's own children in _ready"""
+        super()._duplicate_state(clone, flags)
+        clone._collision_shape = None
+        clone._interaction_area = None
+        clone._sprite = None
+
     def to_dict(self) -> Dict[str, Any]:
         """Serialize TopDown8DirPlayerController to a dictionary"""
         data = super().to_dict()
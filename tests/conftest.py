@@ -0,0 +1,9 @@
+"""
+Test configuration for Lupine Engine
+Puts the engine root on the import path so tests import core and nodes directly
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,90 @@
+"""
+Tests for time-based AnimatedSprite frames
+"""
+
+import random
+
+import pytest
+
+from core.scene.base_node import Node
+from nodes.node2d.AnimatedSprite import AnimatedSprite
+
+RUN_FRAMES = [8, 9, 10, 11, 12, 13, 14, 15]
+
+
+def _sprite(fps, loop=True, ping_pong=False, backwards=False):
+    sprite = AnimatedSprite("Runner")
+    sprite.lod_enabled = False
+    sprite.hframes = 8
+    sprite.vframes = 2
+    sprite.frames = 16
+    sprite.add_animation("run", RUN_FRAMES, fps=fps, loop=loop, ping_pong=ping_pong)
+    sprite.play("run", backwards)
+    return sprite
+
+
+class _Listener(Node):
+    def __init__(self):
+        super().__init__("Listener")
+        self.finished = []
+
+    def on_finished(self, name):
+        self.finished.append(name)
+
+
+def _on_boundary(elapsed, fps):
+    """Whether elapsed lands on a frame change, where rounding may pick either frame"""
+    steps = elapsed * fps
+    return abs(steps - round(steps)) < 1e-6
+
+
+def _random_deltas(seed, count=400):
+    """Mixed refresh rates with occasional long hitches"""
+    rng = random.Random(seed)
+    return [rng.choice([1 / 240, 1 / 144, 1 / 60, 1 / 30]) if rng.random() > 0.05 else rng.uniform(0.1, 0.5)
+            for _ in range(count)]
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("fps", [7.0, 12.0, 24.0, 60.0])
+def test_looping_frame_follows_elapsed_time(seed, fps):
+    sprite = _sprite(fps)
+    elapsed = 0.0
+    for delta in _random_deltas(seed):
+        sprite._process(delta)
+        elapsed += delta
+        if not _on_boundary(elapsed, fps):
+            assert sprite.frame == RUN_FRAMES[int(elapsed * fps) % len(RUN_FRAMES)]
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_ping_pong_and_backwards(seed):
+    fps = 15.0
+    forward = _sprite(fps, ping_pong=True)
+    backward = _sprite(fps, backwards=True)
+    cycle = [0, 1, 2, 3, 4, 5, 6, 7, 6, 5, 4, 3, 2, 1]
+    elapsed = 0.0
+    for delta in _random_deltas(seed):
+        forward._process(delta)
+        backward._process(delta)
+        elapsed += delta
+        if _on_boundary(elapsed, fps):
+            continue
+        step = int(elapsed * fps)
+        assert forward.frame == RUN_FRAMES[cycle[step % len(cycle)]]
+        assert backward.frame == RUN_FRAMES[len(RUN_FRAMES) - 1 - step % len(RUN_FRAMES)]
+
+
+def test_one_shot_stops_on_last_frame():
+    sprite = _sprite(12.0, loop=False)
+    listener = _Listener()
+    sprite.connect("animation_finished", listener, "on_finished")
+    elapsed = 0.0
+    for delta in _random_deltas(11):
+        sprite._process(delta)
+        elapsed += delta
+        if elapsed * 12.0 < len(RUN_FRAMES) and not _on_boundary(elapsed, 12.0):
+            assert sprite.frame == RUN_FRAMES[int(elapsed * 12.0)]
+    assert sprite.frame == RUN_FRAMES[-1]
+    assert not sprite.playing
+    assert listener.finished == ["run"]
@@ -0,0 +1,73 @@
+"""
+Tests for the animation LOD
+"""
+
+from core.animation import Animation
+from core.animation.animation_lod import AnimationLOD, set_animation_lod
+from core.animation.animation_track import ColorTrack, TransformTrack
+from core.scene.node2d import Node2D
+from nodes.base.AnimationPlayer import AnimationPlayer
+
+
+def _build_slide_in():
+    """A panel that slides from far off-screen to the origin while fading in"""
+    root = Node2D("Root")
+    panel = Node2D("Panel")
+    panel.position = [-5000.0, 0.0]
+    panel.modulate = [1.0, 1.0, 1.0, 0.0]
+    root.add_child(panel)
+
+    animation = Animation("slide_in")
+    animation.length = 1.0
+    slide = TransformTrack("Panel", "position")
+    slide.add_keyframe(0.0, [-5000.0, 0.0])
+    slide.add_keyframe(1.0, [0.0, 0.0])
+    animation.add_track(slide)
+    fade = ColorTrack("Panel", "modulate")
+    fade.add_keyframe(0.0, [1.0, 1.0, 1.0, 0.0])
+    fade.add_keyframe(1.0, [1.0, 1.0, 1.0, 1.0])
+    animation.add_track(fade)
+
+    player = AnimationPlayer("Player")
+    player.add_animation(animation)
+    root.add_child(player)
+    return root, panel, player
+
+
+def _run_frames(player, lod, frames, delta=1.0 / 60.0):
+    for _ in range(frames):
+        lod.begin_frame()
+        player._process(delta)
+
+
+def test_offscreen_slide_in_reaches_view():
+    lod = AnimationLOD()
+    lod.set_view(-640, -360, 1280, 720)
+    set_animation_lod(lod)
+    try:
+        root, panel, player = _build_slide_in()
+        player.play("slide_in")
+        _run_frames(player, lod, 120)
+
+        assert not player.is_playing()
+        assert list(panel.position) == [0.0, 0.0]
+        # The fade, paused while off-screen, is at its final value once the animation finished
+        assert list(panel.modulate) == [1.0, 1.0, 1.0, 1.0]
+    finally:
+        set_animation_lod(None)
+
+
+def test_offscreen_pauses_non_transform_tracks():
+    lod = AnimationLOD()
+    lod.set_view(-640, -360, 1280, 720)
+    set_animation_lod(lod)
+    try:
+        root, panel, player = _build_slide_in()
+        player.play("slide_in")
+        _run_frames(player, lod, 6)
+
+        # Still far off-screen: the slide runs, the fade waits
+        assert panel.position[0] > -5000.0
+        assert list(panel.modulate) == [1.0, 1.0, 1.0, 0.0]
+    finally:
+        set_animation_lod(None)
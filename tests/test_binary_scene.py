@@ -0,0 +1,51 @@
+"""
+Tests for the binary scene format
+"""
+
+import json
+import os
+
+import pytest
+
+from core.scene.binary_scene import (BinarySceneError, BinarySceneReader, get_binary_scene_path,
+                                     load_scene_data, save_binary_scene)
+
+
+def _scene_data():
+    nodes = [{"name": f"Node{i}", "type": "Node2D", "position": [float(i), 2.0], "properties": {"tag": "é"},
+              "children": [{"name": "Child", "type": "Sprite", "texture": "assets/a.png", "children": []}]}
+             for i in range(20)]
+    return {"name": "Level", "nodes": nodes}
+
+
+def _write_scene(tmp_path):
+    scene_path = tmp_path / "level.scene"
+    with open(scene_path, "w", encoding="utf-8") as f:
+        json.dump(_scene_data(), f)
+    binary_path = get_binary_scene_path(scene_path)
+    save_binary_scene(_scene_data(), binary_path)
+    return scene_path, binary_path
+
+
+def test_round_trip(tmp_path):
+    scene_path, _ = _write_scene(tmp_path)
+    assert load_scene_data(scene_path) == _scene_data()
+
+
+@pytest.mark.parametrize("fraction", [0.05, 0.3, 0.5, 0.8, 0.99])
+def test_truncated_binary_falls_back_to_json(tmp_path, fraction):
+    scene_path, binary_path = _write_scene(tmp_path)
+    data = binary_path.read_bytes()
+    binary_path.write_bytes(data[:int(len(data) * fraction)])
+    # Keep the truncated copy newer than the JSON so it is preferred
+    stat = os.stat(scene_path)
+    os.utime(binary_path, (stat.st_atime, stat.st_mtime + 10))
+
+    assert load_scene_data(scene_path) == _scene_data()
+
+
+def test_reader_rejects_truncated_tables(tmp_path):
+    _, binary_path = _write_scene(tmp_path)
+    data = binary_path.read_bytes()
+    with pytest.raises(BinarySceneError):
+        BinarySceneReader(data[:64])
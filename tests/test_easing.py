@@ -0,0 +1,84 @@
+"""
+Tests for the tween easing tables and LUTs
+"""
+
+import math
+
+import pytest
+
+from core.animation.tween import EaseType, Tween, TweenType, get_easing_function
+
+PROGRESS = [i / 997.0 for i in range(998)] + [(i * 0.618034) % 1.0 for i in range(3000)]
+
+# Worst absolute LUT error allowed per curve (1024 entries, linear interpolation)
+LUT_TOLERANCE = {TweenType.BOUNCE: 2.5e-3, TweenType.ELASTIC: 1.5e-3}
+
+
+def _analytic_ease(p, ease_type):
+    if ease_type == EaseType.IN:
+        return p * p
+    if ease_type == EaseType.OUT:
+        return 1.0 - (1.0 - p) * (1.0 - p)
+    if ease_type == EaseType.IN_OUT:
+        return 2.0 * p * p if p < 0.5 else 1.0 - 2.0 * (1.0 - p) * (1.0 - p)
+    if ease_type == EaseType.OUT_IN:
+        if p < 0.5:
+            return 0.5 * (1.0 - (1.0 - 2.0 * p) * (1.0 - 2.0 * p))
+        return 0.5 + 0.5 * (2.0 * p - 1.0) * (2.0 * p - 1.0)
+    return p
+
+
+def _analytic_curve(p, tween_type):
+    if tween_type == TweenType.SMOOTH:
+        return p * p * (3.0 - 2.0 * p)
+    if tween_type == TweenType.SMOOTHER:
+        return p * p * p * (p * (p * 6.0 - 15.0) + 10.0)
+    if tween_type == TweenType.SPRING:
+        return 1.0 - math.cos(p * math.pi * 0.5)
+    if tween_type == TweenType.BOUNCE:
+        if p < 1.0 / 2.75:
+            return 7.5625 * p * p
+        if p < 2.0 / 2.75:
+            p -= 1.5 / 2.75
+            return 7.5625 * p * p + 0.75
+        if p < 2.5 / 2.75:
+            p -= 2.25 / 2.75
+            return 7.5625 * p * p + 0.9375
+        p -= 2.625 / 2.75
+        return 7.5625 * p * p + 0.984375
+    if tween_type == TweenType.ELASTIC:
+        if p == 0.0 or p == 1.0:
+            return p
+        return -(2.0 ** (10.0 * (p - 1.0))) * math.sin((p - 1.1) * 5.0 * math.pi)
+    return p
+
+
+def _analytic(p, tween_type, ease_type):
+    if tween_type == TweenType.LINEAR:
+        return p
+    return _analytic_curve(_analytic_ease(p, ease_type), tween_type)
+
+
+@pytest.mark.parametrize("tween_type", list(TweenType))
+@pytest.mark.parametrize("ease_type", list(EaseType))
+def test_dispatch_matches_analytic(tween_type, ease_type):
+    function = get_easing_function(tween_type, ease_type)
+    for p in PROGRESS:
+        assert function(p) == pytest.approx(_analytic(p, tween_type, ease_type), abs=1e-12)
+
+
+@pytest.mark.parametrize("tween_type", list(TweenType))
+@pytest.mark.parametrize("ease_type", list(EaseType))
+def test_lut_within_tolerance(tween_type, ease_type):
+    function = get_easing_function(tween_type, ease_type, True)
+    tolerance = LUT_TOLERANCE.get(tween_type, 1e-12)
+    worst = max(abs(function(p) - _analytic(p, tween_type, ease_type)) for p in PROGRESS)
+    assert worst <= tolerance
+    assert function(0.0) == pytest.approx(_analytic(0.0, tween_type, ease_type), abs=1e-12)
+    assert function(1.0) == pytest.approx(_analytic(1.0, tween_type, ease_type), abs=1e-12)
+
+
+def test_interpolate_uses_the_same_curves():
+    for p in PROGRESS[:200]:
+        expected = 10.0 * _analytic(p, TweenType.ELASTIC, EaseType.OUT)
+        assert Tween.interpolate(0.0, 10.0, p, TweenType.ELASTIC, EaseType.OUT) == pytest.approx(expected)
@@ -0,0 +1,54 @@
+"""
+Tests for keyframe reduction
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from core.animation import EaseType, PropertyTrack, Tween, TweenType
+from core.animation.animation_track import Keyframe
+from core.animation.keyframe_reduction import reduce_track
+
+
+def _sampled_track(tween_type, ease_type, seed, linear_keys):
+    """Runs of keys sampled from one eased curve, keyed either linearly or with the curve itself"""
+    rng = random.Random(seed)
+    curve = (TweenType.LINEAR, EaseType.IN_OUT) if linear_keys else (tween_type, ease_type)
+    track = PropertyTrack("Node", "rotation")
+    keys = []
+    time = value = 0.0
+    for _ in range(6):
+        span = rng.uniform(0.2, 1.0)
+        target = value + rng.uniform(-100, 100)
+        count = rng.randint(2, 12)
+        for i in range(count):
+            eased = Tween.interpolate(0.0, 1.0, i / count, tween_type, ease_type)
+            keys.append(Keyframe(time + span * i / count, value + (target - value) * eased, *curve))
+        time += span
+        value = target
+    keys.append(Keyframe(time, value))
+    track.add_keyframes(keys)
+    return track
+
+
+def _dense(track, per_segment=200):
+    times = [keyframe.time for keyframe in track.keyframes]
+    samples = np.concatenate([np.linspace(a, b, per_segment, endpoint=False) for a, b in zip(times[:-1], times[1:])])
+    return samples, np.array([track.get_value_at_time(float(t)) for t in samples])
+
+
+@pytest.mark.parametrize("curve", [(TweenType.BOUNCE, EaseType.IN_OUT), (TweenType.BOUNCE, EaseType.IN),
+                                   (TweenType.ELASTIC, EaseType.IN), (TweenType.SMOOTHER, EaseType.OUT)])
+@pytest.mark.parametrize("linear_keys", [False, True])
+@pytest.mark.parametrize("change_easing", [False, True])
+def test_dense_error_stays_near_tolerance(curve, linear_keys, change_easing):
+    for tolerance in (0.1, 1.0):
+        for seed in range(4):
+            track = _sampled_track(*curve, seed, linear_keys)
+            samples, original = _dense(track)
+            reduce_track(track, tolerance, change_easing)
+            reduced = np.array([track.get_value_at_time(float(t)) for t in samples])
+            assert np.abs(reduced - original).max() <= 1.02 * tolerance
+
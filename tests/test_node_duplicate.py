@@ -0,0 +1,37 @@
+"""
+Tests for Node.duplicate
+"""
+
+from core.scene.base_node import Node
+
+
+def _build():
+    outside = Node("Outside")
+    root = Node("Root")
+    button = Node("Button")
+    label = Node("Label")
+    root.add_child(button)
+    root.add_child(label)
+    button.connect("pressed", label, "on_pressed")
+    button.connect("pressed", outside, "on_pressed")
+    label.connect("changed", root, "on_label_changed")
+    return outside, root, button, label
+
+
+def test_signals_inside_subtree_target_the_copies():
+    outside, root, button, label = _build()
+    clone = root.duplicate()
+    clone_button, clone_label = clone.children
+
+    targets = [connection['target'] for connection in clone_button._signals["pressed"]]
+    assert targets == [clone_label, outside]
+    assert clone_label._signals["changed"][0]['target'] is clone
+    # The originals keep their own connections
+    assert [connection['target'] for connection in button._signals["pressed"]] == [label, outside]
+    assert label._signals["changed"][0]['target'] is root
+
+
+def test_duplicate_without_signals_drops_connections():
+    _, root, _, _ = _build()
+    clone = root.duplicate(Node.DUPLICATE_GROUPS)
+    assert clone.children[0]._signals["pressed"] == []
@@ -0,0 +1,44 @@
+"""
+Tests for copy-on-write PropertyOverlay
+"""
+
+from core.scene.base_node import PropertyOverlay
+
+
+def _overlay():
+    prototype = {"health": 10, "tags": ["enemy"], "speed": 2.0}
+    return prototype, PropertyOverlay(prototype, {"speed": 3.0, "loot": "coin"})
+
+
+def test_iteration_reflects_every_write():
+    prototype, overlay = _overlay()
+    assert list(overlay) == ["health", "tags", "speed", "loot"]
+    assert len(overlay) == 4
+
+    overlay["armor"] = 1
+    del overlay["health"]
+    overlay.update(speed=4.0)
+    overlay.setdefault("level", 2)
+    assert dict(overlay.items()) == {"tags": ["enemy"], "speed": 4.0, "loot": "coin", "armor": 1, "level": 2}
+    assert len(overlay) == 5
+    assert "health" not in overlay.keys()
+
+    overlay.clear()
+    assert len(overlay) == 0 and list(overlay.values()) == []
+    assert prototype == {"health": 10, "tags": ["enemy"], "speed": 2.0}
+
+
+def test_items_follow_copy_on_read():
+    prototype, overlay = _overlay()
+    assert dict(overlay.items())["tags"] is prototype["tags"]
+    overlay["tags"].append("boss")
+    assert dict(overlay.items())["tags"] == ["enemy", "boss"]
+    assert prototype["tags"] == ["enemy"]
+
+
+def test_merged_is_a_private_copy():
+    _, overlay = _overlay()
+    merged = overlay.merged()
+    merged["speed"] = 99.0
+    assert overlay["speed"] == 3.0
+    assert overlay == {"health": 10, "tags": ["enemy"], "speed": 3.0, "loot": "coin"}
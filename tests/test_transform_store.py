@@ -0,0 +1,69 @@
+"""
+Tests for TransformStore attachment as nodes move between parents
+"""
+
+import pytest
+
+from core.scene.base_node import Node
+from core.scene.node2d import Node2D
+from core.scene.transform_store import TransformStore
+
+
+def _scene():
+    """A plain Node root with Node2Ds under both Node2D and plain Node parents"""
+    root = Node("Root")
+    anchor = Node2D("Anchor")
+    anchor.position = [100.0, 0.0]
+    group_a = Node("GroupA")
+    group_b = Node("GroupB")
+    mover = Node2D("Mover")
+    mover.position = [5.0, 5.0]
+    child = Node2D("Child")
+    child.position = [1.0, 0.0]
+    root.add_child(anchor)
+    root.add_child(group_a)
+    root.add_child(group_b)
+    group_a.add_child(mover)
+    mover.add_child(child)
+    store = TransformStore()
+    store.attach(root)
+    store.update()
+    return store, anchor, group_b, mover, child
+
+
+def test_reparent_under_plain_node_stays_attached():
+    store, anchor, group_b, mover, child = _scene()
+    anchor.add_child(mover)
+    assert mover._transform_store is store
+    store.update()
+    assert child.get_global_position() == pytest.approx([106.0, 5.0])
+
+    group_b.add_child(mover)
+    assert mover._transform_store is store and child._transform_store is store
+    mover.position = [7.0, 0.0]
+    store.update()
+    assert mover.get_global_position() == pytest.approx([7.0, 0.0])
+    assert child.get_global_position() == pytest.approx([8.0, 0.0])
+
+
+def test_leaving_and_joining_stored_trees():
+    store, anchor, group_b, mover, child = _scene()
+    outside = Node("Outside")
+    outside.add_child(mover)
+    assert mover._transform_store is None and child._transform_store is None
+
+    group_b.add_child(mover)
+    assert mover._transform_store is store and child._transform_store is store
+
+    other = TransformStore()
+    other_root = Node("OtherRoot")
+    other.attach(other_root)
+    other_root.add_child(mover)
+    assert mover._transform_store is other and child._transform_store is other
+    other.update()
+    assert child.get_global_position() == pytest.approx([6.0, 5.0])
+
+    other.detach(other_root)
+    other_root.remove_child(mover)
+    group_b.add_child(mover)
+    assert mover._transform_store is store